@@ -5,6 +5,35 @@ SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
 
+# 模擬時間設定（固定步長，與繪製幀率分開）
+# 物理數值（重力、速度）都是以每秒 60 步調整的，改變這個值會改變遊戲速度
+SIMULATION_HZ = 60
+FIXED_TIMESTEP = 1 / SIMULATION_HZ  # 每個模擬步的長度（秒）
+MAX_STEPS_PER_FRAME = 5  # 每幀最多追趕的模擬步數，避免卡頓後越追越慢
+
+# 模擬時鐘起始時間（秒），初始化為 0 的「上次使用時間」在遊戲開始時就已經冷卻完畢
+GAME_CLOCK_START_TIME = 1000.0
+
+# 效能分析設定（各階段耗時的疊加面板和匯出檔）
+PROFILER_HISTORY_FRAMES = 120  # 疊加面板平均最近幾幀的耗時
+PROFILER_EXPORT_MAX_ROWS = 100000  # 匯出檔寫滿這麼多列就換新檔（舊檔改名為 .1）
+PROFILER_OVERLAY_REFRESH_FRAMES = 15  # 疊加面板每隔幾幀重畫一次
+PROFILER_OVERLAY_X = 10  # 疊加面板位置（在血條下方）
+PROFILER_OVERLAY_Y = 90
+PROFILER_OVERLAY_WIDTH = 220
+
+# 日誌設定（訊息由背景執行緒輸出，不會卡住遊戲迴圈）
+LOG_LEVEL = "INFO"  # 顯示的最低等級：DEBUG、INFO、WARNING、ERROR
+LOG_CATEGORY_LEVELS = {}  # 個別分類的最低等級，例如 {"audio": "DEBUG"}
+LOG_RATE_LIMIT_SECONDS = 1.0  # 同一則訊息最短的輸出間隔，期間重複的訊息只計數
+LOG_QUEUE_LIMIT = 10000  # 等待輸出的訊息上限，終端機太慢時多的訊息直接丟掉
+
+# 效能基準測試設定（python3 -m src.main --benchmark）
+BENCHMARK_SEED = 20250826  # 所有場景使用同一個種子，每次執行的遊戲過程都相同
+BENCHMARK_TICKS = SIMULATION_HZ * 20  # 每個場景量測的模擬步數（20 秒遊戲時間）
+BENCHMARK_WARMUP_TICKS = SIMULATION_HZ  # 量測前先跑的模擬步數，讓圖片和文字快取就緒
+BENCHMARK_TOLERANCE = 0.15  # 和基準比較時容許變差的比例，超過就判定退步
+
 # 顏色定義
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -65,6 +94,7 @@ MELEE_RANGE = 80
 BULLET_SPEED = 15
 BULLET_SIZE = 8
 FIRE_RATE = 0.3  # 發射間隔（秒）
+USE_BULLET_ARRAY_STORE = True  # 用 numpy 陣列批次處理子彈（沒安裝 numpy 時自動改用列表）
 
 # 子彈屬性顏色
 WATER_BULLET_COLOR = CYAN
@@ -119,6 +149,14 @@ GRENADE_EXPLOSION_RADIUS = 400  # 4公分爆炸範圍（以像素為單位，實
 GRENADE_MAX_COUNT = 10  # 玩家最大手榴彈數量（從5增加到10）
 GRENADE_GRAVITY = 0.3  # 手榴彈重力影響（讓拋物線更真實）
 
+# 手榴彈軌跡預覽設定（拋物線直接解出來，只有投擲位置、方向或平台改變時才重算）
+GRENADE_TRAJECTORY_STEPS = 50  # 最多預測幾個更新步
+GRENADE_TRAJECTORY_SAMPLES_PER_STEP = 4  # 每一步之間取幾個點畫線，數字越大曲線越平滑
+GRENADE_TRAJECTORY_RANGE_X = 1000  # 水平離開投擲點超過這個距離就不再預測
+GRENADE_TRAJECTORY_RANGE_Y = 800  # 垂直離開投擲點超過這個距離就不再預測
+GRENADE_TRAJECTORY_DASH_LENGTH = 8  # 虛線段長度
+GRENADE_TRAJECTORY_GAP_LENGTH = 6  # 虛線間隔長度
+
 # 爆炸視覺效果設定
 EXPLOSION_DURATION = 0.5  # 爆炸效果持續時間（秒）
 EXPLOSION_COLORS = [
@@ -166,6 +204,19 @@ SNIPER_BOSS_SPEED = 3  # 降低移動速度避免被跑酷板卡住（從8降至
 SNIPER_BOSS_HEALTH = 1500  # 與岩漿Boss相同的血量
 SNIPER_BOSS_DAMAGE = 60  # 高攻擊力
 
+# 怪物群批次更新（一般岩漿怪、水怪的 AI 和物理用 numpy 陣列一次算完）
+USE_MONSTER_CROWD_BATCH = True  # 沒安裝 numpy 時自動改回逐隻更新
+MONSTER_CROWD_MIN_BATCH = 24  # 怪物少於這個數量時逐隻更新比較快
+HACK_MODE_MAX_MONSTERS = 15  # hack 模式場上小怪上限（逐隻更新）
+HACK_MODE_MAX_CROWD_MONSTERS = 150  # hack 模式場上小怪上限（批次更新）
+
+# 怪物 AI 細節層級（離畫面越遠的怪物越久才更新一次，靠近畫面時恢復每步更新）
+USE_MONSTER_AI_LOD = True
+MONSTER_LOD_NEAR_DISTANCE = 300  # 畫面外這個距離內的怪物每個模擬步都更新
+MONSTER_LOD_FAR_DISTANCE = 1200  # 畫面外超過這個距離的怪物用最低頻率更新
+MONSTER_LOD_MID_INTERVAL = 2  # 中距離怪物每 2 步更新一次
+MONSTER_LOD_FAR_INTERVAL = 4  # 遠處怪物每 4 步更新一次（必須是中距離間隔的倍數）
+
 ######################Boss設定######################
 
 # 熔岩龍捲怪 Boss
@@ -205,6 +256,29 @@ PARALYSIS_EFFECT_RATE = 0.0  # 麻痺時完全無法移動
 PLATFORM_HEIGHT = 30
 PLATFORM_COLOR = GRAY
 
+# 空間網格設定（平台、尖刺、愛心的碰撞查詢）
+SPATIAL_GRID_CELL_SIZE = 256  # 每個網格的邊長（像素）
+SPATIAL_GRID_LARGE_ITEM_CELLS = 32  # 覆蓋超過這麼多格的物件不逐格登記，查詢時直接檢查
+
+# 怪物空間網格設定（爆炸、近戰、甩槍和自動瞄準找附近的怪物和Boss）
+MONSTER_GRID_CELL_SIZE = 128  # 每個網格的邊長（像素），一般怪物只佔一到四格
+
+# 關卡分塊繪製設定（平台和尖刺預先畫成區塊，每幀只貼畫面內的區塊）
+LEVEL_CHUNK_SIZE = 512  # 每個區塊的邊長（像素）
+LEVEL_CHUNK_CACHE_LIMIT = 64  # 最多保留的區塊圖片數量，超過時丟掉最久沒用到的
+
+# 關卡串流設定（跑酷平台、尖刺、愛心依照種子分段生成，攝影機靠近時才建立）
+LEVEL_WIDTH = SCREEN_WIDTH * 10  # 關卡寬度，只生成畫面附近的段，加寬不增加啟動時間
+LEVEL_HEIGHT = SCREEN_HEIGHT * 15  # 關卡高度，容納30層
+LEVEL_LAYOUT_WIDTH = SCREEN_WIDTH * 5  # 版面寬度，每一層在每個版面裡有一個跑酷平台
+LEVEL_PICKUPS_PER_LAYOUT = 5  # 每個版面的愛心數量
+LEVEL_SECTION_WIDTH = SCREEN_WIDTH  # 串流段的寬度，載入和丟棄都以段為單位
+LEVEL_STREAM_LOAD_MARGIN = SCREEN_WIDTH // 2  # 畫面左右這個距離內的段要載入
+LEVEL_STREAM_EVICT_MARGIN = SCREEN_WIDTH * 3 // 2  # 離畫面超過這個距離的段丟掉（要大於載入距離）
+
+# 重新開始設定
+RESET_KEEP_LEVEL = False  # 按 R 重新開始時保留同一個關卡（False 表示換新的關卡種子）
+
 # 陷阱設定
 LAVA_TRAP_COLOR = RED
 WATER_TRAP_COLOR = BLUE
@@ -329,6 +403,9 @@ CROSSHAIR_IMAGE_PATH = (
 CROSSHAIR_SIZE = 50  # 準心圖片大小（像素）- 適合狙擊槍使用的尺寸
 CROSSHAIR_COLOR = (255, 0, 0)  # 備用準心顏色（當圖片載入失敗時使用）
 
+# 武器旋轉圖片快取設定
+WEAPON_ROTATION_STEP = 2  # 旋轉角度取整的間隔（度），每個角度只旋轉一次圖片
+
 ######################機關槍武器設定######################
 
 # 機關槍圖片設定
@@ -467,6 +544,7 @@ SOUND_CHANNELS = 8  # 同時播放的音效頻道數量，支援機關槍連續
 
 ######################字體設定######################
 
+import json
 import pygame
 import os
 
@@ -489,15 +567,162 @@ FONT_SIZE_NORMAL = 24  # 一般文字
 FONT_SIZE_SMALL = 20  # 說明文字
 FONT_SIZE_TINY = 16  # 最小文字
 
+# 開始遊戲前先建立的字體大小（HUD 用的大小加上小地圖的 10、12），
+# 傷害數字的大小由 DamageDisplayManager 另外提供
+PRELOAD_FONT_SIZES = (
+    FONT_SIZE_LARGE,
+    FONT_SIZE_MEDIUM,
+    FONT_SIZE_NORMAL,
+    FONT_SIZE_SMALL,
+    FONT_SIZE_TINY,
+    12,
+    10,
+)
+
+# 找到的中文字體路徑會記在這個檔案，下次啟動不用再逐一嘗試
+FONT_PATH_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "elemental_parkour_shooter", "font_path.json"
+)
+
+# 文字圖片緩存設定
+TEXT_SURFACE_CACHE_LIMIT = 256  # 最多保留的文字圖片數量，超過時丟掉最久沒用到的
+
 # 字體緩存字典，避免重複載入
 _font_cache = {}
 
+# 這次執行找到的中文字體路徑（"path" -> 路徑，None 表示使用預設字體）
+_font_path_cache = {}
+
+
+def _get_font_logger():
+    """
+    取得字體分類的日誌\n
+    \n
+    回傳:\n
+    Logger: 字體日誌\n
+    """
+    # 日誌模組會讀取這個檔案的設定，用到時才載入，避免循環匯入
+    try:
+        from .utils.game_logger import get_logger
+    except ImportError:
+        from src.utils.game_logger import get_logger
+    return get_logger("font")
+
+
+def _font_file_signature(font_path):
+    """
+    取得字體檔的大小和修改時間，用來判斷記下的路徑是否還能用\n
+    \n
+    參數:\n
+    font_path (str): 字體檔路徑\n
+    \n
+    回傳:\n
+    list: [檔案大小, 修改時間]，檔案不存在時回傳 None\n
+    """
+    try:
+        stat = os.stat(font_path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_font_path_cache(cache_file=None):
+    """
+    讀取上次找到的中文字體路徑\n
+    \n
+    字體候選清單改過、字體檔不見或被換掉時，記下的路徑就不用\n
+    \n
+    參數:\n
+    cache_file (str): 記錄檔路徑，None 表示使用 FONT_PATH_CACHE_FILE\n
+    \n
+    回傳:\n
+    str: 字體路徑，沒有可用的紀錄時回傳 None\n
+    """
+    try:
+        with open(cache_file or FONT_PATH_CACHE_FILE, encoding="utf-8") as file:
+            record = json.load(file)
+        font_path = record["path"]
+        if record["candidates"] != CHINESE_FONTS:
+            return None
+        if _font_file_signature(font_path) != record["signature"]:
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return font_path
+
+
+def save_font_path_cache(font_path, cache_file=None):
+    """
+    記下找到的中文字體路徑，寫不進去時不影響遊戲\n
+    \n
+    參數:\n
+    font_path (str): 字體路徑\n
+    cache_file (str): 記錄檔路徑，None 表示使用 FONT_PATH_CACHE_FILE\n
+    """
+    cache_file = cache_file or FONT_PATH_CACHE_FILE
+    record = {
+        "candidates": CHINESE_FONTS,
+        "path": font_path,
+        "signature": _font_file_signature(font_path),
+    }
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as file:
+            json.dump(record, file, ensure_ascii=False)
+    except OSError as e:
+        _get_font_logger().warning(f"無法記錄字體路徑: {e}")
+
+
+def resolve_chinese_font_path():
+    """
+    找出可以使用的中文字體檔 - 每次執行只找一次\n
+    \n
+    先看上次記下的路徑，沒有可用的紀錄時才依序嘗試 CHINESE_FONTS，\n
+    找到後記到 FONT_PATH_CACHE_FILE\n
+    \n
+    回傳:\n
+    str: 字體路徑，都無法使用時回傳 None（使用 pygame 預設字體）\n
+    """
+    if "path" in _font_path_cache:
+        return _font_path_cache["path"]
+
+    log = _get_font_logger()
+
+    # 確保 pygame 字體模組已初始化
+    if not pygame.get_init() or not pygame.font.get_init():
+        pygame.font.init()
+
+    font_path = load_font_path_cache()
+    if font_path is not None:
+        log.info(f"使用記下的字體: {font_path}")
+    else:
+        # 嘗試載入繁體中文字體
+        for candidate in CHINESE_FONTS:
+            # 檢查字體檔案是否存在
+            if not os.path.exists(candidate):
+                continue
+            try:
+                pygame.font.Font(candidate, FONT_SIZE_NORMAL)
+            except (pygame.error, OSError) as e:
+                # 字體載入失敗，繼續嘗試下一個
+                continue
+            font_path = os.path.abspath(candidate)
+            log.info(f"成功載入字體: {font_path}")
+            save_font_path_cache(font_path)
+            break
+
+    if font_path is None:
+        log.warning("所有中文字體載入失敗，使用預設字體")
+
+    _font_path_cache["path"] = font_path
+    return font_path
+
 
 def get_chinese_font(size):
     """
     獲取支援繁體中文的字體\n
     \n
-    此函數會依序嘗試載入繁體中文字體，如果都失敗則使用預設字體\n
+    此函數會使用 resolve_chinese_font_path 找到的中文字體，找不到時使用預設字體\n
     使用緩存機制避免重複載入同樣大小的字體\n
     \n
     參數:\n
@@ -508,7 +733,7 @@ def get_chinese_font(size):
     \n
     降級策略:\n
     1. 檢查緩存中是否已有相同大小的字體\n
-    2. 嘗試載入系統中的繁體中文字體\n
+    2. 使用找到的繁體中文字體（路徑每次執行只找一次，並記在硬碟上）\n
     3. 如果都失敗，使用 pygame 預設字體\n
     4. 確保遊戲能正常運行，即使字體不完美\n
     """
@@ -516,30 +741,88 @@ def get_chinese_font(size):
     if size in _font_cache:
         return _font_cache[size]
 
-    # 確保 pygame 字體模組已初始化
-    if not pygame.get_init() or not pygame.font.get_init():
-        pygame.font.init()
-
+    font_path = resolve_chinese_font_path()
     font = None
-
-    # 嘗試載入繁體中文字體
-    for font_path in CHINESE_FONTS:
+    if font_path is not None:
         try:
-            # 檢查字體檔案是否存在
-            if os.path.exists(font_path):
-                # 嘗試載入字體
-                font = pygame.font.Font(font_path, size)
-                print(f"成功載入字體: {font_path} (大小: {size})")
-                break
-        except (pygame.error, OSError, FileNotFoundError) as e:
-            # 字體載入失敗，繼續嘗試下一個
-            continue
-
-    # 所有字體都載入失敗，使用預設字體
+            font = pygame.font.Font(font_path, size)
+        except (pygame.error, OSError) as e:
+            _get_font_logger().warning(f"載入字體失敗，使用預設字體: {e}")
+
     if font is None:
-        print(f"所有中文字體載入失敗，使用預設字體，大小: {size}")
         font = pygame.font.Font(None, size)
 
     # 將字體加入緩存
     _font_cache[size] = font
     return font
+
+
+def preload_fonts(sizes):
+    """
+    預先建立各種大小的字體 - 遊戲開始前呼叫，戰鬥中就不會讀取字體檔\n
+    \n
+    參數:\n
+    sizes (iterable): 字體大小\n
+    \n
+    回傳:\n
+    int: 建立好的字體數量\n
+    """
+    sizes = set(sizes)
+    for size in sizes:
+        get_chinese_font(size)
+    return len(sizes)
+
+
+# 文字圖片緩存字典（依照最近使用順序排列），避免每幀重新排版同樣的文字
+_text_surface_cache = {}
+
+
+def get_text_surface(text, size, color, antialias=True):
+    """
+    取得排版好的文字圖片 - 同樣的文字、大小、顏色只會 render 一次\n
+    \n
+    HUD、傷害數字、Boss 標籤每幀都會畫同樣的文字，\n
+    排版好的圖片放在有上限的緩存裡，超過上限時丟掉最久沒用到的\n
+    \n
+    參數:\n
+    text (str): 要顯示的文字\n
+    size (int): 字體大小，範圍 > 0\n
+    color (tuple): RGB 顏色值\n
+    antialias (bool): 是否使用反鋸齒\n
+    \n
+    回傳:\n
+    pygame.Surface: 文字圖片（共用，不可直接修改，淡出請用 blit_text_with_alpha）\n
+    """
+    key = (text, size, tuple(color), antialias)
+
+    # 取出後重新放到最後，表示最近用過
+    text_surface = _text_surface_cache.pop(key, None)
+    if text_surface is None:
+        text_surface = get_chinese_font(size).render(text, antialias, color)
+
+        # 超過上限時丟掉最久沒用到的文字
+        while len(_text_surface_cache) >= TEXT_SURFACE_CACHE_LIMIT:
+            del _text_surface_cache[next(iter(_text_surface_cache))]
+
+    _text_surface_cache[key] = text_surface
+    return text_surface
+
+
+def blit_text_with_alpha(screen, text_surface, position, alpha):
+    """
+    用指定透明度繪製緩存的文字圖片 - 淡出效果不需要重新排版文字\n
+    \n
+    參數:\n
+    screen (pygame.Surface): 要繪製到的表面\n
+    text_surface (pygame.Surface): get_text_surface 取得的文字圖片\n
+    position (tuple or pygame.Rect): 繪製位置\n
+    alpha (int): 透明度，範圍 0-255\n
+    """
+    if alpha >= 255:
+        screen.blit(text_surface, position)
+        return
+
+    # 文字圖片是共用的，畫完要把透明度恢復
+    text_surface.set_alpha(max(0, alpha))
+    screen.blit(text_surface, position)
+    text_surface.set_alpha(255)
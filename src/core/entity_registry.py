@@ -0,0 +1,136 @@
+######################實體能力######################
+
+# 實體在類別上宣告一次自己有哪些能力（GameObject.capabilities），
+# 系統用能力挑出要處理的實體，不必在每一對碰撞檢查裡逐一 hasattr
+DAMAGEABLE = "damageable"  # 有 take_damage()：會被子彈、近戰和爆炸打傷
+KNOCKBACKABLE = "knockbackable"  # 有 apply_knockback()：會被擊退
+STATUS_AFFECTED = "status_affected"  # 有 add_status_effect()：會被減速、麻痺
+FIRE_BULLET_EMITTER = "fire_bullet_emitter"  # 會發射火焰子彈（岩漿Boss）
+HOMING_BULLET_EMITTER = "homing_bullet_emitter"  # 會發射追蹤子彈（狙擊Boss）
+BOSS = "boss"  # Boss：必殺技優先鎖定、可以穿牆
+
+
+def filter_capable(entities, capability):
+    """
+    從一般列表挑出有指定能力的實體 - 沒有登記表可用時的備用做法\n
+    \n
+    場上的怪物和Boss請用 EntityRegistry.get_capable()，不必每次重新篩選\n
+    \n
+    保留原本的順序，子彈擊中「第一個」重疊目標的結果不會改變\n
+    \n
+    參數:\n
+    entities (list): 實體列表\n
+    capability (str): 能力名稱，例如 DAMAGEABLE\n
+    \n
+    回傳:\n
+    list: 有這個能力的實體\n
+    """
+    return [entity for entity in entities if capability in entity.capabilities]
+
+
+######################實體登記表類別######################
+
+
+class EntityRegistry:
+    """
+    實體登記表 - 給每隻怪物和 Boss 一個固定的整數 ID\n
+    \n
+    追蹤子彈和黏在怪物身上的手榴彈只記 ID，不直接保存怪物物件：\n
+    1. 用 ID 查詢怪物是否還在場上是 O(1)，不必在目標列表裡逐一比對\n
+    2. ID 不會重複使用，怪物被移除後舊 ID 永遠查不到其他怪物\n
+    3. 每移除一個實體 generation 就加一，追蹤者可以用來判斷快取是否過期\n
+    4. 依照能力分組的名單在登記和移除時同步更新，系統直接走訪需要的那一組\n
+    \n
+    「還在場上」的意思和怪物管理器的列表相同：怪物死亡後到下次移除死亡怪物之前\n
+    仍然查得到\n
+    """
+
+    def __init__(self):
+        self.entities = {}  # ID -> 還在場上的實體
+        self.next_id = 1  # 下一個要發出的 ID
+        self.generation = 0  # 移除實體的次數
+        self.capable = {}  # 能力 -> {ID: 實體}，依照登記順序排列
+
+    def register(self, entity):
+        """
+        登記新實體並發給它一個 ID（寫入 entity.entity_id）\n
+        \n
+        實體的能力要在登記前設定好，登記時會依照能力放進對應的名單\n
+        \n
+        參數:\n
+        entity (GameObject): 要登記的實體\n
+        \n
+        回傳:\n
+        int: 發給實體的 ID\n
+        """
+        entity_id = self.next_id
+        self.next_id += 1
+        entity.entity_id = entity_id
+        self.entities[entity_id] = entity
+        for capability in entity.capabilities:
+            self.capable.setdefault(capability, {})[entity_id] = entity
+        return entity_id
+
+    def despawn(self, entity):
+        """
+        把實體移出場上，之後用它的 ID 都查不到\n
+        \n
+        參數:\n
+        entity (GameObject): 要移除的實體\n
+        """
+        if self.entities.pop(entity.entity_id, None) is not None:
+            self.generation += 1
+            for capability in entity.capabilities:
+                self.capable.get(capability, {}).pop(entity.entity_id, None)
+
+    def is_alive(self, entity_id):
+        """
+        檢查實體是否還在場上\n
+        \n
+        參數:\n
+        entity_id (int): 實體 ID，None 表示沒有實體\n
+        \n
+        回傳:\n
+        bool: True 表示還在場上\n
+        """
+        return entity_id in self.entities
+
+    def get(self, entity_id):
+        """
+        用 ID 取得還在場上的實體\n
+        \n
+        參數:\n
+        entity_id (int): 實體 ID，None 表示沒有實體\n
+        \n
+        回傳:\n
+        GameObject: 實體，已經被移除時回傳 None\n
+        """
+        return self.entities.get(entity_id)
+
+    def get_capable(self, capability):
+        """
+        取得還在場上、有指定能力的實體 - 直接回傳維護好的名單，不必重新篩選\n
+        \n
+        參數:\n
+        capability (str): 能力名稱，例如 DAMAGEABLE\n
+        \n
+        回傳:\n
+        dict_values: 有這個能力的實體，依照登記順序排列\n
+        （唯讀檢視，走訪時不要登記或移除實體）\n
+        """
+        group = self.capable.get(capability)
+        if group is None:
+            return ()
+        return group.values()
+
+    def clear(self):
+        """
+        移除所有實體 - 重新開始或換關卡時使用（ID 繼續往上發，不會重複）\n
+        """
+        # 每個被清掉的實體都算一次移除，和逐一 despawn 的結果相同
+        self.generation += len(self.entities)
+        self.entities.clear()
+        self.capable.clear()
+
+    def __len__(self):
+        return len(self.entities)
@@ -1,13 +1,18 @@
 ######################載入套件######################
 import pygame
 import math
-import time
 
 # 支援直接執行和模組執行兩種方式
 try:
     from ..config import *
+    from ..utils.game_logger import get_logger
+    from .game_session import get_game_time, get_game_clock
 except ImportError:
     from src.config import *
+    from src.utils.game_logger import get_logger
+    from src.core.game_session import get_game_time, get_game_clock
+
+log = get_logger("items")
 
 ######################基礎物件類別######################
 
@@ -30,8 +35,12 @@ class GameObject:
     \n
     屬性:\n
     rect (pygame.Rect): 碰撞檢測用的矩形區域\n
+    entity_id (int): 實體登記表發的 ID，沒有登記的物件為 None\n
+    capabilities (frozenset): 物件的能力（見 entity_registry），子類別宣告一次\n
     """
 
+    capabilities = frozenset()
+
     def __init__(self, x, y, width, height, color):
         self.x = x
         self.y = y
@@ -40,6 +49,7 @@ class GameObject:
         self.color = color
         # 建立碰撞檢測用的矩形，會跟著物件位置更新
         self.rect = pygame.Rect(x, y, width, height)
+        self.entity_id = None
 
     def update_rect(self):
         """
@@ -53,6 +63,15 @@ class GameObject:
         self.rect.width = int(self.width)
         self.rect.height = int(self.height)
 
+    def add_capabilities(self, *capabilities):
+        """
+        讓這個物件多出幾種能力 - 例如一般岩漿怪升級成Boss\n
+        \n
+        參數:\n
+        *capabilities (str): 要加上的能力名稱\n
+        """
+        self.capabilities = self.capabilities | frozenset(capabilities)
+
     def draw(self, screen, camera_x=0, camera_y=0):
         """
         在螢幕上繪製物件 - 基本的矩形繪製\n
@@ -105,22 +124,32 @@ class StatusEffect:
     \n
     管理施加在怪物或玩家身上的各種狀態效果，\n
     包含效果類型、強度和持續時間。\n
+    效果結束時由模擬時鐘觸發 on_expire，持有者不用每一步檢查是否過期。\n
     \n
     參數:\n
     effect_type (str): 效果類型，'slow' 或 'paralysis'\n
     duration (float): 效果持續時間（秒），範圍 > 0\n
     intensity (float): 效果強度，範圍 0.0-1.0\n
+    on_expire (callable): 效果結束時呼叫，參數是這個效果；None 表示不通知\n
     \n
     回傳:\n
     bool: is_active() 回傳效果是否仍在作用中\n
     float: get_speed_modifier() 回傳移動速度修正值\n
     """
 
-    def __init__(self, effect_type, duration, intensity):
+    def __init__(self, effect_type, duration, intensity, on_expire=None):
         self.effect_type = effect_type  # 'slow', 'paralysis' 等
         self.duration = duration  # 持續時間（秒）
         self.intensity = intensity  # 效果強度 (0.0 - 1.0)
-        self.start_time = time.time()  # 記錄開始時間
+        self.start_time = get_game_time()  # 記錄開始時間
+        self.end_time = self.start_time + duration  # 結束時間
+
+        # 排程結束事件
+        self.expiry_timer = None
+        if on_expire is not None:
+            self.expiry_timer = get_game_clock().schedule_at(
+                self.end_time, on_expire, self
+            )
 
     def is_active(self):
         """
@@ -129,7 +158,7 @@ class StatusEffect:
         回傳:\n
         bool: True 表示效果還在持續，False 表示已經結束\n
         """
-        return time.time() - self.start_time < self.duration
+        return get_game_time() < self.end_time
 
     def get_speed_modifier(self):
         """
@@ -213,7 +242,7 @@ class HealthPickup(GameObject):
             if player.health < player.max_health:
                 old_health = player.health
                 player.heal(self.heal_amount)
-                print(f"💚 撿到愛心！生命值：{old_health} → {player.health}")
+                log.info(f"💚 撿到愛心！生命值：{old_health} → {player.health}")
                 self.collected = True
                 return True
 
@@ -345,10 +374,10 @@ class SpikeHazard(GameObject):
         screen_x = self.x - camera_x
         screen_y = self.y - camera_y
 
-        # 只在螢幕範圍內繪製
+        # 只在畫面範圍內繪製（畫面可能是螢幕，也可能是關卡的預繪區塊）
         if (
-            -50 <= screen_x <= SCREEN_WIDTH + 50
-            and -50 <= screen_y <= SCREEN_HEIGHT + 50
+            -self.width <= screen_x <= screen.get_width()
+            and -self.height <= screen_y <= screen.get_height()
         ):
 
             # 繪製尖刺基座
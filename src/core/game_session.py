@@ -0,0 +1,187 @@
+######################載入套件######################
+import heapq
+import random
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+except ImportError:
+    from src.config import *
+
+######################模擬時鐘類別######################
+
+
+class Timer:
+    """
+    排程中的事件 - GameClock.schedule() 的回傳值\n
+    \n
+    參數:\n
+    due_time (float): 到期的模擬時間（秒）\n
+    callback (callable): 到期時呼叫的函式\n
+    args (tuple): 呼叫時傳入的參數\n
+    """
+
+    __slots__ = ("due_time", "callback", "args", "cancelled")
+
+    def __init__(self, due_time, callback, args):
+        self.due_time = due_time
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        取消事件 - 還沒到期的事件不會再觸發，已經觸發過的不受影響\n
+        """
+        self.cancelled = True
+        # 放掉參照，取消的事件留在排程裡等到期時才丟掉，不會拖住物件
+        self.callback = None
+        self.args = ()
+
+
+class GameClock:
+    """
+    模擬時鐘 - 只在遊戲更新時前進，取代冷卻和持續時間裡的 time.time()\n
+    \n
+    每次模擬步推進 FIXED_TIMESTEP 秒，所以同樣的輸入一定得到同樣的冷卻結果，\n
+    和電腦快慢、無頭模式跑多快都無關，重播時才能得到完全相同的狀態。\n
+    \n
+    起始時間設在 GAME_CLOCK_START_TIME 而不是 0：\n
+    很多「上次使用時間」初始化為 0，原本配合 time.time() 時一開始就能使用，\n
+    從一個夠大的時間開始，這些冷卻在遊戲開始時同樣已經結束。\n
+    \n
+    狀態效果、投射物、爆炸和傷害數字的持續時間用 schedule() 排程，\n
+    時鐘推進到到期時間時才觸發一次，不用每一步逐一檢查是否過期。\n
+    排程用 heap 保存，每一步只需要看最早到期的事件。\n
+    \n
+    參數:\n
+    start_time (float): 起始時間（秒）\n
+    """
+
+    def __init__(self, start_time=GAME_CLOCK_START_TIME):
+        self.start_time = start_time
+        self.current_time = start_time
+        self.tick_count = 0  # 已經推進的模擬步數
+        self.timers = []  # (到期時間, 排程順序, Timer) 組成的 heap
+        self.timer_sequence = 0  # 同時到期的事件依照排程先後觸發
+
+    def advance(self, dt=FIXED_TIMESTEP):
+        """
+        推進一個模擬步，並觸發所有已經到期的事件\n
+        \n
+        參數:\n
+        dt (float): 推進的時間（秒）\n
+        """
+        self.current_time += dt
+        self.tick_count += 1
+
+        timers = self.timers
+        while timers and timers[0][0] <= self.current_time:
+            timer = heapq.heappop(timers)[2]
+            if timer.cancelled:
+                continue
+            callback, args = timer.callback, timer.args
+            timer.cancel()
+            callback(*args)
+
+    def schedule(self, delay, callback, *args):
+        """
+        排程一個事件，delay 秒後觸發\n
+        \n
+        參數:\n
+        delay (float): 從現在起算的秒數\n
+        callback (callable): 到期時呼叫的函式\n
+        *args: 呼叫時傳入的參數\n
+        \n
+        回傳:\n
+        Timer: 排程的事件，可以用 cancel() 取消\n
+        """
+        return self.schedule_at(self.current_time + delay, callback, *args)
+
+    def schedule_at(self, due_time, callback, *args):
+        """
+        排程一個事件，在指定的模擬時間觸發\n
+        \n
+        事件在時鐘推進到 due_time 以後的第一個模擬步開始時觸發，\n
+        早於這一步的遊戲更新\n
+        \n
+        參數:\n
+        due_time (float): 到期的模擬時間（秒）\n
+        callback (callable): 到期時呼叫的函式\n
+        *args: 呼叫時傳入的參數\n
+        \n
+        回傳:\n
+        Timer: 排程的事件，可以用 cancel() 取消\n
+        """
+        timer = Timer(due_time, callback, args)
+        heapq.heappush(self.timers, (due_time, self.timer_sequence, timer))
+        self.timer_sequence += 1
+        return timer
+
+    def reset(self):
+        """
+        回到起始時間並丟掉所有排程 - 開始新的遊戲階段時使用\n
+        """
+        self.current_time = self.start_time
+        self.tick_count = 0
+        self.timers.clear()
+        self.timer_sequence = 0
+
+
+######################遊戲階段共用狀態######################
+
+# 整個遊戲階段共用的亂數產生器和模擬時鐘
+# 各模組在載入時取得同一個物件，重新設定種子時直接修改它的狀態，不會換成新物件
+_session_rng = random.Random()
+_game_clock = GameClock()
+
+
+def get_rng():
+    """
+    取得遊戲階段共用的亂數產生器 - 所有會影響遊戲結果的亂數都從這裡取\n
+    \n
+    回傳:\n
+    random.Random: 共用的亂數產生器\n
+    """
+    return _session_rng
+
+
+def make_seed():
+    """
+    產生新的隨機種子 - 沒有指定種子時使用，之後可以用同一個種子重現這一局\n
+    \n
+    回傳:\n
+    int: 32 位元的種子\n
+    """
+    return random.SystemRandom().randrange(2**32)
+
+
+def start_session(seed):
+    """
+    開始新的遊戲階段 - 設定亂數種子並把模擬時鐘歸零\n
+    \n
+    參數:\n
+    seed (int): 亂數種子\n
+    """
+    _session_rng.seed(seed)
+    _game_clock.reset()
+
+
+def get_game_clock():
+    """
+    取得遊戲階段共用的模擬時鐘\n
+    \n
+    回傳:\n
+    GameClock: 共用的模擬時鐘\n
+    """
+    return _game_clock
+
+
+def get_game_time():
+    """
+    取得目前的模擬時間 - 用來取代 time.time()\n
+    \n
+    回傳:\n
+    float: 模擬時間（秒）\n
+    """
+    return _game_clock.current_time
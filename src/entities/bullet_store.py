@@ -0,0 +1,302 @@
+######################載入套件######################
+# numpy 是選用套件，沒安裝時武器管理器會改回逐顆更新的列表模式
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+except ImportError:
+    from src.config import *
+
+######################子彈類型代碼######################
+
+# 陣列裡用整數代碼記錄子彈類型，批次篩選比比對字串快
+BULLET_TYPE_CODES = {
+    "machine_gun": 0,
+    "assault_rifle": 1,
+    "shotgun": 2,
+    "sniper": 3,
+    "lightning_tracking": 4,
+}
+UNKNOWN_BULLET_CODE = -1
+
+# 需要每幀重新計算方向的子彈（追蹤類），其他子彈都是直線飛行
+STEERED_BULLET_CODES = (BULLET_TYPE_CODES["lightning_tracking"],)
+
+######################子彈陣列儲存類別######################
+
+
+class BulletArrayStore:
+    """
+    子彈陣列儲存 - 用結構陣列（struct of arrays）批次處理玩家子彈\n
+    \n
+    每顆子彈的位置、速度、起點、射程、類型代碼和存活狀態都存在 numpy 陣列裡，\n
+    移動、射程淘汰、和怪物的矩形碰撞都用幾次向量運算一次算完。\n
+    Bullet 物件仍然保留，當作對外的把手：繪製、Boss 躲避、傷害數字\n
+    都照舊讀取 bullet.x、bullet.bullet_type 等屬性。\n
+    \n
+    特點：\n
+    1. objects 列表和陣列的列一一對應，順序就是發射順序\n
+    2. 追蹤子彈先由物件自己轉向，再把新速度寫回陣列\n
+    3. 碰撞結果依照子彈順序回傳，和逐顆檢查的結果完全相同\n
+    \n
+    參數:\n
+    capacity (int): 陣列初始容量，不夠時會自動加倍\n
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.count = 0
+        self.objects = []  # 和陣列列數對應的 Bullet 物件
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """
+        建立指定容量的空陣列\n
+        \n
+        參數:\n
+        capacity (int): 陣列容量\n
+        """
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.velocity_x = np.zeros(capacity, dtype=np.float64)
+        self.velocity_y = np.zeros(capacity, dtype=np.float64)
+        self.start_x = np.zeros(capacity, dtype=np.float64)
+        self.start_y = np.zeros(capacity, dtype=np.float64)
+        self.max_distance = np.zeros(capacity, dtype=np.float64)
+        self.distance_traveled = np.zeros(capacity, dtype=np.float64)
+        self.type_code = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def grow(self):
+        """
+        容量不夠時把所有陣列加倍，保留現有資料\n
+        """
+        old_arrays = self.get_arrays()
+        self.capacity *= 2
+        self.allocate(self.capacity)
+
+        for name, old_array in old_arrays.items():
+            getattr(self, name)[: self.count] = old_array[: self.count]
+
+    def get_arrays(self):
+        """
+        取得所有欄位陣列\n
+        \n
+        回傳:\n
+        dict: 欄位名稱 -> numpy 陣列\n
+        """
+        return {
+            "x": self.x,
+            "y": self.y,
+            "velocity_x": self.velocity_x,
+            "velocity_y": self.velocity_y,
+            "start_x": self.start_x,
+            "start_y": self.start_y,
+            "max_distance": self.max_distance,
+            "distance_traveled": self.distance_traveled,
+            "type_code": self.type_code,
+            "alive": self.alive,
+        }
+
+    def add(self, bullet):
+        """
+        把子彈加入陣列\n
+        \n
+        參數:\n
+        bullet (Bullet): 新發射的子彈物件\n
+        """
+        if self.count >= self.capacity:
+            self.grow()
+
+        index = self.count
+        self.x[index] = bullet.x
+        self.y[index] = bullet.y
+        self.velocity_x[index] = bullet.direction_x * bullet.speed
+        self.velocity_y[index] = bullet.direction_y * bullet.speed
+        self.start_x[index] = bullet.start_x
+        self.start_y[index] = bullet.start_y
+        self.max_distance[index] = bullet.max_distance
+        self.distance_traveled[index] = bullet.distance_traveled
+        self.type_code[index] = BULLET_TYPE_CODES.get(
+            bullet.bullet_type, UNKNOWN_BULLET_CODE
+        )
+        self.alive[index] = bullet.is_active
+
+        self.objects.append(bullet)
+        self.count += 1
+
+    def clear(self):
+        """
+        清除所有子彈 - 關卡重置或遊戲結束時使用\n
+        """
+        self.objects.clear()
+        self.count = 0
+
+    def update(self, targets=None, registry=None):
+        """
+        更新所有子彈 - 追蹤轉向、批次移動、射程淘汰、移除失效子彈\n
+        \n
+        參數:\n
+        targets (list): 可能的追蹤目標列表（用於雷電追蹤）\n
+        registry (EntityRegistry): 實體登記表，用 ID 找到分配的目標\n
+        """
+        count = self.count
+        if count == 0:
+            return
+
+        # 追蹤子彈的轉向邏輯牽涉到目標物件，仍由物件自己處理
+        steered_rows = np.nonzero(
+            np.isin(self.type_code[:count], STEERED_BULLET_CODES)
+            & self.alive[:count]
+        )[0]
+        for index in steered_rows.tolist():
+            bullet = self.objects[index]
+            bullet.update_lightning_phases(targets, registry)
+            self.velocity_x[index] = bullet.direction_x * bullet.speed
+            self.velocity_y[index] = bullet.direction_y * bullet.speed
+
+        alive = self.alive[:count]
+        x = self.x[:count]
+        y = self.y[:count]
+
+        # 所有子彈一起移動
+        x += self.velocity_x[:count] * alive
+        y += self.velocity_y[:count] * alive
+
+        # 更新飛行距離（和逐顆更新一樣是離起點的直線距離，只更新還在飛的子彈），
+        # 超出射程的子彈失效
+        distance_x = x - self.start_x[:count]
+        distance_y = y - self.start_y[:count]
+        distance_traveled = self.distance_traveled[:count]
+        np.copyto(
+            distance_traveled,
+            np.sqrt(distance_x * distance_x + distance_y * distance_y),
+            where=alive,
+        )
+        alive &= ~(distance_traveled > self.max_distance[:count])
+
+        self.compact()
+        self.sync_objects()
+
+    def compact(self):
+        """
+        移除失效子彈，存活的子彈往前移並保持原本順序\n
+        """
+        count = self.count
+        alive = self.alive[:count]
+        if alive.all():
+            return
+
+        keep_rows = np.nonzero(alive)[0]
+        new_count = len(keep_rows)
+
+        # 失效子彈的最後狀態要在陣列往前移之前寫回物件，之後這些列就被覆蓋了
+        objects = self.objects
+        for index in np.nonzero(~alive)[0].tolist():
+            bullet = objects[index]
+            bullet.is_active = False
+            bullet.x = self.x[index].item()
+            bullet.y = self.y[index].item()
+            bullet.distance_traveled = self.distance_traveled[index].item()
+            bullet.update_rect()
+
+        for array in self.get_arrays().values():
+            array[:new_count] = array[keep_rows]
+
+        self.objects = [objects[index] for index in keep_rows.tolist()]
+        self.count = new_count
+
+    def sync_objects(self):
+        """
+        把陣列裡的位置和飛行距離寫回子彈物件，讓繪製和其他系統讀到最新狀態\n
+        """
+        count = self.count
+        x_values = self.x[:count].tolist()
+        y_values = self.y[:count].tolist()
+        distance_values = self.distance_traveled[:count].tolist()
+        # astype(int) 和 int() 一樣往 0 取整，碰撞矩形和原本的 update_rect 一致
+        rect_x_values = self.x[:count].astype(np.int64).tolist()
+        rect_y_values = self.y[:count].astype(np.int64).tolist()
+
+        for bullet, x, y, distance, rect_x, rect_y in zip(
+            self.objects,
+            x_values,
+            y_values,
+            distance_values,
+            rect_x_values,
+            rect_y_values,
+        ):
+            bullet.x = x
+            bullet.y = y
+            bullet.distance_traveled = distance
+            bullet.rect.x = rect_x
+            bullet.rect.y = rect_y
+
+    def find_hits(self, targets):
+        """
+        批次檢查子彈和目標的矩形碰撞\n
+        \n
+        每顆子彈只會擊中一個目標，也就是目標列表裡第一個重疊的目標，\n
+        和逐顆子彈、逐個目標呼叫 colliderect 的結果相同。\n
+        \n
+        參數:\n
+        targets (list): 可能被子彈擊中的目標列表\n
+        \n
+        回傳:\n
+        list: (子彈列索引, 子彈物件, 目標物件) 的列表，依照子彈順序排列\n
+        """
+        count = self.count
+        if count == 0 or not targets:
+            return []
+
+        # 收集目標矩形，寬高為 0 的矩形和 colliderect 一樣不算碰撞
+        target_objects = []
+        target_boxes = []
+        for target in targets:
+            rect = target.rect
+            if rect.width > 0 and rect.height > 0:
+                target_objects.append(target)
+                target_boxes.append((rect.left, rect.top, rect.right, rect.bottom))
+
+        if not target_objects:
+            return []
+
+        boxes = np.array(target_boxes, dtype=np.int64)
+        bullet_left = self.x[:count].astype(np.int64)[:, None]
+        bullet_top = self.y[:count].astype(np.int64)[:, None]
+
+        overlaps = (
+            (bullet_left < boxes[:, 2])
+            & (bullet_left + BULLET_SIZE > boxes[:, 0])
+            & (bullet_top < boxes[:, 3])
+            & (bullet_top + BULLET_SIZE > boxes[:, 1])
+        )
+        overlaps &= self.alive[:count, None]
+
+        hit_rows = np.nonzero(overlaps.any(axis=1))[0]
+        if len(hit_rows) == 0:
+            return []
+
+        first_targets = overlaps[hit_rows].argmax(axis=1)
+
+        hits = []
+        for index, target_index in zip(hit_rows.tolist(), first_targets.tolist()):
+            hits.append((index, self.objects[index], target_objects[target_index]))
+        return hits
+
+    def deactivate(self, index):
+        """
+        讓指定列的子彈失效 - 擊中目標後呼叫，下次更新時移除\n
+        \n
+        參數:\n
+        index (int): find_hits 回傳的子彈列索引\n
+        """
+        self.alive[index] = False
+        self.objects[index].is_active = False
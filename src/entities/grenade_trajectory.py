@@ -0,0 +1,437 @@
+######################載入套件######################
+import math
+
+import pygame
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+except ImportError:
+    from src.config import *
+
+######################拋物線計算######################
+
+
+def solve_below_zero(a, b, c):
+    """
+    找出 a*n^2 + b*n + c < 0 的 n 範圍（a >= 0）\n
+    \n
+    參數:\n
+    a (float): 二次項係數\n
+    b (float): 一次項係數\n
+    c (float): 常數項\n
+    \n
+    回傳:\n
+    tuple: (下界, 上界)，沒有解時回傳 None\n
+    """
+    if a == 0:
+        if b == 0:
+            return (-math.inf, math.inf) if c < 0 else None
+        root = -c / b
+        return (-math.inf, root) if b > 0 else (root, math.inf)
+
+    discriminant = b * b - 4 * a * c
+    if discriminant <= 0:
+        return None
+    root = math.sqrt(discriminant)
+    return ((-b - root) / (2 * a), (-b + root) / (2 * a))
+
+
+def intersect_ranges(first, second):
+    """
+    取兩個範圍的交集\n
+    \n
+    參數:\n
+    first (tuple): (下界, 上界)\n
+    second (tuple): (下界, 上界)\n
+    \n
+    回傳:\n
+    tuple: 交集範圍，沒有交集時回傳 None\n
+    """
+    low = max(first[0], second[0])
+    high = min(first[1], second[1])
+    return (low, high) if low <= high else None
+
+
+######################手榴彈軌跡預測類別######################
+
+
+class GrenadeTrajectory:
+    """
+    手榴彈軌跡預測 - 用公式直接算出拋物線和落點，結果快取到輸入改變為止\n
+    \n
+    手榴彈每一步先加重力再移動，所以第 n 步的位置剛好落在一條拋物線上：\n
+    x = x0 + vx * n，y = y0 + vy * n + g * n * (n + 1) / 2。\n
+    落點不必一步一步模擬，而是用空間網格找出拋物線經過範圍內的平台，\n
+    對每個平台解出重疊的步數範圍，只在範圍內確認實際碰撞。\n
+    \n
+    特點：\n
+    1. 投擲位置、方向和平台網格都沒變時直接使用上次的結果\n
+    2. 預測點和 Grenade 的物理一致（碰撞判定和原本逐步模擬相同）\n
+    3. 公式可以在兩步之間取點，畫出來的曲線更平滑，不增加碰撞計算\n
+    4. 虛線段事先算好放在緩衝區，每幀只需要扣掉攝影機偏移再畫\n
+    """
+
+    def __init__(self):
+        self.cache_key = None  # 上次計算時的輸入
+        self.points = []  # 每一步的預測位置（世界座標）
+        self.dashes = []  # 虛線段緩衝區：(顏色, 線寬, 起點, 終點)，世界座標
+
+        # 目前計算中的拋物線
+        self.start_x = 0
+        self.start_y = 0
+        self.velocity_x = 0
+        self.velocity_y = 0
+
+    def update(
+        self, start_x, start_y, direction_x, direction_y, platform_grid, max_steps
+    ):
+        """
+        計算新的預測路徑，輸入和上次相同時直接略過\n
+        \n
+        參數:\n
+        start_x (float): 投擲點 X 座標\n
+        start_y (float): 投擲點 Y 座標\n
+        direction_x (float): 投擲方向 X 分量\n
+        direction_y (float): 投擲方向 Y 分量\n
+        platform_grid (SpatialGrid): 關卡平台空間網格，用於碰撞檢測，None 表示沒有平台\n
+        max_steps (int): 最多預測幾個更新步\n
+        \n
+        回傳:\n
+        bool: True 表示重新計算過\n
+        """
+        # 空間網格的 version 會在平台改變時增加，換了網格或載入新關卡段都會重算
+        platform_version = platform_grid.version if platform_grid is not None else None
+        cache_key = (
+            start_x,
+            start_y,
+            direction_x,
+            direction_y,
+            max_steps,
+            id(platform_grid),
+            platform_version,
+        )
+
+        if cache_key == self.cache_key:
+            return False
+
+        self.start_x = start_x
+        self.start_y = start_y
+        self.velocity_x = direction_x * GRENADE_SPEED
+        self.velocity_y = direction_y * GRENADE_SPEED
+
+        # 先找出飛出預測範圍的步數，碰撞只需要檢查到那一步
+        exit_step = self.find_exit_step(max_steps)
+        step_limit = min(max_steps, exit_step)
+        hit_step = (
+            self.find_hit_step(platform_grid, step_limit)
+            if platform_grid is not None
+            else None
+        )
+
+        if hit_step is not None:
+            # 在碰撞點結束軌跡
+            last_step = hit_step
+        else:
+            last_step = min(exit_step - 1, max_steps - 1)
+
+        self.points = [self.position_at(step) for step in range(last_step + 1)]
+        self.dashes = self.build_dashes(last_step)
+        self.cache_key = cache_key
+        return True
+
+    def position_at(self, step):
+        """
+        計算第 step 步的位置\n
+        \n
+        參數:\n
+        step (float): 步數，可以是小數（兩步之間的曲線）\n
+        \n
+        回傳:\n
+        tuple: (x, y) 世界座標\n
+        """
+        return (
+            self.start_x + self.velocity_x * step,
+            self.start_y
+            + self.velocity_y * step
+            + GRENADE_GRAVITY * step * (step + 1) / 2,
+        )
+
+    def is_out_of_range(self, step):
+        """
+        檢查第 step 步是否已經離投擲點太遠\n
+        \n
+        參數:\n
+        step (int): 步數\n
+        \n
+        回傳:\n
+        bool: True 表示超出預測範圍\n
+        """
+        x, y = self.position_at(step)
+        return (
+            abs(x - self.start_x) > GRENADE_TRAJECTORY_RANGE_X
+            or abs(y - self.start_y) > GRENADE_TRAJECTORY_RANGE_Y
+        )
+
+    def find_exit_step(self, max_steps):
+        """
+        找出第一個超出預測範圍的步數\n
+        \n
+        先用公式解出離開範圍的時間，再從那附近確認實際的步數\n
+        \n
+        參數:\n
+        max_steps (int): 最多預測幾個更新步\n
+        \n
+        回傳:\n
+        int: 超出範圍的步數，max_steps 之內都沒有超出時回傳 max_steps + 1\n
+        """
+        # 垂直位移 = a * n^2 + b * n
+        a = GRENADE_GRAVITY / 2
+        b = self.velocity_y + GRENADE_GRAVITY / 2
+
+        exit_time = math.inf
+        if self.velocity_x != 0:
+            exit_time = GRENADE_TRAJECTORY_RANGE_X / abs(self.velocity_x)
+
+        # 往下超出：位移 < 範圍 的區間結束的時候
+        below = solve_below_zero(a, b, -GRENADE_TRAJECTORY_RANGE_Y)
+        if below is None:
+            exit_time = 0
+        else:
+            exit_time = min(exit_time, below[1])
+
+        # 往上超出：位移 < -範圍 的區間開始的時候
+        above = solve_below_zero(a, b, GRENADE_TRAJECTORY_RANGE_Y)
+        if above is not None and above[1] > 0:
+            exit_time = min(exit_time, max(above[0], 0))
+
+        step = max(1, int(min(exit_time, max_steps + 1)))
+        while step <= max_steps and not self.is_out_of_range(step):
+            step += 1
+        return step
+
+    def find_hit_step(self, platform_grid, step_limit):
+        """
+        找出第一個碰到平台的步數\n
+        \n
+        參數:\n
+        platform_grid (SpatialGrid): 關卡平台空間網格\n
+        step_limit (int): 最多檢查到第幾步\n
+        \n
+        回傳:\n
+        int: 碰撞的步數，沒有碰撞時回傳 None\n
+        """
+        if step_limit < 1:
+            return None
+
+        half_size = GRENADE_SIZE // 2
+        a = GRENADE_GRAVITY / 2
+        b = self.velocity_y + GRENADE_GRAVITY / 2
+
+        # 只查詢拋物線經過範圍內的平台（頂點在範圍內時也要算進去）
+        end_x, end_y = self.position_at(step_limit)
+        y_values = [self.start_y, end_y]
+        if a > 0 and 0 < -b / (2 * a) < step_limit:
+            y_values.append(self.position_at(-b / (2 * a))[1])
+        margin = GRENADE_SIZE + 1
+        left = min(self.start_x, end_x) - margin
+        top = min(y_values) - margin
+        search_rect = pygame.Rect(
+            int(left),
+            int(top),
+            int(max(self.start_x, end_x) + margin - left) + 1,
+            int(max(y_values) + margin - top) + 1,
+        )
+
+        hit_step = None
+        for platform in platform_grid.query_rect(search_rect):
+            limit = step_limit if hit_step is None else hit_step - 1
+            step = self.find_platform_hit(platform.rect, limit, half_size, a, b)
+            if step is not None:
+                hit_step = step
+        return hit_step
+
+    def find_platform_hit(self, rect, step_limit, half_size, a, b):
+        """
+        找出第一個碰到指定平台的步數\n
+        \n
+        手榴彈碰撞框的座標會被 pygame.Rect 取整，\n
+        所以先用放寬一像素的範圍解出可能重疊的步數，再逐一確認\n
+        \n
+        參數:\n
+        rect (pygame.Rect): 平台碰撞矩形\n
+        step_limit (int): 最多檢查到第幾步\n
+        half_size (int): 手榴彈碰撞框的一半大小\n
+        a (float): 垂直位移的二次項係數\n
+        b (float): 垂直位移的一次項係數\n
+        \n
+        回傳:\n
+        int: 碰撞的步數，沒有碰撞時回傳 None\n
+        """
+        if step_limit < 1:
+            return None
+
+        # 碰撞框中心可能重疊平台的範圍
+        low_x = rect.left - GRENADE_SIZE + half_size - 1
+        high_x = rect.right + half_size + 1
+        low_y = rect.top - GRENADE_SIZE + half_size - 1
+        high_y = rect.bottom + half_size + 1
+
+        # 水平方向：直線，重疊的步數是一段區間
+        if self.velocity_x != 0:
+            first = (low_x - self.start_x) / self.velocity_x
+            second = (high_x - self.start_x) / self.velocity_x
+            x_range = (min(first, second), max(first, second))
+        elif low_x < self.start_x < high_x:
+            x_range = (-math.inf, math.inf)
+        else:
+            return None
+        x_range = intersect_ranges(x_range, (1, step_limit))
+        if x_range is None:
+            return None
+
+        # 垂直方向：y < high_y 的區間扣掉 y <= low_y 的區間，最多分成前後兩段
+        under_bottom = solve_below_zero(a, b, self.start_y - high_y)
+        if under_bottom is None:
+            return None
+        above_top = solve_below_zero(a, b, self.start_y - low_y)
+        if above_top is None:
+            y_ranges = [under_bottom]
+        else:
+            y_ranges = [
+                (under_bottom[0], min(under_bottom[1], above_top[0])),
+                (max(under_bottom[0], above_top[1]), under_bottom[1]),
+            ]
+
+        for y_range in y_ranges:
+            step_range = intersect_ranges(x_range, y_range)
+            if step_range is None:
+                continue
+            for step in range(
+                max(1, math.ceil(step_range[0])), int(step_range[1]) + 1
+            ):
+                # 和 Grenade 相同的碰撞框確認實際是否重疊
+                x, y = self.position_at(step)
+                grenade_rect = pygame.Rect(
+                    x - half_size, y - half_size, GRENADE_SIZE, GRENADE_SIZE
+                )
+                if grenade_rect.colliderect(rect):
+                    return step
+        return None
+
+    def build_dashes(self, last_step):
+        """
+        把預測路徑切成虛線段，存進緩衝區\n
+        \n
+        在每兩步之間多取幾個點組成平滑曲線，沿著曲線長度每隔固定距離切出一段虛線\n
+        \n
+        參數:\n
+        last_step (int): 路徑最後一步\n
+        \n
+        回傳:\n
+        list: (顏色, 線寬, 起點, 終點) 的列表，世界座標\n
+        """
+        samples = GRENADE_TRAJECTORY_SAMPLES_PER_STEP
+        curve = [
+            self.position_at(index / samples)
+            for index in range(last_step * samples + 1)
+        ]
+        segment_count = len(curve) - 1
+        if segment_count < 1:
+            return []
+
+        # 曲線上每個點到起點的累積長度
+        lengths = [0.0]
+        for index in range(segment_count):
+            start_x, start_y = curve[index]
+            end_x, end_y = curve[index + 1]
+            lengths.append(lengths[-1] + math.hypot(end_x - start_x, end_y - start_y))
+        total_length = lengths[-1]
+
+        dashes = []
+        index = 0
+        dash_start = 0.0
+        while dash_start < total_length:
+            start, index = self.point_on_curve(curve, lengths, dash_start, index)
+            dash_end = min(dash_start + GRENADE_TRAJECTORY_DASH_LENGTH, total_length)
+            end, _ = self.point_on_curve(curve, lengths, dash_end, index)
+
+            # 軌跡顏色隨著距離漸變（綠色到黃色到紅色），線寬隨距離變細
+            distance_ratio = index / segment_count
+            if distance_ratio < 0.5:
+                # 前半段：綠色到黃色
+                color_ratio = distance_ratio * 2
+                color = (
+                    int(GRENADE_COLOR[0] + (255 - GRENADE_COLOR[0]) * color_ratio),
+                    int(GRENADE_COLOR[1]),
+                    int(GRENADE_COLOR[2] * (1 - color_ratio)),
+                )
+            else:
+                # 後半段：黃色到紅色
+                color_ratio = (distance_ratio - 0.5) * 2
+                color = (255, int(255 * (1 - color_ratio)), 0)
+            line_width = max(1, 3 - int(distance_ratio * 2))
+
+            dashes.append((color, line_width, start, end))
+            dash_start = dash_end + GRENADE_TRAJECTORY_GAP_LENGTH
+
+        return dashes
+
+    @staticmethod
+    def point_on_curve(curve, lengths, distance, index):
+        """
+        找出曲線上離起點指定長度的位置\n
+        \n
+        參數:\n
+        curve (list): 曲線上的點\n
+        lengths (list): 每個點到起點的累積長度\n
+        distance (float): 離起點的長度\n
+        index (int): 從第幾段開始往後找（依序查詢時不用從頭找）\n
+        \n
+        回傳:\n
+        tuple: ((x, y), 所在線段編號)\n
+        """
+        last_index = len(curve) - 2
+        while index < last_index and lengths[index + 1] < distance:
+            index += 1
+
+        start_x, start_y = curve[index]
+        end_x, end_y = curve[index + 1]
+        segment_length = lengths[index + 1] - lengths[index]
+        ratio = 0
+        if segment_length > 0:
+            ratio = (distance - lengths[index]) / segment_length
+        return (
+            (start_x + (end_x - start_x) * ratio, start_y + (end_y - start_y) * ratio),
+            index,
+        )
+
+    def draw(self, screen, camera_x=0, camera_y=0):
+        """
+        從緩衝區繪製虛線軌跡\n
+        \n
+        參數:\n
+        screen (pygame.Surface): 要繪製到的螢幕表面\n
+        camera_x (int): 攝影機 x 偏移\n
+        camera_y (int): 攝影機 y 偏移\n
+        """
+        for color, line_width, start, end in self.dashes:
+            start_x = start[0] - camera_x
+            start_y = start[1] - camera_y
+
+            # 只繪製在螢幕範圍內的線段
+            if (
+                start_x < -50
+                or start_x > SCREEN_WIDTH + 50
+                or start_y < -50
+                or start_y > SCREEN_HEIGHT + 50
+            ):
+                continue
+
+            pygame.draw.line(
+                screen,
+                color,
+                (int(start_x), int(start_y)),
+                (int(end[0] - camera_x), int(end[1] - camera_y)),
+                line_width,
+            )
@@ -0,0 +1,418 @@
+######################載入套件######################
+from operator import attrgetter
+
+# numpy 是選用套件，沒安裝時怪物管理器會改回逐隻更新
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+    from .monsters import LavaMonster, WaterMonster
+    from ..core.entity_registry import BOSS
+    from ..core.game_session import get_game_time
+except ImportError:
+    from src.config import *
+    from src.entities.monsters import LavaMonster, WaterMonster
+    from src.core.entity_registry import BOSS
+    from src.core.game_session import get_game_time
+
+######################批次欄位######################
+
+# 可以批次更新的怪物類型：AI 和物理完全使用 Monster 的預設行為
+# 用 type() 比對而不是 isinstance，子類別改寫行為時會自動回到逐隻更新
+BATCHED_MONSTER_TYPES = (LavaMonster, WaterMonster)
+
+# 每一幀從怪物物件讀出的欄位，順序就是陣列的欄位順序
+CROWD_FIELDS = (
+    "x",
+    "y",
+    "width",
+    "height",
+    "velocity_x",
+    "velocity_y",
+    "on_ground",
+    "direction",
+    "knockback_velocity",
+    "knockback_direction",
+    "last_attack_time",
+    "attack_cooldown",
+    "attack_range",
+    "current_speed",
+    "lod_steps",
+)
+read_crowd_fields = attrgetter(*CROWD_FIELDS)
+
+######################怪物群批次更新類別######################
+
+
+class MonsterCrowd:
+    """
+    怪物群批次更新 - 用 numpy 陣列一次推進所有一般岩漿怪和水怪\n
+    \n
+    逐隻更新時每隻怪物都要跑狀態效果、追蹤 AI、擊退、重力、平台碰撞、\n
+    邊界限制，幾百隻怪物就會佔掉大半幀。這裡每一幀把位置、速度、狀態\n
+    讀進陣列，用幾次向量運算算完，再寫回怪物物件。\n
+    \n
+    怪物物件仍然是唯一的資料來源：近戰擊退、手榴彈、hack 模式生成都\n
+    直接修改怪物屬性，每一幀重新讀取就不會漏掉這些修改。\n
+    \n
+    特點：\n
+    1. 結果和逐隻呼叫 monster.update() 相同（同一個種子重播會得到同樣的狀態）\n
+    2. 攻擊玩家、發射投射物這類特殊行為仍由怪物物件自己處理\n
+    3. 同時碰到兩個以上平台的怪物交給 handle_collisions() 逐一處理，\n
+       只碰到一個平台（站在地上）的一般情況用陣列算完\n
+    4. Boss、龍捲風怪和其他改寫行為的怪物照舊逐隻更新，排在批次之後\n
+    \n
+    參數:\n
+    min_batch (int): 可批次的怪物少於這個數量時直接逐隻更新\n
+    """
+
+    def __init__(self, min_batch=MONSTER_CROWD_MIN_BATCH):
+        self.min_batch = min_batch
+        self.platform_key = None  # 平台矩形陣列對應的平台集合
+        self.platform_boxes = None  # 每個平台的 (left, top, right, bottom)
+
+    def get_platform_boxes(self, platform_grid):
+        """
+        取得平台矩形陣列 - 平台不會移動，平台集合沒變（網格版本相同）就重複使用\n
+        \n
+        參數:\n
+        platform_grid (SpatialGrid): 關卡平台空間網格\n
+        \n
+        回傳:\n
+        numpy.ndarray: 形狀 (平台數, 4) 的整數陣列\n
+        """
+        key = (id(platform_grid), platform_grid.version)
+        if key != self.platform_key:
+            boxes = [
+                (
+                    platform.rect.left,
+                    platform.rect.top,
+                    platform.rect.right,
+                    platform.rect.bottom,
+                )
+                for platform in platform_grid.items
+                if platform.rect.width > 0 and platform.rect.height > 0
+            ]
+            self.platform_boxes = np.array(boxes, dtype=np.int64).reshape(-1, 4)
+            self.platform_key = key
+        return self.platform_boxes
+
+    def update(self, monsters, player, platform_grid, level_width=None):
+        """
+        更新所有怪物 - 可批次的怪物一起算，其他怪物逐隻更新\n
+        \n
+        參數:\n
+        monsters (list): 怪物列表\n
+        player (Player): 玩家物件\n
+        platform_grid (SpatialGrid): 關卡平台空間網格\n
+        level_width (int): 關卡實際寬度\n
+        """
+        batch = []
+        others = []
+        for monster in monsters:
+            if not monster.is_alive:
+                continue
+            if (
+                type(monster) in BATCHED_MONSTER_TYPES
+                and BOSS not in monster.capabilities
+            ):
+                batch.append(monster)
+            else:
+                others.append(monster)
+
+        if len(batch) < self.min_batch:
+            # 數量少時陣列的固定成本比逐隻更新還高
+            for monster in monsters:
+                monster.update(player, platform_grid, level_width)
+            return
+
+        self.update_batch(batch, player, platform_grid, level_width)
+
+        for monster in others:
+            monster.update(player, platform_grid, level_width)
+
+    def update_batch(self, batch, player, platform_grid, level_width=None):
+        """
+        批次更新一般怪物 - 對應 Monster.update() 的三個步驟\n
+        \n
+        1. 狀態效果：有效果的怪物由物件自己計算速度，其他怪物直接用基礎速度\n
+        2. AI：能攻擊的怪物逐一呼叫 attack_player()，其他怪物一起朝玩家追蹤\n
+        3. 物理：擊退、重力、移動、平台碰撞、關卡邊界、掉落死亡\n
+        \n
+        參數:\n
+        batch (list): 存活的一般怪物（BATCHED_MONSTER_TYPES）\n
+        player (Player): 玩家物件\n
+        platform_grid (SpatialGrid): 關卡平台空間網格\n
+        level_width (int): 關卡實際寬度\n
+        """
+        for monster in batch:
+            if monster.status_effects:
+                monster.update_status_effects()
+            else:
+                monster.current_speed = monster.base_speed
+
+        data = np.array(list(map(read_crowd_fields, batch)), dtype=np.float64)
+        x = data[:, 0]
+        y = data[:, 1]
+        width = data[:, 2]
+        height = data[:, 3]
+        velocity_x = data[:, 4]
+        velocity_y = data[:, 5]
+        on_ground = data[:, 6] != 0
+        direction = data[:, 7]
+        knockback_velocity = data[:, 8]
+        knockback_direction = data[:, 9]
+        last_attack_time = data[:, 10]
+        attack_cooldown = data[:, 11]
+        attack_range = data[:, 12]
+        current_speed = data[:, 13]
+        steps = data[:, 14]
+        count = len(batch)
+
+        ######################AI：攻擊或追蹤######################
+
+        dx = player.x - x
+        dy = player.y - y
+        distance = np.sqrt(dx * dx + dy * dy)
+
+        # 玩家在某一隻怪物的攻擊下倒地後，排在後面的怪物既不攻擊也不追蹤
+        stop_row = count if player.is_alive else 0
+        attacked = np.zeros(count, dtype=bool)
+        if stop_row > 0:
+            can_attack = (get_game_time() - last_attack_time >= attack_cooldown) & (
+                distance <= attack_range
+            )
+            for row in np.flatnonzero(can_attack).tolist():
+                monster = batch[row]
+                monster.attack_player(player)
+                attacked[row] = True
+
+                # 攻擊可能改變怪物速度（例如水怪衝刺），讀回來再算物理
+                velocity_x[row] = monster.velocity_x
+                velocity_y[row] = monster.velocity_y
+
+                if not player.is_alive:
+                    stop_row = row + 1
+                    break
+
+        chasing = ~attacked & (distance > 0)
+        chasing[stop_row:] = False
+
+        safe_distance = np.where(chasing, distance, 1.0)
+        velocity_x[:] = np.where(
+            chasing, dx / safe_distance * (current_speed * 1.1), velocity_x
+        )
+        velocity_y[chasing & (dy < -30) & on_ground] = -15
+        velocity_x[chasing & (distance > 300)] *= 1.2
+
+        ######################物理：擊退、重力、移動######################
+
+        # 降頻更新的怪物一次推進 lod_steps 步，算法和 Monster.update_physics() 相同
+        knocked = knockback_velocity > 0
+        if knocked.any():
+            knockback_total = np.zeros(count)
+            for step in range(int(steps[knocked].max())):
+                stepping = knocked & (steps > step)
+                knockback_total[stepping] += knockback_velocity[stepping]
+                knockback_velocity[stepping] *= 0.8
+            velocity_x[:] = np.where(
+                knocked,
+                velocity_x + knockback_direction * (knockback_total / steps),
+                velocity_x,
+            )
+            knockback_velocity[knocked & (knockback_velocity < 1)] = 0
+
+        airborne = ~on_ground
+        velocity_y[airborne] = np.minimum(
+            velocity_y[airborne] + GRAVITY * steps[airborne], MAX_FALL_SPEED
+        )
+
+        # 單步時 clip 不會改變數值；多步時移動距離不超過單步的最大落下速度
+        limit_x = np.maximum(np.abs(velocity_x), MAX_FALL_SPEED)
+        limit_y = np.maximum(np.abs(velocity_y), MAX_FALL_SPEED)
+        x += np.clip(velocity_x * steps, -limit_x, limit_x)
+        y += np.clip(velocity_y * steps, -limit_y, limit_y)
+
+        ######################平台碰撞######################
+
+        on_ground[:] = False
+        self.resolve_platform_collisions(batch, platform_grid, data, on_ground)
+
+        ######################關卡邊界######################
+
+        actual_width = level_width if level_width is not None else SCREEN_WIDTH
+        left_out = x < 0
+        right_out = ~left_out & (x + width > actual_width)
+        x[left_out] = 0
+        direction[left_out] = 1
+        x[right_out] = actual_width - width[right_out]
+        direction[right_out] = -1
+
+        # 掉出螢幕底部就死亡
+        for row in np.flatnonzero(y > SCREEN_HEIGHT + 100).tolist():
+            batch[row].is_alive = False
+
+        ######################寫回怪物物件######################
+
+        # astype(int) 和 int() 一樣往 0 取整，碰撞矩形和 update_rect() 一致
+        for (
+            monster,
+            new_x,
+            new_y,
+            new_velocity_x,
+            new_velocity_y,
+            new_on_ground,
+            new_direction,
+            new_knockback_velocity,
+            was_attacking,
+            rect_x,
+            rect_y,
+            rect_width,
+            rect_height,
+        ) in zip(
+            batch,
+            x.tolist(),
+            y.tolist(),
+            velocity_x.tolist(),
+            velocity_y.tolist(),
+            on_ground.tolist(),
+            direction.astype(np.int64).tolist(),
+            knockback_velocity.tolist(),
+            attacked.tolist(),
+            x.astype(np.int64).tolist(),
+            y.astype(np.int64).tolist(),
+            width.astype(np.int64).tolist(),
+            height.astype(np.int64).tolist(),
+        ):
+            monster.x = new_x
+            monster.y = new_y
+            monster.velocity_x = new_velocity_x
+            monster.velocity_y = new_velocity_y
+            monster.on_ground = new_on_ground
+            monster.direction = new_direction
+            monster.knockback_velocity = new_knockback_velocity
+            monster.ai_state = "attack" if was_attacking else "chase"
+            monster.rect.update(rect_x, rect_y, rect_width, rect_height)
+
+    def resolve_platform_collisions(self, batch, platform_grid, data, on_ground):
+        """
+        批次處理怪物和平台的碰撞 - 對應 Monster.handle_collisions() 的一般怪物分支\n
+        \n
+        只碰到一個平台的怪物用陣列算出碰撞方向並修正位置，\n
+        碰到兩個以上平台時，處理順序會影響結果，交給怪物物件逐一處理。\n
+        \n
+        參數:\n
+        batch (list): 批次更新的怪物\n
+        platform_grid (SpatialGrid): 關卡平台空間網格\n
+        data (numpy.ndarray): 怪物欄位陣列，修正結果直接寫回\n
+        on_ground (numpy.ndarray): 是否站在地上，修正結果直接寫回\n
+        """
+        boxes = self.get_platform_boxes(platform_grid)
+        if len(boxes) == 0:
+            return
+
+        x = data[:, 0]
+        y = data[:, 1]
+        width = data[:, 2]
+        height = data[:, 3]
+        velocity_x = data[:, 4]
+        velocity_y = data[:, 5]
+        direction = data[:, 7]
+
+        # 和 pygame.Rect(self.x, self.y, self.width, self.height) 一樣往 0 取整
+        left = x.astype(np.int64)
+        top = y.astype(np.int64)
+        right = left + width.astype(np.int64)
+        bottom = top + height.astype(np.int64)
+
+        # 先用整群怪物的範圍篩掉遠處的平台，碰撞矩陣只算附近的平台
+        nearby = (
+            (boxes[:, 0] < right.max())
+            & (boxes[:, 2] > left.min())
+            & (boxes[:, 1] < bottom.max())
+            & (boxes[:, 3] > top.min())
+        )
+        boxes = boxes[nearby]
+        if len(boxes) == 0:
+            return
+
+        overlaps = (
+            (left[:, None] < boxes[:, 2])
+            & (right[:, None] > boxes[:, 0])
+            & (top[:, None] < boxes[:, 3])
+            & (bottom[:, None] > boxes[:, 1])
+        )
+        overlap_counts = overlaps.sum(axis=1)
+
+        # 同時碰到多個平台：交給物件依照平台順序逐一處理
+        for row in np.flatnonzero(overlap_counts > 1).tolist():
+            monster = batch[row]
+            monster.x = x[row].item()
+            monster.y = y[row].item()
+            monster.velocity_x = velocity_x[row].item()
+            monster.velocity_y = velocity_y[row].item()
+            monster.direction = int(direction[row])
+            monster.handle_collisions(platform_grid)
+            x[row] = monster.x
+            y[row] = monster.y
+            velocity_y[row] = monster.velocity_y
+            direction[row] = monster.direction
+            on_ground[row] = monster.on_ground
+
+        rows = np.flatnonzero(overlap_counts == 1)
+        if len(rows) == 0:
+            return
+
+        box = boxes[overlaps[rows].argmax(axis=1)]
+        platform_left = box[:, 0]
+        platform_top = box[:, 1]
+        platform_right = box[:, 2]
+        platform_bottom = box[:, 3]
+
+        overlap_left = right[rows] - platform_left
+        overlap_right = platform_right - left[rows]
+        overlap_top = bottom[rows] - platform_top
+        overlap_bottom = platform_bottom - top[rows]
+        min_overlap = np.minimum(
+            np.minimum(overlap_left, overlap_right),
+            np.minimum(overlap_top, overlap_bottom),
+        )
+
+        row_velocity_x = velocity_x[rows]
+        row_velocity_y = velocity_y[rows]
+
+        # 和 handle_collisions 的 if/elif 順序相同：上、下、左、右
+        land = (min_overlap == overlap_top) & (row_velocity_y > 0)
+        hit_ceiling = ~land & (min_overlap == overlap_bottom) & (row_velocity_y < 0)
+        handled = land | hit_ceiling
+        hit_left = ~handled & (min_overlap == overlap_left) & (row_velocity_x > 0)
+        handled |= hit_left
+        hit_right = ~handled & (min_overlap == overlap_right) & (row_velocity_x < 0)
+
+        # 從上方落到平台上
+        land_rows = rows[land]
+        y[land_rows] = platform_top[land] - height[land_rows]
+        velocity_y[land_rows] = 0
+        on_ground[land_rows] = True
+
+        # 從下方撞到平台
+        ceiling_rows = rows[hit_ceiling]
+        y[ceiling_rows] = platform_bottom[hit_ceiling]
+        velocity_y[ceiling_rows] = 0
+
+        # 從左側撞到平台
+        left_rows = rows[hit_left]
+        x[left_rows] = platform_left[hit_left] - width[left_rows]
+        direction[left_rows] = -1
+
+        # 從右側撞到平台
+        right_rows = rows[hit_right]
+        x[right_rows] = platform_right[hit_right]
+        direction[right_rows] = 1
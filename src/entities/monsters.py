@@ -1,16 +1,29 @@
 ######################載入套件######################
 import pygame
 import math
-import random
-import time
 
 # 支援直接執行和模組執行兩種方式
 try:
     from ..config import *
     from ..core.game_objects import GameObject, StatusEffect
+    from ..core.entity_registry import BOSS, DAMAGEABLE, KNOCKBACKABLE
+    from ..core.entity_registry import STATUS_AFFECTED
+    from ..utils.spatial_grid import query_nearby
+    from ..utils.asset_cache import get_image
+    from ..utils.game_logger import get_logger
+    from ..core.game_session import get_rng, get_game_time
 except ImportError:
     from src.config import *
     from src.core.game_objects import GameObject, StatusEffect
+    from src.core.entity_registry import BOSS, DAMAGEABLE, KNOCKBACKABLE
+    from src.core.entity_registry import STATUS_AFFECTED
+    from src.utils.spatial_grid import query_nearby
+    from src.utils.asset_cache import get_image
+    from src.utils.game_logger import get_logger
+    from src.core.game_session import get_rng, get_game_time
+
+log = get_logger("monsters")
+rng = get_rng()
 
 ######################基礎怪物類別######################
 
@@ -37,6 +50,9 @@ class Monster(GameObject):
     speed (float): 移動速度\n
     """
 
+    # 會受傷、會被擊退、會被屬性子彈影響；成為Boss時再加上 BOSS
+    capabilities = frozenset((DAMAGEABLE, KNOCKBACKABLE, STATUS_AFFECTED))
+
     def __init__(
         self,
         x,
@@ -61,13 +77,10 @@ class Monster(GameObject):
         self.current_speed = speed
         self.allow_platform_collision = allow_platform_collision  # 是否受平台碰撞限制
 
-        # Boss相關屬性
-        self.is_boss = False  # 標記是否為Boss
-
         # 移動相關
         self.velocity_x = 0
         self.velocity_y = 0
-        self.direction = random.choice([-1, 1])  # 隨機初始方向
+        self.direction = rng.choice([-1, 1])  # 隨機初始方向
         self.on_ground = False
 
         # 平台相關（防止掉落）
@@ -94,15 +107,44 @@ class Monster(GameObject):
         # 計分相關
         self.score_value = 100  # 基礎分數，各怪物類型可以覆蓋這個值
 
-    def update_status_effects(self):
+        # 投射物管理器（由怪物管理器指定，發射的投射物都交給它統一更新）
+        self.projectile_manager = None
+
+        # AI 細節層級（由怪物管理器排程，遠離畫面的怪物隔幾步才更新一次）
+        self.lod_steps = 1  # 這次更新要推進的模擬步數
+        self.lod_interval = 1  # 目前每幾步更新一次
+        self.lod_bucket = 0  # 分組編號，同樣間隔的怪物分散到不同的步更新
+        self.lod_last_tick = 0  # 上次更新時的排程步數
+
+    def fire_projectile(self, kind, x, y, velocity_x, velocity_y, damage, lifetime):
         """
-        更新所有狀態效果 - 移除過期效果並計算當前速度\n
+        發射投射物 - 交給投射物管理器統一移動、過期和碰撞\n
+        \n
+        參數:\n
+        kind (str): 投射物類型（lava_ball、water_bullet 等）\n
+        x (float): 發射點 X 座標\n
+        y (float): 發射點 Y 座標\n
+        velocity_x (float): X 速度\n
+        velocity_y (float): Y 速度\n
+        damage (int): 傷害值\n
+        lifetime (float): 存活時間（秒）\n
+        \n
+        回傳:\n
+        EnemyProjectile or None: 新的投射物，沒有投射物管理器時回傳 None\n
         """
-        # 移除過期的狀態效果
-        self.status_effects = [
-            effect for effect in self.status_effects if effect.is_active()
-        ]
+        if self.projectile_manager is None:
+            return None
+
+        return self.projectile_manager.spawn(
+            kind, self, x, y, velocity_x, velocity_y, damage, lifetime
+        )
 
+    def update_status_effects(self):
+        """
+        依照目前的狀態效果計算當前速度\n
+        \n
+        過期的效果由模擬時鐘觸發 remove_status_effect() 移除，這裡不用逐一檢查\n
+        """
         # 計算當前速度修正
         speed_modifier = 1.0
         for effect in self.status_effects:
@@ -120,9 +162,21 @@ class Monster(GameObject):
         duration (float): 持續時間（秒）\n
         intensity (float): 效果強度 (0.0-1.0)\n
         """
-        new_effect = StatusEffect(effect_type, duration, intensity)
+        new_effect = StatusEffect(
+            effect_type, duration, intensity, on_expire=self.remove_status_effect
+        )
         self.status_effects.append(new_effect)
 
+    def remove_status_effect(self, effect):
+        """
+        移除結束的狀態效果 - 由模擬時鐘在效果到期時呼叫\n
+        \n
+        參數:\n
+        effect (StatusEffect): 結束的效果\n
+        """
+        if effect in self.status_effects:
+            self.status_effects.remove(effect)
+
     def detect_player(self, player):
         """
         檢測玩家是否在偵測範圍內 - 修改為無限追蹤\n
@@ -153,14 +207,14 @@ class Monster(GameObject):
             return False
 
         # 檢查攻擊冷卻
-        current_time = time.time()
+        current_time = get_game_time()
         if current_time - self.last_attack_time < self.attack_cooldown:
             return False
 
         # 檢查攻擊距離
         dx = player.x - self.x
         dy = player.y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
+        distance = math.sqrt(dx * dx + dy * dy)
 
         return distance <= self.attack_range
 
@@ -177,7 +231,7 @@ class Monster(GameObject):
         # 計算朝向玩家的方向
         dx = player.x - self.x
         dy = player.y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
+        distance = math.sqrt(dx * dx + dy * dy)
 
         if distance > 0:
             # 正規化方向向量
@@ -203,7 +257,7 @@ class Monster(GameObject):
         self.velocity_x = self.direction * self.current_speed
 
         # 隨機改變方向的機率
-        if random.random() < 0.01:  # 1% 機率每幀改變方向
+        if rng.random() < 0.01:  # 1% 機率每幀改變方向
             self.direction *= -1
 
     def apply_knockback(self, force, direction):
@@ -232,7 +286,7 @@ class Monster(GameObject):
         if attack_type == "melee" and not self.monster_type.endswith("boss"):
             self.health = 0
             self.is_alive = False
-            print(f"💀 {self.monster_type}被甩槍攻擊秒殺！")
+            log.debug("💀 %s被甩槍攻擊秒殺！", self.monster_type)
             return True
 
         # 一般傷害處理
@@ -258,11 +312,11 @@ class Monster(GameObject):
 
         # 對玩家造成傷害
         damage_result = player.take_damage(self.damage)
-        self.last_attack_time = time.time()
+        self.last_attack_time = get_game_time()
 
         # 給玩家一個小的擊退效果
         direction = 1 if player.x > self.x else -1
-        if hasattr(player, "apply_knockback"):
+        if KNOCKBACKABLE in player.capabilities:
             player.apply_knockback(20, direction)
 
         return True
@@ -298,23 +352,38 @@ class Monster(GameObject):
         參數:\n
         platforms (list): 平台列表\n
         level_width (int): 關卡實際寬度，如果不提供則使用螢幕寬度\n
+        \n
+        遠離畫面的怪物降頻更新時（lod_steps 大於 1），一次推進多步：\n
+        擊退取這幾步的平均、重力乘上步數，移動距離不超過單步的最大落下速度，\n
+        避免一次移動太遠穿過平台\n
         """
+        steps = self.lod_steps
+
         # 應用擊退效果
         if self.knockback_velocity > 0:
-            self.velocity_x += self.knockback_direction * self.knockback_velocity
-            self.knockback_velocity *= 0.8  # 逐漸減弱
+            knockback_total = 0.0
+            for _ in range(steps):
+                knockback_total += self.knockback_velocity
+                self.knockback_velocity *= 0.8  # 逐漸減弱
+            self.velocity_x += self.knockback_direction * (knockback_total / steps)
             if self.knockback_velocity < 1:
                 self.knockback_velocity = 0
 
         # 應用重力
         if not self.on_ground:
-            self.velocity_y += GRAVITY
+            self.velocity_y += GRAVITY * steps
             if self.velocity_y > MAX_FALL_SPEED:
                 self.velocity_y = MAX_FALL_SPEED
 
         # 更新位置
-        self.x += self.velocity_x
-        self.y += self.velocity_y
+        if steps == 1:
+            self.x += self.velocity_x
+            self.y += self.velocity_y
+        else:
+            limit_x = max(abs(self.velocity_x), MAX_FALL_SPEED)
+            limit_y = max(abs(self.velocity_y), MAX_FALL_SPEED)
+            self.x += max(-limit_x, min(limit_x, self.velocity_x * steps))
+            self.y += max(-limit_y, min(limit_y, self.velocity_y * steps))
 
         # 檢查是否即將掉出所屬平台（已停用，讓怪物可以自由追蹤）
         # self.check_platform_boundary()
@@ -359,13 +428,13 @@ class Monster(GameObject):
         Boss模式下可以無條件穿牆，但仍需要正確地站在地板上\n
         """
         # 如果是Boss，穿牆但要檢查地板碰撞
-        if hasattr(self, "is_boss") and self.is_boss:
+        if BOSS in self.capabilities:
             # Boss模式：可以穿牆，但需要檢查地板以確保腳在地板上
             self.on_ground = False
             boss_rect = pygame.Rect(self.x, self.y, self.width, self.height)
 
             # 只檢查從上方落到平台的碰撞（地板檢測）
-            for platform in platforms:
+            for platform in query_nearby(platforms, boss_rect):
                 if boss_rect.colliderect(platform.rect):
                     # 計算重疊距離
                     overlap_top = boss_rect.bottom - platform.rect.top
@@ -396,7 +465,8 @@ class Monster(GameObject):
         self.on_ground = False
         monster_rect = pygame.Rect(self.x, self.y, self.width, self.height)
 
-        for platform in platforms:
+        # 透過空間網格只取出附近的平台
+        for platform in query_nearby(platforms, monster_rect):
             if monster_rect.colliderect(platform.rect):
                 # 計算重疊距離
                 overlap_left = monster_rect.right - platform.rect.left
@@ -560,7 +630,6 @@ class LavaMonster(Monster):
         # 岩漿怪的分數值（較高，因為比較強）
         self.score_value = 150
         self.last_lava_ball_time = 0
-        self.lava_balls = []  # 噴射的熔岩球列表
 
         # 新增：自動發射系統
         self.auto_fire_interval = 5.0  # Boss每5秒自動發射一次
@@ -571,7 +640,7 @@ class LavaMonster(Monster):
 
     def load_monster_image(self):
         """
-        載入岩漿怪圖片\n
+        載入岩漿怪圖片 - 從共用快取取得，同時準備好朝左的鏡像圖片\n
         \n
         回傳:\n
         pygame.Surface or None: 圖片表面，載入失敗則返回 None\n
@@ -584,20 +653,21 @@ class LavaMonster(Monster):
 
             if is_boss:
                 # Boss使用專用的岩漿Boss圖片
-                image = pygame.image.load(LAVA_BOSS_IMAGE_PATH).convert_alpha()
-                image = pygame.transform.scale(image, LAVA_BOSS_IMAGE_SIZE)
-                print(f"✅ 成功載入岩漿Boss圖片: {LAVA_BOSS_IMAGE_PATH}")
+                image_path = LAVA_BOSS_IMAGE_PATH
+                image_size = LAVA_BOSS_IMAGE_SIZE
             else:
                 # 普通岩漿怪使用小火怪圖片
-                image = pygame.image.load(LAVA_MONSTER_IMAGE_PATH).convert_alpha()
-                image = pygame.transform.scale(image, LAVA_MONSTER_IMAGE_SIZE)
-                print(f"✅ 成功載入岩漿怪圖片: {LAVA_MONSTER_IMAGE_PATH}")
+                image_path = LAVA_MONSTER_IMAGE_PATH
+                image_size = LAVA_MONSTER_IMAGE_SIZE
 
+            image = get_image(image_path, image_size)
+            self.flipped_image = get_image(image_path, image_size, "flip_x")
             return image
         except (pygame.error, FileNotFoundError) as e:
             # 圖片載入失敗，使用預設顏色繪製
-            print(f"⚠️ 載入岩漿怪圖片失敗: {e}")
-            print("🎨 將使用預設顏色矩形繪製")
+            log.warning(f"⚠️ 載入岩漿怪圖片失敗: {e}")
+            log.warning("🎨 將使用預設顏色矩形繪製")
+            self.flipped_image = None
             return None
 
     def reload_image_if_boss(self):
@@ -616,9 +686,9 @@ class LavaMonster(Monster):
         target_y (float): 目標 Y 座標\n
         \n
         回傳:\n
-        dict: 熔岩球資訊\n
+        EnemyProjectile or None: 熔岩球\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
 
         # 移除冷卻時間檢查，讓自動發射系統處理冷卻
         # 這樣create_lava_ball可以隨時被呼叫
@@ -635,44 +705,22 @@ class LavaMonster(Monster):
             direction_x = dx / distance
             direction_y = dy / distance
 
-            lava_ball = {
-                "x": start_x,
-                "y": start_y,
-                "velocity_x": direction_x * 8,  # 熔岩球速度
-                "velocity_y": direction_y * 8,
-                "damage": self.damage,
-                "lifetime": 3.0,  # 3秒後消失
-                "created_time": current_time,
-            }
-
-            self.lava_balls.append(lava_ball)
-            self.last_lava_ball_time = current_time
+            lava_ball = self.fire_projectile(
+                "lava_ball",
+                start_x,
+                start_y,
+                direction_x * 8,  # 熔岩球速度
+                direction_y * 8,
+                self.damage,
+                3.0,  # 3秒後消失
+            )
+
+            if lava_ball:
+                self.last_lava_ball_time = current_time
             return lava_ball
 
         return None
 
-    def update_lava_balls(self):
-        """
-        更新所有熔岩球的狀態\n
-        """
-        current_time = time.time()
-        active_balls = []
-
-        for ball in self.lava_balls:
-            # 檢查生存時間
-            if current_time - ball["created_time"] > ball["lifetime"]:
-                continue
-
-            # 更新位置
-            ball["x"] += ball["velocity_x"]
-            ball["y"] += ball["velocity_y"]
-
-            # 檢查是否超出螢幕
-            if 0 <= ball["x"] <= SCREEN_WIDTH and 0 <= ball["y"] <= SCREEN_HEIGHT:
-                active_balls.append(ball)
-
-        self.lava_balls = active_balls
-
     def attack_player(self, player):
         """
         岩漿怪的攻擊方式 - 僅近戰攻擊\n
@@ -686,49 +734,21 @@ class LavaMonster(Monster):
         # 只保留近戰攻擊
         return super().attack_player(player)
 
-    def check_lava_ball_collision(self, player):
-        """
-        檢查熔岩球與玩家的碰撞\n
-        \n
-        參數:\n
-        player (Player): 玩家物件\n
-        \n
-        回傳:\n
-        bool: True 表示有熔岩球擊中玩家\n
-        """
-        balls_to_remove = []
-        hit = False
-
-        for i, ball in enumerate(self.lava_balls):
-            ball_rect = pygame.Rect(ball["x"] - 8, ball["y"] - 8, 16, 16)
-
-            if ball_rect.colliderect(player.rect):
-                # 熔岩球擊中玩家
-                player.take_damage(ball["damage"])
-                balls_to_remove.append(i)
-                hit = True
-
-        # 移除擊中的熔岩球
-        for i in reversed(balls_to_remove):
-            del self.lava_balls[i]
-
-        return hit
-
     def auto_heal(self):
         """
         自動回血機制（僅限Boss模式）\n
         """
         # 只有當怪物被設定為Boss時才會回血
-        if not hasattr(self, "heal_cooldown") or not hasattr(self, "is_boss"):
+        if BOSS not in self.capabilities or not hasattr(self, "heal_cooldown"):
             return
 
-        current_time = time.time()
+        current_time = get_game_time()
         if current_time - self.last_heal_time >= self.heal_cooldown:
             if self.health < self.max_health:
                 old_health = self.health
                 self.health = min(self.max_health, self.health + self.heal_amount)
                 if self.health > old_health:
-                    print(f"💚 岩漿Boss回血：{old_health} → {self.health}")
+                    log.debug("💚 岩漿Boss回血：%s → %s", old_health, self.health)
 
             self.last_heal_time = current_time
 
@@ -744,17 +764,11 @@ class LavaMonster(Monster):
         super().update(player, platforms, level_width)
 
         if self.is_alive:
-            # 更新熔岩球
-            self.update_lava_balls()
-
-            # 檢查熔岩球碰撞
-            self.check_lava_ball_collision(player)
-
             # 如果是Boss模式，執行自動回血和自動發射
-            if self.is_boss:
+            if BOSS in self.capabilities:
                 self.auto_heal()
                 # Boss的自動發射系統 - 每5秒朝玩家發射火球
-                current_time = time.time()
+                current_time = get_game_time()
                 if current_time - self.last_auto_fire_time >= self.auto_fire_interval:
                     if player.is_alive:
                         # 朝玩家中心位置發射火球
@@ -765,11 +779,11 @@ class LavaMonster(Monster):
                         )
                         if lava_ball:
                             self.last_auto_fire_time = current_time
-                            print(f"🔥 岩漿Boss發射火球朝向玩家！")
+                            log.debug(f"🔥 岩漿Boss發射火球朝向玩家！")
 
     def draw(self, screen, camera_x=0, camera_y=0):
         """
-        繪製岩漿怪和熔岩球\n
+        繪製岩漿怪\n
         \n
         參數:\n
         screen (pygame.Surface): 要繪製到的螢幕表面\n
@@ -798,7 +812,11 @@ class LavaMonster(Monster):
         # 繪製岩漿怪本體
         if self.image is not None:
             # 使用圖片繪製
-            image_to_draw = self.image
+            # 根據方向使用預先翻轉好的圖片
+            if self.direction < 0:
+                image_to_draw = self.flipped_image
+            else:
+                image_to_draw = self.image
 
             # 如果有狀態效果，需要調整圖片顏色（簡化處理：在圖片上疊加半透明色塊）
             if current_color != self.color:
@@ -808,16 +826,12 @@ class LavaMonster(Monster):
                 )
                 color_overlay.fill((*current_color, 100))  # 半透明覆蓋
 
-                # 複製原圖並疊加顏色
-                image_to_draw = self.image.copy()
+                # 複製圖片並疊加顏色（快取的圖片是共用的，不能直接修改）
+                image_to_draw = image_to_draw.copy()
                 image_to_draw.blit(
                     color_overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2
                 )
 
-            # 根據方向翻轉圖片
-            if self.direction < 0:
-                image_to_draw = pygame.transform.flip(image_to_draw, True, False)
-
             # 檢查是否為Boss（根據當前尺寸判斷）
             is_boss = (
                 self.width > LAVA_MONSTER_WIDTH or self.height > LAVA_MONSTER_HEIGHT
@@ -874,22 +888,6 @@ class LavaMonster(Monster):
 
         pygame.draw.polygon(screen, WHITE, arrow_points)
 
-        # 繪製熔岩球（考慮攝影機偏移）
-        for ball in self.lava_balls:
-            ball_screen_x = ball["x"] - camera_x
-            ball_screen_y = ball["y"] - camera_y
-            # 只繪製在螢幕範圍內的熔岩球
-            if (
-                -20 <= ball_screen_x <= SCREEN_WIDTH + 20
-                and -20 <= ball_screen_y <= SCREEN_HEIGHT + 20
-            ):
-                pygame.draw.circle(
-                    screen, LAVA_COLOR, (int(ball_screen_x), int(ball_screen_y)), 8
-                )
-                pygame.draw.circle(
-                    screen, YELLOW, (int(ball_screen_x), int(ball_screen_y)), 4
-                )
-
 
 ######################水怪類別######################
 
@@ -926,7 +924,6 @@ class WaterMonster(Monster):
         # 水怪特殊屬性
         self.splash_cooldown = 2.5  # 水彈攻擊冷卻時間
         self.last_splash_time = 0
-        self.water_bullets = []  # 水彈列表
         self.dash_cooldown = 4.0  # 衝刺冷卻時間
         self.last_dash_time = 0
 
@@ -938,22 +935,22 @@ class WaterMonster(Monster):
 
     def load_monster_image(self):
         """
-        載入水怪圖片\n
+        載入水怪圖片 - 從共用快取取得，同時準備好朝左的鏡像圖片\n
         \n
         回傳:\n
         pygame.Surface or None: 圖片表面，載入失敗則返回 None\n
         """
         try:
-            # 載入圖片檔案
-            image = pygame.image.load(WATER_MONSTER_IMAGE_PATH).convert_alpha()
-            # 縮放到指定大小
-            image = pygame.transform.scale(image, WATER_MONSTER_IMAGE_SIZE)
-            print(f"✅ 成功載入水怪圖片: {WATER_MONSTER_IMAGE_PATH}")
+            image = get_image(WATER_MONSTER_IMAGE_PATH, WATER_MONSTER_IMAGE_SIZE)
+            self.flipped_image = get_image(
+                WATER_MONSTER_IMAGE_PATH, WATER_MONSTER_IMAGE_SIZE, "flip_x"
+            )
             return image
         except (pygame.error, FileNotFoundError) as e:
             # 圖片載入失敗，使用預設顏色繪製
-            print(f"⚠️ 載入水怪圖片失敗: {e}")
-            print("🎨 將使用預設顏色矩形繪製")
+            log.warning(f"⚠️ 載入水怪圖片失敗: {e}")
+            log.warning("🎨 將使用預設顏色矩形繪製")
+            self.flipped_image = None
             return None
 
     def create_water_splash(self, player):
@@ -966,7 +963,7 @@ class WaterMonster(Monster):
         回傳:\n
         list: 建立的水彈列表\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
         if current_time - self.last_splash_time < self.splash_cooldown:
             return []
 
@@ -984,19 +981,19 @@ class WaterMonster(Monster):
             angle_offset = (i - 2) * 0.3  # -0.6 到 +0.6 弧度
             angle = base_angle + angle_offset
 
-            bullet = {
-                "x": center_x,
-                "y": center_y,
-                "velocity_x": math.cos(angle) * 6,
-                "velocity_y": math.sin(angle) * 6,
-                "damage": self.damage // 2,  # 每發水彈傷害較低
-                "lifetime": 2.0,
-                "created_time": current_time,
-            }
+            bullet = self.fire_projectile(
+                "water_bullet",
+                center_x,
+                center_y,
+                math.cos(angle) * 6,
+                math.sin(angle) * 6,
+                self.damage // 2,  # 每發水彈傷害較低
+                2.0,
+            )
 
-            new_bullets.append(bullet)
+            if bullet:
+                new_bullets.append(bullet)
 
-        self.water_bullets.extend(new_bullets)
         self.last_splash_time = current_time
         return new_bullets
 
@@ -1010,7 +1007,7 @@ class WaterMonster(Monster):
         回傳:\n
         bool: True 表示成功發動衝刺\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
         if current_time - self.last_dash_time < self.dash_cooldown:
             return False
 
@@ -1030,28 +1027,6 @@ class WaterMonster(Monster):
 
         return False
 
-    def update_water_bullets(self):
-        """
-        更新所有水彈的狀態\n
-        """
-        current_time = time.time()
-        active_bullets = []
-
-        for bullet in self.water_bullets:
-            # 檢查生存時間
-            if current_time - bullet["created_time"] > bullet["lifetime"]:
-                continue
-
-            # 更新位置
-            bullet["x"] += bullet["velocity_x"]
-            bullet["y"] += bullet["velocity_y"]
-
-            # 檢查是否超出螢幕
-            if 0 <= bullet["x"] <= SCREEN_WIDTH and 0 <= bullet["y"] <= SCREEN_HEIGHT:
-                active_bullets.append(bullet)
-
-        self.water_bullets = active_bullets
-
     def attack_player(self, player):
         """
         水怪的攻擊方式 - 近戰、水彈散射、衝刺\n
@@ -1082,55 +1057,9 @@ class WaterMonster(Monster):
 
         return False
 
-    def check_water_bullet_collision(self, player):
-        """
-        檢查水彈與玩家的碰撞\n
-        \n
-        參數:\n
-        player (Player): 玩家物件\n
-        \n
-        回傳:\n
-        bool: True 表示有水彈擊中玩家\n
-        """
-        bullets_to_remove = []
-        hit = False
-
-        for i, bullet in enumerate(self.water_bullets):
-            bullet_rect = pygame.Rect(bullet["x"] - 6, bullet["y"] - 6, 12, 12)
-
-            if bullet_rect.colliderect(player.rect):
-                # 水彈擊中玩家
-                player.take_damage(bullet["damage"])
-                bullets_to_remove.append(i)
-                hit = True
-
-        # 移除擊中的水彈
-        for i in reversed(bullets_to_remove):
-            del self.water_bullets[i]
-
-        return hit
-
-    def update(self, player, platforms, level_width=None):
-        """
-        水怪的更新方法\n
-        \n
-        參數:\n
-        player (Player): 玩家物件\n
-        platforms (list): 平台列表\n
-        level_width (int): 關卡實際寬度\n
-        """
-        super().update(player, platforms, level_width)
-
-        if self.is_alive:
-            # 更新水彈
-            self.update_water_bullets()
-
-            # 檢查水彈碰撞
-            self.check_water_bullet_collision(player)
-
     def draw(self, screen, camera_x=0, camera_y=0):
         """
-        繪製水怪和水彈\n
+        繪製水怪\n
         \n
         參數:\n
         screen (pygame.Surface): 要繪製到的螢幕表面\n
@@ -1160,7 +1089,11 @@ class WaterMonster(Monster):
         # 繪製水怪本體
         if self.image is not None:
             # 使用圖片繪製
-            image_to_draw = self.image
+            # 根據方向使用預先翻轉好的圖片
+            if self.direction < 0:
+                image_to_draw = self.flipped_image
+            else:
+                image_to_draw = self.image
 
             # 如果有狀態效果，需要調整圖片顏色（簡化處理：在圖片上疊加半透明色塊）
             if current_color != self.color:
@@ -1170,16 +1103,12 @@ class WaterMonster(Monster):
                 )
                 color_overlay.fill((*current_color, 100))  # 半透明覆蓋
 
-                # 複製原圖並疊加顏色
-                image_to_draw = self.image.copy()
+                # 複製圖片並疊加顏色（快取的圖片是共用的，不能直接修改）
+                image_to_draw = image_to_draw.copy()
                 image_to_draw.blit(
                     color_overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2
                 )
 
-            # 根據方向翻轉圖片
-            if self.direction < 0:
-                image_to_draw = pygame.transform.flip(image_to_draw, True, False)
-
             screen.blit(image_to_draw, (screen_x, screen_y))
         else:
             # 圖片載入失敗，使用矩形繪製
@@ -1224,22 +1153,6 @@ class WaterMonster(Monster):
 
         pygame.draw.polygon(screen, WHITE, arrow_points)
 
-        # 繪製水彈（考慮攝影機偏移）
-        for bullet in self.water_bullets:
-            bullet_screen_x = bullet["x"] - camera_x
-            bullet_screen_y = bullet["y"] - camera_y
-            # 只繪製在螢幕範圍內的水彈
-            if (
-                -20 <= bullet_screen_x <= SCREEN_WIDTH + 20
-                and -20 <= bullet_screen_y <= SCREEN_HEIGHT + 20
-            ):
-                pygame.draw.circle(
-                    screen, CYAN, (int(bullet_screen_x), int(bullet_screen_y)), 6
-                )
-                pygame.draw.circle(
-                    screen, WHITE, (int(bullet_screen_x), int(bullet_screen_y)), 3
-                )
-
 
 ######################狙擊Boss類別######################
 
@@ -1259,6 +1172,8 @@ class SniperBoss(Monster):
     y (float): 初始 Y 座標\n
     """
 
+    capabilities = Monster.capabilities | {BOSS}
+
     def __init__(self, x, y, allow_platform_collision=True):
         # 基於龍捲風怪的基礎屬性，但大幅增強
         super().__init__(
@@ -1274,9 +1189,6 @@ class SniperBoss(Monster):
             allow_platform_collision,
         )
 
-        # Boss標記
-        self.is_boss = True
-
         # 提升Boss的攻擊範圍和檢測範圍
         self.detection_range = 300  # 大幅增加檢測範圍
         self.attack_range = 250  # 大幅增加攻擊範圍
@@ -1284,12 +1196,10 @@ class SniperBoss(Monster):
         # 直線子彈系統
         self.tracking_bullet_cooldown = 4.0  # 每4秒發射一次直線子彈
         self.last_tracking_bullet_time = 0
-        self.tracking_bullets = []
 
         # 散彈式發射系統
         self.shotgun_cooldown = SNIPER_BOSS_SHOTGUN_INTERVAL  # 每10秒發射一次散彈
         self.last_shotgun_time = 0
-        self.shotgun_bullets = []  # 散彈式子彈列表
 
         # 震波攻擊系統
         self.shockwave_cooldown = 10.0  # 震波攻擊冷卻時間（調慢攻擊速度）
@@ -1297,7 +1207,6 @@ class SniperBoss(Monster):
         self.is_jumping = False  # 是否在跳躍狀態
         self.jump_phase = "prepare"  # 跳躍階段：prepare, jumping, landing
         self.jump_timer = 0
-        self.shockwaves = []  # 當前活躍震波列表
 
         # 自動回血系統
         self.heal_cooldown = 5.0  # 每5秒回血一次
@@ -1314,35 +1223,27 @@ class SniperBoss(Monster):
         # 載入狙擊Boss圖片
         self.load_sniper_images()
 
-        print(f"🎯 狙擊Boss已生成！具備精準震波攻擊和躲避能力！")
+        log.info(f"🎯 狙擊Boss已生成！具備精準震波攻擊和躲避能力！")
 
     def load_sniper_images(self):
         """
-        載入狙擊Boss的左右朝向圖片\n
+        載入狙擊Boss的左右朝向圖片（從共用快取取得）\n
         """
         try:
-            # 載入往左看的圖片
-            self.image_left = pygame.image.load(
-                SNIPER_BOSS_LEFT_IMAGE_PATH
-            ).convert_alpha()
-            self.image_left = pygame.transform.scale(
-                self.image_left, SNIPER_BOSS_IMAGE_SIZE
+            # 往左看的圖片
+            self.image_left = get_image(
+                SNIPER_BOSS_LEFT_IMAGE_PATH, SNIPER_BOSS_IMAGE_SIZE
             )
-            print(f"✅ 成功載入狙擊Boss往左圖片: {SNIPER_BOSS_LEFT_IMAGE_PATH}")
-
-            # 載入往右看的圖片
-            self.image_right = pygame.image.load(
-                SNIPER_BOSS_RIGHT_IMAGE_PATH
-            ).convert_alpha()
-            self.image_right = pygame.transform.scale(
-                self.image_right, SNIPER_BOSS_IMAGE_SIZE
+
+            # 往右看的圖片
+            self.image_right = get_image(
+                SNIPER_BOSS_RIGHT_IMAGE_PATH, SNIPER_BOSS_IMAGE_SIZE
             )
-            print(f"✅ 成功載入狙擊Boss往右圖片: {SNIPER_BOSS_RIGHT_IMAGE_PATH}")
 
         except (pygame.error, FileNotFoundError) as e:
             # 圖片載入失敗，使用預設顏色繪製
-            print(f"⚠️ 載入狙擊Boss圖片失敗: {e}")
-            print("🎨 將使用預設顏色矩形繪製")
+            log.warning(f"⚠️ 載入狙擊Boss圖片失敗: {e}")
+            log.warning("🎨 將使用預設顏色矩形繪製")
             self.image_left = None
             self.image_right = None
 
@@ -1369,9 +1270,9 @@ class SniperBoss(Monster):
         target_y (float): 目標 Y 座標\n
         \n
         回傳:\n
-        dict or None: 直線子彈資訊\n
+        EnemyProjectile or None: 直線子彈\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
 
         # 移除冷卻時間檢查，讓自動發射系統處理冷卻
         # 這樣create_tracking_bullet可以隨時被呼叫
@@ -1392,47 +1293,22 @@ class SniperBoss(Monster):
             direction_x = 1
             direction_y = 0
 
-        straight_bullet = {
-            "x": start_x,
-            "y": start_y,
-            "velocity_x": direction_x * 24,  # 設置固定速度
-            "velocity_y": direction_y * 24,
-            "speed": 24,  # 子彈速度（原本8 * 3 = 24）
-            "damage": self.damage,
-            "lifetime": 10.0,  # 10秒後消失（縮短生存時間）
-            "created_time": current_time,
-        }
-
-        self.tracking_bullets.append(straight_bullet)
+        straight_bullet = self.fire_projectile(
+            "sniper_bullet",
+            start_x,
+            start_y,
+            direction_x * 24,  # 子彈速度（原本8 * 3 = 24）
+            direction_y * 24,
+            self.damage,
+            10.0,  # 10秒後消失（縮短生存時間）
+        )
+        if straight_bullet is None:
+            return None
+
         self.last_tracking_bullet_time = current_time
-        print(f"🎯 狙擊Boss發射直線子彈朝向玩家中心！")
+        log.debug(f"🎯 狙擊Boss發射直線子彈朝向玩家中心！")
         return straight_bullet
 
-    def update_tracking_bullets(self, player):
-        """
-        更新所有直線子彈的狀態（不再追蹤）\n
-        \n
-        參數:\n
-        player (Player): 玩家物件（保留參數以保持介面相容性）\n
-        """
-        current_time = time.time()
-        active_bullets = []
-
-        for bullet in self.tracking_bullets:
-            # 檢查生存時間
-            if current_time - bullet["created_time"] > bullet["lifetime"]:
-                continue
-
-            # 子彈直線移動，不再追蹤玩家
-            bullet["x"] += bullet["velocity_x"]
-            bullet["y"] += bullet["velocity_y"]
-
-            # 檢查是否超出螢幕邊界
-            if 0 <= bullet["x"] <= SCREEN_WIDTH and 0 <= bullet["y"] <= SCREEN_HEIGHT:
-                active_bullets.append(bullet)
-
-        self.tracking_bullets = active_bullets
-
     def create_shotgun_burst(self, player):
         """
         創建散彈式爆發攻擊（類似散彈槍，一次發射5發不同角度的子彈）\n
@@ -1443,7 +1319,7 @@ class SniperBoss(Monster):
         回傳:\n
         list: 散彈子彈列表\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
 
         # 檢查冷卻時間
         if current_time - self.last_shotgun_time < self.shotgun_cooldown:
@@ -1485,115 +1361,23 @@ class SniperBoss(Monster):
             velocity_x = math.cos(final_angle) * SNIPER_BOSS_SHOTGUN_SPEED
             velocity_y = math.sin(final_angle) * SNIPER_BOSS_SHOTGUN_SPEED
 
-            bullet = {
-                "x": start_x,
-                "y": start_y,
-                "velocity_x": velocity_x,
-                "velocity_y": velocity_y,
-                "damage": SNIPER_BOSS_SHOTGUN_DAMAGE,
-                "lifetime": 8.0,  # 8秒後消失
-                "created_time": current_time,
-                "bullet_type": "sniper_boss_shotgun",  # 標記為散彈類型
-            }
+            bullet = self.fire_projectile(
+                "sniper_shotgun",
+                start_x,
+                start_y,
+                velocity_x,
+                velocity_y,
+                SNIPER_BOSS_SHOTGUN_DAMAGE,
+                8.0,  # 8秒後消失
+            )
 
-            new_bullets.append(bullet)
+            if bullet:
+                new_bullets.append(bullet)
 
-        self.shotgun_bullets.extend(new_bullets)
         self.last_shotgun_time = current_time
-        print(f"🎯 狙擊Boss發射散彈爆發！{len(new_bullets)}發子彈")
+        log.debug("🎯 狙擊Boss發射散彈爆發！%d發子彈", len(new_bullets))
         return new_bullets
 
-    def update_shotgun_bullets(self, player):
-        """
-        更新散彈子彈狀態\n
-        \n
-        參數:\n
-        player (Player): 玩家物件（用於檢查碰撞）\n
-        """
-        current_time = time.time()
-        active_bullets = []
-
-        for bullet in self.shotgun_bullets:
-            # 檢查生存時間
-            if current_time - bullet["created_time"] > bullet["lifetime"]:
-                continue
-
-            # 更新子彈位置
-            bullet["x"] += bullet["velocity_x"]
-            bullet["y"] += bullet["velocity_y"]
-
-            # 檢查是否在合理範圍內
-            if (
-                -100 <= bullet["x"] <= SCREEN_WIDTH + 100
-                and -100 <= bullet["y"] <= SCREEN_HEIGHT + 100
-            ):
-                active_bullets.append(bullet)
-
-        self.shotgun_bullets = active_bullets
-
-    def check_shotgun_bullet_collision(self, player):
-        """
-        檢查散彈子彈與玩家的碰撞\n
-        \n
-        參數:\n
-        player (Player): 玩家物件\n
-        \n
-        回傳:\n
-        bool: True 表示有碰撞發生\n
-        """
-        bullets_to_remove = []
-        collision_occurred = False
-
-        for i, bullet in enumerate(self.shotgun_bullets):
-            # 簡單的矩形碰撞檢測
-            bullet_rect = pygame.Rect(bullet["x"] - 4, bullet["y"] - 4, 8, 8)
-            player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
-
-            if bullet_rect.colliderect(player_rect) and player.is_alive:
-                # 造成傷害
-                damage_dealt = player.take_damage(bullet["damage"])
-                if damage_dealt > 0:
-                    print(f"🎯 狙擊Boss散彈命中玩家！傷害: {damage_dealt}")
-                    collision_occurred = True
-
-                # 標記子彈移除
-                bullets_to_remove.append(i)
-
-        # 移除碰撞的子彈（從後往前移除避免索引問題）
-        for i in reversed(bullets_to_remove):
-            del self.shotgun_bullets[i]
-
-        return collision_occurred
-
-    def check_tracking_bullet_collision(self, player):
-        """
-        檢查直線子彈與玩家的碰撞\n
-        \n
-        參數:\n
-        player (Player): 玩家物件\n
-        \n
-        回傳:\n
-        bool: True 表示有直線子彈擊中玩家\n
-        """
-        bullets_to_remove = []
-        hit = False
-
-        for i, bullet in enumerate(self.tracking_bullets):
-            bullet_rect = pygame.Rect(bullet["x"] - 8, bullet["y"] - 8, 16, 16)
-
-            if bullet_rect.colliderect(player.rect):
-                # 直線子彈擊中玩家
-                player.take_damage(bullet["damage"])
-                bullets_to_remove.append(i)
-                hit = True
-                print(f"🎯 直線子彈擊中玩家！造成 {bullet['damage']} 點傷害")
-
-        # 移除擊中的直線子彈
-        for i in reversed(bullets_to_remove):
-            del self.tracking_bullets[i]
-
-        return hit
-
     def perform_shockwave_attack(self, player):
         """
         執行震波攻擊 - 跳躍然後落地產生震波\n
@@ -1604,7 +1388,7 @@ class SniperBoss(Monster):
         回傳:\n
         bool: True 表示成功發動震波攻擊\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
         if current_time - self.last_shockwave_time < self.shockwave_cooldown:
             return False
 
@@ -1625,7 +1409,7 @@ class SniperBoss(Monster):
             self.velocity_y = -25  # 超強跳躍力
 
             self.last_shockwave_time = current_time
-            print(f"💥 狙擊Boss準備震波攻擊！目標玩家中心位置")
+            log.debug(f"💥 狙擊Boss準備震波攻擊！目標玩家中心位置")
             return True
 
         return False
@@ -1638,8 +1422,11 @@ class SniperBoss(Monster):
         player (Player): 玩家物件，用於計算震波中心位置\n
         \n
         回傳:\n
-        dict: 震波資訊\n
+        EnemyProjectile or None: 震波\n
         """
+        if self.projectile_manager is None:
+            return None
+
         # 如果有玩家位置，震波中心朝向玩家和Boss的中點
         if player:
             player_center_x = player.x + player.width // 2
@@ -1654,79 +1441,21 @@ class SniperBoss(Monster):
             shockwave_x = self.x + self.width // 2
             shockwave_y = self.y + self.height
 
-        shockwave = {
-            "x": shockwave_x,  # 震波中心朝向玩家
-            "y": shockwave_y,  # 在Boss腳下
-            "radius": 0,  # 初始半徑
-            "max_radius": 450,  # 最大擴散半徑（原本150 * 3 = 450）
-            "expansion_speed": 8,  # 擴散速度
-            "damage": 200,  # 震波傷害設為固定200點
-            "knockback_force": 200,  # 擊退力道
-            "lifetime": 2.0,  # 震波持續時間
-            "created_time": time.time(),
-            "hit_player": False,  # 防止重複傷害
-        }
-
-        self.shockwaves.append(shockwave)
-        print(f"💥 震波產生！中心朝向玩家，半徑將擴散至 {shockwave['max_radius']} 像素")
-        return shockwave
-
-    def update_shockwaves(self, player):
-        """
-        更新所有震波的狀態並檢查碰撞\n
-        \n
-        參數:\n
-        player (Player): 玩家物件\n
-        """
-        current_time = time.time()
-        active_shockwaves = []
-
-        for shockwave in self.shockwaves:
-            # 檢查震波是否過期
-            if current_time - shockwave["created_time"] > shockwave["lifetime"]:
-                continue
-
-            # 擴散震波
-            shockwave["radius"] += shockwave["expansion_speed"]
-
-            # 檢查是否達到最大半徑
-            if shockwave["radius"] <= shockwave["max_radius"]:
-                # 檢查與玩家的碰撞（只傷害一次）
-                if not shockwave["hit_player"]:
-                    player_center_x = player.x + player.width // 2
-                    player_center_y = player.y + player.height // 2
-
-                    dx = player_center_x - shockwave["x"]
-                    dy = player_center_y - shockwave["y"]
-                    distance_to_player = math.sqrt(dx**2 + dy**2)
-
-                    # 如果玩家在震波範圍內
-                    if distance_to_player <= shockwave["radius"] + 20:  # 添加一些容錯
-                        # 對玩家造成傷害
-                        player.take_damage(shockwave["damage"])
-
-                        # 計算擊退方向
-                        if distance_to_player > 0:
-                            knockback_x = (dx / distance_to_player) * shockwave[
-                                "knockback_force"
-                            ]
-                            knockback_y = -50  # 向上推一點
-
-                            # 應用擊退效果
-                            if hasattr(player, "velocity_x") and hasattr(
-                                player, "velocity_y"
-                            ):
-                                player.velocity_x += knockback_x * 0.1
-                                player.velocity_y += knockback_y * 0.1
-
-                        shockwave["hit_player"] = True
-                        print(
-                            f"💥 震波擊中玩家！造成 {shockwave['damage']} 點傷害並擊退"
-                        )
-
-                active_shockwaves.append(shockwave)
+        shockwave = self.projectile_manager.spawn_shockwave(
+            self,
+            shockwave_x,  # 震波中心朝向玩家
+            shockwave_y,  # 在Boss腳下
+            max_radius=450,  # 最大擴散半徑（原本150 * 3 = 450）
+            expansion_speed=8,  # 擴散速度
+            damage=200,  # 震波傷害設為固定200點
+            knockback_force=200,  # 擊退力道
+            lifetime=2.0,  # 震波持續時間
+        )
 
-        self.shockwaves = active_shockwaves
+        log.debug(
+            "💥 震波產生！中心朝向玩家，半徑將擴散至 %s 像素", shockwave.max_radius
+        )
+        return shockwave
 
     def detect_and_dodge_bullets(self, bullets):
         """
@@ -1779,7 +1508,7 @@ class SniperBoss(Monster):
                         # 開始躲避
                         self.is_dodging = True
                         self.dodge_timer = 0.8  # 躲避持續時間
-                        print(f"🛡️ 狙擊Boss檢測到子彈，開始躲避！")
+                        log.debug(f"🛡️ 狙擊Boss檢測到子彈，開始躲避！")
                         return True
 
         return False
@@ -1799,19 +1528,19 @@ class SniperBoss(Monster):
             if self.dodge_timer <= 0:
                 self.is_dodging = False
                 self.dodge_direction = 0
-                print(f"🛡️ 狙擊Boss躲避結束")
+                log.debug(f"🛡️ 狙擊Boss躲避結束")
 
     def auto_heal(self):
         """
         自動回血機制\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
         if current_time - self.last_heal_time >= self.heal_cooldown:
             if self.health < self.max_health:
                 old_health = self.health
                 self.health = min(self.max_health, self.health + self.heal_amount)
                 if self.health > old_health:
-                    print(f"💚 狙擊Boss回血：{old_health} → {self.health}")
+                    log.debug("💚 狙擊Boss回血：%s → %s", old_health, self.health)
 
             self.last_heal_time = current_time
 
@@ -1883,7 +1612,7 @@ class SniperBoss(Monster):
         distance = math.sqrt(dx**2 + dy**2)
 
         # 自動發射系統：每4秒朝玩家中心發射子彈
-        current_time = time.time()
+        current_time = get_game_time()
         if (
             current_time - self.last_tracking_bullet_time
             >= self.tracking_bullet_cooldown
@@ -1945,21 +1674,6 @@ class SniperBoss(Monster):
         super().update(player, platforms, level_width)
 
         if self.is_alive:
-            # 更新直線子彈
-            self.update_tracking_bullets(player)
-
-            # 檢查直線子彈碰撞
-            self.check_tracking_bullet_collision(player)
-
-            # 更新散彈子彈
-            self.update_shotgun_bullets(player)
-
-            # 檢查散彈子彈碰撞
-            self.check_shotgun_bullet_collision(player)
-
-            # 更新震波
-            self.update_shockwaves(player)
-
             # 更新跳躍狀態，傳遞玩家位置
             self.update_jump_state(player)
 
@@ -1975,7 +1689,7 @@ class SniperBoss(Monster):
 
     def draw(self, screen, camera_x=0, camera_y=0):
         """
-        繪製狙擊Boss和所有特效\n
+        繪製狙擊Boss和狀態特效\n
         \n
         參數:\n
         screen (pygame.Surface): 要繪製到的螢幕表面\n
@@ -2042,71 +1756,12 @@ class SniperBoss(Monster):
         pygame.draw.rect(screen, GREEN, health_rect)
 
         # 繪製"SNIPER BOSS"標籤
-        font = get_chinese_font(FONT_SIZE_SMALL)
-        boss_text = font.render("🎯 SNIPER BOSS", True, RED)
+        boss_text = get_text_surface("🎯 SNIPER BOSS", FONT_SIZE_SMALL, RED)
         text_rect = boss_text.get_rect()
         text_rect.centerx = screen_x + self.width // 2
         text_rect.bottom = bar_y - 5
         screen.blit(boss_text, text_rect)
 
-        # 繪製直線子彈（考慮攝影機偏移）
-        for bullet in self.tracking_bullets:
-            bullet_screen_x = bullet["x"] - camera_x
-            bullet_screen_y = bullet["y"] - camera_y
-            # 只繪製在螢幕範圍內的子彈
-            if (
-                -20 <= bullet_screen_x <= SCREEN_WIDTH + 20
-                and -20 <= bullet_screen_y <= SCREEN_HEIGHT + 20
-            ):
-                # 繪製直線子彈（藍色）
-                pygame.draw.circle(
-                    screen, BLUE, (int(bullet_screen_x), int(bullet_screen_y)), 8
-                )
-                pygame.draw.circle(
-                    screen, WHITE, (int(bullet_screen_x), int(bullet_screen_y)), 4
-                )
-
-        # 繪製散彈子彈（考慮攝影機偏移）
-        for bullet in self.shotgun_bullets:
-            bullet_screen_x = bullet["x"] - camera_x
-            bullet_screen_y = bullet["y"] - camera_y
-            # 只繪製在螢幕範圍內的子彈
-            if (
-                -20 <= bullet_screen_x <= SCREEN_WIDTH + 20
-                and -20 <= bullet_screen_y <= SCREEN_HEIGHT + 20
-            ):
-                # 繪製散彈子彈（紅色）
-                pygame.draw.circle(
-                    screen,
-                    SNIPER_BOSS_SHOTGUN_COLOR,
-                    (int(bullet_screen_x), int(bullet_screen_y)),
-                    6,
-                )
-                pygame.draw.circle(
-                    screen, WHITE, (int(bullet_screen_x), int(bullet_screen_y)), 3
-                )
-
-        # 繪製震波
-        for shockwave in self.shockwaves:
-            shockwave_screen_x = shockwave["x"] - camera_x
-            shockwave_screen_y = shockwave["y"] - camera_y
-
-            # 只繪製在螢幕範圍內的震波
-            if (
-                -200 <= shockwave_screen_x <= SCREEN_WIDTH + 200
-                and -200 <= shockwave_screen_y <= SCREEN_HEIGHT + 200
-            ):
-                # 繪製震波圓圈（透明效果用多層圓圈模擬）
-                for i in range(3):
-                    alpha_factor = 1.0 - (i * 0.3)
-                    wave_color = tuple(int(c * alpha_factor) for c in YELLOW)
-                    pygame.draw.circle(
-                        screen,
-                        wave_color,
-                        (int(shockwave_screen_x), int(shockwave_screen_y)),
-                        int(shockwave["radius"] - i * 5),
-                        3,
-                    )
 
 
 ######################龍捲風怪類別######################
@@ -2163,7 +1818,7 @@ class TornadoMonster(Monster):
         回傳:\n
         dict or None: 旋風攻擊資訊\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
         if current_time - self.last_whirlwind_time < self.whirlwind_cooldown:
             return None
 
@@ -2211,7 +1866,7 @@ class TornadoMonster(Monster):
         回傳:\n
         bool: True 表示成功瞬移\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
         if current_time - self.last_teleport_time < self.teleport_cooldown:
             return False
 
@@ -2225,8 +1880,8 @@ class TornadoMonster(Monster):
             # 嘗試瞬移到玩家附近（但不要太近）
             for _ in range(10):  # 最多嘗試10次找到合適位置
                 # 在玩家周圍100-150像素範圍內隨機選擇位置
-                angle = random.uniform(0, 2 * math.pi)
-                teleport_distance = random.uniform(100, 150)
+                angle = rng.uniform(0, 2 * math.pi)
+                teleport_distance = rng.uniform(100, 150)
 
                 new_x = player.x + math.cos(angle) * teleport_distance
                 new_y = player.y + math.sin(angle) * teleport_distance
@@ -2296,7 +1951,7 @@ class TornadoMonster(Monster):
         # 龍捲風怪移動時有額外的隨機性
         if self.ai_state == "chase":
             # 增加一些隨機的左右搖擺
-            self.velocity_x += random.uniform(-2, 2)
+            self.velocity_x += rng.uniform(-2, 2)
 
     def update(self, player, platforms, level_width=None):
         """
@@ -1,16 +1,29 @@
 ######################載入套件######################
 import pygame
-import time
 import math
-import random
 
 # 嘗試相對導入，如果失敗則使用絕對導入
 try:
     from ..config import *
     from ..core.game_objects import GameObject, StatusEffect
+    from ..core.entity_registry import BOSS, DAMAGEABLE, STATUS_AFFECTED
+    from ..utils.spatial_grid import query_nearby
+    from .grenade_trajectory import GrenadeTrajectory
+    from ..utils.asset_cache import get_image, get_rotated_image
+    from ..utils.game_logger import get_logger
+    from ..core.game_session import get_rng, get_game_time
 except ImportError:
     from src.config import *
     from src.core.game_objects import GameObject, StatusEffect
+    from src.core.entity_registry import BOSS, DAMAGEABLE, STATUS_AFFECTED
+    from src.utils.spatial_grid import query_nearby
+    from src.entities.grenade_trajectory import GrenadeTrajectory
+    from src.utils.asset_cache import get_image, get_rotated_image
+    from src.utils.game_logger import get_logger
+    from src.core.game_session import get_rng, get_game_time
+
+log = get_logger("player")
+rng = get_rng()
 
 ######################玩家類別######################
 
@@ -37,42 +50,44 @@ class Player(GameObject):
     - 1/2/3/4: 切換子彈類型\n
     """
 
+    # 會被手榴彈和敵方攻擊打傷、會被減速；玩家沒有擊退
+    capabilities = frozenset((DAMAGEABLE, STATUS_AFFECTED))
+
     def __init__(self, x, y):
         super().__init__(x, y, PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_COLOR)
 
-        # 移動相關屬性
-        self.velocity_x = 0
-        self.velocity_y = 0
-        self.on_ground = False
-        self.remaining_jumps = 2  # 剩餘空中跳躍次數（二段跳和三段跳）
-        self.is_wall_sliding = False  # 是否在滑牆
-        self.wall_direction = 0  # 接觸的牆壁方向 (-1: 左牆, 1: 右牆, 0: 無牆)
-
-        # 生命值系統
-        self.health = PLAYER_MAX_HEALTH
-        self.max_health = PLAYER_MAX_HEALTH
-        self.is_alive = True
-
         # 玩家圖片相關
         self.player_right_image = None  # 向右看的圖片
         self.player_left_image = None  # 向左看的圖片
         self.load_player_images()  # 載入圖片
 
-        self.death_time = 0  # 死亡時間記錄
-        self.is_dead = False  # 是否已經死亡（區別於 is_alive）
+        # 狙擊槍準心圖片載入
+        self.crosshair_image = None
+        self.load_crosshair_image()
 
-        # 重生系統
-        self.last_safe_x = x  # 上一個安全位置的x
-        self.last_safe_y = y  # 上一個安全位置的y
-        self.safe_position_timer = 0  # 安全位置更新計時器
+        # 機關槍圖片載入
+        self.machine_gun_image = None
+        self.machine_gun_reverse_image = None
+        self.load_machine_gun_image()
 
-        # 戰鬥相關屬性
-        self.current_weapon = (
-            "machine_gun"  # 當前武器類型：machine_gun, assault_rifle, shotgun, sniper
-        )
-        self.last_shot_time = 0  # 上次射擊時間
-        self.last_melee_time = 0  # 上次近戰時間
-        self.facing_direction = 1  # 面向方向 (1: 右, -1: 左)
+        # 狙擊槍圖片載入
+        self.sniper_rifle_image = None
+        self.sniper_rifle_reverse_image = None
+        self.load_sniper_rifle_image()
+
+        # 散彈槍圖片載入
+        self.shotgun_image = None
+        self.shotgun_reverse_image = None
+        self.shotgun_left_image = None  # 專門用於往左射擊的圖片（180度旋轉）
+        self.load_shotgun_image()
+
+        # 衝鋒槍圖片載入
+        self.assault_rifle_image = None
+        self.assault_rifle_reverse_image = None
+        self.load_assault_rifle_image()
+
+        # 手榴彈軌跡預測（結果快取到投擲位置或方向改變為止）
+        self.grenade_trajectory = GrenadeTrajectory()
 
         # 武器屬性配置
         self.weapon_configs = {
@@ -111,6 +126,53 @@ class Player(GameObject):
             },
         }
 
+        # 其他狀態都在 reset() 設定，重新開始時不用重新載入圖片
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """
+        把玩家恢復成剛建立時的狀態 - 重新開始遊戲時使用\n
+        \n
+        已經載入的圖片和武器設定保留，位置、生命、冷卻和按鍵狀態全部回到初始值\n
+        \n
+        參數:\n
+        x (float): 出生 X 座標\n
+        y (float): 出生 Y 座標\n
+        """
+        # 回到出生位置
+        self.x = x
+        self.y = y
+        self.update_rect()
+
+        # 移動相關屬性
+        self.velocity_x = 0
+        self.velocity_y = 0
+        self.on_ground = False
+        self.remaining_jumps = 2  # 剩餘空中跳躍次數（二段跳和三段跳）
+        self.is_wall_sliding = False  # 是否在滑牆
+        self.wall_direction = 0  # 接觸的牆壁方向 (-1: 左牆, 1: 右牆, 0: 無牆)
+
+        # 生命值系統
+        self.health = PLAYER_MAX_HEALTH
+        self.max_health = PLAYER_MAX_HEALTH
+        self.is_alive = True
+
+        self.death_time = 0  # 死亡時間記錄
+        self.is_dead = False  # 是否已經死亡（區別於 is_alive）
+
+        # 重生系統
+        self.last_safe_x = x  # 上一個安全位置的x
+        self.last_safe_y = y  # 上一個安全位置的y
+        self.safe_position_timer = 0  # 安全位置更新計時器
+
+        # 戰鬥相關屬性
+        self.current_weapon = (
+            "machine_gun"  # 當前武器類型：machine_gun, assault_rifle, shotgun, sniper
+        )
+        self.last_shot_time = 0  # 上次射擊時間
+        self.last_melee_time = 0  # 上次近戰時間
+        self.facing_direction = 1  # 面向方向 (1: 右, -1: 左)
+
         # 狀態效果管理
         self.status_effects = []
 
@@ -129,35 +191,11 @@ class Player(GameObject):
         self.prev_key_2 = False
         self.prev_key_3 = False
         self.prev_key_4 = False
+        self.prev_key_h = False
 
         # 射擊請求佇列
         self.pending_bullet = None
 
-        # 狙擊槍準心圖片載入
-        self.crosshair_image = None
-        self.load_crosshair_image()
-
-        # 機關槍圖片載入
-        self.machine_gun_image = None
-        self.machine_gun_reverse_image = None
-        self.load_machine_gun_image()
-
-        # 狙擊槍圖片載入
-        self.sniper_rifle_image = None
-        self.sniper_rifle_reverse_image = None
-        self.load_sniper_rifle_image()
-
-        # 散彈槍圖片載入
-        self.shotgun_image = None
-        self.shotgun_reverse_image = None
-        self.shotgun_left_image = None  # 專門用於往左射擊的圖片（180度旋轉）
-        self.load_shotgun_image()
-
-        # 衝鋒槍圖片載入
-        self.assault_rifle_image = None
-        self.assault_rifle_reverse_image = None
-        self.load_assault_rifle_image()
-
         # 必殺技系統
         self.last_ultimate_time = 0  # 上次使用必殺技的時間
         self.ultimate_cooldown = 20.0  # 必殺技冷卻時間：20秒
@@ -177,18 +215,23 @@ class Player(GameObject):
         self.weapon_fly_distance = 0  # 武器飛離玩家的距離
         self.weapon_spin_angle = 0  # 武器旋轉角度
         self.weapon_max_fly_distance = 120  # 武器最遠飛行距離
+        self.weapon_hit_monsters = set()  # 這次飛槍已經打過的怪物，避免重複傷害
 
         # 回血系統
         self.heal_cooldown = 20.0  # 每20秒回血一次
-        self.last_heal_time = time.time()  # 上次回血時間
+        self.last_heal_time = get_game_time()  # 上次回血時間
         self.heal_amount = 10  # 每次回血量
 
         # 手榴彈系統
         self.pending_grenade = None  # 待投擲的手榴彈資訊
         self.grenade_mode = False  # 是否處於手榴彈瞄準模式
+        self.mouse_pos = (0, 0)  # 最近一次輸入的滑鼠螢幕座標，射擊和投擲都用這個瞄準
         self.pending_grenade_explosion = False  # 是否有待引爆的手榴彈
+        self.monster_grid = None  # 自動追蹤用的怪物空間網格，由遊戲主迴圈設定
 
-    def handle_input(self, keys, mouse_buttons, camera_x=0, camera_y=0):
+    def handle_input(
+        self, keys, mouse_buttons, camera_x=0, camera_y=0, mouse_pos=None
+    ):
         """
         處理玩家輸入 - 將鍵盤滑鼠輸入轉換為動作\n
         \n
@@ -197,6 +240,7 @@ class Player(GameObject):
         mouse_buttons (tuple): pygame.mouse.get_pressed() 的結果\n
         camera_x (int): 攝影機 x 偏移，用於射擊方向計算\n
         camera_y (int): 攝影機 y 偏移，用於射擊方向計算\n
+        mouse_pos (tuple): 滑鼠螢幕座標，None 表示直接讀取 pygame（重播時傳入錄製的座標）\n
         \n
         處理的輸入:\n
         - 移動按鍵：更新 keys_pressed 狀態\n
@@ -204,6 +248,11 @@ class Player(GameObject):
         - 攻擊按鍵：觸發射擊或甩槍攻擊\n
         - 子彈切換：改變當前子彈類型\n
         """
+        # 記錄這一步的滑鼠位置，射擊、投擲和槍口位置都從這裡讀取
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        self.mouse_pos = mouse_pos
+
         # 記錄水平移動按鍵狀態
         self.keys_pressed["left"] = keys[pygame.K_a] or keys[pygame.K_LEFT]
         self.keys_pressed["right"] = keys[pygame.K_d] or keys[pygame.K_RIGHT]
@@ -341,7 +390,7 @@ class Player(GameObject):
         回傳:\n
         list or None: 成功射擊回傳子彈列表，冷卻中回傳 None\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
         weapon_config = self.weapon_configs[self.current_weapon]
 
         # 檢查射擊冷卻時間 - hack 模式下狙擊槍無冷卻
@@ -361,14 +410,14 @@ class Player(GameObject):
                 direction_y = target_y - player_center_y
             else:
                 # 沒有怪物時向滑鼠方向射擊
-                mouse_x, mouse_y = pygame.mouse.get_pos()
+                mouse_x, mouse_y = self.mouse_pos
                 world_mouse_x = mouse_x + camera_x
                 world_mouse_y = mouse_y + camera_y
                 direction_x = world_mouse_x - player_center_x
                 direction_y = world_mouse_y - player_center_y
         else:
             # 正常模式：獲取滑鼠位置來決定射擊方向
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+            mouse_x, mouse_y = self.mouse_pos
 
             # 將滑鼠的螢幕座標轉換為世界座標
             world_mouse_x = mouse_x + camera_x
@@ -415,7 +464,7 @@ class Player(GameObject):
                 final_angle = base_angle + angle_offset
             else:
                 # 其他武器：添加 ±10 度的隨機誤差
-                random_error = random.uniform(-10, 10) * (math.pi / 180)  # 轉換為弧度
+                random_error = rng.uniform(-10, 10) * (math.pi / 180)  # 轉換為弧度
                 final_angle = base_angle + angle_offset + random_error
 
             final_direction_x = math.cos(final_angle)
@@ -480,7 +529,7 @@ class Player(GameObject):
         dict or None: 成功投擲回傳手榴彈資訊，無手榴彈時回傳 None\n
         """
         # 獲取滑鼠位置來決定投擲方向
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = self.mouse_pos
 
         # 將滑鼠的螢幕座標轉換為世界座標
         world_mouse_x = mouse_x + camera_x
@@ -520,7 +569,7 @@ class Player(GameObject):
         return grenade_info
 
     def calculate_grenade_trajectory(
-        self, camera_x=0, camera_y=0, platforms=None, max_points=30
+        self, camera_x=0, camera_y=0, platform_grid=None, max_points=30
     ):
         """
         計算手榴彈拋物線軌跡預測路徑 - 用於顯示虛線軌跡\n
@@ -528,15 +577,16 @@ class Player(GameObject):
         參數:\n
         camera_x (int): 攝影機 x 偏移，用於正確計算滑鼠世界座標\n
         camera_y (int): 攝影機 y 偏移，用於正確計算滑鼠世界座標\n
-        platforms (list): 平台列表，用於碰撞檢測\n
+        platform_grid (SpatialGrid): 關卡平台空間網格，用於碰撞檢測\n
         max_points (int): 最大預測點數，防止路徑過長\n
         \n
         回傳:\n
         list: 軌跡點列表 [(x1, y1), (x2, y2), ...] 或空列表\n
         \n
         說明:\n
-        - 模擬真實的重力影響和拋物線飛行\n
+        - 拋物線和落點直接用公式算出，和實際手榴彈的逐步物理一致\n
         - 考慮平台碰撞，路徑在碰撞點終止\n
+        - 投擲位置、方向和平台都沒變時使用上次的結果\n
         - 只在手榴彈模式下計算路徑\n
         """
         if not self.grenade_mode:
@@ -566,61 +616,15 @@ class Player(GameObject):
             direction_x = self.facing_direction
             direction_y = -0.5
 
-        # 模擬手榴彈初始速度
-        velocity_x = direction_x * GRENADE_SPEED
-        velocity_y = direction_y * GRENADE_SPEED
-
-        # 模擬軌跡計算
-        trajectory_points = []
-        current_x = player_center_x
-        current_y = player_center_y
-
-        # 每幀的物理更新（與實際手榴彈邏輯一致）
-        for i in range(max_points):
-            # 記錄當前位置
-            trajectory_points.append((current_x, current_y))
-
-            # 套用重力（與實際手榴彈 update 方法一致）
-            velocity_y += GRENADE_GRAVITY
-
-            # 更新位置（與實際手榴彈 update 方法一致）
-            next_x = current_x + velocity_x
-            next_y = current_y + velocity_y
-
-            # 檢查平台碰撞
-            if platforms:
-                collision_detected = False
-                temp_rect = pygame.Rect(
-                    next_x - GRENADE_SIZE // 2,
-                    next_y - GRENADE_SIZE // 2,
-                    GRENADE_SIZE,
-                    GRENADE_SIZE,
-                )
-
-                for platform in platforms:
-                    if hasattr(platform, "rect") and temp_rect.colliderect(
-                        platform.rect
-                    ):
-                        collision_detected = True
-                        break
-
-                if collision_detected:
-                    # 在碰撞點結束軌跡
-                    trajectory_points.append((next_x, next_y))
-                    break
-
-            # 檢查是否飛出合理範圍
-            if (
-                abs(next_x - player_center_x) > 1000
-                or abs(next_y - player_center_y) > 800
-            ):
-                break
-
-            # 更新位置
-            current_x = next_x
-            current_y = next_y
-
-        return trajectory_points
+        self.grenade_trajectory.update(
+            player_center_x,
+            player_center_y,
+            direction_x,
+            direction_y,
+            platform_grid,
+            max_points,
+        )
+        return self.grenade_trajectory.points
 
     def get_gun_muzzle_position(self, camera_x=0, camera_y=0):
         """
@@ -634,7 +638,7 @@ class Player(GameObject):
         tuple: (槍口x座標, 槍口y座標)\n
         """
         # 獲取滑鼠位置來決定槍的角度
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = self.mouse_pos
         world_mouse_x = mouse_x + camera_x
         world_mouse_y = mouse_y + camera_y
 
@@ -695,7 +699,7 @@ class Player(GameObject):
         tuple: (槍口x座標, 槍口y座標)\n
         """
         # 獲取滑鼠位置來決定槍的角度
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = self.mouse_pos
         world_mouse_x = mouse_x + camera_x
         world_mouse_y = mouse_y + camera_y
 
@@ -761,7 +765,7 @@ class Player(GameObject):
         - 支援圖片旋轉和鏡像後的精確槍口定位\n
         """
         # 獲取滑鼠位置來決定槍的角度
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = self.mouse_pos
         world_mouse_x = mouse_x + camera_x
         world_mouse_y = mouse_y + camera_y
 
@@ -814,51 +818,39 @@ class Player(GameObject):
         """
         尋找最近的怪物位置 - hack 模式下機關槍自動追蹤用\n
         \n
+        從空間網格裡玩家所在的格子往外一圈一圈找，不用走訪全部怪物\n
+        \n
         回傳:\n
         tuple: (目標x座標, 目標y座標) 或 (None, None) 如果沒有怪物\n
         """
-        if not hasattr(self, "monster_list") or not self.monster_list:
+        if self.monster_grid is None:
             return None, None
 
-        closest_monster = None
-        closest_distance = float("inf")
-
         player_center_x = self.x + self.width // 2
         player_center_y = self.y + self.height // 2
 
-        for monster in self.monster_list:
-            if hasattr(monster, "x") and hasattr(monster, "y"):
-                monster_center_x = monster.x + getattr(monster, "width", 0) // 2
-                monster_center_y = monster.y + getattr(monster, "height", 0) // 2
-
-                distance = math.sqrt(
-                    (monster_center_x - player_center_x) ** 2
-                    + (monster_center_y - player_center_y) ** 2
-                )
-
-                if distance < closest_distance:
-                    closest_distance = distance
-                    closest_monster = monster
+        # Boss 也在網格裡，自動追蹤只瞄準一般怪物
+        closest_monster = self.monster_grid.nearest(
+            player_center_x,
+            player_center_y,
+            lambda monster: BOSS not in monster.capabilities,
+        )
 
         if closest_monster:
-            monster_center_x = (
-                closest_monster.x + getattr(closest_monster, "width", 0) // 2
-            )
-            monster_center_y = (
-                closest_monster.y + getattr(closest_monster, "height", 0) // 2
-            )
+            monster_center_x = closest_monster.x + closest_monster.width // 2
+            monster_center_y = closest_monster.y + closest_monster.height // 2
             return monster_center_x, monster_center_y
 
         return None, None
 
-    def set_monster_list(self, monster_list):
+    def set_monster_grid(self, monster_grid):
         """
-        設定怪物列表 - 用於 hack 模式的自動追蹤\n
+        設定怪物空間網格 - 用於 hack 模式的自動追蹤\n
         \n
         參數:\n
-        monster_list (list): 當前活躍的怪物列表\n
+        monster_grid (DynamicSpatialGrid): 怪物管理器的空間網格\n
         """
-        self.monster_list = monster_list
+        self.monster_grid = monster_grid
 
     def melee_attack(self):
         """
@@ -885,7 +877,7 @@ class Player(GameObject):
         回傳:\n
         dict or None: 甩槍攻擊資訊或 None（冷卻中）\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
 
         # 獲取當前武器的甩槍攻擊配置
         swing_config = WEAPON_SWING_CONFIGS.get(self.current_weapon)
@@ -951,7 +943,7 @@ class Player(GameObject):
         回傳:\n
         list or None: 五顆必殺技子彈資訊列表或 None（冷卻中）\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
 
         # 檢查冷卻時間 - hack 模式下無冷卻
         if not self.hack_mode:
@@ -994,12 +986,13 @@ class Player(GameObject):
         platforms (list): 所有平台物件的列表\n
         \n
         更新內容：\n
-        1. 處理狀態效果\n
-        2. 應用重力和移動\n
-        3. 碰撞檢測和處理\n
-        4. 邊界檢查\n
-        5. 更新安全位置\n
-        6. 自動回血\n
+        1. 應用重力和移動\n
+        2. 碰撞檢測和處理\n
+        3. 邊界檢查\n
+        4. 更新安全位置\n
+        5. 自動回血\n
+        \n
+        狀態效果到期時由模擬時鐘移除，不在這裡檢查\n
         \n
         回傳:\n
         dict or None: 如果玩家死亡則返回死亡狀態，否則返回 None\n
@@ -1007,8 +1000,6 @@ class Player(GameObject):
         # 檢查玩家是否已經死亡，如果是則返回遊戲結束狀態
         if not self.is_alive:
             return {"died": True, "game_over": True}
-        # 更新狀態效果
-        self.update_status_effects()
 
         # 自動回血 (已關閉)
         # self.auto_heal()
@@ -1085,7 +1076,8 @@ class Player(GameObject):
         # 建立玩家的碰撞矩形
         player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
 
-        for platform in platforms:
+        # 透過空間網格只取出附近的平台
+        for platform in query_nearby(platforms, player_rect):
             if player_rect.colliderect(platform.rect):
                 # 判斷碰撞方向
 
@@ -1190,18 +1182,6 @@ class Player(GameObject):
             self.weapon_fly_distance = 0
             self.weapon_spin_angle = 0
 
-    def update_status_effects(self):
-        """
-        更新所有狀態效果 - 移除過期效果\n
-        \n
-        檢查每個狀態效果是否還在作用中，\n
-        移除已經過期的效果。\n
-        """
-        # 使用列表推導式移除非活躍的狀態效果
-        self.status_effects = [
-            effect for effect in self.status_effects if effect.is_active()
-        ]
-
     def get_speed_modifier(self):
         """
         計算當前的速度修正值 - 考慮所有狀態效果\n
@@ -1227,9 +1207,21 @@ class Player(GameObject):
         duration (float): 持續時間（秒）\n
         intensity (float): 效果強度 (0.0-1.0)\n
         """
-        new_effect = StatusEffect(effect_type, duration, intensity)
+        new_effect = StatusEffect(
+            effect_type, duration, intensity, on_expire=self.remove_status_effect
+        )
         self.status_effects.append(new_effect)
 
+    def remove_status_effect(self, effect):
+        """
+        移除結束的狀態效果 - 由模擬時鐘在效果到期時呼叫\n
+        \n
+        參數:\n
+        effect (StatusEffect): 結束的效果\n
+        """
+        if effect in self.status_effects:
+            self.status_effects.remove(effect)
+
     def take_damage(self, damage):
         """
         受到傷害 - 扣除生命值並檢查死亡\n
@@ -1255,10 +1247,10 @@ class Player(GameObject):
             self.health = 0
             self.is_alive = False
             self.is_dead = True
-            self.death_time = time.time()
+            self.death_time = get_game_time()
             result["died"] = True
             result["game_over"] = True  # 玩家死亡直接遊戲結束
-            print("💀 玩家死亡！遊戲結束")
+            log.info("💀 玩家死亡！遊戲結束")
 
         return result
 
@@ -1317,7 +1309,7 @@ class Player(GameObject):
         回傳:
         float: 冷卻比例 (0.0-1.0)，1.0表示可以使用
         """
-        current_time = time.time()
+        current_time = get_game_time()
         elapsed = current_time - self.last_ultimate_time
         cooldown_ratio = min(1.0, elapsed / self.ultimate_cooldown)
         return cooldown_ratio
@@ -1337,13 +1329,13 @@ class Player(GameObject):
         """
         自動回血機制 - 每20秒回復10點生命值\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
         if current_time - self.last_heal_time >= self.heal_cooldown:
             if self.health < self.max_health and self.is_alive:
                 old_health = self.health
                 self.health = min(self.max_health, self.health + self.heal_amount)
                 if self.health > old_health:
-                    print(f"💚 玩家自動回血：{old_health} → {self.health}")
+                    log.debug("💚 玩家自動回血：%s → %s", old_health, self.health)
 
                 self.last_heal_time = current_time
 
@@ -1424,26 +1416,18 @@ class Player(GameObject):
         """
         try:
             # 載入向右看的圖片
-            self.player_right_image = pygame.image.load(
-                PLAYER_RIGHT_IMAGE_PATH
-            ).convert_alpha()
-            self.player_right_image = pygame.transform.scale(
-                self.player_right_image, PLAYER_IMAGE_SIZE
+            self.player_right_image = get_image(
+                PLAYER_RIGHT_IMAGE_PATH, PLAYER_IMAGE_SIZE
             )
-            print(f"成功載入玩家向右圖片: {PLAYER_RIGHT_IMAGE_PATH}")
 
             # 載入向左看的圖片
-            self.player_left_image = pygame.image.load(
-                PLAYER_LEFT_IMAGE_PATH
-            ).convert_alpha()
-            self.player_left_image = pygame.transform.scale(
-                self.player_left_image, PLAYER_IMAGE_SIZE
+            self.player_left_image = get_image(
+                PLAYER_LEFT_IMAGE_PATH, PLAYER_IMAGE_SIZE
             )
-            print(f"成功載入玩家向左圖片: {PLAYER_LEFT_IMAGE_PATH}")
 
         except (pygame.error, FileNotFoundError) as e:
             # 圖片載入失敗，將使用預設顏色矩形
-            print(f"玩家圖片載入失敗: {e}")
+            log.warning(f"玩家圖片載入失敗: {e}")
             self.player_right_image = None
             self.player_left_image = None
 
@@ -1463,17 +1447,12 @@ class Player(GameObject):
         """
         try:
             # 載入準心圖片
-            self.crosshair_image = pygame.image.load(
-                CROSSHAIR_IMAGE_PATH
-            ).convert_alpha()
-            # 縮放到指定大小，保持比例
-            self.crosshair_image = pygame.transform.scale(
-                self.crosshair_image, (CROSSHAIR_SIZE, CROSSHAIR_SIZE)
+            self.crosshair_image = get_image(
+                CROSSHAIR_IMAGE_PATH, (CROSSHAIR_SIZE, CROSSHAIR_SIZE)
             )
-            print(f"成功載入狙擊槍準心圖片: {CROSSHAIR_IMAGE_PATH}")
         except (pygame.error, FileNotFoundError) as e:
             # 圖片載入失敗，將使用預設十字準心
-            print(f"準心圖片載入失敗: {e}")
+            log.warning(f"準心圖片載入失敗: {e}")
             self.crosshair_image = None
 
     def load_sniper_rifle_image(self):
@@ -1493,32 +1472,22 @@ class Player(GameObject):
         """
         try:
             # 載入狙擊槍正向圖片（往右射擊）
-            self.sniper_rifle_image = pygame.image.load(
-                SNIPER_RIFLE_IMAGE_PATH
-            ).convert_alpha()
-            # 縮放到指定大小
-            self.sniper_rifle_image = pygame.transform.scale(
-                self.sniper_rifle_image, SNIPER_RIFLE_IMAGE_SIZE
+            self.sniper_rifle_image = get_image(
+                SNIPER_RIFLE_IMAGE_PATH, SNIPER_RIFLE_IMAGE_SIZE
             )
-            print(f"成功載入狙擊槍正向圖片: {SNIPER_RIFLE_IMAGE_PATH}")
         except (pygame.error, FileNotFoundError) as e:
             # 圖片載入失敗，將使用預設矩形顯示
-            print(f"狙擊槍正向圖片載入失敗: {e}")
+            log.warning(f"狙擊槍正向圖片載入失敗: {e}")
             self.sniper_rifle_image = None
 
         try:
             # 載入狙擊槍反向圖片（往左射擊）
-            self.sniper_rifle_reverse_image = pygame.image.load(
-                SNIPER_RIFLE_REVERSE_IMAGE_PATH
-            ).convert_alpha()
-            # 縮放到指定大小
-            self.sniper_rifle_reverse_image = pygame.transform.scale(
-                self.sniper_rifle_reverse_image, SNIPER_RIFLE_IMAGE_SIZE
+            self.sniper_rifle_reverse_image = get_image(
+                SNIPER_RIFLE_REVERSE_IMAGE_PATH, SNIPER_RIFLE_IMAGE_SIZE
             )
-            print(f"成功載入狙擊槍反向圖片: {SNIPER_RIFLE_REVERSE_IMAGE_PATH}")
         except (pygame.error, FileNotFoundError) as e:
             # 反向圖片載入失敗，將使用預設顯示
-            print(f"狙擊槍反向圖片載入失敗: {e}")
+            log.warning(f"狙擊槍反向圖片載入失敗: {e}")
             self.sniper_rifle_reverse_image = None
 
     def load_shotgun_image(self):
@@ -1535,31 +1504,25 @@ class Player(GameObject):
         - 支援 PNG 格式的透明背景圖片\n
         - 自動縮放到 SHOTGUN_IMAGE_SIZE 尺寸\n
         - 原圖槍口朝右，鏡像後槍口朝左\n
-        - 反向圖片通過 pygame.transform.flip 自動生成\n
+        - 反向圖片由共用圖片快取預先翻轉好\n
         """
         try:
             # 載入散彈槍正向圖片（槍口朝右）
-            self.shotgun_image = pygame.image.load(SHOTGUN_IMAGE_PATH).convert_alpha()
-            # 縮放到指定大小
-            self.shotgun_image = pygame.transform.scale(
-                self.shotgun_image, SHOTGUN_IMAGE_SIZE
-            )
-            print(f"成功載入散彈槍正向圖片: {SHOTGUN_IMAGE_PATH}")
+            self.shotgun_image = get_image(SHOTGUN_IMAGE_PATH, SHOTGUN_IMAGE_SIZE)
 
-            # 通過水平翻轉生成反向圖片（槍口朝左）
-            self.shotgun_reverse_image = pygame.transform.flip(
-                self.shotgun_image, True, False
-            )  # True=水平翻轉, False=不垂直翻轉
+            # 水平翻轉的反向圖片（槍口朝左）
+            self.shotgun_reverse_image = get_image(
+                SHOTGUN_IMAGE_PATH, SHOTGUN_IMAGE_SIZE, "flip_x"
+            )
 
-            # 為往左射擊生成 180 度旋轉的圖片（解決上下左右都顛倒的問題）
-            self.shotgun_left_image = pygame.transform.flip(
-                self.shotgun_image, True, True
-            )  # True=水平翻轉, True=垂直翻轉（相當於 180 度旋轉）
-            print("成功生成散彈槍反向圖片（鏡像）和左射圖片")
+            # 往左射擊用的 180 度旋轉圖片（解決上下左右都顛倒的問題）
+            self.shotgun_left_image = get_image(
+                SHOTGUN_IMAGE_PATH, SHOTGUN_IMAGE_SIZE, "flip_xy"
+            )
 
         except (pygame.error, FileNotFoundError) as e:
             # 圖片載入失敗，將使用預設矩形顯示
-            print(f"散彈槍圖片載入失敗: {e}")
+            log.warning(f"散彈槍圖片載入失敗: {e}")
             self.shotgun_image = None
             self.shotgun_reverse_image = None
             self.shotgun_left_image = None
@@ -1581,32 +1544,22 @@ class Player(GameObject):
         """
         try:
             # 載入機關槍正向圖片
-            self.machine_gun_image = pygame.image.load(
-                MACHINE_GUN_IMAGE_PATH
-            ).convert_alpha()
-            # 縮放到指定大小
-            self.machine_gun_image = pygame.transform.scale(
-                self.machine_gun_image, MACHINE_GUN_IMAGE_SIZE
+            self.machine_gun_image = get_image(
+                MACHINE_GUN_IMAGE_PATH, MACHINE_GUN_IMAGE_SIZE
             )
-            print(f"成功載入機關槍圖片: {MACHINE_GUN_IMAGE_PATH}")
         except (pygame.error, FileNotFoundError) as e:
             # 圖片載入失敗，將使用預設矩形顯示
-            print(f"機關槍圖片載入失敗: {e}")
+            log.warning(f"機關槍圖片載入失敗: {e}")
             self.machine_gun_image = None
 
         try:
             # 載入機關槍反向圖片（往後射擊時使用）
-            self.machine_gun_reverse_image = pygame.image.load(
-                MACHINE_GUN_REVERSE_IMAGE_PATH
-            ).convert_alpha()
-            # 縮放到指定大小
-            self.machine_gun_reverse_image = pygame.transform.scale(
-                self.machine_gun_reverse_image, MACHINE_GUN_IMAGE_SIZE
+            self.machine_gun_reverse_image = get_image(
+                MACHINE_GUN_REVERSE_IMAGE_PATH, MACHINE_GUN_IMAGE_SIZE
             )
-            print(f"成功載入機關槍反向圖片: {MACHINE_GUN_REVERSE_IMAGE_PATH}")
         except (pygame.error, FileNotFoundError) as e:
             # 反向圖片載入失敗，將使用預設顯示
-            print(f"機關槍反向圖片載入失敗: {e}")
+            log.warning(f"機關槍反向圖片載入失敗: {e}")
             self.machine_gun_reverse_image = None
 
     def load_assault_rifle_image(self):
@@ -1625,32 +1578,22 @@ class Player(GameObject):
         """
         try:
             # 載入衝鋒槍正向圖片（往右射擊）
-            self.assault_rifle_image = pygame.image.load(
-                ASSAULT_RIFLE_IMAGE_PATH
-            ).convert_alpha()
-            # 縮放到指定大小
-            self.assault_rifle_image = pygame.transform.scale(
-                self.assault_rifle_image, ASSAULT_RIFLE_IMAGE_SIZE
+            self.assault_rifle_image = get_image(
+                ASSAULT_RIFLE_IMAGE_PATH, ASSAULT_RIFLE_IMAGE_SIZE
             )
-            print(f"成功載入衝鋒槍正向圖片: {ASSAULT_RIFLE_IMAGE_PATH}")
         except (pygame.error, FileNotFoundError) as e:
             # 圖片載入失敗，將使用預設矩形顯示
-            print(f"衝鋒槍正向圖片載入失敗: {e}")
+            log.warning(f"衝鋒槍正向圖片載入失敗: {e}")
             self.assault_rifle_image = None
 
         try:
             # 載入衝鋒槍反向圖片（往左射擊）
-            self.assault_rifle_reverse_image = pygame.image.load(
-                ASSAULT_RIFLE_REVERSE_IMAGE_PATH
-            ).convert_alpha()
-            # 縮放到指定大小
-            self.assault_rifle_reverse_image = pygame.transform.scale(
-                self.assault_rifle_reverse_image, ASSAULT_RIFLE_IMAGE_SIZE
+            self.assault_rifle_reverse_image = get_image(
+                ASSAULT_RIFLE_REVERSE_IMAGE_PATH, ASSAULT_RIFLE_IMAGE_SIZE
             )
-            print(f"成功載入衝鋒槍反向圖片: {ASSAULT_RIFLE_REVERSE_IMAGE_PATH}")
         except (pygame.error, FileNotFoundError) as e:
             # 反向圖片載入失敗，將使用預設顯示
-            print(f"衝鋒槍反向圖片載入失敗: {e}")
+            log.warning(f"衝鋒槍反向圖片載入失敗: {e}")
             self.assault_rifle_reverse_image = None
 
     def draw_machine_gun(self, screen, camera_x=0, camera_y=0):
@@ -1716,8 +1659,8 @@ class Player(GameObject):
                     )
                 else:
                     # 沒有反向圖片時，使用翻轉的正向圖片
-                    gun_image = pygame.transform.flip(
-                        self.machine_gun_image, False, True
+                    gun_image = get_image(
+                        MACHINE_GUN_IMAGE_PATH, MACHINE_GUN_IMAGE_SIZE, "flip_y"
                     )
                     angle_degrees = (
                         angle_degrees - 180
@@ -1728,15 +1671,16 @@ class Player(GameObject):
                 # 往前射擊時使用正常圖片
                 gun_image = self.machine_gun_image
 
-            # 旋轉機關槍圖片
-            rotated_gun = pygame.transform.rotate(gun_image, -angle_degrees)
-
-            # 計算旋轉後圖片的新中心位置（螢幕座標）
-            gun_rect = rotated_gun.get_rect()
-            gun_rect.center = (weapon_x - camera_x, weapon_y - camera_y)
+            # 從快取取得旋轉好的機關槍圖片（角度取整，不必每幀重新旋轉）
+            rotated_gun, (offset_x, offset_y) = get_rotated_image(
+                gun_image, -angle_degrees
+            )
 
-            # 繪製旋轉後的機關槍
-            screen.blit(rotated_gun, gun_rect)
+            # 繪製旋轉後的機關槍，讓圖片中心對準武器位置（螢幕座標）
+            screen.blit(
+                rotated_gun,
+                (weapon_x - camera_x + offset_x, weapon_y - camera_y + offset_y),
+            )
         else:
             # 圖片載入失敗，繪製簡單的槍械矩形代替
             # 計算槍的位置和角度
@@ -1835,8 +1779,8 @@ class Player(GameObject):
                     )
                 else:
                     # 沒有反向圖片時，使用翻轉的正向圖片
-                    rifle_image = pygame.transform.flip(
-                        self.sniper_rifle_image, False, True
+                    rifle_image = get_image(
+                        SNIPER_RIFLE_IMAGE_PATH, SNIPER_RIFLE_IMAGE_SIZE, "flip_y"
                     )
                     angle_degrees = (
                         angle_degrees - 180
@@ -1847,15 +1791,16 @@ class Player(GameObject):
                 # 往前射擊時使用正常圖片
                 rifle_image = self.sniper_rifle_image
 
-            # 旋轉狙擊槍圖片
-            rotated_rifle = pygame.transform.rotate(rifle_image, -angle_degrees)
-
-            # 計算旋轉後圖片的新中心位置（螢幕座標）
-            rifle_rect = rotated_rifle.get_rect()
-            rifle_rect.center = (weapon_x - camera_x, weapon_y - camera_y)
+            # 從快取取得旋轉好的狙擊槍圖片（角度取整，不必每幀重新旋轉）
+            rotated_rifle, (offset_x, offset_y) = get_rotated_image(
+                rifle_image, -angle_degrees
+            )
 
-            # 繪製旋轉後的狙擊槍
-            screen.blit(rotated_rifle, rifle_rect)
+            # 繪製旋轉後的狙擊槍，讓圖片中心對準武器位置（螢幕座標）
+            screen.blit(
+                rotated_rifle,
+                (weapon_x - camera_x + offset_x, weapon_y - camera_y + offset_y),
+            )
         else:
             # 圖片載入失敗，繪製簡單的槍械矩形代替
             # 計算槍的位置和角度
@@ -1959,18 +1904,16 @@ class Player(GameObject):
                     shotgun_image = self.shotgun_image
                 adjusted_angle = angle_degrees
 
-            # 旋轉散彈槍圖片
-            rotated_shotgun = pygame.transform.rotate(shotgun_image, -adjusted_angle)
-
-            # 計算旋轉後圖片的新中心位置（螢幕座標）
-            shotgun_rect = rotated_shotgun.get_rect()
-            shotgun_rect.center = (
-                weapon_x - camera_x,
-                weapon_y - camera_y,
+            # 從快取取得旋轉好的散彈槍圖片（角度取整，不必每幀重新旋轉）
+            rotated_shotgun, (offset_x, offset_y) = get_rotated_image(
+                shotgun_image, -adjusted_angle
             )
 
-            # 繪製旋轉後的散彈槍
-            screen.blit(rotated_shotgun, shotgun_rect)
+            # 繪製旋轉後的散彈槍，讓圖片中心對準武器位置（螢幕座標）
+            screen.blit(
+                rotated_shotgun,
+                (weapon_x - camera_x + offset_x, weapon_y - camera_y + offset_y),
+            )
         else:
             # 圖片載入失敗，繪製簡單的槍械矩形代替
             # 計算槍的位置和角度
@@ -2071,8 +2014,10 @@ class Player(GameObject):
                     )
                 else:
                     # 沒有圖片時，使用翻轉的備用圖片
-                    rifle_image = pygame.transform.flip(
-                        self.assault_rifle_reverse_image, True, False
+                    rifle_image = get_image(
+                        ASSAULT_RIFLE_REVERSE_IMAGE_PATH,
+                        ASSAULT_RIFLE_IMAGE_SIZE,
+                        "flip_x",
                     )
                     angle_degrees = (
                         angle_degrees - 180
@@ -2083,15 +2028,16 @@ class Player(GameObject):
                 # 往右射擊時使用反向圖片（B&T_APC_9_K_side_profile拷貝.png）
                 rifle_image = self.assault_rifle_reverse_image
 
-            # 旋轉衝鋒槍圖片
-            rotated_rifle = pygame.transform.rotate(rifle_image, -angle_degrees)
-
-            # 計算旋轉後圖片的新中心位置（螢幕座標）
-            rifle_rect = rotated_rifle.get_rect()
-            rifle_rect.center = (weapon_x - camera_x, weapon_y - camera_y)
+            # 從快取取得旋轉好的衝鋒槍圖片（角度取整，不必每幀重新旋轉）
+            rotated_rifle, (offset_x, offset_y) = get_rotated_image(
+                rifle_image, -angle_degrees
+            )
 
-            # 繪製旋轉後的衝鋒槍
-            screen.blit(rotated_rifle, rifle_rect)
+            # 繪製旋轉後的衝鋒槍，讓圖片中心對準武器位置（螢幕座標）
+            screen.blit(
+                rotated_rifle,
+                (weapon_x - camera_x + offset_x, weapon_y - camera_y + offset_y),
+            )
         else:
             # 圖片載入失敗，繪製簡單的槍械矩形代替
             # 計算槍的位置和角度
@@ -2215,9 +2161,8 @@ class Player(GameObject):
         pygame.draw.rect(screen, WHITE, bg_rect, 2)
 
         # 繪製生命值文字（調整位置避免重疊）
-        font = get_chinese_font(FONT_SIZE_NORMAL)
-        health_text = font.render(
-            f"生命值: {self.health}/{self.max_health}", True, WHITE
+        health_text = get_text_surface(
+            f"生命值: {self.health}/{self.max_health}", FONT_SIZE_NORMAL, WHITE
         )
         screen.blit(health_text, (bar_x + 220, bar_y + 5))  # 向右移動避免重疊
 
@@ -2259,15 +2204,14 @@ class Player(GameObject):
                 pygame.draw.rect(screen, WHITE, ui_rect, 4)
 
             # 繪製按鍵提示
-            font = get_chinese_font(FONT_SIZE_SMALL)
-            key_text = font.render(str(i + 1), True, WHITE)
+            key_text = get_text_surface(str(i + 1), FONT_SIZE_SMALL, WHITE)
             text_rect = key_text.get_rect(
                 center=(ui_x + BULLET_UI_SIZE // 2, ui_y + BULLET_UI_SIZE + 15)
             )
             screen.blit(key_text, text_rect)
 
             # 繪製武器名稱
-            name_text = font.render(weapon_names[weapon], True, WHITE)
+            name_text = get_text_surface(weapon_names[weapon], FONT_SIZE_SMALL, WHITE)
             name_rect = name_text.get_rect(
                 center=(ui_x + BULLET_UI_SIZE // 2, ui_y + BULLET_UI_SIZE + 35)
             )
@@ -2325,21 +2269,22 @@ class Player(GameObject):
         pygame.draw.polygon(screen, WHITE, lightning_points)
 
         # 繪製按鍵提示
-        font = get_chinese_font(FONT_SIZE_SMALL)
-        key_text = font.render("X", True, WHITE)
+        key_text = get_text_surface("X", FONT_SIZE_SMALL, WHITE)
         key_rect = key_text.get_rect(center=(center_x, center_y + ui_size // 2 + 15))
         screen.blit(key_text, key_rect)
 
         # 繪製冷卻時間文字
         if cooldown_ratio < 1.0:
             remaining_time = self.ultimate_cooldown * (1.0 - cooldown_ratio)
-            time_text = font.render(f"{remaining_time:.1f}s", True, WHITE)
+            time_text = get_text_surface(
+                f"{remaining_time:.1f}s", FONT_SIZE_SMALL, WHITE
+            )
             time_rect = time_text.get_rect(
                 center=(center_x, center_y + ui_size // 2 + 35)
             )
             screen.blit(time_text, time_rect)
         else:
-            ready_text = font.render("準備好！", True, GREEN)
+            ready_text = get_text_surface("準備好！", FONT_SIZE_SMALL, GREEN)
             ready_rect = ready_text.get_rect(
                 center=(center_x, center_y + ui_size // 2 + 35)
             )
@@ -1,15 +1,28 @@
 ######################載入套件######################
 import pygame
 import math
-import time
 
 # 支援直接執行和模組執行兩種方式
 try:
     from ..config import *
     from ..core.game_objects import GameObject
+    from ..core.entity_registry import BOSS, DAMAGEABLE, KNOCKBACKABLE
+    from ..core.entity_registry import STATUS_AFFECTED, filter_capable
+    from ..utils.spatial_grid import query_nearby
+    from .bullet_store import BulletArrayStore, NUMPY_AVAILABLE
+    from ..utils.game_logger import get_logger
+    from ..core.game_session import get_game_time, get_game_clock
 except ImportError:
     from src.config import *
     from src.core.game_objects import GameObject
+    from src.core.entity_registry import BOSS, DAMAGEABLE, KNOCKBACKABLE
+    from src.core.entity_registry import STATUS_AFFECTED, filter_capable
+    from src.utils.spatial_grid import query_nearby
+    from src.entities.bullet_store import BulletArrayStore, NUMPY_AVAILABLE
+    from src.utils.game_logger import get_logger
+    from src.core.game_session import get_game_time, get_game_clock
+
+log = get_logger("weapon")
 
 ######################子彈類別######################
 
@@ -69,7 +82,9 @@ class Bullet(GameObject):
 
         # 雷電追蹤特殊屬性
         if bullet_type == "lightning_tracking":
-            self.tracking_target = None  # 追蹤目標
+            self.assigned_target_id = None  # 必殺技分配的目標 ID
+            self.tracking_target_id = None  # 正在追蹤的目標 ID
+            self.phase = "tracking"  # 飛行階段，必殺技發射時會改成先往上飛
             self.tracking_range = 300  # 追蹤範圍
             self.turn_speed = 5.0  # 轉向速度
             self.bullet_id = 0  # 子彈編號，用於目標分配
@@ -90,12 +105,13 @@ class Bullet(GameObject):
         }
         return damage_values.get(self.bullet_type, 20)
 
-    def update(self, targets=None):
+    def update(self, targets=None, registry=None):
         """
         更新子彈位置和狀態 - 每幀執行的移動邏輯\n
         \n
         參數:\n
         targets (list): 可能的追蹤目標列表（用於雷電追蹤）\n
+        registry (EntityRegistry): 實體登記表，用 ID 找到分配的目標\n
         \n
         處理：\n
         1. 根據方向和速度移動子彈\n
@@ -108,10 +124,10 @@ class Bullet(GameObject):
 
         # 雷電追蹤的階段性邏輯
         if self.bullet_type == "lightning_tracking":
-            self.update_lightning_phases(targets)
+            self.update_lightning_phases(targets, registry)
         # 一般子彈的追蹤邏輯（保持原有功能）
         elif self.bullet_type == "lightning_tracking" and targets:
-            self.update_tracking(targets)
+            self.update_tracking(targets, registry)
 
         # 根據方向向量移動子彈
         self.x += self.direction_x * self.speed
@@ -129,7 +145,59 @@ class Bullet(GameObject):
         # 更新碰撞矩形
         self.update_rect()
 
-    def update_lightning_phases(self, targets):
+    def find_tracking_target(self, targets, registry=None):
+        """
+        找出雷電子彈這一步要追蹤的目標，並記住它的 ID\n
+        \n
+        1. 必殺技分配的目標還在場上就追它\n
+        2. 上一步追蹤的目標還在場上、也還在追蹤範圍內，就繼續追它，不必重新搜尋\n
+        3. 都沒有時才在目標列表裡找追蹤範圍內最近的目標\n
+        \n
+        參數:\n
+        targets (list): 可能的追蹤目標列表\n
+        registry (EntityRegistry): 實體登記表，用 ID 找到目標\n
+        \n
+        回傳:\n
+        GameObject or None: 要追蹤的目標\n
+        """
+        range_squared = self.tracking_range * self.tracking_range
+
+        if registry is not None:
+            # 目標還在場上時登記表才查得到
+            target = registry.get(self.assigned_target_id)
+            if target is not None:
+                return target
+
+            target = registry.get(self.tracking_target_id)
+            if target is not None:
+                dx = target.x + target.width // 2 - self.x
+                dy = target.y + target.height // 2 - self.y
+                if dx * dx + dy * dy <= range_squared:
+                    return target
+
+        closest_target = None
+        closest_distance_squared = float("inf")
+
+        for target in targets or ():
+            # 計算到目標中心的距離平方
+            dx = target.x + target.width // 2 - self.x
+            dy = target.y + target.height // 2 - self.y
+            distance_squared = dx * dx + dy * dy
+
+            # 在追蹤範圍內且是最近的目標
+            if (
+                distance_squared <= range_squared
+                and distance_squared < closest_distance_squared
+            ):
+                closest_target = target
+                closest_distance_squared = distance_squared
+
+        self.tracking_target_id = (
+            closest_target.entity_id if closest_target is not None else None
+        )
+        return closest_target
+
+    def update_lightning_phases(self, targets, registry=None):
         """
         更新雷電子彈的階段性行為\n
         \n
@@ -138,11 +206,8 @@ class Bullet(GameObject):
         \n
         參數:\n
         targets (list): 可能的追蹤目標列表\n
+        registry (EntityRegistry): 實體登記表，用 ID 找到分配的目標\n
         """
-        if not hasattr(self, "phase"):
-            # 如果沒有階段屬性，初始化為追蹤模式（兼容舊子彈）
-            self.phase = "tracking"
-
         if self.phase == "ascending":
             # 階段1：往上飛行
             # 計算已上升的距離
@@ -157,44 +222,13 @@ class Bullet(GameObject):
 
         elif self.phase == "tracking":
             # 階段2：追蹤目標
-            # 優先使用分配的目標
-            target_to_track = None
-
-            if hasattr(self, "assigned_target") and self.assigned_target:
-                # 檢查分配的目標是否還在目標列表中（還活著）
-                if self.assigned_target in targets:
-                    target_to_track = self.assigned_target
-
-            # 如果沒有分配目標或分配目標已死亡，找最近的目標
-            if not target_to_track and targets:
-                closest_target = None
-                closest_distance = float("inf")
-
-                for target in targets:
-                    # 計算到目標的距離
-                    target_center_x = target.x + getattr(target, "width", 0) // 2
-                    target_center_y = target.y + getattr(target, "height", 0) // 2
-
-                    dx = target_center_x - self.x
-                    dy = target_center_y - self.y
-                    distance = math.sqrt(dx**2 + dy**2)
-
-                    # 在追蹤範圍內且是最近的目標
-                    if distance <= self.tracking_range and distance < closest_distance:
-                        closest_target = target
-                        closest_distance = distance
-
-                target_to_track = closest_target
+            # 優先追分配的目標，再來是上一步追的目標，都不在了才找最近的目標
+            target_to_track = self.find_tracking_target(targets, registry)
 
             # 如果找到目標，進行積極追蹤
             if target_to_track:
-                self.tracking_target = target_to_track
-                target_center_x = (
-                    target_to_track.x + getattr(target_to_track, "width", 0) // 2
-                )
-                target_center_y = (
-                    target_to_track.y + getattr(target_to_track, "height", 0) // 2
-                )
+                target_center_x = target_to_track.x + target_to_track.width // 2
+                target_center_y = target_to_track.y + target_to_track.height // 2
 
                 # 計算到目標的方向
                 dx = target_center_x - self.x
@@ -230,51 +264,21 @@ class Bullet(GameObject):
                         self.direction_x /= current_length
                         self.direction_y /= current_length
 
-    def update_tracking(self, targets):
+    def update_tracking(self, targets, registry=None):
         """
         更新雷電追蹤邏輯 - 使用分配的目標進行追蹤\n
         \n
         參數:\n
         targets (list): 可能的追蹤目標列表\n
+        registry (EntityRegistry): 實體登記表，用 ID 找到分配的目標\n
         """
-        # 優先使用分配的目標
-        target_to_track = None
-
-        if hasattr(self, "assigned_target") and self.assigned_target:
-            # 檢查分配的目標是否還在目標列表中（還活著）
-            if self.assigned_target in targets:
-                target_to_track = self.assigned_target
-
-        # 如果沒有分配目標或分配目標已死亡，找最近的目標
-        if not target_to_track and targets:
-            closest_target = None
-            closest_distance = float("inf")
-
-            for target in targets:
-                # 計算到目標的距離
-                target_center_x = target.x + getattr(target, "width", 0) // 2
-                target_center_y = target.y + getattr(target, "height", 0) // 2
-
-                dx = target_center_x - self.x
-                dy = target_center_y - self.y
-                distance = math.sqrt(dx**2 + dy**2)
-
-                # 在追蹤範圍內且是最近的目標
-                if distance <= self.tracking_range and distance < closest_distance:
-                    closest_target = target
-                    closest_distance = distance
-
-            target_to_track = closest_target
+        # 優先追分配的目標，再來是上一步追的目標，都不在了才找最近的目標
+        target_to_track = self.find_tracking_target(targets, registry)
 
         # 如果找到目標，進行積極追蹤
         if target_to_track:
-            self.tracking_target = target_to_track
-            target_center_x = (
-                target_to_track.x + getattr(target_to_track, "width", 0) // 2
-            )
-            target_center_y = (
-                target_to_track.y + getattr(target_to_track, "height", 0) // 2
-            )
+            target_center_x = target_to_track.x + target_to_track.width // 2
+            target_center_y = target_to_track.y + target_to_track.height // 2
 
             # 計算到目標的方向
             dx = target_center_x - self.x
@@ -383,7 +387,7 @@ class Bullet(GameObject):
             pygame.draw.circle(screen, WHITE, (center_x, center_y), radius // 2)
             # 額外的電光效果
             for i in range(4):
-                angle = (i * math.pi / 2) + (time.time() * 5)  # 旋轉的電光
+                angle = (i * math.pi / 2) + (get_game_time() * 5)  # 旋轉的電光
                 end_x = center_x + math.cos(angle) * radius * 1.5
                 end_y = center_y + math.sin(angle) * radius * 1.5
                 pygame.draw.line(
@@ -407,21 +411,28 @@ class ExplosionEffect:
     x (float): 爆炸中心 X 座標\n
     y (float): 爆炸中心 Y 座標\n
     max_radius (float): 最大爆炸半徑\n
+    on_expire (callable): 動畫結束時呼叫，參數是這個效果；None 表示不通知\n
     """
 
-    def __init__(self, x, y, max_radius):
+    def __init__(self, x, y, max_radius, on_expire=None):
         self.x = x
         self.y = y
         self.max_radius = max_radius
-        self.start_time = time.time()
+        self.start_time = get_game_time()
         self.duration = EXPLOSION_DURATION
         self.is_active = True
 
-    def update(self):
-        """更新爆炸效果狀態"""
-        elapsed = time.time() - self.start_time
-        if elapsed >= self.duration:
-            self.is_active = False
+        # 動畫結束由模擬時鐘通知，不用每一步檢查
+        self.on_expire = on_expire
+        get_game_clock().schedule_at(self.start_time + self.duration, self.expire)
+
+    def expire(self):
+        """
+        動畫結束 - 由模擬時鐘呼叫\n
+        """
+        self.is_active = False
+        if self.on_expire is not None:
+            self.on_expire(self)
 
     def draw(self, screen, camera_x=0, camera_y=0):
         """
@@ -435,7 +446,7 @@ class ExplosionEffect:
         if not self.is_active:
             return
 
-        elapsed = time.time() - self.start_time
+        elapsed = get_game_time() - self.start_time
         progress = elapsed / self.duration
 
         # 計算螢幕座標
@@ -503,7 +514,8 @@ class Grenade(GameObject):
         # 手榴彈狀態
         self.is_active = True
         self.is_attached = False  # 是否已黏附到物體
-        self.attached_to = None  # 黏附的目標物件
+        self.attached_to_id = None  # 黏附的怪物或Boss的 ID（平台、牆壁和地面為 None）
+        self.attached_anchor = None  # 黏附物件最後已知的位置 (x, y)
         self.attached_offset_x = 0  # 相對於黏附物件的偏移
         self.attached_offset_y = 0
 
@@ -515,7 +527,14 @@ class Grenade(GameObject):
         self.start_x = x
         self.start_y = y
 
-    def update(self, platforms=None, targets=None, level_width=None, level_height=None):
+    def update(
+        self,
+        platforms=None,
+        targets=None,
+        level_width=None,
+        level_height=None,
+        registry=None,
+    ):
         """
         更新手榴彈位置和狀態\n
         \n
@@ -524,9 +543,10 @@ class Grenade(GameObject):
         targets (list): 目標列表（怪物等），用於黏附檢測\n
         level_width (int): 關卡世界寬度\n
         level_height (int): 關卡世界高度\n
+        registry (EntityRegistry): 實體登記表，用 ID 找到黏附的怪物\n
         \n
         處理：\n
-        1. 如果已黏附，跟隨黏附物件移動\n
+        1. 如果已黏附，跟隨黏附物件移動（怪物被移除後停在最後的位置）\n
         2. 如果未黏附，按照物理規律飛行\n
         3. 檢測與各種物體的碰撞黏附\n
         """
@@ -534,10 +554,16 @@ class Grenade(GameObject):
             return
 
         if self.is_attached:
+            # 黏附的怪物還在場上時記下它現在的位置
+            if self.attached_to_id is not None and registry is not None:
+                target = registry.get(self.attached_to_id)
+                if target is not None:
+                    self.attached_anchor = (target.x, target.y)
+
             # 如果已黏附，跟隨黏附的物件移動
-            if self.attached_to:
-                self.x = self.attached_to.x + self.attached_offset_x
-                self.y = self.attached_to.y + self.attached_offset_y
+            if self.attached_anchor is not None:
+                self.x = self.attached_anchor[0] + self.attached_offset_x
+                self.y = self.attached_anchor[1] + self.attached_offset_y
         else:
             # 如果未黏附，繼續飛行
             # 套用重力
@@ -576,16 +602,15 @@ class Grenade(GameObject):
         # 優先黏附到怪物身上
         if targets:
             for target in targets:
-                if hasattr(target, "rect") and self.rect.colliderect(target.rect):
+                if self.rect.colliderect(target.rect):
                     self.attach_to_object(target)
                     return
 
-        # 其次黏附到平台上
+        # 其次黏附到平台上（透過空間網格只檢查附近的平台）
         if platforms:
-            for platform in platforms:
-                if hasattr(platform, "rect") and self.rect.colliderect(platform.rect):
-                    self.attach_to_object(platform)
-                    return
+            for platform in query_nearby(platforms, self.rect):
+                self.attach_to_object(platform)
+                return
 
         # 檢查是否碰到世界邊界（使用關卡尺寸而非螢幕尺寸）
         if level_width and level_height:
@@ -602,7 +627,8 @@ class Grenade(GameObject):
         target_object: 要黏附的目標物件\n
         """
         self.is_attached = True
-        self.attached_to = target_object
+        self.attached_to_id = target_object.entity_id
+        self.attached_anchor = (target_object.x, target_object.y)
 
         # 計算相對於目標物件的偏移量
         self.attached_offset_x = self.x - target_object.x
@@ -620,7 +646,8 @@ class Grenade(GameObject):
         level_width (int): 關卡世界寬度\n
         """
         self.is_attached = True
-        self.attached_to = None  # 牆壁沒有物件
+        self.attached_to_id = None  # 牆壁沒有物件
+        self.attached_anchor = None
         self.velocity_x = 0
         self.velocity_y = 0
 
@@ -639,18 +666,20 @@ class Grenade(GameObject):
         level_height (int): 關卡世界高度\n
         """
         self.is_attached = True
-        self.attached_to = None  # 地面沒有物件
+        self.attached_to_id = None  # 地面沒有物件
+        self.attached_anchor = None
         if level_height:
             self.y = level_height - self.height
         self.velocity_x = 0
         self.velocity_y = 0
 
-    def explode(self, all_targets):
+    def explode(self, all_targets, target_grid=None):
         """
         引爆手榴彈，對範圍內所有目標造成傷害\n
         \n
         參數:\n
-        all_targets (list): 所有可能受到傷害的目標列表（包括玩家）\n
+        all_targets (list): 逐一檢查的目標列表（例如玩家）\n
+        target_grid (DynamicSpatialGrid): 怪物和Boss的空間網格，只檢查爆炸附近的格子\n
         \n
         回傳:\n
         list: 受到傷害的目標資訊列表\n
@@ -663,30 +692,39 @@ class Grenade(GameObject):
         # 計算爆炸中心點
         explosion_x = self.x + self.width // 2
         explosion_y = self.y + self.height // 2
+        radius_squared = self.explosion_radius * self.explosion_radius
 
-        # 檢查範圍內的所有目標
+        # 列表裡的目標逐一檢查（用距離平方比較，省掉開根號）
+        hit_targets = []
         for target in all_targets:
-            if hasattr(target, "x") and hasattr(target, "y"):
-                # 計算目標中心點
-                target_x = target.x + getattr(target, "width", 0) // 2
-                target_y = target.y + getattr(target, "height", 0) // 2
-
-                # 計算距離
-                distance = math.sqrt(
-                    (target_x - explosion_x) ** 2 + (target_y - explosion_y) ** 2
+            offset_x = target.x + target.width // 2 - explosion_x
+            offset_y = target.y + target.height // 2 - explosion_y
+            if offset_x * offset_x + offset_y * offset_y <= radius_squared:
+                hit_targets.append(target)
+
+        # 網格裡的怪物只查爆炸半徑涵蓋的格子
+        if target_grid is not None:
+            hit_targets.extend(
+                target_grid.query_radius(
+                    explosion_x, explosion_y, self.explosion_radius
                 )
+            )
 
-                # 如果在爆炸範圍內
-                if distance <= self.explosion_radius:
-                    explosion_results.append(
-                        {
-                            "target": target,
-                            "damage": self.damage,
-                            "explosion_x": explosion_x,
-                            "explosion_y": explosion_y,
-                            "distance": distance,
-                        }
-                    )
+        for target in hit_targets:
+            # 只有在範圍內的目標才需要真正的距離
+            distance = math.sqrt(
+                (target.x + target.width // 2 - explosion_x) ** 2
+                + (target.y + target.height // 2 - explosion_y) ** 2
+            )
+            explosion_results.append(
+                {
+                    "target": target,
+                    "damage": self.damage,
+                    "explosion_x": explosion_x,
+                    "explosion_y": explosion_y,
+                    "distance": distance,
+                }
+            )
 
         # 引爆後手榴彈失效
         self.is_active = False
@@ -749,14 +787,24 @@ class WeaponManager:
     3. 近戰攻擊的處理\n
     4. 武器系統的整體更新\n
     5. 手榴彈系統的管理\n
+    \n
+    參數:\n
+    registry (EntityRegistry): 怪物管理器的實體登記表，追蹤子彈和黏附的手榴彈用 ID 找目標\n
     """
 
-    def __init__(self):
+    def __init__(self, registry=None):
+        self.registry = registry
         self.bullets = []  # 所有活躍的子彈列表
         self.lightning_bullets = []  # 雷電追蹤子彈列表
         self.grenades = []  # 所有活躍的手榴彈列表
         self.grenade_count = GRENADE_MAX_COUNT  # 玩家剩餘手榴彈數量
         self.explosion_effects = []  # 爆炸視覺效果列表
+
+        # 有 numpy 時改用陣列批次處理子彈，self.bullets 會指向陣列對應的物件列表
+        self.bullet_store = None
+        if USE_BULLET_ARRAY_STORE and NUMPY_AVAILABLE:
+            self.bullet_store = BulletArrayStore()
+            self.bullets = self.bullet_store.objects
         
         # hack 模式 - 作弊功能開關
         self.hack_mode = False
@@ -788,7 +836,7 @@ class WeaponManager:
             if bullet:
                 new_bullets.append(bullet)
 
-        self.bullets.extend(new_bullets)
+        self.add_bullets(new_bullets)
         return new_bullets
 
     def create_ultimate(self, ultimate_info, targets=None):
@@ -849,51 +897,44 @@ class WeaponManager:
                 # 智能目標分配策略 - 優先攻擊Boss
                 if targets:
                     # 分離Boss和普通怪物
-                    boss_targets = [
-                        target
-                        for target in targets
-                        if hasattr(target, "is_boss") and target.is_boss
-                    ]
+                    if self.registry is not None:
+                        boss_targets = list(self.registry.get_capable(BOSS))
+                    else:
+                        boss_targets = filter_capable(targets, BOSS)
                     regular_targets = [
-                        target
-                        for target in targets
-                        if not (hasattr(target, "is_boss") and target.is_boss)
+                        target for target in targets if BOSS not in target.capabilities
                     ]
 
                     if boss_targets:
                         # 有Boss時：所有子彈都攻擊Boss，忽略小怪
                         # 如果有多個Boss（理論上不會發生），優先攻擊第一個
-                        lightning_bullet.assigned_target = boss_targets[0]
+                        lightning_bullet.assigned_target_id = boss_targets[0].entity_id
                         if i == 0:  # 只在第一顆子彈時顯示訊息
-                            print(
+                            log.info(
                                 f"⚡ 必殺技鎖定Boss目標：{boss_targets[0].monster_type}"
                             )
                     elif regular_targets:
                         # 沒有Boss時：攻擊普通怪物
                         if len(regular_targets) == 1:
                             # 單怪物：所有子彈都追蹤同一目標
-                            lightning_bullet.assigned_target = regular_targets[0]
+                            lightning_bullet.assigned_target_id = regular_targets[
+                                0
+                            ].entity_id
                         else:
-                            # 多怪物：優先確保每個怪物至少被一顆子彈攻擊
+                            # 多怪物：輪流分配，確保每個怪物至少被一顆子彈攻擊
                             target_index = i % len(regular_targets)
-                            lightning_bullet.assigned_target = regular_targets[
+                            lightning_bullet.assigned_target_id = regular_targets[
                                 target_index
-                            ]
-                            # 記錄這個目標已被分配
-                            if not hasattr(
-                                regular_targets[target_index], "assigned_bullet_count"
-                            ):
-                                regular_targets[target_index].assigned_bullet_count = 0
-                            regular_targets[target_index].assigned_bullet_count += 1
+                            ].entity_id
 
                         if i == 0:  # 只在第一顆子彈時顯示訊息
-                            print(
+                            log.info(
                                 f"⚡ 必殺技攻擊普通怪物：{len(regular_targets)}個目標"
                             )
                     else:
-                        lightning_bullet.assigned_target = None
+                        lightning_bullet.assigned_target_id = None
                 else:
-                    lightning_bullet.assigned_target = None
+                    lightning_bullet.assigned_target_id = None
 
                 new_lightning_bullets.append(lightning_bullet)
         else:
@@ -914,10 +955,24 @@ class WeaponManager:
 
         # 將新子彈加入列表
         self.lightning_bullets.extend(new_lightning_bullets)
-        self.bullets.extend(new_lightning_bullets)  # 也加入一般子彈列表進行碰撞檢測
+        self.add_bullets(new_lightning_bullets)  # 也加入一般子彈列表進行碰撞檢測
 
         return new_lightning_bullets
 
+    def add_bullets(self, new_bullets):
+        """
+        把新子彈加入子彈列表 - 使用陣列儲存時同時寫入陣列\n
+        \n
+        參數:\n
+        new_bullets (list): 新建立的子彈物件列表\n
+        """
+        if self.bullet_store is None:
+            self.bullets.extend(new_bullets)
+            return
+
+        for bullet in new_bullets:
+            self.bullet_store.add(bullet)
+
     def _create_single_bullet(self, info):
         """
         創建單發子彈\n
@@ -950,7 +1005,7 @@ class WeaponManager:
         \n
         參數:\n
         melee_info (dict): 近戰攻擊資訊\n
-        targets (list): 可能被攻擊的目標列表\n
+        targets (list): 可能被攻擊的目標列表或空間網格\n
         \n
         回傳:\n
         list: 被擊中的目標列表\n
@@ -961,19 +1016,19 @@ class WeaponManager:
         hit_targets = []
         attack_rect = melee_info["attack_rect"]
 
-        for target in targets:
-            if hasattr(target, "rect") and attack_rect.colliderect(target.rect):
+        # 近戰只打得到會受傷的目標，目標可以是列表或空間網格
+        for target in query_nearby(targets, attack_rect):
+            if DAMAGEABLE in target.capabilities:
                 # 目標被近戰攻擊擊中
                 damage = melee_info["damage"]
                 knockback = melee_info["knockback"]
                 direction = melee_info["direction"]
 
                 # 對目標造成傷害
-                if hasattr(target, "take_damage"):
-                    target.take_damage(damage)
+                target.take_damage(damage)
 
                 # 對目標施加擊退效果
-                if hasattr(target, "apply_knockback"):
+                if KNOCKBACKABLE in target.capabilities:
                     target.apply_knockback(knockback, direction)
 
                 hit_targets.append(target)
@@ -1010,12 +1065,13 @@ class WeaponManager:
 
         return True
 
-    def explode_all_grenades(self, all_targets):
+    def explode_all_grenades(self, all_targets, target_grid=None):
         """
         引爆所有活躍的手榴彈 - 右鍵觸發\n
         \n
         參數:\n
-        all_targets (list): 所有可能受到傷害的目標列表（包括玩家和怪物）\n
+        all_targets (list): 逐一檢查的目標列表（例如玩家）\n
+        target_grid (DynamicSpatialGrid): 怪物和Boss的空間網格\n
         \n
         回傳:\n
         list: 所有爆炸造成的傷害結果\n
@@ -1024,7 +1080,7 @@ class WeaponManager:
 
         for grenade in self.grenades[:]:  # 使用切片避免在迭代中修改列表
             if grenade.is_active:
-                explosion_results = grenade.explode(all_targets)
+                explosion_results = grenade.explode(all_targets, target_grid)
                 all_explosion_results.extend(explosion_results)
 
                 # 創建爆炸視覺效果
@@ -1032,6 +1088,7 @@ class WeaponManager:
                     grenade.x + grenade.width // 2,  # 爆炸中心 X
                     grenade.y + grenade.height // 2,  # 爆炸中心 Y
                     GRENADE_EXPLOSION_RADIUS,  # 最大爆炸半徑
+                    on_expire=self.remove_explosion_effect,
                 )
                 self.explosion_effects.append(explosion_effect)
 
@@ -1053,7 +1110,7 @@ class WeaponManager:
         level_height (int): 關卡世界高度\n
         """
         for grenade in self.grenades:
-            grenade.update(platforms, targets, level_width, level_height)
+            grenade.update(platforms, targets, level_width, level_height, self.registry)
 
         # 移除非活躍的手榴彈
         self.grenades = [grenade for grenade in self.grenades if grenade.is_active]
@@ -1083,12 +1140,17 @@ class WeaponManager:
         參數:\n
         targets (list): 可能的追蹤目標列表（用於雷電追蹤）\n
         """
-        # 更新每顆子彈
-        for bullet in self.bullets:
-            bullet.update(targets)
+        if self.bullet_store is not None:
+            # 陣列模式：一次移動並移除所有失效子彈
+            self.bullet_store.update(targets, self.registry)
+            self.bullets = self.bullet_store.objects
+        else:
+            # 更新每顆子彈
+            for bullet in self.bullets:
+                bullet.update(targets, self.registry)
 
-        # 移除非活躍的子彈
-        self.bullets = [bullet for bullet in self.bullets if bullet.is_active]
+            # 移除非活躍的子彈
+            self.bullets = [bullet for bullet in self.bullets if bullet.is_active]
         self.lightning_bullets = [
             bullet for bullet in self.lightning_bullets if bullet.is_active
         ]
@@ -1104,6 +1166,21 @@ class WeaponManager:
         list: 發生碰撞的資訊列表\n
         """
         collision_results = []
+
+        # 子彈只打得到會受傷的目標，登記表隨怪物進出場維護好這份名單，
+        # 每一對子彈和目標就不必再檢查
+        if self.registry is not None:
+            targets = self.registry.get_capable(DAMAGEABLE)
+        else:
+            targets = filter_capable(targets, DAMAGEABLE)
+
+        if self.bullet_store is not None:
+            # 陣列模式：一次算出所有子彈擊中的第一個目標
+            for index, bullet, target in self.bullet_store.find_hits(targets):
+                collision_results.append(self.apply_bullet_hit(bullet, target))
+                self.bullet_store.deactivate(index)
+            return collision_results
+
         bullets_to_remove = []
 
         for bullet in self.bullets:
@@ -1111,35 +1188,9 @@ class WeaponManager:
                 continue
 
             for target in targets:
-                if hasattr(target, "rect") and bullet.rect.colliderect(target.rect):
+                if bullet.rect.colliderect(target.rect):
                     # 子彈擊中目標
-
-                    # 計算傷害（考慮屬性剋制）
-                    target_type = getattr(target, "monster_type", "unknown")
-                    damage, status_effect = bullet.get_damage_against_target(
-                        target_type
-                    )
-
-                    # 對目標造成傷害
-                    if hasattr(target, "take_damage"):
-                        target.take_damage(damage)
-
-                    # 施加狀態效果
-                    if status_effect and hasattr(target, "add_status_effect"):
-                        target.add_status_effect(
-                            status_effect["type"],
-                            status_effect["duration"],
-                            status_effect["intensity"],
-                        )
-
-                    # 記錄碰撞結果
-                    collision_info = {
-                        "bullet": bullet,
-                        "target": target,
-                        "damage": damage,
-                        "status_effect": status_effect,
-                    }
-                    collision_results.append(collision_info)
+                    collision_results.append(self.apply_bullet_hit(bullet, target))
 
                     # 標記子彈為待移除
                     bullets_to_remove.append(bullet)
@@ -1152,6 +1203,40 @@ class WeaponManager:
 
         return collision_results
 
+    def apply_bullet_hit(self, bullet, target):
+        """
+        處理子彈擊中目標的效果 - 造成傷害並施加狀態效果\n
+        \n
+        參數:\n
+        bullet (Bullet): 擊中目標的子彈\n
+        target: 被擊中的目標（有 DAMAGEABLE 能力）\n
+        \n
+        回傳:\n
+        dict: 碰撞資訊，包含子彈、目標、傷害和狀態效果\n
+        """
+        # 計算傷害（考慮屬性剋制）
+        target_type = getattr(target, "monster_type", "unknown")
+        damage, status_effect = bullet.get_damage_against_target(target_type)
+
+        # 對目標造成傷害
+        target.take_damage(damage)
+
+        # 施加狀態效果
+        if status_effect and STATUS_AFFECTED in target.capabilities:
+            target.add_status_effect(
+                status_effect["type"],
+                status_effect["duration"],
+                status_effect["intensity"],
+            )
+
+        # 記錄碰撞結果
+        return {
+            "bullet": bullet,
+            "target": target,
+            "damage": damage,
+            "status_effect": status_effect,
+        }
+
     def update(self, targets=None, platforms=None, level_width=None, level_height=None):
         """
         武器系統的主要更新方法\n
@@ -1171,12 +1256,6 @@ class WeaponManager:
         # 更新所有手榴彈
         self.update_grenades(platforms, targets, level_width, level_height)
 
-        # 更新爆炸效果
-        for effect in self.explosion_effects[:]:
-            effect.update()
-            if not effect.is_active:
-                self.explosion_effects.remove(effect)
-
         # 檢查子彈碰撞
         collision_results = []
         if targets:
@@ -1218,10 +1297,35 @@ class WeaponManager:
         """
         清除所有子彈和手榴彈 - 用於關卡重置或遊戲結束\n
         """
-        self.bullets.clear()
+        if self.bullet_store is not None:
+            self.bullet_store.clear()
+            self.bullets = self.bullet_store.objects
+        else:
+            self.bullets.clear()
         self.grenades.clear()
         self.explosion_effects.clear()
 
+    def remove_explosion_effect(self, effect):
+        """
+        移除播放完的爆炸效果 - 由模擬時鐘在動畫結束時呼叫\n
+        \n
+        參數:\n
+        effect (ExplosionEffect): 結束的爆炸效果\n
+        """
+        if effect in self.explosion_effects:
+            self.explosion_effects.remove(effect)
+
+    def reset(self):
+        """
+        把武器系統恢復成剛建立時的狀態 - 重新開始遊戲時使用\n
+        \n
+        子彈陣列和列表都清空後繼續使用，不重新配置\n
+        """
+        self.clear_all_bullets()
+        self.lightning_bullets.clear()
+        self.grenade_count = GRENADE_MAX_COUNT
+        self.hack_mode = False
+
     def reset_grenades(self):
         """
         重置手榴彈系統 - 補充滿手榴彈數量\n
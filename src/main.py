@@ -1,5 +1,6 @@
 ######################載入套件######################
 import pygame
+import argparse
 import sys
 import time
 import os
@@ -13,22 +14,54 @@ if __name__ == "__main__":
 try:
     from .config import *
     from .core.game_objects import *
+    from .core.entity_registry import BOSS, DAMAGEABLE, KNOCKBACKABLE
     from .entities.player import Player
     from .entities.weapon import WeaponManager
     from .systems.monster_manager import MonsterManager
     from .systems.damage_display import DamageDisplayManager
     from .systems.level_system import LevelManager
+    from .systems.level_file import capture_level, load_level
+    from .systems.timestep import FixedTimestep, RenderInterpolator
+    from .systems.frame_profiler import FrameProfiler
     from .utils.cloud_system import CloudSystemf
+    from .utils.asset_cache import get_asset_cache, GAME_SPRITE_ASSETS
+    from .utils.audio_manager import AudioManager
+    from .utils.game_logger import get_logger, set_log_level
+    from .core.game_session import get_rng, get_game_time
+    from .core.game_session import make_seed, start_session, get_game_clock
+    from .systems.input_recorder import InputRecorder, load_recording
+    from .systems.input_recorder import capture_input, compute_state_hash
+    from .systems.input_recorder import IDLE_INPUT, RESTART_INPUT, SEED_LIMIT
+    from .systems.benchmark import run_benchmark, write_results
+    from .systems.benchmark import load_baseline, compare_with_baseline
 except ImportError:
     # 直接執行時使用絕對導入
     from src.config import *
     from src.core.game_objects import *
+    from src.core.entity_registry import BOSS, DAMAGEABLE, KNOCKBACKABLE
     from src.entities.player import Player
     from src.entities.weapon import WeaponManager
     from src.systems.monster_manager import MonsterManager
     from src.systems.damage_display import DamageDisplayManager
     from src.systems.level_system import LevelManager
+    from src.systems.level_file import capture_level, load_level
+    from src.systems.timestep import FixedTimestep, RenderInterpolator
+    from src.systems.frame_profiler import FrameProfiler
     from src.utils.cloud_system import CloudSystem
+    from src.utils.asset_cache import get_asset_cache, GAME_SPRITE_ASSETS
+    from src.utils.audio_manager import AudioManager
+    from src.utils.game_logger import get_logger, set_log_level
+    from src.core.game_session import get_rng, get_game_time
+    from src.core.game_session import make_seed, start_session, get_game_clock
+    from src.systems.input_recorder import InputRecorder, load_recording
+    from src.systems.input_recorder import capture_input, compute_state_hash
+    from src.systems.input_recorder import IDLE_INPUT, RESTART_INPUT, SEED_LIMIT
+    from src.systems.benchmark import run_benchmark, write_results
+    from src.systems.benchmark import load_baseline, compare_with_baseline
+
+log = get_logger("game")
+audio_log = get_logger("audio")
+rng = get_rng()
 
 ######################遊戲主類別######################
 
@@ -52,103 +85,47 @@ class ElementalParkourShooter:
     - 'victory': 勝利\n
     """
 
-    def __init__(self):
+    def __init__(self, headless=False, seed=None, level_data=None):
         """
         初始化遊戲系統和基本設定\n
         \n
         設定 pygame、建立遊戲視窗、初始化遊戲狀態\n
+        \n
+        參數:\n
+        headless (bool): 無頭模式，不開啟視窗和音效裝置，用於效能量測和 CI 測試\n
+        seed (int): 亂數種子，None 表示隨機產生（同一個種子加上同樣的輸入會重現同一局）\n
+        level_data (LevelData): 讀進來的關卡檔，None 表示每一局用亂數生成關卡\n
         """
+        # 無頭模式使用 SDL 的虛擬驅動，不會真的開啟視窗或音效裝置
+        self.headless = headless
+        if self.headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
         # 初始化 pygame 系統
         pygame.init()
 
-        # 初始化音效系統
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-        pygame.mixer.set_num_channels(SOUND_CHANNELS)  # 設定音效頻道數量
-
-        # 載入射擊音效
-        self.shooting_sound = None
-        try:
-            self.shooting_sound = pygame.mixer.Sound(SHOOTING_SOUND_PATH)
-            self.shooting_sound.set_volume(SHOOTING_SOUND_VOLUME)
-            print(f"成功載入射擊音效: {SHOOTING_SOUND_PATH}")
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"載入射擊音效失敗: {e}")
-            print("遊戲將在沒有音效的情況下運行")
-
-        # 載入必殺技音效
-        self.ultimate_sound = None
-        try:
-            self.ultimate_sound = pygame.mixer.Sound(ULTIMATE_SOUND_PATH)
-            self.ultimate_sound.set_volume(ULTIMATE_SOUND_VOLUME)
-            print(f"成功載入必殺技音效: {ULTIMATE_SOUND_PATH}")
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"載入必殺技音效失敗: {e}")
-            print("必殺技將在沒有音效的情況下運行")
-
-        # 載入狙擊怪來襲音樂
-        self.sniper_incoming_music = None
-        try:
-            self.sniper_incoming_music = pygame.mixer.Sound(SNIPER_INCOMING_MUSIC_PATH)
-            self.sniper_incoming_music.set_volume(SNIPER_INCOMING_MUSIC_VOLUME)
-            print(f"成功載入狙擊怪來襲音樂: {SNIPER_INCOMING_MUSIC_PATH}")
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"載入狙擊怪來襲音樂失敗: {e}")
-            print("狙擊怪將在沒有特殊音樂的情況下出現")
-
-        # 載入死亡音效
-        self.game_over_sound = None
-        try:
-            self.game_over_sound = pygame.mixer.Sound(GAME_OVER_SOUND_PATH)
-            self.game_over_sound.set_volume(GAME_OVER_SOUND_VOLUME)
-            print(f"成功載入死亡音效: {GAME_OVER_SOUND_PATH}")
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"載入死亡音效失敗: {e}")
-            print("遊戲將在沒有死亡音效的情況下運行")
-
-        # 載入勝利星星音效
-        self.victory_sound = None
-        try:
-            self.victory_sound = pygame.mixer.Sound(VICTORY_SOUND_PATH)
-            self.victory_sound.set_volume(VICTORY_SOUND_VOLUME)
-            print(f"成功載入勝利星星音效: {VICTORY_SOUND_PATH}")
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"載入勝利星星音效失敗: {e}")
-            print("勝利星星將在沒有音效的情況下顯示")
-
-        # 載入愛心道具音效
-        self.health_pickup_sound = None
-        try:
-            self.health_pickup_sound = pygame.mixer.Sound(HEALTH_PICKUP_SOUND_PATH)
-            self.health_pickup_sound.set_volume(HEALTH_PICKUP_SOUND_VOLUME)
-            print(f"成功載入愛心道具音效: {HEALTH_PICKUP_SOUND_PATH}")
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"載入愛心道具音效失敗: {e}")
-            print("愛心道具將在沒有音效的情況下顯示")
-
-        # 載入Boss背景音樂
-        self.boss_music = None
-        try:
-            self.boss_music = pygame.mixer.Sound(BOSS_MUSIC_PATH)
-            self.boss_music.set_volume(BOSS_MUSIC_VOLUME)
-            print(f"成功載入Boss背景音樂: {BOSS_MUSIC_PATH}")
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"載入Boss背景音樂失敗: {e}")
-            print("Boss將在沒有背景音樂的情況下出現")
+        # 音效管理器（無頭模式不開啟音效裝置，播放方法會自動略過）
+        self.audio = AudioManager()
 
         # 音樂播放狀態管理
         self.is_sniper_music_playing = False
-        self.sniper_music_channel = None
-        self.sniper_music_channels = []  # 多重播放頻道列表
 
         # Boss音樂管理
-        self.boss_music_channel = None
         self.is_boss_music_playing = False
         self.boss_music_fade_duration = 1.0  # 漸弱持續時間（秒）
 
-        # 建立遊戲視窗
+        # 建立遊戲視窗（無頭模式下是虛擬視窗，圖片的 convert_alpha 仍需要它）
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("跑酷射擊大冒險 - Elemental Parkour Shooter")
 
+        # 視窗出現後才開啟音效裝置，短音效在背景解碼，不會擋住第一幀
+        if not self.headless:
+            self.audio.start()
+
+        # 預先載入會大量生成的角色圖片，遊戲中生成怪物時不用再讀硬碟
+        get_asset_cache().preload(GAME_SPRITE_ASSETS)
+
         # 設定遊戲時鐘，控制幀率
         self.clock = pygame.time.Clock()
 
@@ -170,12 +147,30 @@ class ElementalParkourShooter:
         self.score = 0
         self.font = get_chinese_font(FONT_SIZE_MEDIUM)
 
+        # 遊戲階段的亂數和模擬時鐘（要在建立關卡和怪物之前設定種子）
+        self.seed = seed if seed is not None else make_seed()
+        start_session(self.seed)
+        self.game_clock = get_game_clock()
+
+        # 輸入管理（單次事件先暫存，交給下一個模擬步處理）
+        self.pending_input_events = []
+        self.recorder = None  # 錄製輸入時的 InputRecorder
+
+        # 關卡檔只讀一次，每次重新開始都從同一份資料建立關卡，不重新生成
+        self.level_data = level_data
+        self.keep_level = RESET_KEEP_LEVEL  # 重新開始時是否保留同一個關卡
+
         # 初始化遊戲物件
         self.player = Player(100, SCREEN_HEIGHT - 200)  # 在安全位置生成玩家
-        self.weapon_manager = WeaponManager()  # 武器系統管理器
         self.monster_manager = MonsterManager()  # 怪物系統管理器
+        # 武器系統管理器，追蹤子彈和黏附的手榴彈透過怪物管理器的登記表找目標
+        self.weapon_manager = WeaponManager(self.monster_manager.registry)
         self.damage_display = DamageDisplayManager()  # 傷害顯示管理器
-        self.level_manager = LevelManager()  # 關卡場景管理器
+        self.level_manager = LevelManager(self.level_data)  # 關卡場景管理器
+
+        # 第一幀之前建立 HUD 和傷害數字會用到的所有字體，戰鬥中不會讀取字體檔
+        if not self.headless:
+            preload_fonts(PRELOAD_FONT_SIZES + self.damage_display.get_font_sizes())
 
         # 初始化背景和UI系統
         self.cloud_system = CloudSystem(
@@ -186,9 +181,14 @@ class ElementalParkourShooter:
         self.camera_x = 0
         self.camera_y = 0
 
-        # 時間管理
-        self.last_update_time = time.time()
-        self.dt = 1 / 60  # 默認時間間隔
+        # 時間管理（模擬用固定步長推進，繪製時在兩個模擬步之間插值）
+        self.last_update_time = get_game_time()
+        self.dt = FIXED_TIMESTEP  # 每次更新推進的模擬時間
+        self.timestep = FixedTimestep()
+        self.interpolator = RenderInterpolator()
+
+        # 效能分析（預設關閉，按 F3 顯示各階段耗時）
+        self.profiler = FrameProfiler()
 
     def update_camera(self):
         """
@@ -219,13 +219,15 @@ class ElementalParkourShooter:
         6. 每0.5秒生成兩隻小怪\n
         """
         if self.hack_mode:
-            print("🎯 開啟 hack 模式功能：")
-            print("  - 機關槍自動追蹤")
-            print("  - 狙擊槍無冷卻時間")
-            print("  - 無限手榴彈")
-            print("  - 必殺技無冷卻時間")
-            print("  - 無限血量（不會受到傷害）")
-            print("  - 每0.5秒生成兩隻小怪")
+            log.info(
+                "🎯 開啟 hack 模式功能：\n"
+                "  - 機關槍自動追蹤\n"
+                "  - 狙擊槍無冷卻時間\n"
+                "  - 無限手榴彈\n"
+                "  - 必殺技無冷卻時間\n"
+                "  - 無限血量（不會受到傷害）\n"
+                "  - 每0.5秒生成兩隻小怪"
+            )
 
             # 設定玩家和武器管理器的 hack 模式
             self.player.hack_mode = True
@@ -242,7 +244,7 @@ class ElementalParkourShooter:
             self.hack_monster_spawn_timer = 0
 
         else:
-            print("❌ 關閉 hack 模式")
+            log.info("❌ 關閉 hack 模式")
 
             # 關閉玩家和武器管理器的 hack 模式
             self.player.hack_mode = False
@@ -260,10 +262,12 @@ class ElementalParkourShooter:
         2. 在玩家附近但不太近的位置生成\n
         3. 每次生成兩隻怪物\n
         """
-        import random
-
-        # 如果怪物太多就不生成了（避免性能問題）
-        if len(self.monster_manager.monsters) >= 15:
+        
+        # 如果怪物太多就不生成了（避免性能問題，批次更新時可以容納更多）
+        max_monsters = HACK_MODE_MAX_MONSTERS
+        if self.monster_manager.crowd is not None:
+            max_monsters = HACK_MODE_MAX_CROWD_MONSTERS
+        if len(self.monster_manager.monsters) >= max_monsters:
             return
 
         # 獲取玩家位置
@@ -276,11 +280,11 @@ class ElementalParkourShooter:
         # 生成兩隻怪物
         for i in range(2):
             # 隨機選擇怪物類型
-            monster_type = random.choice(monster_types)
+            monster_type = rng.choice(monster_types)
 
             # 在玩家周圍隨機位置生成（距離150-400像素）
-            angle = random.uniform(0, 2 * 3.14159)  # 隨機角度
-            distance = random.uniform(150, 400)  # 隨機距離
+            angle = rng.uniform(0, 2 * 3.14159)  # 隨機角度
+            distance = rng.uniform(150, 400)  # 隨機距離
 
             spawn_x = player_x + distance * math.cos(angle)
             spawn_y = player_y + distance * math.sin(angle)
@@ -292,8 +296,9 @@ class ElementalParkourShooter:
             # 生成怪物
             self.monster_manager.spawn_specific_monster(monster_type, spawn_x, spawn_y)
 
-        print(
-            f"🎯 hack 模式生成了2隻怪物，當前怪物數量: {len(self.monster_manager.monsters)}"
+        log.debug(
+            "🎯 hack 模式生成了2隻怪物，當前怪物數量: %d",
+            len(self.monster_manager.monsters),
         )
 
     def handle_melee_bullet_deflection(self):
@@ -321,37 +326,10 @@ class ElementalParkourShooter:
         player_center_x = self.player.x + self.player.width // 2
         player_center_y = self.player.y + self.player.height // 2
 
-        # 檢查所有怪物的子彈，看看有沒有飛進甩槍範圍
-        for monster in self.monster_manager.monsters:
-            # 擋掉熔岩球 - 從後面開始檢查，這樣移除時不會搞亂索引
-            if hasattr(monster, "lava_balls"):  # 確保怪物有熔岩球系統
-                for i in range(len(monster.lava_balls) - 1, -1, -1):
-                    lava_ball = monster.lava_balls[i]
-
-                    # 算出熔岩球跟玩家的距離
-                    distance = (
-                        (lava_ball["x"] - player_center_x) ** 2
-                        + (lava_ball["y"] - player_center_y) ** 2
-                    ) ** 0.5
-
-                    # 如果熔岩球進入甩槍範圍就擋掉
-                    if distance <= deflection_range:
-                        monster.lava_balls.pop(i)  # 把熔岩球從遊戲中移除
-
-            # 擋掉水彈 - 同樣從後面開始檢查
-            if hasattr(monster, "water_bullets"):  # 確保怪物有水彈系統
-                for i in range(len(monster.water_bullets) - 1, -1, -1):
-                    water_bullet = monster.water_bullets[i]
-
-                    # 算出水彈跟玩家的距離
-                    distance = (
-                        (water_bullet[0] - player_center_x) ** 2
-                        + (water_bullet[1] - player_center_y) ** 2
-                    ) ** 0.5
-
-                    # 如果水彈進入甩槍範圍就擋掉
-                    if distance <= deflection_range:
-                        monster.water_bullets.pop(i)  # 把水彈從遊戲中移除
+        # 一次查詢擋掉所有飛進甩槍範圍的熔岩球和水彈
+        self.monster_manager.projectiles.deflect(
+            player_center_x, player_center_y, deflection_range
+        )
 
     def handle_weapon_spin_collision(self):
         """
@@ -368,10 +346,6 @@ class ElementalParkourShooter:
         - 根據武器飛行距離確定攻擊範圍\n
         - 使用圓形碰撞檢測確保精確判定\n
         """
-        if not hasattr(self.player, "weapon_hit_monsters"):
-            # 初始化已攻擊怪物記錄，防止重複傷害
-            self.player.weapon_hit_monsters = set()
-
         # 如果這是新的攻擊，清空之前的記錄
         if self.player.melee_animation_time == 0:
             self.player.weapon_hit_monsters.clear()
@@ -394,8 +368,11 @@ class ElementalParkourShooter:
         # 武器攻擊範圍（武器大小）
         weapon_attack_radius = 40  # 武器攻擊範圍半徑
 
-        # 檢查所有怪物是否被武器碰到
-        for monster in self.monster_manager.monsters:
+        # 只檢查空間網格裡武器附近的怪物
+        nearby_monsters = self.monster_manager.get_monsters_in_range(
+            weapon_x, weapon_y, weapon_attack_radius
+        )
+        for monster in nearby_monsters:
             # 避免對同一怪物重複攻擊
             if id(monster) in self.player.weapon_hit_monsters:
                 continue
@@ -404,51 +381,41 @@ class ElementalParkourShooter:
             monster_center_x = monster.x + monster.width // 2
             monster_center_y = monster.y + monster.height // 2
 
-            # 計算武器與怪物的距離
+            # 計算武器與怪物的距離（擊退方向用）
             distance = math.sqrt(
                 (weapon_x - monster_center_x) ** 2 + (weapon_y - monster_center_y) ** 2
             )
 
-            # 檢查是否在攻擊範圍內
-            if distance <= weapon_attack_radius:
-                # 記錄已攻擊的怪物，避免重複傷害
-                self.player.weapon_hit_monsters.add(id(monster))
+            # 記錄已攻擊的怪物，避免重複傷害
+            self.player.weapon_hit_monsters.add(id(monster))
 
-                # 對怪物造成傷害
-                if hasattr(monster, "take_damage"):
-                    monster.take_damage(90)  # 造成90點傷害
-                    print(f"🌪️ 旋轉武器擊中怪物！造成90點傷害")
+            # 對怪物造成傷害
+            if DAMAGEABLE in monster.capabilities:
+                monster.take_damage(90)  # 造成90點傷害
+                log.debug(f"🌪️ 旋轉武器擊中怪物！造成90點傷害")
 
-                # 計算擊退方向（從武器位置推向怪物）
-                if distance > 0:
-                    knockback_direction_x = (monster_center_x - weapon_x) / distance
-                    knockback_direction_y = (monster_center_y - weapon_y) / distance
-                else:
-                    # 如果距離為0，使用預設方向
-                    knockback_direction_x = self.player.facing_direction
-                    knockback_direction_y = 0
-
-                # 施加擊退效果
-                knockback_force = 200  # 強力擊退
-                if hasattr(monster, "apply_knockback"):
-                    monster.apply_knockback(knockback_force, knockback_direction_x)
-                elif hasattr(monster, "velocity_x"):
-                    # 如果怪物沒有 apply_knockback 方法，直接修改速度
-                    monster.velocity_x += knockback_direction_x * knockback_force
-                    if hasattr(monster, "velocity_y"):
-                        monster.velocity_y += (
-                            knockback_direction_y * knockback_force * 0.5
-                        )  # 輕微向上擊飛
-
-                # 增加分數
-                self.score += 25  # 旋轉攻擊額外分數
+            # 計算擊退方向（從武器位置推向怪物）
+            if distance > 0:
+                knockback_direction_x = (monster_center_x - weapon_x) / distance
+            else:
+                # 如果距離為0，使用預設方向
+                knockback_direction_x = self.player.facing_direction
+
+            # 施加擊退效果
+            knockback_force = 200  # 強力擊退
+            if KNOCKBACKABLE in monster.capabilities:
+                monster.apply_knockback(knockback_force, knockback_direction_x)
+
+            # 增加分數
+            self.score += 25  # 旋轉攻擊額外分數
 
     def handle_events(self):
         """
         處理所有遊戲事件 - 滑鼠點擊、鍵盤按鍵、視窗關閉等\n
         \n
-        檢查玩家的輸入並做出對應反應，\n
-        包含遊戲控制和系統事件。\n
+        離開遊戲和效能面板這類和遊戲過程無關的事件直接處理；\n
+        會影響遊戲的單次事件（重新開始、hack 模式、甩槍攻擊等）\n
+        先暫存起來，由下一個模擬步的 apply_input() 處理，錄製時才記得到。\n
         """
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -460,89 +427,145 @@ class ElementalParkourShooter:
                     # 按 ESC 鍵離開遊戲
                     self.running = False
                 elif event.key == pygame.K_r:
-                    # 按 R 鍵重新開始遊戲 - 修正重新開始邏輯
-                    if self.game_state in ["game_over", "victory", "death_screen"]:
-                        self.reset_game()
-                        print("🔄 玩家按下 R 鍵，遊戲重新開始")
+                    # 按 R 鍵重新開始遊戲
+                    self.pending_input_events.append("restart")
                 elif event.key == pygame.K_t:
                     # 按 T 鍵測試GameOver功能
-                    if self.game_state == "playing":
-                        print("🧪 測試按鍵：強制觸發玩家死亡")
-                        self.player.health = 0
-                        self.player.is_alive = False
+                    self.pending_input_events.append("force_death")
                 elif event.key == pygame.K_0:
                     # 按 0 鍵切換 hack 模式
-                    self.hack_mode = not self.hack_mode
-                    self.toggle_hack_mode()
-                    print(f"🔧 hack 模式: {'開啟' if self.hack_mode else '關閉'}")
+                    self.pending_input_events.append("toggle_hack")
+                elif event.key == pygame.K_F3:
+                    # 按 F3 切換效能分析面板
+                    self.profiler.toggle_overlay()
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                # 處理滑鼠點擊事件 - 只在遊戲進行時處理
-                if self.game_state == "playing" and self.player.is_alive:
-                    if event.button == 3:  # 右鍵點擊
-                        # 執行甩槍攻擊
-                        attack_result = self.player.melee_attack()
-                        if attack_result and attack_result.get("success"):
-                            print(
-                                f"🥊 {attack_result.get('weapon_name', '武器')}甩槍攻擊！"
-                            )
+                if event.button == 3:  # 右鍵點擊
+                    # 執行甩槍攻擊
+                    self.pending_input_events.append("melee")
 
-                            # 檢查攻擊是否命中怪物
-                            attack_x = self.player.x
-                            attack_y = self.player.y
-                            attack_range = attack_result.get("range", 80)
-                            attack_damage = attack_result.get("damage", 120)
-                            attack_knockback = attack_result.get("knockback", 150)
-
-                            # 計算攻擊範圍內的怪物
-                            hit_monsters = []
-                            for monster in self.monster_manager.monsters:
-                                distance = (
-                                    (monster.x - attack_x) ** 2
-                                    + (monster.y - attack_y) ** 2
-                                ) ** 0.5
-                                if distance <= attack_range:
-                                    hit_monsters.append(monster)
-
-                            # 對範圍內的怪物造成傷害
-                            for monster in hit_monsters:
-                                monster.take_damage(
-                                    attack_damage, "melee"
-                                )  # 標記為甩槍攻擊
-
-                                # 計算擊退方向
-                                dx = monster.x - attack_x
-                                dy = monster.y - attack_y
-                                distance = (dx**2 + dy**2) ** 0.5
-                                if distance > 0:
-                                    dx /= distance
-                                    dy /= distance
-                                    monster.velocity_x = dx * attack_knockback
-                                    monster.velocity_y = dy * attack_knockback
-
-                                # 顯示傷害數字
-                                self.damage_display.add_damage_number(
-                                    monster.x, monster.y - 20, attack_damage
-                                )
-
-                                print(
-                                    f"💥 {attack_result.get('weapon_name', '武器')}甩槍攻擊命中怪物，造成 {attack_damage} 點傷害！"
-                                )
-
-                                # 檢查怪物是否死亡
-                                if monster.health <= 0:
-                                    self.score += monster.score_value
-                                    print(
-                                        f"💀 怪物被甩槍攻擊擊敗！得分 +{monster.score_value}"
-                                    )
-                        else:
-                            print("🔄 甩槍攻擊冷卻中...")
+    def read_input(self):
+        """
+        讀取這一個模擬步的輸入 - 暫存的單次事件只交給一個模擬步\n
+        \n
+        回傳:\n
+        InputFrame: 目前的鍵盤、滑鼠狀態和暫存的事件\n
+        """
+        input_frame = capture_input(self.pending_input_events)
+        self.pending_input_events = []
+        return input_frame
 
-        # 處理連續按鍵和滑鼠輸入 - 確保只在遊戲進行時處理
+    def apply_input(self, input_frame):
+        """
+        把一個模擬步的輸入套用到遊戲 - 即時遊玩和重播都走這裡\n
+        \n
+        參數:\n
+        input_frame (InputFrame): 這一步的輸入\n
+        """
+        if input_frame.has_event("restart"):
+            # 重新開始遊戲 - 只在遊戲結束的畫面有效
+            if self.game_state in ["game_over", "victory", "death_screen"]:
+                self.reset_game()
+                log.info("🔄 玩家按下 R 鍵，遊戲重新開始")
+
+        if input_frame.has_event("force_death"):
+            # 測試按鍵：強制玩家死亡
+            if self.game_state == "playing":
+                log.info("🧪 測試按鍵：強制觸發玩家死亡")
+                self.player.health = 0
+                self.player.is_alive = False
+
+        if input_frame.has_event("toggle_hack"):
+            self.hack_mode = not self.hack_mode
+            self.toggle_hack_mode()
+            log.info(f"🔧 hack 模式: {'開啟' if self.hack_mode else '關閉'}")
+
+        # 處理滑鼠點擊和連續按鍵 - 確保只在遊戲進行時處理
         if self.game_state == "playing" and self.player.is_alive:
-            keys = pygame.key.get_pressed()
-            mouse_buttons = pygame.mouse.get_pressed()
-            self.player.handle_input(keys, mouse_buttons, self.camera_x, self.camera_y)
+            if input_frame.has_event("melee"):
+                self.handle_melee_click()
+
+            self.player.handle_input(
+                input_frame.keys,
+                input_frame.mouse_buttons,
+                self.camera_x,
+                self.camera_y,
+                input_frame.mouse_pos,
+            )
+
+    def handle_melee_click(self):
+        """
+        處理滑鼠右鍵的甩槍攻擊 - 對攻擊範圍內的怪物造成傷害和擊退\n
+        """
+        attack_result = self.player.melee_attack()
+        if attack_result and attack_result.get("success"):
+            log.debug("🥊 %s甩槍攻擊！", attack_result.get("weapon_name", "武器"))
+
+            # 檢查攻擊是否命中怪物
+            attack_x = self.player.x
+            attack_y = self.player.y
+            attack_range = attack_result.get("range", 80)
+            attack_damage = attack_result.get("damage", 120)
+            attack_knockback = attack_result.get("knockback", 150)
+
+            # 計算攻擊範圍內的怪物（先用空間網格找出左上角可能在範圍內的怪物，
+            # 外框多留 1 像素，涵蓋碰撞矩形座標取整的誤差）
+            search_left = math.floor(attack_x - attack_range) - 1
+            search_top = math.floor(attack_y - attack_range) - 1
+            search_size = math.ceil(attack_range) * 2 + 3
+            search_rect = pygame.Rect(search_left, search_top, search_size, search_size)
+            range_squared = attack_range * attack_range
+            hit_monsters = []
+            for monster in self.monster_manager.get_monsters_in_rect(search_rect):
+                offset_x = monster.x - attack_x
+                offset_y = monster.y - attack_y
+                if offset_x * offset_x + offset_y * offset_y <= range_squared:
+                    hit_monsters.append(monster)
+
+            # 對範圍內的怪物造成傷害
+            for monster in hit_monsters:
+                monster.take_damage(attack_damage, "melee")  # 標記為甩槍攻擊
+
+                # 計算擊退方向
+                dx = monster.x - attack_x
+                dy = monster.y - attack_y
+                distance = (dx**2 + dy**2) ** 0.5
+                if distance > 0:
+                    dx /= distance
+                    dy /= distance
+                    monster.velocity_x = dx * attack_knockback
+                    monster.velocity_y = dy * attack_knockback
+
+                # 顯示傷害數字
+                self.damage_display.add_damage_number(
+                    monster.x, monster.y - 20, attack_damage
+                )
+
+                log.debug(
+                    "💥 %s甩槍攻擊命中怪物，造成 %s 點傷害！",
+                    attack_result.get("weapon_name", "武器"),
+                    attack_damage,
+                )
+
+                # 檢查怪物是否死亡
+                if monster.health <= 0:
+                    self.score += monster.score_value
+                    log.debug("💀 怪物被甩槍攻擊擊敗！得分 +%s", monster.score_value)
+        else:
+            log.debug("🔄 甩槍攻擊冷卻中...")
+
+    def step(self, input_frame):
+        """
+        執行一個模擬步 - 記錄輸入、套用輸入、更新遊戲邏輯\n
+        \n
+        參數:\n
+        input_frame (InputFrame): 這一步的輸入\n
+        """
+        if self.recorder is not None:
+            self.recorder.record(input_frame)
+
+        self.apply_input(input_frame)
+        self.update()
 
     def update(self):
         """
@@ -554,19 +577,26 @@ class ElementalParkourShooter:
         - 子彈飛行和碰撞\n
         - 狀態效果更新\n
         """
+        # 模擬時鐘每次更新都前進一步，冷卻和持續時間都用它計算
+        self.game_clock.advance(FIXED_TIMESTEP)
+
         if self.game_state == "playing":
-            # 計算時間差
-            current_time = time.time()
-            dt = current_time - self.last_update_time
-            self.last_update_time = current_time
+            # 每次更新固定推進一個模擬步，和電腦快慢、繪製幀率無關
+            dt = FIXED_TIMESTEP
+            self.last_update_time = get_game_time()
             self.dt = dt  # 儲存為實例變數以供其他方法使用
 
+            # 載入攝影機附近的關卡段，丟掉離得很遠的段
+            self.level_manager.update_streaming(
+                self.camera_x, self.camera_x + SCREEN_WIDTH
+            )
+
             # 使用關卡管理器的平台資料
             platforms = self.level_manager.get_platforms()
 
             # hack 模式下為玩家提供怪物資訊用於自動追蹤
             if self.hack_mode:
-                self.player.set_monster_list(self.monster_manager.monsters)
+                self.player.set_monster_grid(self.monster_manager.grid)
 
                 # hack 模式下每0.5秒生成兩隻小怪
                 self.hack_monster_spawn_timer += dt
@@ -575,7 +605,8 @@ class ElementalParkourShooter:
                     self.hack_monster_spawn_timer = 0
 
             # 更新玩家狀態（無論是否存活都要更新以檢查死亡狀態）
-            player_update_result = self.player.update(platforms)
+            with self.profiler.scope("player"):
+                player_update_result = self.player.update(platforms)
 
             # 檢查玩家更新結果（可能包含死亡資訊）
             if player_update_result and player_update_result.get("game_over", False):
@@ -583,8 +614,8 @@ class ElementalParkourShooter:
                 self.play_game_over_sound()  # 播放死亡音效
                 self.stop_sniper_incoming_music()  # 強制停止大怪來襲音樂
                 self.game_state = "game_over"
-                self.game_over_time = time.time()
-                print("💀 遊戲結束！")
+                self.game_over_time = get_game_time()
+                log.info("💀 遊戲結束！")
                 return  # 直接返回，不再執行其他更新邏輯
 
             # 只有在玩家存活時才執行遊戲邏輯
@@ -623,64 +654,57 @@ class ElementalParkourShooter:
                     self.play_ultimate_sound()
 
                     # 根據目標類型顯示不同的攻擊模式訊息
-                    boss_targets = [
-                        target
-                        for target in all_targets
-                        if hasattr(target, "is_boss") and target.is_boss
-                    ]
+                    boss_targets = list(
+                        self.monster_manager.registry.get_capable(BOSS)
+                    )
                     regular_targets = [
                         target
                         for target in all_targets
-                        if not (hasattr(target, "is_boss") and target.is_boss)
+                        if BOSS not in target.capabilities
                     ]
 
                     if boss_targets:
                         # 有Boss時優先攻擊Boss
                         if len(boss_targets) == 1:
                             boss_type = getattr(boss_targets[0], "monster_type", "Boss")
-                            print(f"⚡ 雷電追蹤攻擊發動！鎖定Boss目標：{boss_type}")
+                            log.info(f"⚡ 雷電追蹤攻擊發動！鎖定Boss目標：{boss_type}")
                         else:
-                            print(
+                            log.info(
                                 f"⚡ 雷電追蹤攻擊發動！鎖定多個Boss目標：{len(boss_targets)}個"
                             )
                     elif regular_targets:
                         # 沒有Boss時攻擊普通怪物
                         if len(regular_targets) == 1:
-                            print("⚡ 雷電追蹤攻擊發動！(集中火力模式)")
+                            log.info("⚡ 雷電追蹤攻擊發動！(集中火力模式)")
                         else:
-                            print(
+                            log.info(
                                 f"⚡ 雷電追蹤攻擊發動！(分散攻擊模式 - {len(regular_targets)}個目標)"
                             )
                     else:
-                        print("⚡ 雷電追蹤攻擊發動！(無目標模式)")
+                        log.info("⚡ 雷電追蹤攻擊發動！(無目標模式)")
 
                 # 處理玩家的手榴彈投擲 - 檢查是否有待投擲的手榴彈
                 grenade_info = self.player.get_pending_grenade()
                 if grenade_info:
                     success = self.weapon_manager.create_grenade(grenade_info)
                     if success:
-                        print(
-                            f"💣 手榴彈投擲成功！剩餘: {self.weapon_manager.get_grenade_count()}"
+                        log.debug(
+                            "💣 手榴彈投擲成功！剩餘: %s",
+                            self.weapon_manager.get_grenade_count(),
                         )
                     else:
-                        print("💣 手榴彈投擲失敗（無剩餘手榴彈）")
+                        log.debug("💣 手榴彈投擲失敗（無剩餘手榴彈）")
 
                 # 處理手榴彈引爆 - 檢查是否觸發右鍵引爆
                 if self.player.get_pending_grenade_explosion():
-                    # 獲取所有可能受傷的目標（包括玩家和怪物）
-                    explosion_targets = [self.player]  # 玩家也可能被炸傷
-                    explosion_targets.extend(self.monster_manager.monsters)
-                    if self.monster_manager.boss:
-                        explosion_targets.append(self.monster_manager.boss)
-
-                    # 引爆所有手榴彈
+                    # 引爆所有手榴彈（玩家也可能被炸傷，怪物和Boss從空間網格查詢）
                     explosion_results = self.weapon_manager.explode_all_grenades(
-                        explosion_targets
+                        [self.player], self.monster_manager.grid
                     )
 
                     if explosion_results:
                         total_explosions = len([r for r in explosion_results if r])
-                        print(f"💥 手榴彈爆炸！造成 {total_explosions} 次傷害")
+                        log.debug("💥 手榴彈爆炸！造成 %s 次傷害", total_explosions)
 
                         # 處理爆炸傷害
                         for result in explosion_results:
@@ -689,7 +713,7 @@ class ElementalParkourShooter:
                                 damage = result["damage"]
 
                                 # 對目標造成傷害
-                                if hasattr(target, "take_damage"):
+                                if DAMAGEABLE in target.capabilities:
                                     target.take_damage(damage)
 
                                     # 顯示傷害數字
@@ -705,7 +729,7 @@ class ElementalParkourShooter:
                                             damage // 2
                                         )  # 手榴彈傷害的一半作為分數
                     else:
-                        print("💥 引爆手榴彈，但沒有手榴彈可以爆炸")
+                        log.debug("💥 引爆手榴彈，但沒有手榴彈可以爆炸")
 
                     # 重置引爆標記
                     self.player.reset_grenade_explosion_flag()
@@ -719,7 +743,10 @@ class ElementalParkourShooter:
                 if melee_info:
                     # 檢查近戰攻擊是否擊中怪物
                     hit_monsters = self.weapon_manager.handle_melee_attack(
-                        melee_info, self.monster_manager.monsters
+                        melee_info,
+                        self.monster_manager.get_monsters_in_rect(
+                            melee_info["attack_rect"]
+                        ),
                     )
 
                     # 每擊中一個怪物得20分
@@ -737,11 +764,14 @@ class ElementalParkourShooter:
                             melee_info.get("weapon_type", "unknown"), "未知武器"
                         )
                         damage = melee_info.get("damage", 0)
-                        print(
-                            f"🔨 {weapon_name}甩擊命中 {len(hit_monsters)} 個目標！傷害: {damage}"
+                        log.debug(
+                            "🔨 %s甩擊命中 %d 個目標！傷害: %s",
+                            weapon_name,
+                            len(hit_monsters),
+                            damage,
                         )
                     else:
-                        print("🔨 甩槍攻擊發動但未命中目標")
+                        log.debug("🔨 甩槍攻擊發動但未命中目標")
 
             elif self.player.is_dead:
                 # 玩家已經死亡，不再進行遊戲更新
@@ -749,9 +779,10 @@ class ElementalParkourShooter:
 
             # 更新關卡系統
             bullets = self.weapon_manager.bullets
-            level_update_result = self.level_manager.update(
-                dt, self.player, bullets, False
-            )
+            with self.profiler.scope("level"):
+                level_update_result = self.level_manager.update(
+                    dt, self.player, bullets, False
+                )
 
             # 檢查關卡中的傷害結果（如尖刺傷害）
             damage_result = level_update_result.get("damage_result")
@@ -761,8 +792,8 @@ class ElementalParkourShooter:
                     self.play_game_over_sound()  # 播放死亡音效
                     self.stop_sniper_incoming_music()  # 強制停止大怪來襲音樂
                     self.game_state = "game_over"
-                    self.game_over_time = time.time()
-                    print("💀 遊戲結束！")
+                    self.game_over_time = get_game_time()
+                    log.info("💀 遊戲結束！")
 
             # 檢查是否收集到星星
             if level_update_result.get("star_collected", False):
@@ -788,9 +819,13 @@ class ElementalParkourShooter:
             platforms = self.level_manager.get_platforms()
             bullets = self.weapon_manager.bullets  # 獲取玩家子彈用於Boss躲避
             level_width = self.level_manager.level_width  # 獲取關卡實際寬度
-            monster_update_result = self.monster_manager.update(
-                self.player, platforms, dt, bullets, level_width
-            )
+            view_rect = pygame.Rect(
+                self.camera_x, self.camera_y, SCREEN_WIDTH, SCREEN_HEIGHT
+            )  # 攝影機範圍，遠離畫面的怪物降低 AI 更新頻率
+            with self.profiler.scope("monsters"):
+                monster_update_result = self.monster_manager.update(
+                    self.player, platforms, dt, bullets, level_width, view_rect
+                )
 
             # 甩槍攔截怪物子彈 - 檢查甩槍攻擊是否能擋下敵方子彈
             if self.player.is_melee_attacking:
@@ -812,12 +847,12 @@ class ElementalParkourShooter:
                     self.play_game_over_sound()
                     self.stop_sniper_incoming_music()
                     self.game_state = "game_over"
-                    self.game_over_time = time.time()
-                    print("💀 遊戲結束！")
+                    self.game_over_time = get_game_time()
+                    log.info("💀 遊戲結束！")
 
             # 檢查Boss生成
             if monster_update_result["boss_spawned"]:
-                print("🔥 強大的Boss出現了！")
+                log.info("🔥 強大的Boss出現了！")
                 # 開始播放Boss背景音樂
                 self.start_boss_music()
 
@@ -847,9 +882,9 @@ class ElementalParkourShooter:
                     self.level_manager.star_y = boss_y - 50
                     self.level_manager.star_collected = False
                     self.level_manager.star_visible = True  # 讓勝利星星可見
-                    print("🌟 最終Boss被擊敗！勝利星星出現了！")
+                    log.info("🌟 最終Boss被擊敗！勝利星星出現了！")
                 else:
-                    print("🔥 第一階段Boss被擊敗，準備最終挑戰！")
+                    log.info("🔥 第一階段Boss被擊敗，準備最終挑戰！")
 
             # Boss系統移除，簡化遊戲體驗
 
@@ -860,19 +895,16 @@ class ElementalParkourShooter:
             if self.monster_manager.boss:
                 all_targets.append(self.monster_manager.boss)
 
-            # 獲取關卡平台用於手榴彈碰撞檢測
-            platforms = (
-                self.level_manager.platforms
-                if hasattr(self.level_manager, "platforms")
-                else []
-            )
+            # 獲取關卡平台空間網格用於手榴彈碰撞檢測
+            platforms = self.level_manager.get_platforms()
 
-            collision_results = self.weapon_manager.update(
-                targets=all_targets,
-                platforms=platforms,
-                level_width=self.level_manager.level_width,
-                level_height=self.level_manager.level_height,
-            )
+            with self.profiler.scope("weapons"):
+                collision_results = self.weapon_manager.update(
+                    targets=all_targets,
+                    platforms=platforms,
+                    level_width=self.level_manager.level_width,
+                    level_height=self.level_manager.level_height,
+                )
 
             # 處理子彈碰撞結果
             for collision in collision_results:
@@ -906,7 +938,8 @@ class ElementalParkourShooter:
                     )
 
             # 更新傷害顯示
-            self.damage_display.update()
+            with self.profiler.scope("damage_display"):
+                self.damage_display.update()
 
         # 移除 death_screen 狀態處理，改用死亡倒數機制
 
@@ -928,7 +961,8 @@ class ElementalParkourShooter:
         - 傷害 35（火彈/衝鋒槍）→ 音量 0.4\n
         - 傷害 90（狙擊槍）→ 音量 1.0（最大聲）\n
         """
-        if self.shooting_sound:
+        shooting_sound = self.audio.get_sound("shooting")
+        if shooting_sound:
             try:
                 # 根據傷害值計算音量（線性映射，範圍更大）
                 # 傷害範圍：20-90，音量範圍：0.1-1.0（差距9倍）
@@ -945,15 +979,15 @@ class ElementalParkourShooter:
                 volume = min_volume + (max_volume - min_volume) * volume_ratio
 
                 # 設定音效音量並播放
-                self.shooting_sound.set_volume(volume)
-                self.shooting_sound.play()
+                shooting_sound.set_volume(volume)
+                shooting_sound.play()
 
                 # 除錯資訊：顯示當前音量（可啟用來觀察效果）
-                print(f"🔊 射擊音效：傷害 {damage} → 音量 {volume:.2f}")
+                audio_log.debug("🔊 射擊音效：傷害 %s → 音量 %.2f", damage, volume)
 
             except pygame.error as e:
                 # 音效播放失敗時不影響遊戲
-                print(f"播放射擊音效失敗: {e}")
+                audio_log.warning(f"播放射擊音效失敗: {e}")
 
     def play_ultimate_sound(self):
         """
@@ -970,30 +1004,31 @@ class ElementalParkourShooter:
         - 音量強化到4倍大聲\n
         - 適合20秒冷卻的強力技能\n
         """
-        if self.ultimate_sound:
+        ultimate_sound = self.audio.get_sound("ultimate")
+        if ultimate_sound:
             try:
                 # 設定超大音量（pygame會自動限制在1.0，但我們盡力而為）
                 max_volume = min(1.0, ULTIMATE_SOUND_VOLUME)  # 確保不超過1.0
-                self.ultimate_sound.set_volume(max_volume)
+                ultimate_sound.set_volume(max_volume)
 
                 # 多重播放技術：同時在多個頻道播放相同音效來增強音量感
                 # 這會讓音效聽起來更響亮更震撼
                 for i in range(3):  # 同時播放3次
                     channel = pygame.mixer.find_channel()
                     if channel:
-                        channel.play(self.ultimate_sound)
+                        channel.play(ultimate_sound)
                     else:
                         # 如果沒有可用頻道，直接播放
-                        self.ultimate_sound.play()
+                        ultimate_sound.play()
 
                 # 除錯資訊：顯示必殺技音效觸發
-                print(
+                audio_log.info(
                     f"⚡⚡⚡ 必殺技音效：超大聲雷電轟鳴！音量 {ULTIMATE_SOUND_VOLUME}倍（實際{max_volume}）"
                 )
 
             except pygame.error as e:
                 # 音效播放失敗時不影響遊戲
-                print(f"播放必殺技音效失敗: {e}")
+                audio_log.warning(f"播放必殺技音效失敗: {e}")
 
     def play_game_over_sound(self):
         """
@@ -1009,15 +1044,16 @@ class ElementalParkourShooter:
         - 玩家掉出螢幕死亡時\n
         - 受到致命傷害時\n
         """
-        if self.game_over_sound:
+        game_over_sound = self.audio.get_sound("game_over")
+        if game_over_sound:
             try:
                 # 播放死亡音效
-                self.game_over_sound.play()
-                print(f"💀 播放死亡音效：Game Over！")
+                game_over_sound.play()
+                audio_log.info(f"💀 播放死亡音效：Game Over！")
 
             except pygame.error as e:
                 # 音效播放失敗時不影響遊戲
-                print(f"播放死亡音效失敗: {e}")
+                audio_log.warning(f"播放死亡音效失敗: {e}")
 
     def play_victory_sound(self):
         """
@@ -1034,15 +1070,16 @@ class ElementalParkourShooter:
         - 玩家收集到最右邊破關星星時\n
         - 完成重要成就時\n
         """
-        if self.victory_sound:
+        victory_sound = self.audio.get_sound("victory")
+        if victory_sound:
             try:
                 # 播放勝利音效
-                self.victory_sound.play()
-                print(f"🌟 播放勝利星星音效：Stage Clear！")
+                victory_sound.play()
+                audio_log.info(f"🌟 播放勝利星星音效：Stage Clear！")
 
             except pygame.error as e:
                 # 音效播放失敗時不影響遊戲
-                print(f"播放勝利星星音效失敗: {e}")
+                audio_log.warning(f"播放勝利星星音效失敗: {e}")
 
     def play_health_pickup_sound(self):
         """
@@ -1058,15 +1095,16 @@ class ElementalParkourShooter:
         - 玩家碰到愛心道具並成功恢復生命值時\n
         - 拾取其他有益道具時（未來擴展）\n
         """
-        if self.health_pickup_sound:
+        health_pickup_sound = self.audio.get_sound("health_pickup")
+        if health_pickup_sound:
             try:
                 # 播放愛心道具音效
-                self.health_pickup_sound.play()
-                print(f"💚 播放愛心道具音效：吃到寶物！")
+                health_pickup_sound.play()
+                audio_log.info(f"💚 播放愛心道具音效：吃到寶物！")
 
             except pygame.error as e:
                 # 音效播放失敗時不影響遊戲
-                print(f"播放愛心道具音效失敗: {e}")
+                audio_log.warning(f"播放愛心道具音效失敗: {e}")
 
     def manage_sniper_incoming_music(self):
         """
@@ -1075,9 +1113,7 @@ class ElementalParkourShooter:
         根據狙擊Boss的存在狀態決定是否播放特殊音樂\n
         """
         # 檢查是否有狙擊Boss存在
-        has_sniper_boss = self.monster_manager.boss is not None and hasattr(
-            self.monster_manager.boss, "tracking_bullets"
-        )
+        has_sniper_boss = self.monster_manager.has_sniper_boss()
 
         if has_sniper_boss and not self.is_sniper_music_playing:
             # 狙擊Boss存在但音樂還沒播放，開始播放
@@ -1088,70 +1124,40 @@ class ElementalParkourShooter:
 
     def play_sniper_incoming_music(self):
         """
-        播放狙擊怪來襲音樂 - 超大音量版本\n
+        播放狙擊怪來襲音樂 - 從音樂串流循環播放\n
         \n
-        使用多重播放技術增強音量感，達到3倍大聲的效果\n
+        音樂串流只有一條，會取代正在播放的Boss背景音樂\n
         """
-        if self.sniper_incoming_music and not self.is_sniper_music_playing:
-            try:
-                # 設定最大音量（pygame會自動限制在1.0，但我們盡力而為）
-                max_volume = min(1.0, SNIPER_INCOMING_MUSIC_VOLUME)
-                self.sniper_incoming_music.set_volume(max_volume)
-
-                # 多重播放技術：同時在多個頻道播放相同音樂來增強音量感
-                # 這會讓音樂聽起來更響亮更震撼
-                self.sniper_music_channels = []  # 儲存多個音樂頻道
-
-                for i in range(3):  # 同時播放3次來達到3倍音量效果
-                    channel = pygame.mixer.find_channel()
-                    if channel:
-                        channel.play(self.sniper_incoming_music, loops=-1)
-                        self.sniper_music_channels.append(channel)
-                    else:
-                        # 如果沒有可用頻道，直接播放
-                        self.sniper_incoming_music.play(loops=-1)
-
-                self.is_sniper_music_playing = True
-                print(
-                    f"🎯🎯🎯 狙擊怪來襲音樂開始播放！音量 {SNIPER_INCOMING_MUSIC_VOLUME}倍（3倍大聲）"
-                )
+        if self.is_sniper_music_playing:
+            return
 
-            except pygame.error as e:
-                print(f"播放狙擊怪來襲音樂失敗: {e}")
+        if self.audio.play_music("sniper_incoming"):
+            self.is_sniper_music_playing = True
+            audio_log.info(
+                f"🎯🎯🎯 狙擊怪來襲音樂開始播放！音量 {SNIPER_INCOMING_MUSIC_VOLUME}倍"
+            )
 
     def stop_sniper_incoming_music(self):
         """
-        停止狙擊怪來襲音樂 - 停止所有多重播放頻道\n
+        停止狙擊怪來襲音樂\n
         """
         if self.is_sniper_music_playing:
-            try:
-                # 停止所有音樂頻道
-                if (
-                    hasattr(self, "sniper_music_channels")
-                    and self.sniper_music_channels
-                ):
-                    for channel in self.sniper_music_channels:
-                        if channel:
-                            channel.stop()
-                    self.sniper_music_channels = []
-                elif (
-                    hasattr(self, "sniper_music_channel") and self.sniper_music_channel
-                ):
-                    self.sniper_music_channel.stop()
-                else:
-                    # 停止所有正在播放的音樂（如果沒有專用頻道）
-                    pygame.mixer.stop()
-
-                self.is_sniper_music_playing = False
-                self.sniper_music_channel = None
-                print("🎯 狙擊怪來襲音樂已停止（3倍音量版本）")
+            if self.audio.current_music == "sniper_incoming":
+                self.audio.stop_music()
 
-            except pygame.error as e:
-                print(f"停止狙擊怪來襲音樂失敗: {e}")
+            self.is_sniper_music_playing = False
+            audio_log.info("🎯 狙擊怪來襲音樂已停止")
 
-    def reset_game(self):
+    def reset_game(self, keep_level=None):
         """
         重置遊戲到初始狀態\n
+        \n
+        各管理器就地清空自己的狀態，已載入的圖片、子彈陣列、空間網格和\n
+        預繪區塊都繼續使用，重新開始幾乎不用等待，也不會每局多出一批圖片\n
+        \n
+        參數:\n
+        keep_level (bool): True 表示保留同一個關卡，False 表示換新的關卡種子，\n
+        None 表示依照 self.keep_level\n
         """
         # 停止狙擊怪來襲音樂（如果正在播放）
         if self.is_sniper_music_playing:
@@ -1168,25 +1174,26 @@ class ElementalParkourShooter:
         self.game_over_time = 0
 
         # 重置遊戲物件
-        self.player = Player(100, SCREEN_HEIGHT - 200)
-        self.weapon_manager = WeaponManager()
-        self.monster_manager = MonsterManager()
-        self.damage_display = DamageDisplayManager()
-        self.level_manager = LevelManager()
+        if keep_level is None:
+            keep_level = self.keep_level
+        self.player.reset(100, SCREEN_HEIGHT - 200)
+        self.weapon_manager.reset()
+        self.monster_manager.reset()
+        self.damage_display.clear_all()
+        self.level_manager.reset(keep_level)
 
-        # 重新初始化背景和UI系統
-        self.cloud_system = CloudSystem(
-            self.level_manager.level_width, self.level_manager.level_height
-        )
+        # 關卡大小不會改變，背景雲朵繼續使用
 
         # 重置攝影機
         self.camera_x = 0
         self.camera_y = 0
 
         # 重置時間管理
-        self.last_update_time = time.time()
+        self.last_update_time = get_game_time()
+        self.timestep.reset()
+        self.interpolator.clear()
 
-        print("🔄 遊戲已重置")
+        log.info("🔄 遊戲已重置")
 
     def draw(self):
         """
@@ -1200,111 +1207,82 @@ class ElementalParkourShooter:
         5. UI 介面（血量、分數等）\n
         """
         if self.game_state == "playing":
-            # 先清空螢幕並繪製天空背景
-            self.screen.fill(SKY_COLOR)
-
-            # 繪製遠山背景（在地平線上）- 使用標準 Pygame 座標系統
-            horizon_y = 500  # 固定地平線在 Y=500，玩家在 Y=600
-
-            for i in range(5):
-                # 簡化座標：背景山峰幾乎不移動
-                mountain_x = i * (SCREEN_WIDTH // 4) - (
-                    self.camera_x * 0.05
-                )  # 極輕微視差
-                mountain_height = 50 + i * 20
-                mountain_color = (64 + i * 10, 64 + i * 10, 80 + i * 10)  # 漸層灰藍色
-
-                # 繪製三角形山峰
-                mountain_points = [
-                    (mountain_x - 100, horizon_y),
-                    (mountain_x, horizon_y - mountain_height),
-                    (mountain_x + 100, horizon_y),
-                ]
-
-                pygame.draw.polygon(self.screen, mountain_color, mountain_points)
-
-            # 繪製地面背景（在螢幕下方）
-            ground_height = SCREEN_HEIGHT // 4  # 地面佔螢幕下方1/4
-            ground_rect = pygame.Rect(
-                0, SCREEN_HEIGHT - ground_height, SCREEN_WIDTH, ground_height
-            )
-            pygame.draw.rect(self.screen, (101, 67, 33), ground_rect)  # 深棕色地面
-
-            # 繪製草地表面
-            grass_height = 10
-            grass_rect = pygame.Rect(
-                0,
-                SCREEN_HEIGHT - ground_height - grass_height,
-                SCREEN_WIDTH,
-                grass_height,
-            )
-            pygame.draw.rect(self.screen, (34, 139, 34), grass_rect)  # 草綠色
-
-            # 繪製關卡場景（包含背景、平台和陷阱）
-            self.level_manager.draw(self.screen, self.camera_x, self.camera_y)
+            # 繪製關卡場景（天空背景會清空整個畫面，接著貼上平台和陷阱）
+            with self.profiler.scope("draw_level"):
+                self.level_manager.draw(self.screen, self.camera_x, self.camera_y)
 
             # 繪製怪物（需要攝影機偏移）
-            self.monster_manager.draw(self.screen, self.camera_x, self.camera_y)
+            with self.profiler.scope("draw_monsters"):
+                self.monster_manager.draw(self.screen, self.camera_x, self.camera_y)
 
             # 繪製武器系統（子彈等）
-            self.weapon_manager.draw(self.screen, self.camera_x, self.camera_y)
+            with self.profiler.scope("draw_weapons"):
+                self.weapon_manager.draw(self.screen, self.camera_x, self.camera_y)
 
             # 繪製傷害數字
-            self.damage_display.draw(self.screen, self.camera_x, self.camera_y)
+            with self.profiler.scope("draw_damage"):
+                self.damage_display.draw(self.screen, self.camera_x, self.camera_y)
 
-            # 繪製玩家
-            if self.player.is_alive:
-                self.player.draw(self.screen, self.camera_x, self.camera_y)
+            with self.profiler.scope("draw_player"):
+                # 繪製玩家
+                if self.player.is_alive:
+                    self.player.draw(self.screen, self.camera_x, self.camera_y)
 
-            # 繪製手榴彈拋物線軌跡（在玩家繪製後，準心之前）
-            self.draw_grenade_trajectory()
+                # 繪製手榴彈拋物線軌跡（在玩家繪製後，準心之前）
+                self.draw_grenade_trajectory()
 
-            # 繪製狙擊槍準心（在最上層）
-            self.player.draw_crosshair(self.screen, self.camera_x, self.camera_y)
+                # 繪製狙擊槍準心（在最上層）
+                self.player.draw_crosshair(self.screen, self.camera_x, self.camera_y)
 
-            # 繪製 UI 元素（固定在螢幕上，不受攝影機影響）
-            self.player.draw_health_bar(self.screen)
-            self.player.draw_bullet_ui(self.screen)
-            self.player.draw_ultimate_ui(self.screen)
+            with self.profiler.scope("draw_ui"):
+                # 繪製 UI 元素（固定在螢幕上，不受攝影機影響）
+                self.player.draw_health_bar(self.screen)
+                self.player.draw_bullet_ui(self.screen)
+                self.player.draw_ultimate_ui(self.screen)
 
-            # 繪製手榴彈計數UI
-            self.draw_grenade_ui()
+                # 繪製手榴彈計數UI
+                self.draw_grenade_ui()
 
-            # 繪製 hack 模式狀態
-            self.draw_hack_mode_ui()
+                # 繪製 hack 模式狀態
+                self.draw_hack_mode_ui()
 
-            # 繪製分數（恢復到原始位置）
-            score_font = get_chinese_font(FONT_SIZE_MEDIUM)
-            score_text = score_font.render(f"分數: {self.score}", True, WHITE)
-            score_rect = score_text.get_rect()
-            score_rect.topright = (SCREEN_WIDTH - 20, 20)  # 恢復到右上角原始位置
-            self.screen.blit(score_text, score_rect)
+                # 繪製分數（恢復到原始位置）
+                score_text = get_text_surface(
+                    f"分數: {self.score}", FONT_SIZE_MEDIUM, WHITE
+                )
+                score_rect = score_text.get_rect()
+                score_rect.topright = (SCREEN_WIDTH - 20, 20)  # 恢復到右上角原始位置
+                self.screen.blit(score_text, score_rect)
 
         elif self.game_state == "victory":
             # 繪製勝利畫面
             self.screen.fill(BLACK)
 
-            victory_text = get_chinese_font(FONT_SIZE_LARGE).render(
-                "🏆 勝利！", True, YELLOW
-            )
+            victory_text = get_text_surface("🏆 勝利！", FONT_SIZE_LARGE, YELLOW)
             victory_rect = victory_text.get_rect(
                 center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100)
             )
             self.screen.blit(victory_text, victory_rect)
 
-            score_text = self.font.render(f"最終分數: {self.score}", True, WHITE)
+            score_text = get_text_surface(
+                f"最終分數: {self.score}", FONT_SIZE_MEDIUM, WHITE
+            )
             score_rect = score_text.get_rect(
                 center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20)
             )
             self.screen.blit(score_text, score_rect)
 
-            congrats_text = self.font.render("恭喜找到目標星星！", True, GREEN)
+            congrats_text = get_text_surface(
+                "恭喜找到目標星星！", FONT_SIZE_MEDIUM, GREEN
+            )
             congrats_rect = congrats_text.get_rect(
                 center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)
             )
             self.screen.blit(congrats_text, congrats_rect)
 
-            restart_text = self.font.render("按 R 重新開始，ESC 離開", True, WHITE)
+            restart_text = get_text_surface(
+                "按 R 重新開始，ESC 離開", FONT_SIZE_MEDIUM, WHITE
+            )
             restart_rect = restart_text.get_rect(
                 center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 70)
             )
@@ -1317,8 +1295,8 @@ class ElementalParkourShooter:
             self.screen.fill(GAME_OVER_BG_COLOR)
 
             # 標題文字
-            game_over_text = get_chinese_font(FONT_SIZE_LARGE).render(
-                DEATH_TITLE_TEXT, True, GAME_OVER_TITLE_COLOR
+            game_over_text = get_text_surface(
+                DEATH_TITLE_TEXT, FONT_SIZE_LARGE, GAME_OVER_TITLE_COLOR
             )
             text_rect = game_over_text.get_rect(
                 center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 120)
@@ -1326,8 +1304,10 @@ class ElementalParkourShooter:
             self.screen.blit(game_over_text, text_rect)
 
             # 最終分數
-            score_text = self.font.render(
-                f"{DEATH_FINAL_SCORE_TEXT}: {self.score}", True, GAME_OVER_TEXT_COLOR
+            score_text = get_text_surface(
+                f"{DEATH_FINAL_SCORE_TEXT}: {self.score}",
+                FONT_SIZE_MEDIUM,
+                GAME_OVER_TEXT_COLOR,
             )
             score_rect = score_text.get_rect(
                 center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)
@@ -1336,8 +1316,8 @@ class ElementalParkourShooter:
 
             # 爬升高度（保留原有功能）
             height_level = max(1, int(-(self.player.y - SCREEN_HEIGHT) / 120))
-            level_text = self.font.render(
-                f"爬升高度: 第 {height_level} 層", True, GAME_OVER_TEXT_COLOR
+            level_text = get_text_surface(
+                f"爬升高度: 第 {height_level} 層", FONT_SIZE_MEDIUM, GAME_OVER_TEXT_COLOR
             )
             level_rect = level_text.get_rect(
                 center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
@@ -1345,8 +1325,8 @@ class ElementalParkourShooter:
             self.screen.blit(level_text, level_rect)
 
             # 重新開始提示
-            restart_text = self.font.render(
-                DEATH_RETRY_TEXT, True, GAME_OVER_RETRY_COLOR
+            restart_text = get_text_surface(
+                DEATH_RETRY_TEXT, FONT_SIZE_MEDIUM, GAME_OVER_RETRY_COLOR
             )
             restart_rect = restart_text.get_rect(
                 center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60)
@@ -1354,7 +1334,9 @@ class ElementalParkourShooter:
             self.screen.blit(restart_text, restart_rect)
 
             # 離開遊戲提示
-            quit_text = self.font.render(DEATH_QUIT_TEXT, True, GAME_OVER_TEXT_COLOR)
+            quit_text = get_text_surface(
+                DEATH_QUIT_TEXT, FONT_SIZE_MEDIUM, GAME_OVER_TEXT_COLOR
+            )
             quit_rect = quit_text.get_rect(
                 center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100)
             )
@@ -1362,78 +1344,73 @@ class ElementalParkourShooter:
 
         # 最後繪製雲朵系統（最上層顯示）
         if self.game_state == "playing":
-            self.cloud_system.draw(self.screen, self.camera_x, self.camera_y)
+            with self.profiler.scope("draw_clouds"):
+                self.cloud_system.draw(self.screen, self.camera_x, self.camera_y)
+
+        # 效能分析面板蓋在所有畫面上面
+        if self.profiler.overlay_visible:
+            self.profiler.draw(self.screen)
 
         # 更新整個螢幕顯示
         pygame.display.flip()
 
     def start_boss_music(self):
         """
-        開始播放Boss背景音樂，支持循環播放
+        開始從音樂串流播放Boss背景音樂，支持循環播放
         """
-        if not self.boss_music or self.is_boss_music_playing:
+        if self.is_boss_music_playing:
             return
 
-        try:
-            # 如果有其他音樂在播放，停止它們
-            if self.is_sniper_music_playing:
-                self.stop_sniper_music()
-
-            # 播放Boss音樂，使用-1表示無限循環
-            self.boss_music_channel = pygame.mixer.find_channel()
-            if self.boss_music_channel:
-                self.boss_music_channel.play(self.boss_music, loops=-1)
-                self.is_boss_music_playing = True
-                print("🎵 Boss背景音樂開始播放（循環）")
+        # 如果有其他音樂在播放，停止它們
+        if self.is_sniper_music_playing:
+            self.stop_sniper_music()
 
-        except Exception as e:
-            print(f"播放Boss音樂時發生錯誤: {e}")
+        # 串流播放Boss音樂並無限循環
+        if self.audio.play_music("boss"):
+            self.is_boss_music_playing = True
+            audio_log.info("🎵 Boss背景音樂開始播放（循環）")
 
     def stop_boss_music_with_fade(self):
         """
         以漸弱效果停止Boss背景音樂
         """
-        if not self.is_boss_music_playing or not self.boss_music_channel:
+        if not self.is_boss_music_playing:
             return
 
-        try:
-            # 使用pygame的fadeout功能實現漸弱效果
+        if self.audio.current_music == "boss":
+            # 使用音樂串流的fadeout功能實現漸弱效果
             fade_time_ms = int(self.boss_music_fade_duration * 1000)  # 轉換為毫秒
-            self.boss_music_channel.fadeout(fade_time_ms)
-
-            self.is_boss_music_playing = False
-            self.boss_music_channel = None
-            print(f"🎵 Boss背景音樂以 {self.boss_music_fade_duration} 秒漸弱停止")
+            self.audio.stop_music(fade_time_ms)
 
-        except Exception as e:
-            print(f"停止Boss音樂時發生錯誤: {e}")
+        self.is_boss_music_playing = False
+        audio_log.info(f"🎵 Boss背景音樂以 {self.boss_music_fade_duration} 秒漸弱停止")
 
     def update_boss_music_status(self):
         """
         更新Boss音樂播放狀態，檢查是否需要重新播放
         """
-        if self.is_boss_music_playing and self.boss_music_channel:
-            # 檢查音樂是否還在播放
-            if not self.boss_music_channel.get_busy():
-                print("🎵 Boss音樂播放結束，準備重新播放")
-                self.is_boss_music_playing = False
-                self.boss_music_channel = None
+        if self.is_boss_music_playing and not self.audio.is_music_playing("boss"):
+            # 音樂播放結束或被狙擊怪來襲音樂取代
+            audio_log.info("🎵 Boss音樂已停止，準備重新播放")
+            self.is_boss_music_playing = False
 
-                # 如果還有Boss存在，重新開始播放音樂
-                if self.monster_manager.boss and self.monster_manager.boss.is_alive:
-                    self.start_boss_music()
+            # 如果還有Boss存在且沒有其他音樂，重新開始播放音樂
+            if (
+                self.audio.current_music is None
+                and self.monster_manager.boss
+                and self.monster_manager.boss.is_alive
+            ):
+                self.start_boss_music()
 
     def stop_sniper_music(self):
         """
         停止狙擊怪音樂播放
         """
         if self.is_sniper_music_playing:
-            for channel in self.sniper_music_channels:
-                if channel and channel.get_busy():
-                    channel.stop()
-            self.sniper_music_channels.clear()
+            if self.audio.current_music == "sniper_incoming":
+                self.audio.stop_music()
             self.is_sniper_music_playing = False
-            print("🎵 狙擊怪音樂已停止")
+            audio_log.info("🎵 狙擊怪音樂已停止")
 
     def draw_grenade_trajectory(self):
         """
@@ -1443,107 +1420,25 @@ class ElementalParkourShooter:
         1. 只在手榴彈模式下顯示軌跡\n
         2. 考慮重力影響的真實拋物線\n
         3. 檢測平台碰撞，在碰撞點停止\n
-        4. 使用虛線效果增加視覺美感\n
+        4. 使用虛線效果增加視覺美感（虛線段事先算好，每幀只需要繪製）\n
         """
         # 檢查是否應該顯示軌跡：玩家存活 + 手榴彈模式
         if not self.player.is_alive or not self.player.grenade_mode:
             return
 
         # 獲取平台資訊用於碰撞檢測
-        platforms = self.level_manager.get_platforms()
+        platform_grid = self.level_manager.get_platforms()
 
-        # 計算軌跡路徑
+        # 計算軌跡路徑（位置和方向沒變時直接使用上次的結果）
         trajectory_points = self.player.calculate_grenade_trajectory(
-            self.camera_x, self.camera_y, platforms, max_points=50
+            self.camera_x, self.camera_y, platform_grid, GRENADE_TRAJECTORY_STEPS
         )
 
         if len(trajectory_points) < 2:
             return
 
         # 繪製虛線軌跡
-        dash_length = 8  # 虛線段長度
-        gap_length = 6  # 虛線間隔長度
-
-        for i in range(len(trajectory_points) - 1):
-            start_point = trajectory_points[i]
-            end_point = trajectory_points[i + 1]
-
-            # 轉換為螢幕座標
-            screen_start = (
-                start_point[0] - self.camera_x,
-                start_point[1] - self.camera_y,
-            )
-            screen_end = (end_point[0] - self.camera_x, end_point[1] - self.camera_y)
-
-            # 只繪製在螢幕範圍內的線段
-            if (
-                screen_start[0] < -50
-                or screen_start[0] > SCREEN_WIDTH + 50
-                or screen_start[1] < -50
-                or screen_start[1] > SCREEN_HEIGHT + 50
-            ):
-                continue
-
-            # 計算線段長度和方向
-            dx = screen_end[0] - screen_start[0]
-            dy = screen_end[1] - screen_start[1]
-            line_length = math.sqrt(dx**2 + dy**2)
-
-            if line_length == 0:
-                continue
-
-            # 正規化方向向量
-            unit_x = dx / line_length
-            unit_y = dy / line_length
-
-            # 繪製虛線效果
-            current_distance = 0
-            dash_on = True  # 控制虛線的開關
-
-            while current_distance < line_length:
-                if dash_on:
-                    # 繪製實線段
-                    dash_start_x = screen_start[0] + unit_x * current_distance
-                    dash_start_y = screen_start[1] + unit_y * current_distance
-                    dash_end_distance = min(current_distance + dash_length, line_length)
-                    dash_end_x = screen_start[0] + unit_x * dash_end_distance
-                    dash_end_y = screen_start[1] + unit_y * dash_end_distance
-
-                    # 軌跡顏色隨著距離漸變（綠色到黃色到紅色）
-                    distance_ratio = i / max(len(trajectory_points) - 1, 1)
-
-                    if distance_ratio < 0.5:
-                        # 前半段：綠色到黃色
-                        color_ratio = distance_ratio * 2
-                        color = (
-                            int(
-                                GRENADE_COLOR[0]
-                                + (255 - GRENADE_COLOR[0]) * color_ratio
-                            ),
-                            int(GRENADE_COLOR[1]),
-                            int(GRENADE_COLOR[2] * (1 - color_ratio)),
-                        )
-                    else:
-                        # 後半段：黃色到紅色
-                        color_ratio = (distance_ratio - 0.5) * 2
-                        color = (255, int(255 * (1 - color_ratio)), 0)
-
-                    # 繪製線段，線寬隨距離變細
-                    line_width = max(1, 3 - int(distance_ratio * 2))
-                    pygame.draw.line(
-                        self.screen,
-                        color,
-                        (int(dash_start_x), int(dash_start_y)),
-                        (int(dash_end_x), int(dash_end_y)),
-                        line_width,
-                    )
-
-                    current_distance = dash_end_distance
-                else:
-                    # 跳過間隔
-                    current_distance += gap_length
-
-                dash_on = not dash_on
+        self.player.grenade_trajectory.draw(self.screen, self.camera_x, self.camera_y)
 
     def draw_grenade_ui(self):
         """
@@ -1571,33 +1466,29 @@ class ElementalParkourShooter:
         pygame.draw.rect(self.screen, (0, 0, 0, 180), ui_rect)  # 半透明黑色背景
         pygame.draw.rect(self.screen, GRENADE_COLOR, ui_rect, 2)  # 綠色邊框
 
-        # 設定字體
-        font = get_chinese_font(FONT_SIZE_SMALL)
-
-        # 顯示手榴彈標題
-        title_text = font.render("💣 手榴彈系統", True, WHITE)
+        # 顯示手榴彈標題（文字圖片由共用緩存提供）
+        title_text = get_text_surface("💣 手榴彈系統", FONT_SIZE_SMALL, WHITE)
         self.screen.blit(title_text, (ui_x, ui_y))
 
         # 顯示剩餘數量
-        count_text = font.render(
-            f"剩餘: {remaining_count}/{GRENADE_MAX_COUNT}", True, WHITE
+        count_text = get_text_surface(
+            f"剩餘: {remaining_count}/{GRENADE_MAX_COUNT}", FONT_SIZE_SMALL, WHITE
         )
         self.screen.blit(count_text, (ui_x, ui_y + 20))
 
         # 顯示場上數量
-        active_text = font.render(f"場上: {active_count}", True, WHITE)
+        active_text = get_text_surface(f"場上: {active_count}", FONT_SIZE_SMALL, WHITE)
         self.screen.blit(active_text, (ui_x, ui_y + 40))
 
         # 顯示手榴彈模式狀態
         if grenade_mode:
-            mode_text = font.render("手榴彈模式: 開啟", True, GREEN)
+            mode_text = get_text_surface("手榴彈模式: 開啟", FONT_SIZE_SMALL, GREEN)
         else:
-            mode_text = font.render("手榴彈模式: 關閉", True, GRAY)
+            mode_text = get_text_surface("手榴彈模式: 關閉", FONT_SIZE_SMALL, GRAY)
         self.screen.blit(mode_text, (ui_x, ui_y + 60))
 
         # 顯示操作提示（右側）
         tip_x = ui_x + ui_width + 20
-        tip_font = get_chinese_font(FONT_SIZE_TINY)
 
         tips = [
             "H - 切換手榴彈模式",
@@ -1606,7 +1497,7 @@ class ElementalParkourShooter:
         ]
 
         for i, tip in enumerate(tips):
-            tip_text = tip_font.render(tip, True, WHITE)
+            tip_text = get_text_surface(tip, FONT_SIZE_TINY, WHITE)
             self.screen.blit(tip_text, (tip_x, ui_y + i * 15))
 
     def draw_hack_mode_ui(self):
@@ -1629,23 +1520,19 @@ class ElementalParkourShooter:
         pygame.draw.rect(self.screen, (128, 0, 128, 180), ui_rect)  # 半透明紫色背景
         pygame.draw.rect(self.screen, RED, ui_rect, 3)  # 紅色邊框
 
-        # 設定字體
-        font = get_chinese_font(FONT_SIZE_SMALL)
-        title_font = get_chinese_font(FONT_SIZE_MEDIUM)
-
-        # 顯示 hack 模式標題
-        title_text = title_font.render("🔧 HACK 模式啟用", True, RED)
+        # 顯示 hack 模式標題（文字圖片由共用緩存提供）
+        title_text = get_text_surface("🔧 HACK 模式啟用", FONT_SIZE_MEDIUM, RED)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, ui_y + 15))
         self.screen.blit(title_text, title_rect)
 
         # 顯示功能說明
         features = "機關槍追蹤 | 狙擊槍無冷卻 | 無限手榴彈 | 必殺技無冷卻 | 無限血量 | 快速生怪"
-        feature_text = font.render(features, True, YELLOW)
+        feature_text = get_text_surface(features, FONT_SIZE_SMALL, YELLOW)
         feature_rect = feature_text.get_rect(center=(SCREEN_WIDTH // 2, ui_y + 40))
         self.screen.blit(feature_text, feature_rect)
 
         # 顯示關閉提示
-        tip_text = font.render("按 0 鍵關閉 hack 模式", True, WHITE)
+        tip_text = get_text_surface("按 0 鍵關閉 hack 模式", FONT_SIZE_SMALL, WHITE)
         tip_rect = tip_text.get_rect(center=(SCREEN_WIDTH // 2, ui_y + 60))
         self.screen.blit(tip_text, tip_rect)
 
@@ -1661,35 +1548,502 @@ class ElementalParkourShooter:
         \n
         直到玩家選擇離開遊戲為止。\n
         """
+        self.timestep.reset()
+
         while self.running:
             # 處理事件（按鍵、滑鼠、視窗關閉等）
             self.handle_events()
 
-            # 更新遊戲邏輯
-            self.update()
+            # 依照經過的真實時間執行固定步長的模擬更新
+            steps = self.timestep.advance()
+            for _ in range(steps):
+                input_frame = self.read_input()
+
+                # 每步之前記下位置，繪製時才能在上一步和這一步之間插值
+                self.capture_interpolation_state()
+                self.step(input_frame)
 
-            # 繪製遊戲畫面
-            self.draw()
+            # 繪製遊戲畫面（位置內插到目前時間點）
+            self.draw_interpolated(self.timestep.get_alpha())
 
-            # 控制遊戲幀率，確保穩定的 60 FPS
+            # 記錄這一幀各階段的耗時（分析關閉時直接略過）
+            if self.profiler.enabled:
+                self.profiler.end_frame(self.get_profile_counts())
+
+            # 控制繪製幀率（模擬頻率由 SIMULATION_HZ 決定，兩者互不影響）
             self.clock.tick(FPS)
 
         # 遊戲結束時清理資源
+        self.stop_recording()
+        self.profiler.stop_export()
+        self.audio.close()
         pygame.quit()
         sys.exit()
 
+    def get_profile_counts(self):
+        """
+        取得效能分析面板和匯出檔使用的物件數量\n
+        \n
+        回傳:\n
+        dict: 子彈數和怪物數\n
+        """
+        return {
+            "bullet_count": self.weapon_manager.get_bullet_count(),
+            "monster_count": self.monster_manager.get_monster_count(),
+        }
+
+    def get_interpolated_objects(self):
+        """
+        取得繪製時需要位置插值的物件\n
+        \n
+        回傳:\n
+        list: 玩家、怪物、Boss、子彈和手榴彈\n
+        """
+        objects = [self.player]
+        objects.extend(self.monster_manager.monsters)
+        if self.monster_manager.boss:
+            objects.append(self.monster_manager.boss)
+        objects.extend(self.weapon_manager.bullets)
+        objects.extend(self.weapon_manager.grenades)
+        return objects
+
+    def capture_interpolation_state(self):
+        """
+        在模擬步之前記錄所有插值物件的位置\n
+        """
+        self.interpolator.capture(self.get_interpolated_objects())
+
+    def draw_interpolated(self, alpha):
+        """
+        用內插位置繪製一幀，畫完後還原真實狀態\n
+        \n
+        參數:\n
+        alpha (float): 插值比例，0.0 = 上一個模擬步，1.0 = 目前模擬步\n
+        """
+        self.interpolator.apply(self.get_interpolated_objects(), alpha)
+
+        # 攝影機跟著內插後的玩家位置，畫面才會一起平滑移動
+        saved_camera = (self.camera_x, self.camera_y)
+        self.update_camera()
+
+        self.draw()
+
+        self.camera_x, self.camera_y = saved_camera
+        self.interpolator.restore()
+
+    def run_headless(self, ticks=None, duration=None, replay=None):
+        """
+        無頭模擬迴圈 - 不繪製、不限速，連續執行遊戲更新並回報效能\n
+        \n
+        每一次迴圈只執行一個模擬步，不呼叫 draw() 也不呼叫 clock.tick()，\n
+        所以量到的是純模擬的吞吐量。玩家死亡或勝利時會自動重新開始，\n
+        讓長時間的穩定性測試可以一直跑下去。\n
+        \n
+        重播時依照錄製檔逐步套用輸入，跑完後比對結束狀態的雜湊。\n
+        \n
+        參數:\n
+        ticks (int): 要執行的更新次數，None 表示不限制\n
+        duration (float): 要執行的秒數（真實時間），None 表示不限制\n
+        replay (dict): load_recording() 讀出的錄製資料，None 表示不重播\n
+        \n
+        回傳:\n
+        dict: 執行統計，包含 ticks、elapsed、ticks_per_second、episodes、state_hash\n
+        """
+        replay_frames = None
+        if replay is not None:
+            # 重播時步數由錄製檔決定
+            replay_frames = replay["frames"]
+            ticks = len(replay_frames)
+            duration = None
+
+        # 兩個條件都沒給時，預設跑 60 秒遊戲時間的更新次數
+        if ticks is None and duration is None:
+            ticks = FPS * 60
+
+        tick_count = 0
+        episodes = 1
+        start_time = time.perf_counter()
+
+        while self.running:
+            # 檢查是否達到指定的次數或時間
+            if ticks is not None and tick_count >= ticks:
+                break
+            if duration is not None and time.perf_counter() - start_time >= duration:
+                break
+
+            # 讓 SDL 處理內部事件佇列，避免事件堆積
+            pygame.event.pump()
+
+            game_ended = self.game_state in ["game_over", "victory"]
+            if replay_frames is not None:
+                input_frame = replay_frames[tick_count]
+            elif game_ended:
+                # 遊戲結束時自動重新開始（和按 R 鍵一樣透過輸入，錄製後才能重播）
+                input_frame = RESTART_INPUT
+            else:
+                input_frame = IDLE_INPUT
+
+            if game_ended and input_frame.has_event("restart"):
+                episodes += 1
+
+            # 更新遊戲邏輯（不繪製）
+            self.step(input_frame)
+            tick_count += 1
+
+            if self.profiler.enabled:
+                self.profiler.end_frame(self.get_profile_counts())
+
+        elapsed = time.perf_counter() - start_time
+        ticks_per_second = tick_count / elapsed if elapsed > 0 else 0.0
+        state_hash = compute_state_hash(self)
+
+        log.info(
+            f"⏱️ 無頭模擬完成：{tick_count} 次更新，耗時 {elapsed:.2f} 秒，"
+            f"{ticks_per_second:.1f} ticks/sec，共 {episodes} 局，"
+            f"種子 {self.seed}，狀態雜湊 {state_hash[:16]}"
+        )
+
+        if replay is not None:
+            if state_hash == replay["state_hash"]:
+                log.info("✅ 重播結果和錄製時完全相同")
+            else:
+                log.warning(
+                    f"❌ 重播結果和錄製時不同（錄製時 {replay['state_hash'][:16]}）"
+                )
+
+        if self.profiler.enabled:
+            self.profiler.print_summary()
+
+        return {
+            "ticks": tick_count,
+            "elapsed": elapsed,
+            "ticks_per_second": ticks_per_second,
+            "episodes": episodes,
+            "state_hash": state_hash,
+        }
+
+    def start_recording(self, path):
+        """
+        開始錄製每個模擬步的輸入 - 要在第一個模擬步之前呼叫\n
+        \n
+        參數:\n
+        path (str): 錄製檔路徑\n
+        """
+        self.recorder = InputRecorder(path, self.seed)
+        log.info(f"⏺️ 開始錄製輸入: {path}（種子 {self.seed}）")
+
+    def stop_recording(self):
+        """
+        停止錄製並寫出錄製檔，檔案裡會附上目前的狀態雜湊供重播比對\n
+        """
+        if self.recorder is None:
+            return
+
+        state_hash = compute_state_hash(self)
+        try:
+            self.recorder.save(state_hash)
+            log.info(
+                f"⏺️ 錄製完成: {self.recorder.path}，{self.recorder.frame_count} 步，"
+                f"狀態雜湊 {state_hash[:16]}"
+            )
+        except OSError as e:
+            log.error(f"寫入錄製檔失敗: {e}")
+
+        self.recorder = None
+
 
 ######################主程式入口######################
 
 
+def parse_arguments(argv=None):
+    """
+    解析命令列參數\n
+    \n
+    參數:\n
+    argv (list): 命令列參數列表，None 表示使用 sys.argv\n
+    \n
+    回傳:\n
+    argparse.Namespace: 解析結果\n
+    """
+    parser = argparse.ArgumentParser(description="跑酷射擊大冒險")
+    parser.add_argument(
+        "--headless", action="store_true", help="無頭模式：不開視窗、不播音效、不限速"
+    )
+    parser.add_argument(
+        "--ticks", type=int, default=None, help="無頭模式（或每個基準測試場景）執行的更新次數"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=None, help="無頭模式執行的秒數"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="開啟各階段耗時分析（視窗模式顯示面板）"
+    )
+    parser.add_argument(
+        "--profile-export",
+        default=None,
+        metavar="PATH",
+        help="把每一幀的耗時匯出到檔案（.csv 或 .jsonl）",
+    )
+    parser.add_argument(
+        "--log-level",
+        default=None,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        type=str.upper,
+        help="終端機訊息的最低等級（DEBUG 會顯示每次射擊、命中等訊息）",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="亂數種子，同一個種子會生成同樣的關卡"
+    )
+    parser.add_argument(
+        "--record",
+        default=None,
+        metavar="PATH",
+        help="把每個模擬步的輸入錄製到檔案，離開遊戲時寫出",
+    )
+    parser.add_argument(
+        "--replay",
+        default=None,
+        metavar="PATH",
+        help="用無頭模式重播錄製檔，結束時比對狀態雜湊",
+    )
+    parser.add_argument(
+        "--level",
+        default=None,
+        metavar="PATH",
+        help="載入關卡檔，不用亂數生成關卡（重播時要指定錄製時的同一個關卡檔）",
+    )
+    parser.add_argument(
+        "--save-level",
+        default=None,
+        metavar="PATH",
+        help="把生成的關卡（或 --level 載入的關卡）存成關卡檔後結束",
+    )
+    parser.add_argument(
+        "--level-json",
+        default=None,
+        metavar="PATH",
+        help="把關卡匯出成 JSON 檔後結束（除錯用）",
+    )
+    parser.add_argument(
+        "--keep-level",
+        action="store_true",
+        help="重新開始時保留同一個關卡，不換新的關卡種子（重播時也要指定）",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="執行基準測試場景，回報 ticks/sec、每步耗時百分位和記憶體高峰",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        default=None,
+        metavar="NAME",
+        help="只執行指定的基準測試場景（可以重複指定）",
+    )
+    parser.add_argument(
+        "--benchmark-output",
+        default=None,
+        metavar="PATH",
+        help="把基準測試結果寫成 JSON",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        metavar="PATH",
+        help="和基準結果 JSON 比較，任何場景退步超過容許比例就以錯誤碼結束",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=BENCHMARK_TOLERANCE,
+        help="和基準比較時容許變差的比例（預設 %(default)s）",
+    )
+    args = parser.parse_args(argv)
+
+    # 種子要寫進錄製檔的檔頭，超出範圍要在開始執行前就擋下，不要等到存檔才失敗
+    if args.seed is not None and not 0 <= args.seed < SEED_LIMIT:
+        parser.error(f"--seed 必須介於 0 到 {SEED_LIMIT - 1} 之間")
+
+    return args
+
+
+def setup_profiler(game, args):
+    """
+    依照命令列參數設定效能分析\n
+    \n
+    參數:\n
+    game (ElementalParkourShooter): 遊戲實例\n
+    args (argparse.Namespace): 命令列參數\n
+    """
+    if args.profile:
+        game.profiler.set_enabled(True)
+        if not game.headless:
+            game.profiler.toggle_overlay()
+
+    if args.profile_export:
+        game.profiler.start_export(args.profile_export)
+
+
+def export_level(args, level_data):
+    """
+    依照命令列參數把關卡存成關卡檔或匯出成 JSON\n
+    \n
+    參數:\n
+    args (argparse.Namespace): 命令列參數\n
+    level_data (LevelData): --level 載入的關卡，None 表示用 --seed 生成\n
+    \n
+    回傳:\n
+    int: 結束碼，0 表示成功，1 表示寫檔失敗\n
+    """
+    game = ElementalParkourShooter(headless=True, seed=args.seed, level_data=level_data)
+    captured = capture_level(game.level_manager)
+    pygame.quit()
+
+    try:
+        if args.save_level:
+            captured.save(args.save_level)
+            log.info(
+                f"💾 關卡已存到 {args.save_level}（種子 {captured.seed}，"
+                f"{captured.count('platforms')} 個平台）"
+            )
+        if args.level_json:
+            captured.export_json(args.level_json)
+            log.info(f"📄 關卡已匯出成 JSON: {args.level_json}")
+    except OSError as e:
+        log.error(f"寫入關卡檔失敗: {e}")
+        return 1
+    return 0
+
+
+def run_benchmark_suite(args):
+    """
+    依照命令列參數執行基準測試，寫出結果並和基準比較\n
+    \n
+    參數:\n
+    args (argparse.Namespace): 命令列參數\n
+    \n
+    回傳:\n
+    int: 結束碼，0 表示沒有退步，1 表示退步或無法執行\n
+    """
+    baseline = None
+    if args.baseline:
+        # 先讀基準檔，檔案有問題時不用白跑一趟
+        try:
+            baseline = load_baseline(args.baseline)
+        except (OSError, ValueError) as e:
+            log.error(f"讀取基準檔失敗: {e}")
+            return 1
+
+    try:
+        results = run_benchmark(
+            ElementalParkourShooter,
+            scenario_names=args.scenario,
+            seed=args.seed if args.seed is not None else BENCHMARK_SEED,
+            ticks=args.ticks or BENCHMARK_TICKS,
+        )
+    except ValueError as e:
+        log.error(str(e))
+        return 1
+    finally:
+        pygame.quit()
+
+    if args.benchmark_output:
+        try:
+            write_results(results, args.benchmark_output)
+            log.info(f"📄 基準測試結果已寫入 {args.benchmark_output}")
+        except OSError as e:
+            log.error(f"寫入基準測試結果失敗: {e}")
+            return 1
+
+    if baseline is None:
+        return 0
+
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    if regressions:
+        log.error(
+            "❌ 和基準相比有退步：\n" + "\n".join(f"  - {line}" for line in regressions)
+        )
+        return 1
+
+    log.info(f"✅ 所有場景都在基準的 {args.tolerance * 100:.0f}% 容許範圍內")
+    return 0
+
+
 def main():
     """
     程式進入點 - 建立遊戲實例並開始運行\n
+    \n
+    回傳:\n
+    int: 結束碼（基準測試退步、讀檔失敗或重播結果不同時為 1）\n
     """
-    game = ElementalParkourShooter()
+    args = parse_arguments()
+
+    if args.log_level:
+        set_log_level(args.log_level)
+
+    if args.benchmark:
+        return run_benchmark_suite(args)
+
+    level_data = None
+    if args.level:
+        try:
+            level_data = load_level(args.level)
+        except (OSError, ValueError) as e:
+            log.error(f"讀取關卡檔失敗: {e}")
+            return 1
+
+    if args.save_level or args.level_json:
+        return export_level(args, level_data)
+
+    if args.replay:
+        # 重播模式：用錄製時的種子建立遊戲，依照錄製的輸入跑完後比對狀態
+        try:
+            recording = load_recording(args.replay)
+        except (OSError, ValueError) as e:
+            log.error(f"讀取錄製檔失敗: {e}")
+            return 1
+
+        game = ElementalParkourShooter(
+            headless=True, seed=recording["seed"], level_data=level_data
+        )
+        setup_profiler(game, args)
+        if args.keep_level:
+            game.keep_level = True
+        result = game.run_headless(replay=recording)
+        game.profiler.stop_export()
+        pygame.quit()
+
+        # 狀態雜湊不同時以錯誤碼結束，腳本可以直接拿重播當回歸檢查
+        if result["state_hash"] != recording["state_hash"]:
+            return 1
+        return 0
+
+    if args.headless:
+        # 無頭模式：跑完指定次數後回報效能並結束
+        game = ElementalParkourShooter(
+            headless=True, seed=args.seed, level_data=level_data
+        )
+        setup_profiler(game, args)
+        if args.keep_level:
+            game.keep_level = True
+        if args.record:
+            game.start_recording(args.record)
+        game.run_headless(ticks=args.ticks, duration=args.duration)
+        game.stop_recording()
+        game.profiler.stop_export()
+        pygame.quit()
+        return
+
+    game = ElementalParkourShooter(seed=args.seed, level_data=level_data)
+    setup_profiler(game, args)
+    if args.keep_level:
+        game.keep_level = True
+    if args.record:
+        game.start_recording(args.record)
     game.run()
 
 
 # 只有在直接執行時才啟動遊戲
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,612 @@
+######################載入套件######################
+import gc
+import json
+import platform
+import time
+import tracemalloc
+
+import pygame
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+    from ..utils.game_logger import get_logger
+    from .input_recorder import InputFrame, KEY_BITS, IDLE_INPUT, RESTART_INPUT
+    from .input_recorder import compute_state_hash
+except ImportError:
+    from src.config import *
+    from src.utils.game_logger import get_logger
+    from src.systems.input_recorder import InputFrame, KEY_BITS
+    from src.systems.input_recorder import IDLE_INPUT, RESTART_INPUT
+    from src.systems.input_recorder import compute_state_hash
+
+log = get_logger("benchmark")
+
+# 結果檔格式版本，欄位改變時要加一，舊的基準檔就不會被拿來比較
+BENCHMARK_RESULT_VERSION = 1
+
+# 和基準比較的指標：名稱 -> True 表示數值越大越好
+BENCHMARK_METRICS = {
+    "ticks_per_second": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+    "peak_memory_kb": False,
+}
+
+######################輔助函式######################
+
+
+def aim_at(game, world_x, world_y):
+    """
+    把世界座標換成滑鼠的螢幕座標 - 讓場景的輸入瞄準某個位置\n
+    \n
+    參數:\n
+    game (ElementalParkourShooter): 遊戲實例\n
+    world_x (float): 目標的世界 X 座標\n
+    world_y (float): 目標的世界 Y 座標\n
+    \n
+    回傳:\n
+    tuple: 滑鼠的螢幕座標\n
+    """
+    return (int(world_x - game.camera_x), int(world_y - game.camera_y))
+
+
+def fill_monsters(game, count, distance=250):
+    """
+    在玩家兩側補滿指定數量的小怪 - 讓攻擊類場景一直有目標\n
+    \n
+    參數:\n
+    game (ElementalParkourShooter): 遊戲實例\n
+    count (int): 場上要維持的小怪數量\n
+    distance (float): 和玩家的水平距離\n
+    """
+    monster_manager = game.monster_manager
+    player = game.player
+    monster_types = ["lava_monster", "water_monster"]
+
+    level_width = game.level_manager.level_width
+
+    index = len(monster_manager.monsters)
+    while len(monster_manager.monsters) < count:
+        side = 1 if index % 2 == 0 else -1
+        offset = distance + (index // 2) * 40
+        spawn_x = player.x + side * offset
+        if not 50 <= spawn_x <= level_width - 50:
+            # 這一側靠近關卡邊界放不下，改放另一側，距離不能縮短
+            spawn_x = player.x - side * offset
+        spawn_x = max(50, min(spawn_x, level_width - 50))
+        monster_manager.spawn_specific_monster(
+            monster_types[index % len(monster_types)], spawn_x, player.y - 40
+        )
+        index += 1
+
+
+def keep_player_alive(game):
+    """
+    把玩家血量補滿 - 場景量測的是戰鬥中的負載，不能讓玩家中途陣亡\n
+    \n
+    參數:\n
+    game (ElementalParkourShooter): 遊戲實例\n
+    """
+    game.player.health = game.player.max_health
+
+
+def percentile(sorted_values, fraction):
+    """
+    計算百分位數（線性內插）\n
+    \n
+    參數:\n
+    sorted_values (list): 已排序的數值\n
+    fraction (float): 百分位，0.0 ~ 1.0\n
+    \n
+    回傳:\n
+    float: 百分位數，沒有資料時回傳 0.0\n
+    """
+    if not sorted_values:
+        return 0.0
+
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+######################測試場景類別######################
+
+
+class BenchmarkScenario:
+    """
+    基準測試場景 - 設定遊戲狀態並提供每個模擬步的輸入\n
+    \n
+    子類別覆寫 setup() 佈置場景，覆寫 get_input() 決定每一步的輸入。\n
+    所有輸入都透過 game.step() 進入遊戲，和玩家實際操作走同樣的程式路徑。\n
+    \n
+    參數:\n
+    name (str): 場景名稱（命令列和結果檔使用）\n
+    description (str): 場景說明\n
+    """
+
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+
+    def setup(self, game):
+        """
+        佈置場景 - 遊戲建立後和每次重新開始後呼叫\n
+        \n
+        參數:\n
+        game (ElementalParkourShooter): 遊戲實例\n
+        """
+
+    def get_input(self, game, tick):
+        """
+        取得這一步的輸入，也可以在這裡調整遊戲狀態\n
+        \n
+        參數:\n
+        game (ElementalParkourShooter): 遊戲實例\n
+        tick (int): 從場景開始算起的步數（包含暖身）\n
+        \n
+        回傳:\n
+        InputFrame: 這一步的輸入\n
+        """
+        return InputFrame()
+
+
+class HackSwarmScenario(BenchmarkScenario):
+    """
+    hack 模式怪物海 - 開啟 hack 模式，先把怪物生滿，機關槍自動追蹤連射\n
+    """
+
+    def __init__(self):
+        super().__init__("hack_swarm", "hack 模式生滿怪物並持續自動追蹤射擊")
+
+    def setup(self, game):
+        if not game.hack_mode:
+            game.hack_mode = True
+            game.toggle_hack_mode()
+
+        # spawn_hack_monsters 每次生成兩隻，先生成 16 隻
+        for _ in range(8):
+            game.spawn_hack_monsters()
+
+    def get_input(self, game, tick):
+        player = game.player
+        return InputFrame(
+            mouse_buttons=(True, False, False),
+            mouse_pos=aim_at(game, player.x + 400, player.y),
+        )
+
+
+class MonsterCrowdScenario(BenchmarkScenario):
+    """
+    大量怪物 - 玩家站著不動，場上維持數百隻小怪同時追擊
+
+    """
+
+    MONSTER_COUNT = 300
+
+    def __init__(self):
+        super().__init__("monster_crowd", f"{self.MONSTER_COUNT} 隻小怪同時追擊玩家")
+
+    def setup(self, game):
+        fill_monsters(game, self.MONSTER_COUNT)
+
+    def get_input(self, game, tick):
+        keep_player_alive(game)
+        if tick % SIMULATION_HZ == 0:
+            fill_monsters(game, self.MONSTER_COUNT)
+        return IDLE_INPUT
+
+
+class MachineGunScenario(BenchmarkScenario):
+    """
+    機關槍連射 - 朝怪物群按住左鍵不放，子彈數量維持在射速上限\n
+    """
+
+    def __init__(self):
+        super().__init__("machine_gun", "機關槍朝怪物群持續連射")
+
+    def setup(self, game):
+        game.player.current_weapon = "machine_gun"
+        fill_monsters(game, 8)
+
+    def get_input(self, game, tick):
+        keep_player_alive(game)
+        if tick % SIMULATION_HZ == 0:
+            fill_monsters(game, 8)
+
+        player = game.player
+        return InputFrame(
+            mouse_buttons=(True, False, False),
+            mouse_pos=aim_at(game, player.x + 400, player.y),
+        )
+
+
+class GrenadeVolleyScenario(BenchmarkScenario):
+    """
+    手榴彈齊爆 - 每半秒把十顆手榴彈黏到怪物身上，再用右鍵一次引爆\n
+    \n
+    引爆走 explode_all_grenades 的正常流程（傷害、傷害數字、分數、爆炸特效）。\n
+    怪物生在爆炸範圍外，十顆一起炸的傷害超過玩家血量上限，不能把玩家捲進去\n
+    """
+
+    GRENADE_COUNT = 10
+    CYCLE_TICKS = SIMULATION_HZ // 2
+    MONSTER_DISTANCE = GRENADE_EXPLOSION_RADIUS + 150
+
+    def __init__(self):
+        super().__init__("grenade_volley", "十顆手榴彈黏在怪物身上後同時引爆")
+
+    def setup(self, game):
+        game.weapon_manager.grenade_count = 9999
+        fill_monsters(game, self.GRENADE_COUNT, self.MONSTER_DISTANCE)
+
+    def get_input(self, game, tick):
+        keep_player_alive(game)
+        phase = tick % self.CYCLE_TICKS
+
+        if phase == 0:
+            fill_monsters(game, self.GRENADE_COUNT, self.MONSTER_DISTANCE)
+            self.attach_grenades(game)
+
+        # 下一步按下右鍵引爆，再下一步放開，讓下一輪能再次觸發
+        return InputFrame(mouse_buttons=(False, False, phase == 1))
+
+    def attach_grenades(self, game):
+        """
+        丟出十顆手榴彈並直接黏到怪物身上\n
+        \n
+        參數:\n
+        game (ElementalParkourShooter): 遊戲實例\n
+        """
+        player = game.player
+        weapon_manager = game.weapon_manager
+        monsters = game.monster_manager.monsters
+
+        for index in range(self.GRENADE_COUNT):
+            grenade_info = {
+                "start_x": player.x + player.width // 2,
+                "start_y": player.y,
+                "direction_x": 1 if index % 2 == 0 else -1,
+                "direction_y": -1,
+            }
+            if not weapon_manager.create_grenade(grenade_info):
+                break
+
+            if monsters:
+                # attach_to_object 保留目前的相對位置，要先把手榴彈移到怪物身上
+                grenade = weapon_manager.grenades[-1]
+                monster = monsters[index % len(monsters)]
+                grenade.x = monster.x + monster.width // 2
+                grenade.y = monster.y
+                grenade.attach_to_object(monster)
+
+
+class UltimateVolleyScenario(BenchmarkScenario):
+    """
+    必殺技連發 - 每 1/3 秒發動一次雷電追蹤，追蹤子彈分散攻擊場上的怪物\n
+    """
+
+    MONSTER_COUNT = 10
+    CYCLE_TICKS = SIMULATION_HZ // 3
+
+    def __init__(self):
+        super().__init__("ultimate_volley", "重複發動必殺技雷電追蹤攻擊")
+
+    def setup(self, game):
+        fill_monsters(game, self.MONSTER_COUNT)
+
+    def get_input(self, game, tick):
+        keep_player_alive(game)
+        phase = tick % self.CYCLE_TICKS
+
+        key_mask = 0
+        if phase == 0:
+            fill_monsters(game, self.MONSTER_COUNT)
+            # 跳過 20 秒冷卻，每一輪都能發動
+            game.player.last_ultimate_time = 0
+            key_mask = KEY_BITS[pygame.K_x]
+
+        return InputFrame(key_mask=key_mask)
+
+
+class SniperBossScenario(BenchmarkScenario):
+    """
+    狙擊Boss戰 - 直接生成狙擊Boss，縮短散彈和震波的冷卻，玩家持續朝Boss射擊\n
+    \n
+    Boss和玩家的血量都維持全滿，整段量測都停留在戰鬥中\n
+    """
+
+    ATTACK_CYCLE_TICKS = SIMULATION_HZ * 2
+
+    def __init__(self):
+        super().__init__("sniper_boss", "狙擊Boss的散彈爆發和震波攻擊")
+
+    def setup(self, game):
+        monster_manager = game.monster_manager
+        monster_manager.boss_stage = 2
+        boss = monster_manager.spawn_boss(
+            game.level_manager.get_platforms(), game.player
+        )
+        if boss is None:
+            log.warning("⚠️ 基準測試無法生成狙擊Boss，場景只剩一般怪物")
+            return
+
+        # 放在震波攻擊的距離內
+        boss.x = game.player.x + 200
+        boss.y = game.player.y - boss.height
+        boss.update_rect()
+        # 直接搬動Boss，要同步更新空間網格，爆炸和近戰才查得到新位置
+        monster_manager.grid.move(boss)
+
+    def get_input(self, game, tick):
+        keep_player_alive(game)
+
+        boss = game.monster_manager.boss
+        if boss is None:
+            return InputFrame()
+
+        boss.health = boss.max_health
+        if tick % self.ATTACK_CYCLE_TICKS == 0:
+            boss.last_shotgun_time = 0
+            boss.last_shockwave_time = 0
+
+        return InputFrame(
+            mouse_buttons=(True, False, False),
+            mouse_pos=aim_at(
+                game, boss.x + boss.width // 2, boss.y + boss.height // 2
+            ),
+        )
+
+
+# 所有場景，依照執行順序排列
+BENCHMARK_SCENARIOS = [
+    HackSwarmScenario(),
+    MonsterCrowdScenario(),
+    MachineGunScenario(),
+    GrenadeVolleyScenario(),
+    UltimateVolleyScenario(),
+    SniperBossScenario(),
+]
+
+######################執行與量測######################
+
+
+def play_scenario(game_factory, scenario, seed, ticks, warmup_ticks, on_step=None):
+    """
+    建立新遊戲並把場景跑完 - 每次都從同一個種子開始，遊戲過程完全相同\n
+    \n
+    參數:\n
+    game_factory (callable): 用 headless、seed 參數建立遊戲實例\n
+    scenario (BenchmarkScenario): 要執行的場景\n
+    seed (int): 亂數種子\n
+    ticks (int): 量測的模擬步數\n
+    warmup_ticks (int): 量測前先跑的模擬步數\n
+    on_step (callable): 每一個量測步執行完後呼叫，參數是這一步的耗時（秒）\n
+    \n
+    回傳:\n
+    tuple: (遊戲實例, 重新開始的次數)\n
+    """
+    game = game_factory(headless=True, seed=seed)
+    scenario.setup(game)
+    restarts = 0
+
+    gc.collect()
+    for tick in range(warmup_ticks + ticks):
+        if game.game_state in ["game_over", "victory"]:
+            input_frame = RESTART_INPUT
+        else:
+            input_frame = scenario.get_input(game, tick)
+
+        start_time = time.perf_counter()
+        game.step(input_frame)
+        step_time = time.perf_counter() - start_time
+
+        if input_frame is RESTART_INPUT:
+            # 重新開始後場景要重新佈置
+            scenario.setup(game)
+            restarts += 1
+
+        if on_step is not None and tick >= warmup_ticks:
+            on_step(step_time)
+
+    return game, restarts
+
+
+def run_scenario(game_factory, scenario, seed, ticks, warmup_ticks):
+    """
+    執行一個場景並量測效能\n
+    \n
+    跑兩次：第一次量每一步的耗時，第二次用 tracemalloc 量記憶體高峰。\n
+    tracemalloc 會讓每次配置記憶體都變慢，分開跑耗時數字才不會被拖累。\n
+    兩次的種子和輸入相同，結束狀態雜湊不同就表示場景本身不穩定。\n
+    \n
+    參數:\n
+    game_factory (callable): 用 headless、seed 參數建立遊戲實例\n
+    scenario (BenchmarkScenario): 要執行的場景\n
+    seed (int): 亂數種子\n
+    ticks (int): 量測的模擬步數\n
+    warmup_ticks (int): 量測前先跑的模擬步數\n
+    \n
+    回傳:\n
+    dict: 場景的量測結果\n
+    """
+    step_times = []
+    game, restarts = play_scenario(
+        game_factory, scenario, seed, ticks, warmup_ticks, step_times.append
+    )
+    state_hash = compute_state_hash(game)
+    game = None
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        game, _ = play_scenario(game_factory, scenario, seed, ticks, warmup_ticks)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    if compute_state_hash(game) != state_hash:
+        log.warning(f"⚠️ 場景 {scenario.name} 兩次執行的結束狀態不同，結果可能不穩定")
+
+    elapsed = sum(step_times)
+    sorted_times = sorted(step_times)
+    return {
+        "description": scenario.description,
+        "ticks": len(step_times),
+        "elapsed": round(elapsed, 4),
+        "ticks_per_second": round(len(step_times) / elapsed, 1) if elapsed > 0 else 0.0,
+        "p50_ms": round(percentile(sorted_times, 0.50) * 1000, 4),
+        "p95_ms": round(percentile(sorted_times, 0.95) * 1000, 4),
+        "p99_ms": round(percentile(sorted_times, 0.99) * 1000, 4),
+        "peak_memory_kb": round(peak_memory / 1024, 1),
+        "restarts": restarts,
+        "state_hash": state_hash,
+    }
+
+
+def run_benchmark(
+    game_factory,
+    scenario_names=None,
+    seed=BENCHMARK_SEED,
+    ticks=BENCHMARK_TICKS,
+    warmup_ticks=BENCHMARK_WARMUP_TICKS,
+):
+    """
+    依序執行基準測試場景\n
+    \n
+    參數:\n
+    game_factory (callable): 用 headless、seed 參數建立遊戲實例\n
+    scenario_names (list): 要執行的場景名稱，None 表示全部\n
+    seed (int): 亂數種子\n
+    ticks (int): 每個場景量測的模擬步數\n
+    warmup_ticks (int): 每個場景量測前先跑的模擬步數\n
+    \n
+    回傳:\n
+    dict: 所有場景的結果，可以直接寫成 JSON\n
+    \n
+    例外:\n
+    ValueError: 未知的場景名稱\n
+    """
+    scenarios = BENCHMARK_SCENARIOS
+    if scenario_names:
+        scenario_map = {scenario.name: scenario for scenario in BENCHMARK_SCENARIOS}
+        unknown_names = [name for name in scenario_names if name not in scenario_map]
+        if unknown_names:
+            raise ValueError(
+                f"未知的場景: {', '.join(unknown_names)}"
+                f"（可用: {', '.join(scenario_map)}）"
+            )
+        scenarios = [scenario_map[name] for name in scenario_names]
+
+    results = {
+        "version": BENCHMARK_RESULT_VERSION,
+        "seed": seed,
+        "ticks": ticks,
+        "warmup_ticks": warmup_ticks,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "scenarios": {},
+    }
+
+    for scenario in scenarios:
+        log.info(f"⏱️ 基準測試場景 {scenario.name}：{scenario.description}")
+        result = run_scenario(game_factory, scenario, seed, ticks, warmup_ticks)
+        results["scenarios"][scenario.name] = result
+        log.info(
+            f"   {result['ticks_per_second']:.1f} ticks/sec，"
+            f"p50 {result['p50_ms']:.3f} ms，p95 {result['p95_ms']:.3f} ms，"
+            f"p99 {result['p99_ms']:.3f} ms，記憶體高峰 {result['peak_memory_kb']:.1f} KB"
+        )
+
+    return results
+
+
+######################結果檔和基準比較######################
+
+
+def write_results(results, path):
+    """
+    把基準測試結果寫成 JSON\n
+    \n
+    參數:\n
+    results (dict): run_benchmark() 的結果\n
+    path (str): 輸出路徑\n
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+
+
+def load_baseline(path):
+    """
+    讀取基準結果檔\n
+    \n
+    參數:\n
+    path (str): 基準檔路徑\n
+    \n
+    回傳:\n
+    dict: 基準結果\n
+    \n
+    例外:\n
+    ValueError: 檔案不是基準測試結果或版本不符\n
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    if not isinstance(baseline, dict) or "scenarios" not in baseline:
+        raise ValueError(f"不是基準測試結果檔: {path}")
+    if baseline.get("version") != BENCHMARK_RESULT_VERSION:
+        raise ValueError(f"不支援的基準檔版本 {baseline.get('version')}: {path}")
+    return baseline
+
+
+def compare_with_baseline(results, baseline, tolerance=BENCHMARK_TOLERANCE):
+    """
+    和基準比較，找出變差超過容許比例的指標\n
+    \n
+    ticks/sec 越大越好，耗時和記憶體越小越好。\n
+    基準裡沒有的場景只提示不比較。\n
+    \n
+    參數:\n
+    results (dict): 這次的結果\n
+    baseline (dict): 基準結果\n
+    tolerance (float): 容許變差的比例，0.15 表示 15%\n
+    \n
+    回傳:\n
+    list: 退步的說明文字，空列表表示沒有退步\n
+    """
+    regressions = []
+
+    if (
+        baseline.get("seed") != results["seed"]
+        or baseline.get("ticks") != results["ticks"]
+    ):
+        log.warning("⚠️ 基準檔的種子或步數和這次不同，比較結果僅供參考")
+
+    for name, result in results["scenarios"].items():
+        baseline_result = baseline["scenarios"].get(name)
+        if baseline_result is None:
+            log.info(f"   場景 {name} 沒有基準資料，略過比較")
+            continue
+
+        for metric, higher_is_better in BENCHMARK_METRICS.items():
+            baseline_value = baseline_result.get(metric)
+            if not baseline_value:
+                continue
+
+            value = result[metric]
+            change = (value - baseline_value) / baseline_value
+            if higher_is_better:
+                change = -change
+
+            if change > tolerance:
+                regressions.append(
+                    f"{name} {metric}: {baseline_value} → {value}"
+                    f"（變差 {change * 100:.1f}%，容許 {tolerance * 100:.0f}%）"
+                )
+
+    return regressions
@@ -1,15 +1,21 @@
 ######################載入套件######################
 import pygame
-import time
-import random
 
 # 支援直接執行和模組執行兩種方式
 try:
     from ..config import *
     from ..core.element_system import ElementSystem
+    from ..core.game_session import get_rng, get_game_time, get_game_clock
 except ImportError:
     from src.config import *
     from src.core.element_system import ElementSystem
+    from src.core.game_session import get_rng, get_game_time, get_game_clock
+
+rng = get_rng()
+
+# 傷害數字會用到的大小倍率（抗性和狀態效果 0.8、普通 1.0、有效和恢復 1.2、弱點 1.5），
+# 和 ElementSystem.create_damage_popup_info 的設定一致
+DAMAGE_NUMBER_SIZE_MULTIPLIERS = (0.8, 1.0, 1.2, 1.5)
 
 ######################傷害數字顯示系統######################
 
@@ -35,8 +41,8 @@ class DamageNumber:
     def __init__(
         self, x, y, damage, damage_type="普通傷害", color=WHITE, size_multiplier=1.0
     ):
-        self.x = x + random.uniform(-10, 10)  # 加入隨機偏移避免重疊
-        self.y = y + random.uniform(-5, 5)
+        self.x = x + rng.uniform(-10, 10)  # 加入隨機偏移避免重疊
+        self.y = y + rng.uniform(-5, 5)
         self.start_x = self.x
         self.start_y = self.y
 
@@ -47,13 +53,25 @@ class DamageNumber:
 
         # 動畫屬性
         self.lifetime = 2.0  # 顯示時間（秒）
-        self.creation_time = time.time()
+        self.creation_time = get_game_time()
         self.velocity_y = -30  # 向上飄動速度
         self.alpha = 255  # 透明度
 
-        # 字體設定
-        self.font_size = max(16, int(24 * size_multiplier))
-        self.font = get_chinese_font(self.font_size)
+        # 字體設定（文字圖片由共用緩存提供）
+        self.font_size, self.type_font_size = self.get_font_sizes(size_multiplier)
+
+    @staticmethod
+    def get_font_sizes(size_multiplier):
+        """
+        計算傷害數字和說明文字的字體大小\n
+        \n
+        參數:\n
+        size_multiplier (float): 字體大小倍率\n
+        \n
+        回傳:\n
+        tuple: (傷害數字大小, 說明文字大小)\n
+        """
+        return max(16, int(24 * size_multiplier)), max(12, int(16 * size_multiplier))
 
     def update(self):
         """
@@ -62,7 +80,7 @@ class DamageNumber:
         回傳:\n
         bool: True 表示還需要繼續顯示，False 表示可以移除\n
         """
-        current_time = time.time()
+        current_time = get_game_time()
         elapsed = current_time - self.creation_time
 
         if elapsed >= self.lifetime:
@@ -91,23 +109,24 @@ class DamageNumber:
         screen_x = self.x - camera_x
         screen_y = self.y - camera_y
 
-        # 建立文字表面
-        damage_text = self.font.render(str(self.damage), True, self.color)
+        # 從緩存取得文字圖片
+        damage_text = get_text_surface(str(self.damage), self.font_size, self.color)
 
         # 計算繪製位置（置中）
         text_rect = damage_text.get_rect()
         text_rect.center = (int(screen_x), int(screen_y))
 
-        # 繪製傷害數字
-        screen.blit(damage_text, text_rect)
+        # 繪製傷害數字（套用淡出透明度）
+        blit_text_with_alpha(screen, damage_text, text_rect, self.alpha)
 
         # 如果有特殊效果，在下方顯示類型
         if self.damage_type != "普通傷害":
-            type_font = get_chinese_font(max(12, int(16 * self.size_multiplier)))
-            type_text = type_font.render(self.damage_type, True, self.color)
+            type_text = get_text_surface(
+                self.damage_type, self.type_font_size, self.color
+            )
             type_rect = type_text.get_rect()
             type_rect.center = (int(screen_x), int(screen_y + text_rect.height))
-            screen.blit(type_text, type_rect)
+            blit_text_with_alpha(screen, type_text, type_rect, self.alpha)
 
 
 ######################傷害顯示管理器######################
@@ -127,6 +146,40 @@ class DamageDisplayManager:
     def __init__(self):
         self.damage_numbers = []  # 所有活躍的傷害數字
 
+    def get_font_sizes(self):
+        """
+        取得傷害數字會用到的所有字體大小，讓遊戲開始前先建立好字體\n
+        \n
+        回傳:\n
+        tuple: 字體大小\n
+        """
+        sizes = set()
+        for size_multiplier in DAMAGE_NUMBER_SIZE_MULTIPLIERS:
+            sizes.update(DamageNumber.get_font_sizes(size_multiplier))
+        return tuple(sorted(sizes))
+
+    def add_number(self, number):
+        """
+        開始顯示一個數字，並排程在顯示時間結束時移除\n
+        \n
+        參數:\n
+        number (DamageNumber): 要顯示的數字\n
+        """
+        self.damage_numbers.append(number)
+        get_game_clock().schedule_at(
+            number.creation_time + number.lifetime, self.remove_number, number
+        )
+
+    def remove_number(self, number):
+        """
+        移除顯示時間結束的數字 - 由模擬時鐘呼叫\n
+        \n
+        參數:\n
+        number (DamageNumber): 結束的數字\n
+        """
+        if number in self.damage_numbers:
+            self.damage_numbers.remove(number)
+
     def add_damage_number(self, x, y, damage, attacker_element=None, target_type=None):
         """
         加入新的傷害數字顯示\n
@@ -159,7 +212,7 @@ class DamageDisplayManager:
             # 預設的傷害顯示
             damage_number = DamageNumber(x, y, damage)
 
-        self.damage_numbers.append(damage_number)
+        self.add_number(damage_number)
         return damage_number
 
     def add_healing_number(self, x, y, heal_amount):
@@ -172,7 +225,7 @@ class DamageDisplayManager:
         heal_amount (int): 治療量\n
         """
         healing_number = DamageNumber(x, y, heal_amount, "恢復", GREEN, 1.2)
-        self.damage_numbers.append(healing_number)
+        self.add_number(healing_number)
         return healing_number
 
     def add_status_effect_text(self, x, y, effect_name):
@@ -194,21 +247,15 @@ class DamageDisplayManager:
         # 修改顯示方式
         status_display.damage = ""  # 不顯示數字部分
 
-        self.damage_numbers.append(status_display)
+        self.add_number(status_display)
         return status_display
 
     def update(self):
         """
-        更新所有傷害數字的狀態\n
+        更新所有傷害數字的動畫 - 顯示時間結束的數字由模擬時鐘移除\n
         """
-        # 更新每個傷害數字
-        active_numbers = []
-
         for number in self.damage_numbers:
-            if number.update():
-                active_numbers.append(number)
-
-        self.damage_numbers = active_numbers
+            number.update()
 
     def draw(self, screen, camera_x=0, camera_y=0):
         """
@@ -0,0 +1,565 @@
+######################載入套件######################
+import pygame
+import math
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+    from ..utils.game_logger import get_logger
+    from ..core.game_session import get_game_time, get_game_clock
+except ImportError:
+    from src.config import *
+    from src.utils.game_logger import get_logger
+    from src.core.game_session import get_game_time, get_game_clock
+
+log = get_logger("projectiles")
+
+######################敵方投射物類型設定######################
+
+# 每種投射物的碰撞大小、存活範圍、能否被甩槍擋掉和繪製方式
+# bounds_margin: 超出螢幕範圍多少像素後移除（與原本各怪物的判定相同）
+# hit_message: 擊中玩家時的提示訊息（%s 會換成傷害值），None 表示不顯示
+ENEMY_PROJECTILE_TYPES = {
+    "lava_ball": {
+        "hit_size": 16,
+        "bounds_margin": 0,
+        "deflectable": True,
+        "outer_color": LAVA_COLOR,
+        "outer_radius": 8,
+        "inner_color": YELLOW,
+        "inner_radius": 4,
+        "hit_message": None,
+    },
+    "water_bullet": {
+        "hit_size": 12,
+        "bounds_margin": 0,
+        "deflectable": True,
+        "outer_color": CYAN,
+        "outer_radius": 6,
+        "inner_color": WHITE,
+        "inner_radius": 3,
+        "hit_message": None,
+    },
+    "fire_bullet": {
+        "hit_size": 16,
+        "bounds_margin": 0,
+        "deflectable": False,
+        "outer_color": FIRE_BULLET_COLOR,
+        "outer_radius": 8,
+        "inner_color": YELLOW,
+        "inner_radius": 4,
+        "hit_message": "🔥 Boss火焰子彈擊中玩家！造成 %s 點傷害",
+    },
+    "sniper_bullet": {
+        "hit_size": 16,
+        "bounds_margin": 0,
+        "deflectable": False,
+        "outer_color": BLUE,
+        "outer_radius": 8,
+        "inner_color": WHITE,
+        "inner_radius": 4,
+        "hit_message": "🎯 直線子彈擊中玩家！造成 %s 點傷害",
+    },
+    "sniper_shotgun": {
+        "hit_size": 8,
+        "bounds_margin": 100,
+        "deflectable": False,
+        "outer_color": SNIPER_BOSS_SHOTGUN_COLOR,
+        "outer_radius": 6,
+        "inner_color": None,
+        "inner_radius": 0,
+        "hit_message": "🎯 狙擊Boss散彈命中玩家！傷害: %s",
+    },
+    "homing_bullet": {
+        "hit_size": 16,
+        "bounds_margin": 200,
+        "deflectable": False,
+        "outer_color": SNIPER_BOSS_BULLET_COLOR,
+        "outer_radius": 8,
+        "inner_color": (255, 100, 255),  # 亮紫色內圈
+        "inner_radius": 4,
+        "hit_message": "🎯 狙擊Boss追蹤子彈擊中玩家！造成 %s 點傷害",
+    },
+    "shockwave": {
+        "hit_size": 0,
+        "bounds_margin": None,  # 震波不會因為離開螢幕而消失
+        "deflectable": False,
+        "outer_color": YELLOW,
+        "outer_radius": 0,
+        "inner_color": None,
+        "inner_radius": 0,
+        "hit_message": "💥 震波擊中玩家！造成 {damage} 點傷害並擊退",
+    },
+}
+
+SHOCKWAVE_HIT_TOLERANCE = 20  # 震波判定的容錯距離（像素）
+
+######################敵方投射物類別######################
+
+
+class EnemyProjectile:
+    """
+    敵方投射物 - 熔岩球、水彈、Boss子彈和震波共用的資料結構\n
+    \n
+    使用 __slots__ 固定欄位，所有投射物都是同一種緊湊的物件，\n
+    管理器不需要再分辨字典、列表等不同格式。\n
+    \n
+    參數:\n
+    kind (str): 投射物類型，對應 ENEMY_PROJECTILE_TYPES 的鍵\n
+    owner (Monster): 發射這個投射物的怪物\n
+    x (float): 初始 X 座標（投射物中心）\n
+    y (float): 初始 Y 座標（投射物中心）\n
+    velocity_x (float): 每次更新的 X 位移\n
+    velocity_y (float): 每次更新的 Y 位移\n
+    damage (int): 擊中玩家的傷害\n
+    lifetime (float): 存活時間（秒）\n
+    """
+
+    __slots__ = (
+        "kind",
+        "owner",
+        "x",
+        "y",
+        "velocity_x",
+        "velocity_y",
+        "damage",
+        "lifetime",
+        "created_time",
+        "expiry_timer",
+        "is_active",
+        "tracking_strength",
+        "radius",
+        "max_radius",
+        "expansion_speed",
+        "knockback_force",
+        "hit_player",
+    )
+
+    def __init__(
+        self, kind, owner, x, y, velocity_x, velocity_y, damage, lifetime
+    ):
+        self.kind = kind
+        self.owner = owner
+        self.x = x
+        self.y = y
+        self.velocity_x = velocity_x
+        self.velocity_y = velocity_y
+        self.damage = damage
+        self.lifetime = lifetime
+        self.created_time = get_game_time()
+        self.expiry_timer = None  # 存活時間到期的事件（由管理器排程）
+        self.is_active = True
+
+        # 追蹤子彈專用
+        self.tracking_strength = 0
+
+        # 震波專用
+        self.radius = 0
+        self.max_radius = 0
+        self.expansion_speed = 0
+        self.knockback_force = 0
+        self.hit_player = False  # 防止同一個震波重複傷害
+
+
+######################敵方投射物管理器類別######################
+
+
+class EnemyProjectileManager:
+    """
+    敵方投射物管理器 - 統一更新、碰撞和繪製所有怪物發射的投射物\n
+    \n
+    原本每種怪物各自保存自己的子彈列表，各自移動、過期、檢查碰撞，\n
+    甩槍擋彈時又要再把每個列表走過一次。現在所有投射物放在同一個列表：\n
+    1. 每次更新只跑一次移動／過期／出界判定\n
+    2. 接著只跑一次和玩家的碰撞判定\n
+    3. 甩槍擋彈只需要一次圓形範圍查詢\n
+    """
+
+    def __init__(self):
+        self.projectiles = []  # 所有活躍的敵方投射物
+
+    def spawn(
+        self,
+        kind,
+        owner,
+        x,
+        y,
+        velocity_x=0,
+        velocity_y=0,
+        damage=0,
+        lifetime=3.0,
+    ):
+        """
+        建立新的投射物\n
+        \n
+        參數:\n
+        kind (str): 投射物類型\n
+        owner (Monster): 發射者\n
+        x (float): 初始 X 座標\n
+        y (float): 初始 Y 座標\n
+        velocity_x (float): X 速度\n
+        velocity_y (float): Y 速度\n
+        damage (int): 傷害值\n
+        lifetime (float): 存活時間（秒）\n
+        \n
+        回傳:\n
+        EnemyProjectile: 新建立的投射物\n
+        """
+        projectile = EnemyProjectile(
+            kind, owner, x, y, velocity_x, velocity_y, damage, lifetime
+        )
+        projectile.expiry_timer = get_game_clock().schedule_at(
+            projectile.created_time + lifetime, self.expire, projectile
+        )
+        self.projectiles.append(projectile)
+        return projectile
+
+    def expire(self, projectile):
+        """
+        存活時間到期 - 由模擬時鐘呼叫，下次更新時移除\n
+        \n
+        參數:\n
+        projectile (EnemyProjectile): 到期的投射物\n
+        """
+        projectile.is_active = False
+
+    def release(self, projectile):
+        """
+        投射物離場 - 標記失效並取消還沒到期的存活時間事件\n
+        \n
+        被擋下、擊中玩家或飛出畫面的投射物不會再被模擬時鐘的排程參照\n
+        \n
+        參數:\n
+        projectile (EnemyProjectile): 要移除的投射物\n
+        """
+        projectile.is_active = False
+        projectile.expiry_timer.cancel()
+
+    def spawn_shockwave(
+        self, owner, x, y, max_radius, expansion_speed, damage, knockback_force, lifetime
+    ):
+        """
+        建立向外擴散的震波\n
+        \n
+        參數:\n
+        owner (Monster): 發射者\n
+        x (float): 震波中心 X 座標\n
+        y (float): 震波中心 Y 座標\n
+        max_radius (float): 最大擴散半徑\n
+        expansion_speed (float): 每次更新擴散的像素\n
+        damage (int): 傷害值\n
+        knockback_force (float): 擊退力道\n
+        lifetime (float): 持續時間（秒）\n
+        \n
+        回傳:\n
+        EnemyProjectile: 新建立的震波\n
+        """
+        shockwave = self.spawn("shockwave", owner, x, y, 0, 0, damage, lifetime)
+        shockwave.max_radius = max_radius
+        shockwave.expansion_speed = expansion_speed
+        shockwave.knockback_force = knockback_force
+        return shockwave
+
+    def update(self, player, view_rect):
+        """
+        更新所有投射物並檢查和玩家的碰撞\n
+        \n
+        參數:\n
+        player (Player): 玩家物件\n
+        view_rect (pygame.Rect): 攝影機看到的範圍（世界座標），飛出畫面的投射物會移除\n
+        \n
+        回傳:\n
+        dict or None: 最後一次擊中玩家的傷害結果（沒有擊中則為 None）\n
+        """
+        self.update_positions(player, view_rect)
+        return self.check_player_collisions(player)
+
+    def update_positions(self, player, view_rect):
+        """
+        移動、過期、出界判定 - 所有投射物只走一次\n
+        \n
+        參數:\n
+        player (Player): 玩家物件（追蹤子彈需要目標位置）\n
+        view_rect (pygame.Rect): 攝影機看到的範圍（世界座標）\n
+        """
+        player_center_x = player.x + player.width // 2
+        player_center_y = player.y + player.height // 2
+        active_projectiles = []
+
+        for projectile in self.projectiles:
+            # 發射者死亡後投射物跟著消失
+            if not projectile.owner.is_alive:
+                self.release(projectile)
+                continue
+
+            # 存活時間到期（模擬時鐘的事件已經標記為失效）
+            if not projectile.is_active:
+                continue
+
+            if projectile.kind == "shockwave":
+                # 震波往外擴散，超過最大半徑就結束
+                projectile.radius += projectile.expansion_speed
+                if projectile.radius <= projectile.max_radius:
+                    active_projectiles.append(projectile)
+                else:
+                    self.release(projectile)
+                continue
+
+            if projectile.kind == "homing_bullet":
+                self.steer_homing(projectile, player_center_x, player_center_y)
+
+            # 更新位置
+            projectile.x += projectile.velocity_x
+            projectile.y += projectile.velocity_y
+
+            # 檢查是否飛出畫面（座標是世界座標，要和攝影機範圍比較）
+            margin = ENEMY_PROJECTILE_TYPES[projectile.kind]["bounds_margin"]
+            if (
+                view_rect.left - margin <= projectile.x <= view_rect.right + margin
+                and view_rect.top - margin <= projectile.y <= view_rect.bottom + margin
+            ):
+                active_projectiles.append(projectile)
+            else:
+                self.release(projectile)
+
+        self.projectiles = active_projectiles
+
+    def steer_homing(self, projectile, target_x, target_y):
+        """
+        讓追蹤子彈的速度逐漸轉向目標\n
+        \n
+        參數:\n
+        projectile (EnemyProjectile): 追蹤子彈\n
+        target_x (float): 目標 X 座標\n
+        target_y (float): 目標 Y 座標\n
+        """
+        dx = target_x - projectile.x
+        dy = target_y - projectile.y
+        distance = (dx**2 + dy**2) ** 0.5
+
+        if distance > 0:
+            # 混合當前速度和追蹤方向，實現平滑追蹤
+            strength = projectile.tracking_strength
+            projectile.velocity_x = (1 - strength) * projectile.velocity_x + (
+                strength * dx / distance * BOSS_BULLET_SPEED
+            )
+            projectile.velocity_y = (1 - strength) * projectile.velocity_y + (
+                strength * dy / distance * BOSS_BULLET_SPEED
+            )
+
+    def check_player_collisions(self, player):
+        """
+        檢查所有投射物和玩家的碰撞 - 擊中的子彈會消失，震波只傷害一次\n
+        \n
+        參數:\n
+        player (Player): 玩家物件\n
+        \n
+        回傳:\n
+        dict or None: 最後一次擊中玩家的傷害結果\n
+        """
+        if not self.projectiles or not player.is_alive:
+            return None
+
+        player_left = player.rect.left
+        player_top = player.rect.top
+        player_right = player.rect.right
+        player_bottom = player.rect.bottom
+        player_center_x = player.x + player.width // 2
+        player_center_y = player.y + player.height // 2
+
+        player_damage_result = None
+        remaining_projectiles = []
+
+        for projectile in self.projectiles:
+            if projectile.kind == "shockwave":
+                if not projectile.hit_player and self.shockwave_hits(
+                    projectile, player, player_center_x, player_center_y
+                ):
+                    player_damage_result = (
+                        self.damage_player(projectile, player) or player_damage_result
+                    )
+                remaining_projectiles.append(projectile)
+                continue
+
+            # 以投射物中心建立碰撞方塊（和 pygame.Rect 一樣把座標取整）
+            hit_size = ENEMY_PROJECTILE_TYPES[projectile.kind]["hit_size"]
+            left = int(projectile.x - hit_size // 2)
+            top = int(projectile.y - hit_size // 2)
+
+            if (
+                left < player_right
+                and left + hit_size > player_left
+                and top < player_bottom
+                and top + hit_size > player_top
+            ):
+                # 擊中後子彈消失
+                self.release(projectile)
+                player_damage_result = (
+                    self.damage_player(projectile, player) or player_damage_result
+                )
+                continue
+
+            remaining_projectiles.append(projectile)
+
+        self.projectiles = remaining_projectiles
+        return player_damage_result
+
+    def shockwave_hits(self, shockwave, player, player_center_x, player_center_y):
+        """
+        檢查震波是否擴散到玩家，擊中時套用擊退\n
+        \n
+        參數:\n
+        shockwave (EnemyProjectile): 震波\n
+        player (Player): 玩家物件\n
+        player_center_x (float): 玩家中心 X 座標\n
+        player_center_y (float): 玩家中心 Y 座標\n
+        \n
+        回傳:\n
+        bool: True 表示震波擊中玩家\n
+        """
+        dx = player_center_x - shockwave.x
+        dy = player_center_y - shockwave.y
+        reach = shockwave.radius + SHOCKWAVE_HIT_TOLERANCE
+        distance_squared = dx**2 + dy**2
+
+        if distance_squared > reach * reach:
+            return False
+
+        # 計算擊退方向，水平推開並向上推一點
+        distance_to_player = math.sqrt(distance_squared)
+        if distance_to_player > 0:
+            knockback_x = (dx / distance_to_player) * shockwave.knockback_force
+            knockback_y = -50
+            if hasattr(player, "velocity_x") and hasattr(player, "velocity_y"):
+                player.velocity_x += knockback_x * 0.1
+                player.velocity_y += knockback_y * 0.1
+
+        shockwave.hit_player = True
+        return True
+
+    def damage_player(self, projectile, player):
+        """
+        對玩家造成投射物傷害並顯示提示\n
+        \n
+        參數:\n
+        projectile (EnemyProjectile): 擊中玩家的投射物\n
+        player (Player): 玩家物件\n
+        \n
+        回傳:\n
+        dict: 玩家的傷害結果\n
+        """
+        damage_result = player.take_damage(projectile.damage)
+
+        hit_message = ENEMY_PROJECTILE_TYPES[projectile.kind]["hit_message"]
+        if hit_message:
+            log.debug(hit_message, projectile.damage)
+
+        return damage_result
+
+    def deflect(self, center_x, center_y, deflection_range):
+        """
+        甩槍擋彈 - 移除範圍內可以被擋下的投射物\n
+        \n
+        參數:\n
+        center_x (float): 防護圓中心 X 座標\n
+        center_y (float): 防護圓中心 Y 座標\n
+        deflection_range (float): 防護半徑\n
+        \n
+        回傳:\n
+        int: 被擋下的投射物數量\n
+        """
+        range_squared = deflection_range * deflection_range
+        remaining_projectiles = []
+        deflected_count = 0
+
+        for projectile in self.projectiles:
+            if ENEMY_PROJECTILE_TYPES[projectile.kind]["deflectable"]:
+                dx = projectile.x - center_x
+                dy = projectile.y - center_y
+                if dx * dx + dy * dy <= range_squared:
+                    self.release(projectile)
+                    deflected_count += 1
+                    continue
+
+            remaining_projectiles.append(projectile)
+
+        self.projectiles = remaining_projectiles
+        return deflected_count
+
+    def get_projectiles(self, owner=None, kind=None):
+        """
+        取得符合條件的投射物\n
+        \n
+        參數:\n
+        owner (Monster): 只取這個怪物發射的，None 表示全部\n
+        kind (str): 只取這個類型的，None 表示全部\n
+        \n
+        回傳:\n
+        list: 符合條件的投射物列表\n
+        """
+        return [
+            projectile
+            for projectile in self.projectiles
+            if (owner is None or projectile.owner is owner)
+            and (kind is None or projectile.kind == kind)
+        ]
+
+    def clear(self):
+        """
+        清除所有投射物 - 用於關卡重置\n
+        """
+        for projectile in self.projectiles:
+            self.release(projectile)
+        self.projectiles.clear()
+
+    def draw(self, screen, camera_x=0, camera_y=0):
+        """
+        繪製所有投射物\n
+        \n
+        參數:\n
+        screen (pygame.Surface): 要繪製到的螢幕表面\n
+        camera_x (int): 攝影機 x 偏移\n
+        camera_y (int): 攝影機 y 偏移\n
+        """
+        for projectile in self.projectiles:
+            if not projectile.owner.is_alive:
+                continue
+
+            screen_x = projectile.x - camera_x
+            screen_y = projectile.y - camera_y
+
+            if projectile.kind == "shockwave":
+                # 只繪製在螢幕範圍內的震波
+                if (
+                    -200 <= screen_x <= SCREEN_WIDTH + 200
+                    and -200 <= screen_y <= SCREEN_HEIGHT + 200
+                ):
+                    # 繪製震波圓圈（透明效果用多層圓圈模擬）
+                    for i in range(3):
+                        alpha_factor = 1.0 - (i * 0.3)
+                        wave_color = tuple(int(c * alpha_factor) for c in YELLOW)
+                        pygame.draw.circle(
+                            screen,
+                            wave_color,
+                            (int(screen_x), int(screen_y)),
+                            int(projectile.radius - i * 5),
+                            3,
+                        )
+                continue
+
+            # 只繪製在螢幕範圍內的投射物
+            if not (
+                -20 <= screen_x <= SCREEN_WIDTH + 20
+                and -20 <= screen_y <= SCREEN_HEIGHT + 20
+            ):
+                continue
+
+            style = ENEMY_PROJECTILE_TYPES[projectile.kind]
+            center = (int(screen_x), int(screen_y))
+            pygame.draw.circle(
+                screen, style["outer_color"], center, style["outer_radius"]
+            )
+            if style["inner_color"] is not None:
+                pygame.draw.circle(
+                    screen, style["inner_color"], center, style["inner_radius"]
+                )
@@ -0,0 +1,396 @@
+######################載入套件######################
+import csv
+import json
+import os
+import time
+from collections import deque
+
+import pygame
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+    from ..utils.game_logger import get_logger
+except ImportError:
+    from src.config import *
+    from src.utils.game_logger import get_logger
+
+log = get_logger("profiler")
+
+######################階段名稱######################
+
+# 遊戲迴圈裡量測的階段，依照執行順序排列（CSV 欄位也用這個順序）
+FRAME_PHASES = [
+    "player",
+    "level",
+    "monsters",
+    "weapons",
+    "damage_display",
+    "draw_level",
+    "draw_monsters",
+    "draw_weapons",
+    "draw_damage",
+    "draw_player",
+    "draw_ui",
+    "draw_clouds",
+]
+
+# 疊加面板和匯出檔裡的物件數量欄位
+FRAME_COUNTERS = ["bullet_count", "monster_count"]
+
+######################計時區塊類別######################
+
+
+class NullScope:
+    """
+    關閉分析時使用的空計時區塊 - with 進出都不做任何事\n
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+# 所有關閉中的計時區塊共用同一個物件，不會產生額外配置
+NULL_SCOPE = NullScope()
+
+
+class TimingScope:
+    """
+    具名計時區塊 - 用 with 包住一段程式，離開時把耗時加進這一幀的統計\n
+    \n
+    每個名稱只建立一個物件重複使用，同名區塊不能巢狀使用\n
+    \n
+    參數:\n
+    profiler (FrameProfiler): 接收耗時的分析器\n
+    name (str): 階段名稱\n
+    """
+
+    __slots__ = ("profiler", "name", "start_time")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start_time = 0.0
+
+    def __enter__(self):
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.add_time(self.name, time.perf_counter() - self.start_time)
+        return False
+
+
+######################匯出檔類別######################
+
+
+class ProfileExporter:
+    """
+    逐幀匯出分析資料 - 副檔名 .csv 寫成 CSV，其他寫成 JSONL（每行一個 JSON）\n
+    \n
+    檔案超過 max_rows 列就把舊檔改名為「檔名.1」再開新檔，\n
+    長時間執行時磁碟用量不會無限增加，最近的資料永遠在原檔名裡。\n
+    \n
+    參數:\n
+    path (str): 匯出檔路徑\n
+    max_rows (int): 每個檔案最多寫入的列數\n
+    """
+
+    def __init__(self, path, max_rows=PROFILER_EXPORT_MAX_ROWS):
+        self.path = path
+        self.max_rows = max_rows
+        self.use_csv = path.lower().endswith(".csv")
+        self.file = None
+        self.writer = None
+        self.rows_written = 0
+        self.open_file()
+
+    def open_file(self):
+        """
+        開啟新的匯出檔，CSV 會先寫入欄位名稱\n
+        """
+        self.file = open(self.path, "w", newline="", encoding="utf-8")
+        self.rows_written = 0
+
+        if self.use_csv:
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(
+                ["frame", "frame_ms"]
+                + [f"{phase}_ms" for phase in FRAME_PHASES]
+                + FRAME_COUNTERS
+            )
+
+    def rotate(self):
+        """
+        把寫滿的檔案改名為「檔名.1」，再開新檔繼續寫\n
+        """
+        self.file.close()
+        os.replace(self.path, self.path + ".1")
+        self.open_file()
+
+    def write(self, frame_index, frame_ms, phase_ms, counts):
+        """
+        寫入一幀的資料\n
+        \n
+        參數:\n
+        frame_index (int): 幀編號\n
+        frame_ms (float): 和上一幀之間的真實時間（毫秒）\n
+        phase_ms (dict): 階段名稱 -> 耗時（毫秒）\n
+        counts (dict): 物件數量\n
+        """
+        if self.rows_written >= self.max_rows:
+            self.rotate()
+
+        if self.use_csv:
+            self.writer.writerow(
+                [frame_index, round(frame_ms, 3)]
+                + [round(phase_ms.get(phase, 0.0), 3) for phase in FRAME_PHASES]
+                + [counts.get(counter, 0) for counter in FRAME_COUNTERS]
+            )
+        else:
+            record = {
+                "frame": frame_index,
+                "frame_ms": round(frame_ms, 3),
+                "phases": {
+                    phase: round(duration, 3) for phase, duration in phase_ms.items()
+                },
+                "counts": counts,
+            }
+            self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        self.rows_written += 1
+
+    def close(self):
+        """
+        關閉匯出檔\n
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+######################幀分析器類別######################
+
+
+class FrameProfiler:
+    """
+    幀分析器 - 量測遊戲迴圈各階段的耗時，顯示疊加面板或匯出到檔案\n
+    \n
+    用法：\n
+    with profiler.scope("monsters"):\n
+        monster_manager.update(...)\n
+    每一幀結束時呼叫 end_frame()，把這一幀的耗時存進歷史紀錄\n
+    \n
+    特點：\n
+    1. 關閉時 scope() 直接回傳共用的空區塊，幾乎沒有成本\n
+    2. 同一幀裡同名階段執行多次時（例如一幀跑多個模擬步）耗時會累加\n
+    3. 疊加面板顯示最近 history_size 幀的平均值，數字不會一直跳動\n
+    \n
+    參數:\n
+    enabled (bool): 是否開始量測\n
+    history_size (int): 平均時使用的幀數\n
+    """
+
+    def __init__(self, enabled=False, history_size=PROFILER_HISTORY_FRAMES):
+        self.enabled = enabled
+        self.overlay_visible = False
+        self.scopes = {}  # 階段名稱 -> TimingScope
+        self.frame_phases = {}  # 這一幀的累計耗時（秒）
+        self.history = deque(maxlen=history_size)  # (幀間隔毫秒, 階段毫秒, 數量)
+        self.frame_index = 0
+        self.last_frame_time = time.perf_counter()
+        self.exporter = None
+        self.overlay_surface = None  # 疊加面板圖片，每隔幾幀才重畫一次
+        self.overlay_age = 0  # 疊加面板距離上次重畫的幀數
+
+    def scope(self, name):
+        """
+        取得具名計時區塊\n
+        \n
+        參數:\n
+        name (str): 階段名稱\n
+        \n
+        回傳:\n
+        TimingScope or NullScope: 用 with 包住要量測的程式\n
+        """
+        if not self.enabled:
+            return NULL_SCOPE
+
+        timing_scope = self.scopes.get(name)
+        if timing_scope is None:
+            timing_scope = TimingScope(self, name)
+            self.scopes[name] = timing_scope
+        return timing_scope
+
+    def add_time(self, name, seconds):
+        """
+        把一段耗時加進這一幀的統計\n
+        \n
+        參數:\n
+        name (str): 階段名稱\n
+        seconds (float): 耗時（秒）\n
+        """
+        self.frame_phases[name] = self.frame_phases.get(name, 0.0) + seconds
+
+    def end_frame(self, counts=None):
+        """
+        結束這一幀 - 存進歷史紀錄、寫入匯出檔，並清空這一幀的統計\n
+        \n
+        參數:\n
+        counts (dict): 這一幀的物件數量，例如子彈數、怪物數\n
+        """
+        if not self.enabled:
+            return
+
+        current_time = time.perf_counter()
+        frame_ms = (current_time - self.last_frame_time) * 1000
+        self.last_frame_time = current_time
+
+        phase_ms = {
+            name: seconds * 1000 for name, seconds in self.frame_phases.items()
+        }
+        counts = counts or {}
+        self.history.append((frame_ms, phase_ms, counts))
+
+        if self.exporter is not None:
+            self.exporter.write(self.frame_index, frame_ms, phase_ms, counts)
+
+        self.frame_index += 1
+        self.frame_phases = {}
+
+    def set_enabled(self, enabled):
+        """
+        開啟或關閉量測，重新開啟時從新的一幀開始計算\n
+        \n
+        參數:\n
+        enabled (bool): 是否量測\n
+        """
+        self.enabled = enabled
+        self.frame_phases = {}
+        self.last_frame_time = time.perf_counter()
+
+    def toggle_overlay(self):
+        """
+        切換疊加面板 - 開啟面板時會一併開始量測\n
+        """
+        self.overlay_visible = not self.overlay_visible
+        self.overlay_surface = None
+        if self.overlay_visible and not self.enabled:
+            self.set_enabled(True)
+
+    def start_export(self, path):
+        """
+        開始把每一幀的資料匯出到檔案（會一併開始量測）\n
+        \n
+        參數:\n
+        path (str): 匯出檔路徑，.csv 為 CSV 格式，其他為 JSONL 格式\n
+        """
+        self.stop_export()
+        self.exporter = ProfileExporter(path)
+        if not self.enabled:
+            self.set_enabled(True)
+        log.info(f"📊 效能資料匯出到: {path}")
+
+    def stop_export(self):
+        """
+        停止匯出並關閉檔案\n
+        """
+        if self.exporter is not None:
+            self.exporter.close()
+            self.exporter = None
+
+    def get_summary(self):
+        """
+        計算最近幾幀的平均耗時\n
+        \n
+        回傳:\n
+        dict: frame_ms（平均幀間隔）、phases（階段名稱 -> 平均毫秒）、counts（最新數量）\n
+        """
+        if not self.history:
+            return {"frame_ms": 0.0, "phases": {}, "counts": {}}
+
+        frame_count = len(self.history)
+        totals = {}
+        total_frame_ms = 0.0
+        for frame_ms, phase_ms, counts in self.history:
+            total_frame_ms += frame_ms
+            for name, duration in phase_ms.items():
+                totals[name] = totals.get(name, 0.0) + duration
+
+        # 先依照 FRAME_PHASES 的順序，其他自訂階段排在後面
+        ordered_names = [name for name in FRAME_PHASES if name in totals]
+        ordered_names += [name for name in totals if name not in FRAME_PHASES]
+
+        return {
+            "frame_ms": total_frame_ms / frame_count,
+            "phases": {name: totals[name] / frame_count for name in ordered_names},
+            "counts": self.history[-1][2],
+        }
+
+    def print_summary(self):
+        """
+        在終端機印出各階段的平均耗時 - 無頭模式結束時使用\n
+        """
+        summary = self.get_summary()
+
+        # 組成一則訊息輸出，各行不會被頻率限制拆開
+        lines = [f"📊 最近 {len(self.history)} 幀平均："]
+        for name, duration in summary["phases"].items():
+            lines.append(f"   {name:<16}{duration:8.3f} ms")
+        for name, count in summary["counts"].items():
+            lines.append(f"   {name:<16}{count:8d}")
+        log.info("\n".join(lines))
+
+    def draw(self, screen):
+        """
+        繪製疊加面板 - 顯示各階段平均耗時和物件數量\n
+        \n
+        面板每 PROFILER_OVERLAY_REFRESH_FRAMES 幀才重畫一次；\n
+        數字一直在變，直接用字體排版，不放進共用的文字緩存\n
+        \n
+        參數:\n
+        screen (pygame.Surface): 遊戲畫面\n
+        """
+        self.overlay_age += 1
+        if (
+            self.overlay_surface is None
+            or self.overlay_age >= PROFILER_OVERLAY_REFRESH_FRAMES
+        ):
+            self.overlay_surface = self.render_overlay()
+            self.overlay_age = 0
+
+        screen.blit(self.overlay_surface, (PROFILER_OVERLAY_X, PROFILER_OVERLAY_Y))
+
+    def render_overlay(self):
+        """
+        把目前的平均值畫成疊加面板圖片\n
+        \n
+        回傳:\n
+        pygame.Surface: 半透明背景加上文字的面板\n
+        """
+        summary = self.get_summary()
+        frame_ms = summary["frame_ms"]
+        fps = 1000 / frame_ms if frame_ms > 0 else 0.0
+
+        lines = [f"幀: {frame_ms:.2f} ms ({fps:.0f} FPS)"]
+        for name, duration in summary["phases"].items():
+            lines.append(f"{name}: {duration:.2f} ms")
+        for name, count in summary["counts"].items():
+            lines.append(f"{name}: {count}")
+
+        # 半透明黑色背景，文字比較好讀
+        font = get_chinese_font(FONT_SIZE_TINY)
+        line_height = FONT_SIZE_TINY + 2
+        panel = pygame.Surface(
+            (PROFILER_OVERLAY_WIDTH, line_height * len(lines) + 10), pygame.SRCALPHA
+        )
+        panel.fill((0, 0, 0, 160))
+
+        for i, line in enumerate(lines):
+            text = font.render(line, True, WHITE)
+            panel.blit(text, (5, 5 + i * line_height))
+
+        return panel
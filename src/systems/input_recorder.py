@@ -0,0 +1,323 @@
+######################載入套件######################
+import hashlib
+import struct
+import zlib
+
+import pygame
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+    from ..core.game_session import get_rng, get_game_clock
+except ImportError:
+    from src.config import *
+    from src.core.game_session import get_rng, get_game_clock
+
+######################輸入代碼######################
+
+# 會影響遊戲的按鍵，每個按鍵佔錄製檔裡的一個位元（順序不能改，否則舊錄製檔會讀錯）
+RECORDED_KEYS = [
+    pygame.K_a,
+    pygame.K_LEFT,
+    pygame.K_d,
+    pygame.K_RIGHT,
+    pygame.K_w,
+    pygame.K_UP,
+    pygame.K_SPACE,
+    pygame.K_h,
+    pygame.K_1,
+    pygame.K_2,
+    pygame.K_3,
+    pygame.K_4,
+    pygame.K_x,
+]
+KEY_BITS = {key: 1 << index for index, key in enumerate(RECORDED_KEYS)}
+
+# 只在按下那一刻觸發一次的事件，同樣每個事件佔一個位元
+# restart: R 鍵重新開始, force_death: T 鍵測試死亡, toggle_hack: 0 鍵切換 hack 模式,
+# melee: 滑鼠右鍵甩槍攻擊
+INPUT_EVENTS = ["restart", "force_death", "toggle_hack", "melee"]
+EVENT_BITS = {name: 1 << index for index, name in enumerate(INPUT_EVENTS)}
+
+######################錄製檔格式######################
+
+# 檔頭：識別碼、版本、種子、步數、結束時的狀態雜湊
+RECORDING_MAGIC = b"EPSR"
+RECORDING_VERSION = 1
+RECORDING_HEADER = struct.Struct("<4sHQI32s")
+SEED_LIMIT = 2**64  # 檔頭用 64 位元無號整數存種子，種子必須在 0 到 SEED_LIMIT - 1 之間
+
+# 每個模擬步一筆：按鍵位元、事件位元、滑鼠按鍵位元、滑鼠 x、滑鼠 y（共 8 bytes）
+# 整段資料再用 zlib 壓縮，長時間按住同樣按鍵的部分幾乎不佔空間
+RECORDING_FRAME = struct.Struct("<HBBhh")
+
+######################輸入類別######################
+
+
+class KeyState:
+    """
+    按鍵狀態 - 和 pygame.key.get_pressed() 一樣可以用按鍵代碼查詢\n
+    \n
+    只記錄 RECORDED_KEYS 裡的按鍵，其他按鍵一律視為沒按\n
+    \n
+    參數:\n
+    key_mask (int): 按下的按鍵位元\n
+    """
+
+    __slots__ = ("key_mask",)
+
+    def __init__(self, key_mask=0):
+        self.key_mask = key_mask
+
+    def __getitem__(self, key):
+        return bool(self.key_mask & KEY_BITS.get(key, 0))
+
+
+class InputFrame:
+    """
+    一個模擬步的輸入 - 遊戲更新只從這裡讀取玩家輸入\n
+    \n
+    即時遊玩時從 pygame 讀取，重播時從錄製檔讀取，\n
+    遊戲邏輯不需要知道輸入是從哪裡來的\n
+    \n
+    參數:\n
+    key_mask (int): 按下的按鍵位元（對應 RECORDED_KEYS）\n
+    event_mask (int): 這一步觸發的事件位元（對應 INPUT_EVENTS）\n
+    mouse_buttons (tuple): 滑鼠左、中、右鍵是否按下\n
+    mouse_pos (tuple): 滑鼠的螢幕座標\n
+    """
+
+    __slots__ = ("keys", "event_mask", "mouse_buttons", "mouse_pos")
+
+    def __init__(self, key_mask=0, event_mask=0, mouse_buttons=None, mouse_pos=None):
+        self.keys = KeyState(key_mask)
+        self.event_mask = event_mask
+        self.mouse_buttons = mouse_buttons or (False, False, False)
+        self.mouse_pos = mouse_pos or (0, 0)
+
+    def has_event(self, name):
+        """
+        檢查這一步是否觸發了某個事件\n
+        \n
+        參數:\n
+        name (str): 事件名稱（INPUT_EVENTS 之一）\n
+        \n
+        回傳:\n
+        bool: True 表示觸發了\n
+        """
+        return bool(self.event_mask & EVENT_BITS[name])
+
+    def pack(self):
+        """
+        轉成錄製檔裡的一筆資料\n
+        \n
+        回傳:\n
+        bytes: 8 bytes 的資料\n
+        """
+        button_mask = 0
+        for index, pressed in enumerate(self.mouse_buttons[:3]):
+            if pressed:
+                button_mask |= 1 << index
+
+        return RECORDING_FRAME.pack(
+            self.keys.key_mask,
+            self.event_mask,
+            button_mask,
+            max(-32768, min(32767, int(self.mouse_pos[0]))),
+            max(-32768, min(32767, int(self.mouse_pos[1]))),
+        )
+
+    @classmethod
+    def unpack(cls, data, offset=0):
+        """
+        從錄製檔資料還原一個模擬步的輸入\n
+        \n
+        參數:\n
+        data (bytes): 錄製檔資料\n
+        offset (int): 這一筆的起始位置\n
+        \n
+        回傳:\n
+        InputFrame: 還原的輸入\n
+        """
+        key_mask, event_mask, button_mask, mouse_x, mouse_y = (
+            RECORDING_FRAME.unpack_from(data, offset)
+        )
+        mouse_buttons = tuple(bool(button_mask & (1 << index)) for index in range(3))
+        return cls(key_mask, event_mask, mouse_buttons, (mouse_x, mouse_y))
+
+
+# 沒有任何輸入的模擬步（無頭模式使用）
+IDLE_INPUT = InputFrame()
+
+# 只有「重新開始」事件的模擬步（無頭模式遊戲結束時使用）
+RESTART_INPUT = InputFrame(event_mask=EVENT_BITS["restart"])
+
+
+def capture_input(event_names=()):
+    """
+    讀取目前的鍵盤和滑鼠狀態\n
+    \n
+    參數:\n
+    event_names (iterable): 這一步要觸發的事件名稱\n
+    \n
+    回傳:\n
+    InputFrame: 目前的輸入\n
+    """
+    pressed = pygame.key.get_pressed()
+    key_mask = 0
+    for key, bit in KEY_BITS.items():
+        if pressed[key]:
+            key_mask |= bit
+
+    event_mask = 0
+    for name in event_names:
+        event_mask |= EVENT_BITS[name]
+
+    return InputFrame(
+        key_mask,
+        event_mask,
+        tuple(pygame.mouse.get_pressed()),
+        pygame.mouse.get_pos(),
+    )
+
+
+######################錄製與讀取######################
+
+
+class InputRecorder:
+    """
+    輸入錄製器 - 把每個模擬步的輸入存起來，結束時寫成錄製檔\n
+    \n
+    錄製檔包含種子和每一步的輸入，用 --replay 重播時\n
+    會得到完全相同的遊戲過程和結束狀態\n
+    \n
+    參數:\n
+    path (str): 錄製檔路徑\n
+    seed (int): 這一局的亂數種子\n
+    """
+
+    def __init__(self, path, seed):
+        self.path = path
+        self.seed = seed
+        self.frames = bytearray()
+        self.frame_count = 0
+
+    def record(self, input_frame):
+        """
+        記錄一個模擬步的輸入\n
+        \n
+        參數:\n
+        input_frame (InputFrame): 這一步的輸入\n
+        """
+        self.frames += input_frame.pack()
+        self.frame_count += 1
+
+    def save(self, state_hash):
+        """
+        寫出錄製檔\n
+        \n
+        參數:\n
+        state_hash (str): 錄製結束時的狀態雜湊（十六進位），重播時用來比對\n
+        """
+        header = RECORDING_HEADER.pack(
+            RECORDING_MAGIC,
+            RECORDING_VERSION,
+            self.seed,
+            self.frame_count,
+            bytes.fromhex(state_hash),
+        )
+        with open(self.path, "wb") as file:
+            file.write(header)
+            file.write(zlib.compress(bytes(self.frames), 9))
+
+
+def load_recording(path):
+    """
+    讀取錄製檔\n
+    \n
+    參數:\n
+    path (str): 錄製檔路徑\n
+    \n
+    回傳:\n
+    dict: seed（種子）、frames（InputFrame 列表）、state_hash（錄製時的結束狀態雜湊）\n
+    \n
+    例外:\n
+    ValueError: 檔案格式或版本不符\n
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if len(data) < RECORDING_HEADER.size:
+        raise ValueError(f"錄製檔太短: {path}")
+
+    magic, version, seed, frame_count, state_hash = RECORDING_HEADER.unpack_from(data)
+    if magic != RECORDING_MAGIC:
+        raise ValueError(f"不是錄製檔: {path}")
+    if version != RECORDING_VERSION:
+        raise ValueError(f"不支援的錄製檔版本 {version}: {path}")
+
+    try:
+        body = zlib.decompress(data[RECORDING_HEADER.size :])
+    except zlib.error as e:
+        raise ValueError(f"錄製檔資料損壞: {path} ({e})") from e
+    if len(body) != frame_count * RECORDING_FRAME.size:
+        raise ValueError(f"錄製檔資料不完整: {path}")
+
+    frames = [
+        InputFrame.unpack(body, index * RECORDING_FRAME.size)
+        for index in range(frame_count)
+    ]
+    return {"seed": seed, "frames": frames, "state_hash": state_hash.hex()}
+
+
+######################狀態雜湊######################
+
+
+def compute_state_hash(game):
+    """
+    計算遊戲狀態的雜湊 - 兩次執行的雜湊相同，表示模擬結果完全一致\n
+    \n
+    包含模擬時間、亂數狀態、分數、玩家、怪物、Boss、子彈、手榴彈和敵方投射物。\n
+    浮點數用 repr 轉成文字，差一個位元也會得到不同的雜湊。\n
+    座標和速度一律轉成 float 再比較，534 和 534.0 視為相同，\n
+    怪物批次更新（一律寫回 float）和逐隻更新才能得到同樣的雜湊。\n
+    \n
+    參數:\n
+    game (ElementalParkourShooter): 遊戲實例\n
+    \n
+    回傳:\n
+    str: SHA-256 雜湊（十六進位）\n
+    """
+    player = game.player
+    monster_manager = game.monster_manager
+
+    def body_state(obj):
+        return (
+            type(obj).__name__,
+            float(obj.x),
+            float(obj.y),
+            float(getattr(obj, "velocity_x", 0.0)),
+            float(getattr(obj, "velocity_y", 0.0)),
+            getattr(obj, "health", 0),
+        )
+
+    state = (
+        get_game_clock().tick_count,
+        get_game_clock().current_time,
+        get_rng().getstate(),
+        game.game_state,
+        game.score,
+        game.hack_mode,
+        game.star_collected,
+        body_state(player),
+        player.current_weapon,
+        [body_state(monster) for monster in monster_manager.monsters],
+        body_state(monster_manager.boss) if monster_manager.boss else None,
+        [body_state(bullet) for bullet in game.weapon_manager.bullets],
+        [body_state(grenade) for grenade in game.weapon_manager.grenades],
+        [
+            body_state(projectile)
+            for projectile in monster_manager.projectiles.projectiles
+        ],
+    )
+    return hashlib.sha256(repr(state).encode("utf-8")).hexdigest()
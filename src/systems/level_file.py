@@ -0,0 +1,383 @@
+######################載入套件######################
+import json
+import struct
+import sys
+import zlib
+from array import array
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+except ImportError:
+    from src.config import *
+
+######################關卡檔格式######################
+
+# 檔頭：識別碼、版本、關卡種子、關卡寬、高、段寬、星星 x、y，接著是每張表的筆數
+LEVEL_MAGIC = b"EPSL"
+LEVEL_VERSION = 1
+LEVEL_HEADER = struct.Struct("<4sHIiiiiiIIII")
+
+# 檔頭之後是四張表（順序不能改），每張表是一整塊連續的 int32 陣列，
+# 每筆資料佔固定幾格，第一格是段編號（-1 表示地板、牆壁這些永遠載入的物件）。
+# 四張表接在一起後用 zlib 壓縮
+LEVEL_TABLES = (
+    ("platforms", ("section", "x", "y", "width", "height")),
+    ("spikes", ("section", "x", "y", "width", "height", "damage")),
+    ("pickups", ("section", "index", "x", "y", "heal_amount", "collected")),
+    (
+        "hazards",
+        ("section", "kind", "x", "y", "width", "height", "direction_x", "direction_y"),
+    ),
+)
+LEVEL_TABLE_FIELDS = {name: len(fields) for name, fields in LEVEL_TABLES}
+
+# 永遠載入的物件用的段編號（固定平台的第一筆是地板）
+FIXED_SECTION = -1
+
+# 陷阱種類代碼，方向以千分之一為單位存成整數
+HAZARD_KINDS = ("lava", "water", "wind")
+HAZARD_DIRECTION_SCALE = 1000
+
+######################關卡資料######################
+
+
+class LevelData:
+    """
+    關卡資料 - 一個關卡所有段的平台、尖刺、愛心和陷阱\n
+    \n
+    每張表是一整塊連續的 int32 陣列，讀檔時直接整塊轉換，不逐筆解析。\n
+    讀檔時掃一次段編號欄位，記下每一段在表裡的範圍，\n
+    LevelManager 串流載入某一段時只取那一段的範圍建立物件。\n
+    \n
+    參數:\n
+    seed (int): 關卡種子\n
+    level_width (int): 關卡寬度\n
+    level_height (int): 關卡高度\n
+    section_width (int): 每一段的寬度\n
+    star_x (int): 星星 x 座標\n
+    star_y (int): 星星 y 座標\n
+    tables (dict): 表名稱 -> array('i')，每張表依段編號排序\n
+    \n
+    例外:\n
+    ValueError: 表的長度不對、沒有依段編號排序或沒有地板\n
+    """
+
+    def __init__(
+        self, seed, level_width, level_height, section_width, star_x, star_y, tables
+    ):
+        self.seed = seed
+        self.level_width = level_width
+        self.level_height = level_height
+        self.section_width = section_width
+        self.star_x = star_x
+        self.star_y = star_y
+        self.tables = tables
+        self.section_ranges = {
+            name: self.index_sections(name) for name, _ in LEVEL_TABLES
+        }
+        if FIXED_SECTION not in self.section_ranges["platforms"]:
+            raise ValueError("關卡資料沒有地板")
+
+    def index_sections(self, name):
+        """
+        掃一次段編號欄位，找出每一段在表裡的範圍\n
+        \n
+        參數:\n
+        name (str): 表名稱\n
+        \n
+        回傳:\n
+        dict: 段編號 -> (第一筆, 最後一筆的下一筆)\n
+        \n
+        例外:\n
+        ValueError: 表的長度不對或沒有依段編號排序\n
+        """
+        table = self.tables[name]
+        fields = LEVEL_TABLE_FIELDS[name]
+        if len(table) % fields:
+            raise ValueError(f"關卡檔的 {name} 表長度不對")
+
+        ranges = {}
+        current = None
+        for record, section in enumerate(table[::fields]):
+            if section == current:
+                continue
+            if section in ranges or (current is not None and section < current):
+                raise ValueError(f"關卡檔的 {name} 表沒有依段編號排序")
+            if current is not None:
+                ranges[current] = (ranges[current][0], record)
+            ranges[section] = (record, None)
+            current = section
+        if current is not None:
+            ranges[current] = (ranges[current][0], len(table) // fields)
+        return ranges
+
+    def records(self, name, section):
+        """
+        取得某一段在某張表裡的所有資料\n
+        \n
+        參數:\n
+        name (str): 表名稱\n
+        section (int): 段編號（FIXED_SECTION 表示永遠載入的物件）\n
+        \n
+        回傳:\n
+        iterator: 每筆資料一個 tuple，欄位順序和 LEVEL_TABLES 相同\n
+        """
+        start, end = self.section_ranges[name].get(section, (0, 0))
+        fields = LEVEL_TABLE_FIELDS[name]
+        values = self.tables[name][start * fields : end * fields]
+        return zip(*(values[column::fields] for column in range(fields)))
+
+    def count(self, name):
+        """
+        取得某張表的資料筆數\n
+        \n
+        參數:\n
+        name (str): 表名稱\n
+        \n
+        回傳:\n
+        int: 筆數\n
+        """
+        return len(self.tables[name]) // LEVEL_TABLE_FIELDS[name]
+
+    def save(self, path):
+        """
+        寫出關卡檔\n
+        \n
+        參數:\n
+        path (str): 關卡檔路徑\n
+        """
+        header = LEVEL_HEADER.pack(
+            LEVEL_MAGIC,
+            LEVEL_VERSION,
+            self.seed,
+            self.level_width,
+            self.level_height,
+            self.section_width,
+            self.star_x,
+            self.star_y,
+            *(self.count(name) for name, _ in LEVEL_TABLES),
+        )
+
+        body = bytearray()
+        for name, _ in LEVEL_TABLES:
+            table = self.tables[name]
+            if sys.byteorder == "big":
+                # 關卡檔一律用 little-endian，換位元組順序前先複製一份
+                table = array("i", table)
+                table.byteswap()
+            body += table.tobytes()
+
+        with open(path, "wb") as file:
+            file.write(header)
+            file.write(zlib.compress(bytes(body), 9))
+
+    def to_json(self):
+        """
+        轉成方便閱讀的 JSON 結構（除錯用，遊戲只讀二進位關卡檔）\n
+        \n
+        回傳:\n
+        dict: 檔頭欄位加上每張表的資料（每筆一個 dict）\n
+        """
+        result = {
+            "version": LEVEL_VERSION,
+            "seed": self.seed,
+            "level_width": self.level_width,
+            "level_height": self.level_height,
+            "section_width": self.section_width,
+            "star_x": self.star_x,
+            "star_y": self.star_y,
+        }
+        for name, fields in LEVEL_TABLES:
+            rows = []
+            for section in sorted(self.section_ranges[name]):
+                rows.extend(
+                    dict(zip(fields, record)) for record in self.records(name, section)
+                )
+            if name == "hazards":
+                for row in rows:
+                    row["kind"] = HAZARD_KINDS[row["kind"]]
+                    row["direction_x"] /= HAZARD_DIRECTION_SCALE
+                    row["direction_y"] /= HAZARD_DIRECTION_SCALE
+            result[name] = rows
+        return result
+
+    def export_json(self, path):
+        """
+        把關卡匯出成 JSON 檔（除錯用）\n
+        \n
+        參數:\n
+        path (str): JSON 檔路徑\n
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_json(), file, ensure_ascii=False, indent=2)
+
+
+######################存檔與讀取######################
+
+
+def capture_level(level_manager):
+    """
+    把關卡管理器目前的關卡整理成 LevelData - 還沒載入的段會在這裡生成\n
+    \n
+    已經載入的段直接使用場上的物件，撿走的愛心標記為 collected；\n
+    已經丟掉的段裡撿走的愛心不會生成，所以不會出現在關卡檔裡。\n
+    \n
+    參數:\n
+    level_manager (LevelManager): 關卡管理器\n
+    \n
+    回傳:\n
+    LevelData: 整個關卡的資料\n
+    """
+    tables = {name: array("i") for name, _ in LEVEL_TABLES}
+    platforms = tables["platforms"]
+    spikes = tables["spikes"]
+    pickups = tables["pickups"]
+    hazards = tables["hazards"]
+
+    # 永遠載入的物件：地板一定要放在第一筆
+    for platform in [level_manager.ground_platform] + level_manager.fixed_platforms:
+        platforms.extend(
+            (
+                FIXED_SECTION,
+                round(platform.x),
+                round(platform.y),
+                round(platform.width),
+                round(platform.height),
+            )
+        )
+    for hazard in level_manager.hazards:
+        direction = getattr(
+            hazard,
+            "flow_direction",
+            getattr(hazard, "wind_direction", (0, 0)),
+        )
+        hazards.extend(
+            (
+                FIXED_SECTION,
+                HAZARD_KINDS.index(hazard.hazard_type),
+                round(hazard.x),
+                round(hazard.y),
+                round(hazard.width),
+                round(hazard.height),
+                round(direction[0] * HAZARD_DIRECTION_SCALE),
+                round(direction[1] * HAZARD_DIRECTION_SCALE),
+            )
+        )
+
+    for section in range(level_manager.section_count):
+        section_data = level_manager.sections.get(section)
+        if section_data is None:
+            section_data = level_manager.generate_section(section)
+
+        for platform in section_data["platforms"]:
+            platforms.extend(
+                (
+                    section,
+                    round(platform.x),
+                    round(platform.y),
+                    round(platform.width),
+                    round(platform.height),
+                )
+            )
+        for spike in section_data["spikes"]:
+            spikes.extend(
+                (
+                    section,
+                    round(spike.x),
+                    round(spike.y),
+                    round(spike.width),
+                    round(spike.height),
+                    spike.damage,
+                )
+            )
+        for index, pickup in sorted(section_data["pickups"].items()):
+            pickups.extend(
+                (
+                    section,
+                    index,
+                    round(pickup.x),
+                    round(pickup.y),
+                    pickup.heal_amount,
+                    int(pickup.collected),
+                )
+            )
+
+    return LevelData(
+        level_manager.level_seed,
+        level_manager.level_width,
+        level_manager.level_height,
+        level_manager.section_width,
+        level_manager.star_x,
+        level_manager.star_y,
+        tables,
+    )
+
+
+def load_level(path):
+    """
+    讀取關卡檔\n
+    \n
+    四張表各自整塊從檔案資料轉成 int32 陣列，再掃一次段編號建立索引\n
+    \n
+    參數:\n
+    path (str): 關卡檔路徑\n
+    \n
+    回傳:\n
+    LevelData: 關卡資料\n
+    \n
+    例外:\n
+    ValueError: 檔案格式或版本不符、資料損壞\n
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if len(data) < LEVEL_HEADER.size:
+        raise ValueError(f"關卡檔太短: {path}")
+
+    (
+        magic,
+        version,
+        seed,
+        level_width,
+        level_height,
+        section_width,
+        star_x,
+        star_y,
+        *counts,
+    ) = LEVEL_HEADER.unpack_from(data)
+    if magic != LEVEL_MAGIC:
+        raise ValueError(f"不是關卡檔: {path}")
+    if version != LEVEL_VERSION:
+        raise ValueError(f"不支援的關卡檔版本 {version}: {path}")
+    if section_width <= 0 or level_width <= 0:
+        raise ValueError(f"關卡檔的關卡大小不對: {path}")
+
+    try:
+        body = memoryview(zlib.decompress(data[LEVEL_HEADER.size :]))
+    except zlib.error as e:
+        raise ValueError(f"關卡檔資料損壞: {path} ({e})") from e
+
+    tables = {}
+    offset = 0
+    for (name, _), count in zip(LEVEL_TABLES, counts):
+        table = array("i")
+        size = count * LEVEL_TABLE_FIELDS[name] * table.itemsize
+        if offset + size > len(body):
+            raise ValueError(f"關卡檔資料不完整: {path}")
+        table.frombytes(body[offset : offset + size])
+        if sys.byteorder == "big":
+            table.byteswap()
+        tables[name] = table
+        offset += size
+    if offset != len(body):
+        raise ValueError(f"關卡檔資料不完整: {path}")
+
+    hazard_fields = LEVEL_TABLE_FIELDS["hazards"]
+    for kind in tables["hazards"][1::hazard_fields]:
+        if not 0 <= kind < len(HAZARD_KINDS):
+            raise ValueError(f"關卡檔有不認得的陷阱種類 {kind}: {path}")
+
+    return LevelData(
+        seed, level_width, level_height, section_width, star_x, star_y, tables
+    )
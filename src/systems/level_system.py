@@ -1,15 +1,32 @@
 ######################載入套件######################
 import pygame
-import random
 import math
+import random
 
 # 支援直接執行和模組執行兩種方式
 try:
     from ..config import *
     from ..core.game_objects import *
+    from ..utils.spatial_grid import SpatialGrid
+    from ..utils.chunk_renderer import ChunkRenderer
+    from ..utils.game_logger import get_logger
+    from ..core.game_session import get_rng, get_game_time
+    from .level_file import FIXED_SECTION, HAZARD_KINDS, HAZARD_DIRECTION_SCALE
 except ImportError:
     from src.config import *
     from src.core.game_objects import *
+    from src.utils.spatial_grid import SpatialGrid
+    from src.utils.chunk_renderer import ChunkRenderer
+    from src.utils.game_logger import get_logger
+    from src.core.game_session import get_rng, get_game_time
+    from src.systems.level_file import (
+        FIXED_SECTION,
+        HAZARD_KINDS,
+        HAZARD_DIRECTION_SCALE,
+    )
+
+log = get_logger("level")
+rng = get_rng()
 
 ######################場景物件類別######################
 
@@ -128,11 +145,11 @@ class LavaPool(Hazard):
         self.bubble_positions = []
 
         # 在熔岩池範圍內隨機產生5-10個泡泡
-        bubble_count = random.randint(5, 10)
+        bubble_count = rng.randint(5, 10)
         for _ in range(bubble_count):
-            bubble_x = random.randint(int(self.x), int(self.x + self.width))
-            bubble_y = random.randint(int(self.y), int(self.y + self.height))
-            bubble_size = random.randint(3, 8)
+            bubble_x = rng.randint(int(self.x), int(self.x + self.width))
+            bubble_y = rng.randint(int(self.y), int(self.y + self.height))
+            bubble_size = rng.randint(3, 8)
             self.bubble_positions.append([bubble_x, bubble_y, bubble_size])
 
     def update(self, dt):
@@ -318,9 +335,9 @@ class WindGust(Hazard):
 
         # 產生50個風粒子
         for _ in range(50):
-            particle_x = random.uniform(self.x, self.x + self.width)
-            particle_y = random.uniform(self.y, self.y + self.height)
-            particle_speed = random.uniform(50, 150)
+            particle_x = rng.uniform(self.x, self.x + self.width)
+            particle_y = rng.uniform(self.y, self.y + self.height)
+            particle_speed = rng.uniform(50, 150)
             self.particles.append([particle_x, particle_y, particle_speed])
 
     def update(self, dt):
@@ -331,7 +348,7 @@ class WindGust(Hazard):
 
         # 更新陣風週期（每3-5秒一次陣風）
         self.gust_timer += dt
-        if not self.is_gusting and self.gust_timer > random.uniform(3, 5):
+        if not self.is_gusting and self.gust_timer > rng.uniform(3, 5):
             self.is_gusting = True
             self.gust_timer = 0
         elif self.is_gusting and self.gust_timer > 1.5:  # 陣風持續1.5秒
@@ -352,8 +369,8 @@ class WindGust(Hazard):
                 or particle[1] < self.y
                 or particle[1] > self.y + self.height
             ):
-                particle[0] = random.uniform(self.x, self.x + self.width)
-                particle[1] = random.uniform(self.y, self.y + self.height)
+                particle[0] = rng.uniform(self.x, self.x + self.width)
+                particle[1] = rng.uniform(self.y, self.y + self.height)
 
     def apply_force_to_player(self, player, dt):
         """
@@ -433,70 +450,462 @@ class LevelManager:
     2. 管理平台配置和目標星星\n
     3. 提供安全的跑酷體驗\n
     4. 無危險陷阱，專注跑酷樂趣\n
+    \n
+    跑酷平台、愛心和尖刺以版面（LEVEL_LAYOUT_WIDTH）為單位，由關卡種子和版面編號決定；\n
+    載入和丟棄則以比較窄的段（LEVEL_SECTION_WIDTH）為單位，每一段只取版面裡落在段內的物件。\n
+    攝影機靠近時才生成，離得很遠就丟掉，只記住哪些愛心已經撿走。\n
+    地板、左右牆壁和星星平台整個關卡只有幾個，永遠保持載入。\n
+    記憶體和每幀的碰撞檢查只和畫面附近的段有關，和關卡寬度無關。\n
+    \n
+    給了關卡檔的資料（LevelData）時不用種子生成，各段改從關卡檔的陣列建立，\n
+    串流載入和丟棄的方式完全相同。\n
     """
 
-    def __init__(self):
+    def __init__(self, level_data=None):
         """
         初始化關卡管理器\n
+        \n
+        參數:\n
+        level_data (LevelData): 讀進來的關卡檔，None 表示用新的關卡種子生成\n
         """
         self.current_level = 1
         self.level_theme = "parkour"  # 跑酷主題
-        self.platforms = []
+        self.platforms = []  # 目前載入的平台（地板、各段平台、牆壁、星星平台）
         self.hazards = []  # 保留但不使用危險陷阱
-        self.health_pickups = []  # 愛心道具列表
-        self.spike_hazards = []  # 尖刺陷阱列表
-        self.level_width = SCREEN_WIDTH * 10  # 無限寬度地圖 - 大幅擴展寬度
-        self.level_height = SCREEN_HEIGHT * 15  # 高度大幅增加，容納30層
+        self.health_pickups = []  # 目前載入的愛心道具列表
+        self.spike_hazards = []  # 目前載入的尖刺陷阱列表
+        self.platform_grid = SpatialGrid()  # 平台空間網格（碰撞查詢用）
+        self.spike_grid = SpatialGrid()  # 尖刺空間網格
+        self.pickup_grid = SpatialGrid()  # 愛心空間網格
+        # 平台和尖刺不會動，預先畫成區塊圖片（先平台、後尖刺）
+        self.chunk_renderer = ChunkRenderer([self.platform_grid, self.spike_grid])
+        self.level_width = LEVEL_WIDTH  # 無限寬度地圖 - 分段載入，加寬不增加啟動時間
+        self.level_height = LEVEL_HEIGHT  # 高度大幅增加，容納30層
         self.total_levels = 30  # 總共30層
         self.star_collected = False  # 星星是否被收集
         self.star_x = 0  # 星星位置
         self.star_y = 0
         self.star_visible = False  # 勝利星星是否可見（只有Boss被擊敗後才可見）
+
+        # 關卡串流
+        self.layout_width = LEVEL_LAYOUT_WIDTH
+        self.section_width = LEVEL_SECTION_WIDTH
+        self.section_count = math.ceil(self.level_width / self.section_width)
+        self.level_seed = 0  # 每個版面的內容都由關卡種子和版面編號決定
+        # 已載入的段：段編號 -> platforms、spikes、pickups、pickup_spawns
+        self.sections = {}
+        self.collected_pickups = set()  # 已丟掉的段裡撿走的愛心 (段編號, 愛心編號)
+        self.ground_platform = None  # 覆蓋整個關卡的地板
+        self.fixed_platforms = []  # 左右牆壁和星星平台
+        self.level_data = level_data  # 關卡檔的資料，None 表示用關卡種子生成
+
         # 移除最右邊的破關星星，只保留Boss勝利星星
         self.generate_level()
 
     def generate_level(self):
         """
         生成30層跑酷平台系統\n
+        \n
+        這裡只決定關卡種子並建立地板、牆壁和星星平台，\n
+        跑酷平台、愛心和尖刺等攝影機靠近時才分段生成（見 update_streaming）。\n
+        有關卡檔時地板、牆壁和星星位置都從關卡檔來，不使用亂數。\n
+        空間網格和預繪區塊的物件會清空後繼續使用\n
         """
         # 清除舊的場景物件
         self.platforms = []
         self.hazards = []  # 不使用危險陷阱
         self.health_pickups = []  # 清除舊的愛心道具
         self.spike_hazards = []  # 清除舊的尖刺陷阱
+        self.sections = {}
+        self.collected_pickups = set()
+        self.chunk_renderer.clear()
+
+        if self.level_data is not None:
+            self.apply_level_data()
+        else:
+            # 各段用自己的亂數產生器，載入順序不會影響生成結果
+            self.level_seed = rng.getrandbits(32)
 
-        # 生成30層跑酷平台
-        self.generate_parkour_platforms()
+            # 生成實心地板和左右牆壁
+            self.generate_level_bounds()
 
-        # 生成愛心道具
-        self.generate_health_pickups()
+            # 在最高層放置目標星星
+            self.place_target_star()
 
-        # 生成尖刺陷阱
-        self.generate_spike_hazards()
+        # 先載入起點附近的段（玩家從關卡左邊出發）
+        self.update_streaming(0, SCREEN_WIDTH)
 
-        # 在最高層放置目標星星
-        self.place_target_star()
+    def reset(self, keep_level=False):
+        """
+        重新開始遊戲時重置關卡\n
+        \n
+        參數:\n
+        keep_level (bool): True 表示保留同一個關卡，只把愛心和星星恢復原狀；\n
+        False 表示抽新的關卡種子重新生成（有關卡檔時從關卡檔重建）\n
+        """
+        self.star_visible = False
+        if not keep_level:
+            self.generate_level()
+            return
 
-    def generate_parkour_platforms(self):
+        # 地形沒有變，已載入的平台、尖刺和預繪區塊都可以繼續用，
+        # 只要照各段記下的愛心位置把愛心放回去，不必重新生成整段
+        self.star_collected = False
+        self.collected_pickups = set()
+        for section, section_data in self.sections.items():
+            section_data["pickups"] = self.spawn_pickups(
+                section, section_data["pickup_spawns"]
+            )
+        self.build_spatial_index()
+
+        # 玩家回到起點，先載入起點附近的段
+        self.update_streaming(0, SCREEN_WIDTH)
+
+    def apply_level_data(self):
         """
-        生成30層跑酷平台系統\n
+        從關卡檔設定關卡大小、地板、牆壁、星星和陷阱\n
+        """
+        level_data = self.level_data
+        self.level_seed = level_data.seed
+        self.level_width = level_data.level_width
+        self.level_height = level_data.level_height
+        self.section_width = level_data.section_width
+        self.section_count = math.ceil(self.level_width / self.section_width)
+
+        # 固定平台的第一筆是地板，其餘是牆壁和星星平台
+        fixed_platforms = [
+            Platform(x, y, width, height)
+            for _, x, y, width, height in level_data.records(
+                "platforms", FIXED_SECTION
+            )
+        ]
+        self.ground_platform = fixed_platforms[0]
+        self.fixed_platforms = fixed_platforms[1:]
+
+        self.star_x = level_data.star_x
+        self.star_y = level_data.star_y
+        self.star_collected = False
+
+        for _, kind, x, y, width, height, direction_x, direction_y in (
+            level_data.records("hazards", FIXED_SECTION)
+        ):
+            hazard_type = HAZARD_KINDS[kind]
+            direction = (
+                direction_x / HAZARD_DIRECTION_SCALE,
+                direction_y / HAZARD_DIRECTION_SCALE,
+            )
+            if hazard_type == "lava":
+                hazard = LavaPool(x, y, width, height)
+            elif hazard_type == "water":
+                hazard = WaterCurrent(x, y, width, height, direction)
+            else:
+                hazard = WindGust(x, y, width, height, direction)
+            self.hazards.append(hazard)
+
+    def build_spatial_index(self):
+        """
+        為目前載入的平台、尖刺和愛心建立空間網格\n
+        \n
+        玩家、怪物、手榴彈的碰撞和怪物生成位置都透過網格查詢附近物件，\n
+        每個物件的碰撞成本不會因為關卡變大而增加。\n
+        各段依照段編號排列，碰撞處理的先後順序只和載入了哪些段有關。\n
+        """
+        loaded_sections = [self.sections[section] for section in sorted(self.sections)]
+
+        self.platforms = [self.ground_platform]
+        self.spike_hazards = []
+        self.health_pickups = []
+        for section_data in loaded_sections:
+            self.platforms.extend(section_data["platforms"])
+            self.spike_hazards.extend(section_data["spikes"])
+            self.health_pickups.extend(section_data["pickups"].values())
+        self.platforms.extend(self.fixed_platforms)
+
+        self.platform_grid.rebuild(self.platforms)
+        self.spike_grid.rebuild(self.spike_hazards)
+        self.pickup_grid.rebuild(self.health_pickups)
+
+    def update_streaming(self, view_left, view_right):
+        """
+        依照攝影機位置載入和丟棄關卡段\n
+        \n
+        畫面左右 LEVEL_STREAM_LOAD_MARGIN 內的段要載入，離畫面超過\n
+        LEVEL_STREAM_EVICT_MARGIN 的段丟掉。丟掉的距離比載入的距離遠，\n
+        攝影機在段的交界附近來回移動時不會反覆生成同一段。\n
+        \n
+        參數:\n
+        view_left (float): 畫面左邊界（世界座標）\n
+        view_right (float): 畫面右邊界（世界座標）\n
+        \n
+        回傳:\n
+        bool: True 表示有段被載入或丟掉\n
+        """
+        first_section = max(
+            0, int(view_left - LEVEL_STREAM_LOAD_MARGIN) // self.section_width
+        )
+        last_section = min(
+            self.section_count - 1,
+            int(view_right + LEVEL_STREAM_LOAD_MARGIN) // self.section_width,
+        )
+
+        changed = False
+        for section in range(first_section, last_section + 1):
+            if section not in self.sections:
+                self.load_section(section)
+                changed = True
+
+        for section in list(self.sections):
+            section_left = section * self.section_width
+            section_right = section_left + self.section_width
+            if (
+                section_right < view_left - LEVEL_STREAM_EVICT_MARGIN
+                or section_left > view_right + LEVEL_STREAM_EVICT_MARGIN
+            ):
+                self.evict_section(section)
+                changed = True
+
+        if changed:
+            self.build_spatial_index()
+        return changed
+
+    def load_section(self, section):
+        """
+        生成並載入一段關卡\n
+        \n
+        參數:\n
+        section (int): 段編號\n
+        """
+        section_data = self.generate_section(section)
+        self.sections[section] = section_data
+        self.chunk_renderer.invalidate_rect(self.get_section_rect(section_data))
+        log.debug("🧱 載入關卡第 %s 段", section)
+
+    def evict_section(self, section):
+        """
+        丟掉一段關卡 - 只記下撿走的愛心，下次載入時重新生成其他物件\n
+        \n
+        參數:\n
+        section (int): 段編號\n
+        """
+        section_data = self.sections.pop(section)
+        for index, pickup in section_data["pickups"].items():
+            if pickup.collected:
+                self.collected_pickups.add((section, index))
+
+        self.chunk_renderer.invalidate_rect(self.get_section_rect(section_data))
+        log.debug("🧹 丟掉關卡第 %s 段", section)
+
+    def get_section_rect(self, section_data):
+        """
+        計算一段關卡所有物件的外框 - 用來決定哪些預繪區塊要重畫\n
+        \n
+        參數:\n
+        section_data (dict): generate_section() 的結果\n
+        \n
+        回傳:\n
+        pygame.Rect: 涵蓋所有物件的矩形\n
+        """
+        rects = [platform.rect for platform in section_data["platforms"]]
+        rects.extend(spike.rect for spike in section_data["spikes"])
+        rects.extend(pickup.rect for pickup in section_data["pickups"].values())
+        if not rects:
+            return pygame.Rect(0, 0, 0, 0)
+        return rects[0].unionall(rects[1:])
+
+    def generate_section(self, section):
+        """
+        生成一段關卡的跑酷平台、愛心和尖刺\n
+        \n
+        先生成這一段涵蓋的版面，再挑出左邊界落在這一段裡的物件。\n
+        版面的內容只由關卡種子和版面編號決定，\n
+        同一段不管第幾次載入、先載入哪一段，生成的內容都相同\n
+        \n
+        參數:\n
+        section (int): 段編號（從關卡左邊 0 開始）\n
+        \n
+        回傳:\n
+        dict: platforms（平台列表）、spikes（尖刺列表）、pickups（愛心編號 -> 愛心）、\n
+        pickup_spawns（這一段所有愛心的 (編號, x, y, 補血量)，重新開始時用來放回愛心）\n
+        """
+        if self.level_data is not None:
+            return self.build_saved_section(section)
+
+        section_start = section * self.section_width
+        section_end = min(section_start + self.section_width, self.level_width)
+        # 版面交界的輔助平台放在下一個版面左邊界的左邊，所以也要看下一個版面
+        first_layout = section_start // self.layout_width
+        last_layout = min(
+            (section_end - 1) // self.layout_width + 1,
+            math.ceil(self.level_width / self.layout_width) - 1,
+        )
+
+        platforms = []
+        spikes = []
+        pickup_spawns = []
+        for layout in range(first_layout, last_layout + 1):
+            layout_data = self.generate_layout(layout)
+            platforms.extend(
+                platform
+                for platform in layout_data["platforms"]
+                if self.get_object_section(platform.x) == section
+            )
+            spikes.extend(
+                spike
+                for spike in layout_data["spikes"]
+                if self.get_object_section(spike.x) == section
+            )
+            pickup_spawns.extend(
+                spawn
+                for spawn in layout_data["pickup_spawns"]
+                if self.get_object_section(spawn[1]) == section
+            )
+
+        return {
+            "platforms": platforms,
+            "spikes": spikes,
+            "pickups": self.spawn_pickups(section, pickup_spawns),
+            "pickup_spawns": pickup_spawns,
+        }
+
+    def generate_layout(self, layout):
+        """
+        生成一個版面的跑酷平台、愛心位置和尖刺\n
+        \n
+        每個版面用自己的亂數產生器，種子由關卡種子和版面編號決定\n
+        \n
+        參數:\n
+        layout (int): 版面編號（從關卡左邊 0 開始）\n
+        \n
+        回傳:\n
+        dict: platforms（平台列表）、spikes（尖刺列表）、\n
+        pickup_spawns（愛心的 (編號, x, y, 補血量) 列表）\n
+        """
+        layout_rng = random.Random(f"{self.level_seed}-{layout}")
+        layout_start = layout * self.layout_width
+        layout_end = min(layout_start + self.layout_width, self.level_width)
+
+        platforms = self.generate_parkour_platforms(
+            layout_rng, layout, layout_start, layout_end
+        )
+        pickup_spawns = self.generate_health_pickups(
+            layout_rng, layout, layout_start, layout_end, platforms
+        )
+        spikes = self.generate_spike_hazards(
+            layout_rng, layout_start, layout_end, platforms
+        )
+        return {
+            "platforms": platforms,
+            "spikes": spikes,
+            "pickup_spawns": pickup_spawns,
+        }
+
+    def get_object_section(self, x):
+        """
+        找出物件屬於哪一段 - 依照物件左邊界的位置\n
+        \n
+        參數:\n
+        x (float): 物件左邊界（世界座標）\n
+        \n
+        回傳:\n
+        int: 段編號，超出關卡範圍時算在最左或最右的段\n
+        """
+        return min(max(int(x) // self.section_width, 0), self.section_count - 1)
+
+    def spawn_pickups(self, section, pickup_spawns):
+        """
+        依照記下的位置建立一段關卡的愛心 - 已經撿走的不再建立\n
+        \n
+        參數:\n
+        section (int): 段編號\n
+        pickup_spawns (list): (愛心編號, x, y, 補血量) 列表\n
+        \n
+        回傳:\n
+        dict: 愛心編號 -> 愛心道具\n
+        """
+        return {
+            index: HealthPickup(x, y, heal_amount=heal_amount)
+            for index, x, y, heal_amount in pickup_spawns
+            if (section, index) not in self.collected_pickups
+        }
+
+    def build_saved_section(self, section):
+        """
+        從關卡檔的陣列建立一段關卡 - 只取這一段的範圍，不掃整張表\n
+        \n
+        參數:\n
+        section (int): 段編號\n
+        \n
+        回傳:\n
+        dict: 和 generate_section() 相同\n
+        """
+        level_data = self.level_data
+        platforms = [
+            Platform(x, y, width, height)
+            for _, x, y, width, height in level_data.records("platforms", section)
+        ]
+        spikes = [
+            SpikeHazard(x, y, width, height, damage=damage)
+            for _, x, y, width, height, damage in level_data.records("spikes", section)
+        ]
+
+        # 存檔時已經撿走的愛心不會再出現，重新開始也一樣
+        pickup_spawns = [
+            (index, x, y, heal_amount)
+            for _, index, x, y, heal_amount, collected in level_data.records(
+                "pickups", section
+            )
+            if not collected
+        ]
+
+        return {
+            "platforms": platforms,
+            "spikes": spikes,
+            "pickups": self.spawn_pickups(section, pickup_spawns),
+            "pickup_spawns": pickup_spawns,
+        }
+
+    def generate_level_bounds(self):
+        """
+        生成實心地板和左右牆壁 - 整個關卡只有這幾個物件，永遠保持載入\n
+        \n
+        遠處的段被丟掉以後，留在那裡的怪物仍然站在地板上，不會掉出關卡\n
+        """
+        # 生成實心地面（加厚地板，覆蓋整個關卡底部）
+        ground_thickness = 80  # 地板厚度
+        self.ground_platform = Platform(
+            0, SCREEN_HEIGHT - ground_thickness, self.level_width, ground_thickness
+        )
+
+        # 在左右兩側創建實心牆壁，防止玩家掉出關卡
+        left_wall = Platform(-50, 0, 50, self.level_height)
+        right_wall = Platform(self.level_width, 0, 50, self.level_height)
+        self.fixed_platforms = [left_wall, right_wall]
+
+    def generate_parkour_platforms(
+        self, layout_rng, layout, layout_start, layout_end
+    ):
+        """
+        生成一個版面的30層跑酷平台\n
         \n
         特色:\n
         - 每層都有安全的落腳點\n
         - 平台大小和間距適合跑酷\n
         - 從底部到頂部逐漸提升挑戰\n
         - 沒有會讓玩家死亡的陷阱\n
-        - 實心地板確保玩家不會掉下去死亡\n
+        \n
+        參數:\n
+        layout_rng (random.Random): 這個版面的亂數產生器\n
+        layout (int): 版面編號\n
+        layout_start (int): 版面的左邊界\n
+        layout_end (int): 版面的右邊界\n
+        \n
+        回傳:\n
+        list: 這個版面的平台\n
         """
-        # 生成實心地面（加厚地板，覆蓋整個關卡底部）
+        platforms = []
         ground_thickness = 80  # 地板厚度
-        ground_platform = Platform(
-            0, SCREEN_HEIGHT - ground_thickness, self.level_width, ground_thickness
-        )
-        self.platforms.append(ground_platform)
 
         # 每層平台的基本設定 - 提升難度
-        platforms_per_level = 2  # 每層平台數量從3減少到2，增加跳躍距離
         level_height_gap = 120  # 每層之間的高度差增加到120像素，跳躍更困難
         platform_min_width = 100  # 減少最小寬度，讓平台更小更難跳上
         platform_max_width = 160  # 減少最大寬度，平台整體變小
@@ -505,47 +914,35 @@ class LevelManager:
             # 計算這層的基準高度
             base_y = SCREEN_HEIGHT - ground_thickness - (level * level_height_gap)
 
-            # 每層的平台分佈在整個關卡寬度上
-            section_width = self.level_width // platforms_per_level
-
-            for section in range(platforms_per_level):
-                # 在每個區段內隨機放置平台
-                section_start = section * section_width
-                section_end = section_start + section_width
+            # 每個版面每層放一個平台，位置隨機，間距增大提升難度
+            # （版面的兩側留邊距讓平台間距更大，關卡最右邊太窄的版面就貼著左側）
+            min_x = layout_start + 50
+            max_x = max(min_x, layout_end - platform_max_width - 50)
+            platform_x = layout_rng.randint(min_x, max_x)
 
-                # 平台位置隨機，間距增大提升難度
-                platform_x = random.randint(
-                    section_start + 50,
-                    section_end - platform_max_width - 50,  # 增加邊距讓平台間距更大
-                )
-
-                # 平台高度變化增大，讓跳躍更困難
-                height_variation = random.randint(-25, 25)  # 從 -15,15 增加到 -25,25
-                platform_y = base_y + height_variation
+            # 平台高度變化增大，讓跳躍更困難
+            height_variation = layout_rng.randint(-25, 25)  # 從 -15,15 增加到 -25,25
+            platform_y = base_y + height_variation
 
-                # 平台寬度隨機
-                platform_width = random.randint(platform_min_width, platform_max_width)
+            # 平台寬度隨機
+            platform_width = layout_rng.randint(platform_min_width, platform_max_width)
 
-                # 確保平台不會太接近邊界
-                if platform_x + platform_width > self.level_width:
-                    platform_x = self.level_width - platform_width
+            # 確保平台不會太接近邊界
+            if platform_x + platform_width > self.level_width:
+                platform_x = self.level_width - platform_width
 
-                # 創建平台
-                platform = Platform(platform_x, platform_y, platform_width, 25)
-                self.platforms.append(platform)
+            # 創建平台
+            platform = Platform(platform_x, platform_y, platform_width, 25)
+            platforms.append(platform)
 
             # 減少輔助平台的生成，增加跳躍挑戰性
-            if level % 4 == 0:  # 每四層增加額外的輔助平台（原本每三層）
-                extra_x = self.level_width // 2
+            if level % 4 == 0 and layout > 0:  # 每四層在版面和版面的交界增加輔助平台
+                extra_x = layout_start
                 extra_y = base_y - 40  # 輔助平台位置稍微提高
                 extra_platform = Platform(extra_x - 30, extra_y, 60, 20)  # 輔助平台變小
-                self.platforms.append(extra_platform)
+                platforms.append(extra_platform)
 
-        # 在左右兩側創建實心牆壁，防止玩家掉出關卡
-        left_wall = Platform(-50, 0, 50, self.level_height)
-        right_wall = Platform(self.level_width, 0, 50, self.level_height)
-        self.platforms.append(left_wall)
-        self.platforms.append(right_wall)
+        return platforms
 
     def place_target_star(self):
         """
@@ -560,25 +957,43 @@ class LevelManager:
 
         # 在星星下方創建一個特殊的大平台
         star_platform = Platform(self.star_x - 150, star_y + 50, 300, 40)
-        self.platforms.append(star_platform)
+        self.fixed_platforms.append(star_platform)
 
-    def generate_health_pickups(self):
+    def generate_health_pickups(
+        self, layout_rng, layout, layout_start, layout_end, platforms
+    ):
         """
-        在關卡中隨機生成愛心道具\n
+        在一個版面中隨機決定愛心道具的位置\n
+        \n
+        只記下位置，愛心物件由 spawn_pickups() 建立；已經撿走的愛心一樣會抽亂數，\n
+        這個版面其他物件的位置才不會因為撿過愛心而改變\n
+        \n
+        參數:\n
+        layout_rng (random.Random): 這個版面的亂數產生器\n
+        layout (int): 版面編號\n
+        layout_start (int): 版面的左邊界\n
+        layout_end (int): 版面的右邊界\n
+        platforms (list): 這個版面的平台\n
+        \n
+        回傳:\n
+        list: (愛心編號, x, y, 補血量) 列表，編號在整個關卡裡不會重複\n
         """
-        # 生成10個愛心道具分佈在整個關卡中
-        pickup_count = 10
+        pickup_spawns = []
 
-        for _ in range(pickup_count):
+        for slot in range(LEVEL_PICKUPS_PER_LAYOUT):
             # 60% 機率放在平台上，40% 機率放在地面上
-            if random.random() < 0.6 and len(self.platforms) > 2:
+            if layout_rng.random() < 0.6 and platforms:
                 # 在平台上方放置愛心
-                platform = random.choice(self.platforms[1:-2])  # 排除地面和邊界牆
-                heart_x = platform.x + random.randint(20, max(21, platform.width - 40))
+                platform = layout_rng.choice(platforms)
+                heart_x = platform.x + layout_rng.randint(
+                    20, max(21, platform.width - 40)
+                )
                 heart_y = platform.y - 30  # 在平台上方
             else:
                 # 在地面上放置愛心
-                heart_x = random.randint(100, self.level_width - 100)
+                heart_x = layout_rng.randint(
+                    layout_start + 100, max(layout_start + 100, layout_end - 100)
+                )
                 heart_y = SCREEN_HEIGHT - 80 - 30  # 在地面上
 
             # 確保位置合理
@@ -586,41 +1001,56 @@ class LevelManager:
                 50 <= heart_x <= self.level_width - 50
                 and 50 <= heart_y <= self.level_height - 50
             ):
-                health_pickup = HealthPickup(
-                    heart_x, heart_y, heal_amount=10
-                )  # 改為補10點血
-                self.health_pickups.append(health_pickup)
+                index = layout * LEVEL_PICKUPS_PER_LAYOUT + slot
+                pickup_spawns.append((index, heart_x, heart_y, 10))  # 補10點血
+
+        return pickup_spawns
 
-    def generate_spike_hazards(self):
+    def generate_spike_hazards(
+        self, layout_rng, layout_start, layout_end, platforms
+    ):
         """
-        在關卡中隨機生成尖刺陷阱\n
+        在一個版面中隨機生成尖刺陷阱\n
+        \n
+        參數:\n
+        layout_rng (random.Random): 這個版面的亂數產生器\n
+        layout_start (int): 版面的左邊界\n
+        layout_end (int): 版面的右邊界\n
+        platforms (list): 這個版面的平台\n
+        \n
+        回傳:\n
+        list: 這個版面的尖刺\n
         """
-        # 生成6-10個尖刺陷阱分佈在關卡中（減少尖刺數量）
-        spike_count = random.randint(6, 10)
+        spikes = []
+
+        # 每個版面生成3-5個尖刺陷阱（原本整個關卡兩個版面共6-10個）
+        spike_count = layout_rng.randint(3, 5)
 
         for _ in range(spike_count):
             # 隨機選擇位置生成尖刺
-            spike_x = random.randint(200, self.level_width - 200)
+            spike_x = layout_rng.randint(
+                layout_start + 200, max(layout_start + 200, layout_end - 200)
+            )
 
             # 尖刺可能在地面上或平台上
-            if random.random() < 0.6:  # 60% 機率在地面上
-                spike_y = SCREEN_HEIGHT - 80 - 30  # 在地面上
-            else:  # 40% 機率在平台附近
-                if len(self.platforms) > 2:
-                    platform = random.choice(self.platforms[1:-2])
-                    spike_x = platform.x + random.randint(
-                        0, max(1, platform.width - 40)
-                    )
-                    spike_y = platform.y - 30  # 在平台上方
+            spike_y = SCREEN_HEIGHT - 80 - 30  # 在地面上
+            if layout_rng.random() >= 0.6 and platforms:  # 40% 機率在平台附近
+                platform = layout_rng.choice(platforms)
+                spike_x = platform.x + layout_rng.randint(
+                    0, max(1, platform.width - 40)
+                )
+                spike_y = platform.y - 30  # 在平台上方
 
             # 確保位置合理
             if (
                 100 <= spike_x <= self.level_width - 100
                 and 100 <= spike_y <= self.level_height - 100
             ):
-                spike_width = random.randint(30, 60)
+                spike_width = layout_rng.randint(30, 60)
                 spike_hazard = SpikeHazard(spike_x, spike_y, spike_width, 30, damage=20)
-                self.spike_hazards.append(spike_hazard)
+                spikes.append(spike_hazard)
+
+        return spikes
 
     def check_star_collision(self, player):
         """
@@ -659,17 +1089,21 @@ class LevelManager:
         bullets (list): 子彈列表\n
         death_countdown_active (bool): 玩家是否處於死亡倒數狀態\n
         """
-        # 更新愛心道具動畫並檢查碰撞
-        health_pickup_collected = False
+        # 更新愛心道具動畫
         for pickup in self.health_pickups:
             pickup.update(dt)
+
+        # 只檢查玩家附近的愛心道具
+        player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
+        health_pickup_collected = False
+        for pickup in self.pickup_grid.query_rect(player_rect):
             if pickup.check_collision(player):
                 health_pickup_collected = True
 
         # 檢查尖刺碰撞（只有在玩家存活且不在死亡倒數時才造成傷害）
         total_spike_damage = 0
         if player.is_alive and not death_countdown_active:
-            for spike in self.spike_hazards:
+            for spike in self.spike_grid.query_rect(player_rect):
                 damage = spike.check_collision(player)
                 if damage > 0:
                     total_spike_damage += damage
@@ -700,14 +1134,14 @@ class LevelManager:
                             vertical_knockback, dy * horizontal_knockback
                         )  # 向上跳開
 
-                        print(
-                            f"🔺 踩到尖刺！受到 {total_spike_damage} 點傷害並輕微彈開"
+                        log.debug(
+                            "🔺 踩到尖刺！受到 %s 點傷害並輕微彈開", total_spike_damage
                         )
                     else:
                         # 如果沒有方向，預設向上跳開（輕微）
                         player.velocity_y = -30  # 等於尖刺高度
-                        print(
-                            f"🔺 踩到尖刺！受到 {total_spike_damage} 點傷害並向上彈開"
+                        log.debug(
+                            "🔺 踩到尖刺！受到 %s 點傷害並向上彈開", total_spike_damage
                         )
 
                     # 給玩家一個短暫的無敵時間，避免連續受傷
@@ -720,7 +1154,7 @@ class LevelManager:
 
         # 檢查玩家是否收集到星星
         if self.check_star_collision(player):
-            print("🌟 恭喜！您找到了目標星星！")
+            log.info("🌟 恭喜！您找到了目標星星！")
             return {
                 "star_collected": True,
                 "health_pickup_collected": health_pickup_collected,
@@ -751,14 +1185,17 @@ class LevelManager:
         取得關卡中的所有平台\n
         \n
         回傳:\n
-        list: 平台物件列表\n
+        SpatialGrid: 平台空間網格，可以用 query_rect 查詢，也可以直接當列表迭代\n
         """
-        return self.platforms
+        return self.platform_grid
 
     def draw(self, screen, camera_x=0, camera_y=0):
         """
         繪製整個關卡場景\n
         \n
+        平台和尖刺從預繪區塊貼上，只處理攝影機範圍內的區塊；\n
+        愛心有動畫，仍然每幀繪製，但只畫攝影機附近的愛心\n
+        \n
         參數:\n
         screen (pygame.Surface): 遊戲畫面\n
         camera_x (int): 攝影機 x 偏移\n
@@ -768,16 +1205,14 @@ class LevelManager:
         background_color = (135, 206, 235)  # 天空藍
         screen.fill(background_color)
 
-        # 繪製平台
-        for platform in self.platforms:
-            platform.draw(screen, camera_x, camera_y)
-
-        # 繪製尖刺陷阱
-        for spike in self.spike_hazards:
-            spike.draw(screen, camera_x, camera_y)
+        # 貼上畫面內的平台和尖刺區塊
+        self.chunk_renderer.draw(screen, camera_x, camera_y)
 
-        # 繪製愛心道具
-        for pickup in self.health_pickups:
+        # 繪製攝影機附近的愛心道具（愛心脈動時會稍微變大，範圍多留一點）
+        view_rect = pygame.Rect(
+            camera_x - 50, camera_y - 50, SCREEN_WIDTH + 100, SCREEN_HEIGHT + 100
+        )
+        for pickup in self.pickup_grid.query_rect(view_rect):
             pickup.draw(screen, camera_x, camera_y)
 
         # 繪製目標星星（只有在Boss被擊敗後才顯示）
@@ -804,9 +1239,7 @@ class LevelManager:
         ):
 
             # 創建閃爍效果
-            import time
-
-            flash_intensity = abs(math.sin(time.time() * 4)) * 0.5 + 0.5
+            flash_intensity = abs(math.sin(get_game_time() * 4)) * 0.5 + 0.5
 
             # 星星大小
             star_size = 25
@@ -861,5 +1294,6 @@ class LevelManager:
             "height": self.level_height,
             "total_levels": self.total_levels,
             "platform_count": len(self.platforms),
+            "loaded_sections": sorted(self.sections),
             "star_collected": self.star_collected,
         }
@@ -1,7 +1,5 @@
 ######################載入套件######################
 import pygame
-import random
-import time
 
 # 支援直接執行和模組執行兩種方式
 try:
@@ -12,6 +10,13 @@ try:
         SniperBoss,
         TornadoMonster,
     )
+    from ..entities.monster_crowd import MonsterCrowd, NUMPY_AVAILABLE
+    from ..utils.spatial_grid import query_nearby, DynamicSpatialGrid
+    from .enemy_projectile_manager import EnemyProjectileManager
+    from ..core.entity_registry import EntityRegistry, BOSS
+    from ..core.entity_registry import FIRE_BULLET_EMITTER, HOMING_BULLET_EMITTER
+    from ..utils.game_logger import get_logger
+    from ..core.game_session import get_rng, get_game_time
 except ImportError:
     from src.config import *
     from src.entities.monsters import (
@@ -20,6 +25,30 @@ except ImportError:
         SniperBoss,
         TornadoMonster,
     )
+    from src.entities.monster_crowd import MonsterCrowd, NUMPY_AVAILABLE
+    from src.utils.spatial_grid import query_nearby, DynamicSpatialGrid
+    from src.systems.enemy_projectile_manager import EnemyProjectileManager
+    from src.core.entity_registry import EntityRegistry, BOSS
+    from src.core.entity_registry import FIRE_BULLET_EMITTER, HOMING_BULLET_EMITTER
+    from src.utils.game_logger import get_logger
+    from src.core.game_session import get_rng, get_game_time
+
+log = get_logger("monsters")
+rng = get_rng()
+
+
+def is_living_monster(entity):
+    """
+    檢查實體是不是還活著的一般怪物（不是Boss）- 給空間網格的最近目標查詢篩選用\n
+    \n
+    參數:\n
+    entity (Monster): 要檢查的實體\n
+    \n
+    回傳:\n
+    bool: True 表示是活著的一般怪物\n
+    """
+    return entity.is_alive and BOSS not in entity.capabilities
+
 
 ######################怪物管理器類別######################
 
@@ -49,6 +78,24 @@ class MonsterManager:
         self.boss_transition_delay = 3.0  # Boss轉換延遲時間（3秒）
         self.waiting_for_boss_transition = False  # 是否正在等待Boss轉換
 
+        # 所有怪物和Boss發射的投射物都由這裡統一更新
+        self.projectiles = EnemyProjectileManager()
+
+        # 每隻怪物和Boss的 ID，追蹤子彈和黏附的手榴彈用 ID 查詢目標是否還在場上
+        self.registry = EntityRegistry()
+        # 怪物和Boss的動態空間網格，爆炸、近戰和自動瞄準只找附近的怪物
+        self.grid = DynamicSpatialGrid()
+
+        # 有 numpy 時一般怪物的 AI 和物理用陣列批次更新
+        self.crowd = None
+        if USE_MONSTER_CROWD_BATCH and NUMPY_AVAILABLE:
+            self.crowd = MonsterCrowd()
+
+        # AI 細節層級排程：遠離畫面的怪物降低更新頻率，並分組錯開到不同的步
+        self.lod_enabled = USE_MONSTER_AI_LOD
+        self.lod_tick = 0  # 排程步數，每次 update() 加一
+        self.lod_next_bucket = 0  # 下一隻加入的怪物分到的組別
+
         # 怪物類型比例（隨波次調整）- 移除粉紫色怪物TornadoMonster
         self.monster_types = [LavaMonster, WaterMonster]  # 只保留熔岩怪和水怪
         self.spawn_weights = [1, 1]  # 各類型怪物的生成權重
@@ -98,19 +145,14 @@ class MonsterManager:
         # 玩家安全距離（怪物不能在玩家太近的地方出生）
         safe_distance = 100
 
-        # 在視窗範圍內尋找合適的平台
+        # 在視窗範圍內尋找合適的平台（透過空間網格只查詢視窗內的平台）
+        view_rect = pygame.Rect(
+            view_left, view_top, view_right - view_left, view_bottom - view_top
+        )
         suitable_platforms = []
 
-        for platform in platforms:
-            # 檢查平台是否在視窗範圍內
-            platform_in_view = (
-                platform.x + platform.width > view_left
-                and platform.x < view_right
-                and platform.y + platform.height > view_top
-                and platform.y < view_bottom
-            )
-
-            if platform_in_view and platform.width >= 80:  # 確保平台夠大
+        for platform in query_nearby(platforms, view_rect):
+            if platform.width >= 80:  # 確保平台夠大
                 suitable_platforms.append(platform)
 
         # 如果沒有合適的平台，回傳 None
@@ -121,7 +163,7 @@ class MonsterManager:
         max_attempts = 10
         for _ in range(max_attempts):
             # 隨機選擇一個平台
-            platform = random.choice(suitable_platforms)
+            platform = rng.choice(suitable_platforms)
 
             # 在平台上隨機選擇位置
             margin = 30  # 距離平台邊緣的安全距離
@@ -136,7 +178,7 @@ class MonsterManager:
                 # 如果平台太小，就在平台中央生成
                 spawn_x = int(platform.x + platform.width // 2)
             else:
-                spawn_x = random.randint(min_x, max_x)
+                spawn_x = rng.randint(min_x, max_x)
 
             spawn_y = platform.y - 60  # 在平台上方生成
 
@@ -196,7 +238,7 @@ class MonsterManager:
         spawn_x, spawn_y, platform = spawn_result
 
         # 根據權重隨機選擇怪物類型
-        monster_class = random.choices(self.monster_types, weights=self.spawn_weights)[
+        monster_class = rng.choices(self.monster_types, weights=self.spawn_weights)[
             0
         ]
 
@@ -209,7 +251,7 @@ class MonsterManager:
         # 根據波次調整怪物屬性
         self.adjust_monster_stats(new_monster)
 
-        self.monsters.append(new_monster)
+        self.add_monster(new_monster)
         return new_monster
 
     def spawn_specific_monster(self, monster_type, x=None, y=None):
@@ -233,13 +275,13 @@ class MonsterManager:
 
         monster_class = monster_class_map.get(monster_type)
         if monster_class is None:
-            print(f"❌ 未知的怪物類型: {monster_type}")
+            log.error(f"❌ 未知的怪物類型: {monster_type}")
             return None
 
         # 使用指定位置或隨機位置
         if x is None or y is None:
-            spawn_x = random.randint(100, 1000)
-            spawn_y = random.randint(100, 600)
+            spawn_x = rng.randint(100, 1000)
+            spawn_y = rng.randint(100, 600)
         else:
             spawn_x = x
             spawn_y = y
@@ -253,9 +295,129 @@ class MonsterManager:
         # 根據波次調整怪物屬性
         self.adjust_monster_stats(new_monster)
 
-        self.monsters.append(new_monster)
+        self.add_monster(new_monster)
         return new_monster
 
+    def add_monster(self, monster):
+        """
+        把怪物加入管理器並發給它 ID，讓它的投射物交給統一的投射物管理器\n
+        \n
+        參數:\n
+        monster (Monster): 要加入的怪物\n
+        """
+        monster.projectile_manager = self.projectiles
+
+        # 新怪物先每步更新，下次重新評估距離時才決定頻率；組別輪流分配
+        monster.lod_interval = 1
+        monster.lod_bucket = self.lod_next_bucket
+        monster.lod_last_tick = self.lod_tick
+        self.lod_next_bucket = (self.lod_next_bucket + 1) % MONSTER_LOD_FAR_INTERVAL
+
+        self.track_entity(monster)
+        self.monsters.append(monster)
+
+    def track_entity(self, entity):
+        """
+        讓怪物或Boss進場 - 發給 ID 並放進空間網格\n
+        \n
+        參數:\n
+        entity (Monster): 進場的怪物或Boss\n
+        """
+        self.registry.register(entity)
+        self.grid.insert(entity)
+
+    def untrack_entity(self, entity):
+        """
+        讓怪物或Boss離場 - 之後用 ID 和空間網格都找不到它\n
+        \n
+        參數:\n
+        entity (Monster): 離場的怪物或Boss\n
+        """
+        self.registry.despawn(entity)
+        self.grid.remove(entity)
+
+    def untrack_all(self):
+        """
+        讓所有怪物和Boss離場 - 重新開始或換關卡時使用\n
+        """
+        self.registry.clear()
+        self.grid.clear()
+
+    def get_lod_interval(self, monster, view_rect):
+        """
+        依照怪物離畫面的距離決定更新間隔\n
+        \n
+        參數:\n
+        monster (Monster): 要評估的怪物\n
+        view_rect (pygame.Rect): 畫面範圍（世界座標）\n
+        \n
+        回傳:\n
+        int: 每幾個模擬步更新一次\n
+        """
+        # 怪物在畫面外的距離，水平和垂直取較大者（在畫面內為 0）
+        distance = max(
+            view_rect.left - (monster.x + monster.width),
+            monster.x - view_rect.right,
+            view_rect.top - (monster.y + monster.height),
+            monster.y - view_rect.bottom,
+        )
+
+        if distance <= MONSTER_LOD_NEAR_DISTANCE:
+            return 1
+        if distance <= MONSTER_LOD_FAR_DISTANCE:
+            return MONSTER_LOD_MID_INTERVAL
+        return MONSTER_LOD_FAR_INTERVAL
+
+    def get_player_view_rect(self, player):
+        """
+        以玩家為中心的畫面範圍 - 呼叫者沒有提供攝影機範圍時使用\n
+        \n
+        參數:\n
+        player (Player): 玩家物件\n
+        \n
+        回傳:\n
+        pygame.Rect: 畫面大小的矩形（世界座標）\n
+        """
+        view_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        view_rect.center = (
+            player.x + player.width // 2,
+            player.y + player.height // 2,
+        )
+        return view_rect
+
+    def schedule_lod_updates(self, player, view_rect=None):
+        """
+        選出這一步要更新的怪物 - 畫面附近每步更新，遠處隔幾步才更新一次\n
+        \n
+        每隻怪物每 MONSTER_LOD_FAR_INTERVAL 步依照組別輪流重新評估一次距離，\n
+        攝影機靠近時最多幾步內就恢復每步更新。被選到的怪物的 lod_steps\n
+        設成距離上次更新經過的步數，讓物理一次補上略過的步數。\n
+        \n
+        參數:\n
+        player (Player): 玩家物件，沒有畫面範圍時以玩家為中心\n
+        view_rect (pygame.Rect): 畫面範圍（世界座標）\n
+        \n
+        回傳:\n
+        list: 這一步要更新的怪物\n
+        """
+        if view_rect is None:
+            view_rect = self.get_player_view_rect(player)
+
+        tick = self.lod_tick
+        due_monsters = []
+        for monster in self.monsters:
+            phase = tick + monster.lod_bucket
+            if phase % MONSTER_LOD_FAR_INTERVAL == 0:
+                monster.lod_interval = self.get_lod_interval(monster, view_rect)
+            if phase % monster.lod_interval:
+                continue
+
+            monster.lod_steps = tick - monster.lod_last_tick
+            monster.lod_last_tick = tick
+            due_monsters.append(monster)
+
+        return due_monsters
+
     def adjust_monster_stats(self, monster):
         """
         根據當前波次調整怪物屬性\n
@@ -306,15 +468,14 @@ class MonsterManager:
             else:
                 killed_count += 1
                 self.monsters_killed += 1
+                self.untrack_entity(monster)
 
         self.monsters = alive_monsters
 
         # 檢查Boss是否死亡
         if self.boss and not self.boss.is_alive:
             killed_count += 1
-            # 清理Boss的火焰子彈
-            if hasattr(self.boss, "fire_bullets"):
-                self.boss.fire_bullets.clear()
+            # Boss的投射物會在投射物管理器下次更新時跟著移除
             # Boss死亡不增加擊殺計數，因為它是特殊目標
 
         return killed_count
@@ -378,8 +539,7 @@ class MonsterManager:
             self.boss.y = platform.y - self.boss.height
 
             # 重新載入Boss大小的圖片
-            if hasattr(self.boss, "reload_image_if_boss"):
-                self.boss.reload_image_if_boss()
+            self.boss.reload_image_if_boss()
 
             # 更新Boss的碰撞矩形大小（修復子彈碰撞問題）
             self.boss.update_rect()
@@ -402,12 +562,12 @@ class MonsterManager:
             # 添加火焰子彈功能 - 提升攻擊頻率
             self.boss.fire_bullet_cooldown = LAVA_BOSS_BULLET_INTERVAL  # 改為3秒間隔
             self.boss.last_fire_bullet_time = 0
-            self.boss.fire_bullets = []
+            self.boss.add_capabilities(FIRE_BULLET_EMITTER)
 
             # 設定為Boss（重要：啟用永久追蹤）
-            self.boss.is_boss = True
+            self.boss.add_capabilities(BOSS)
             self.boss.monster_type = "boss_lava_monster"
-            print(f"🔥 第一階段Boss - 岩漿怪王 出現！血量是一般怪物的3倍！")
+            log.info(f"🔥 第一階段Boss - 岩漿怪王 出現！血量是一般怪物的3倍！")
 
         elif self.boss_stage == 2:
             # 第二階段：狙擊Boss
@@ -416,17 +576,19 @@ class MonsterManager:
             # 為狙擊Boss添加新的子彈系統
             self.boss.new_bullet_cooldown = SNIPER_BOSS_BULLET_INTERVAL  # 3秒間隔
             self.boss.last_new_bullet_time = 0
-            self.boss.boss_bullets = []  # 新的Boss子彈系統
+            self.boss.add_capabilities(HOMING_BULLET_EMITTER)
 
-            print(f"🎯 最終Boss - 狙擊Boss已生成！具備追蹤子彈、震波攻擊和躲避能力！")
+            log.info(f"🎯 最終Boss - 狙擊Boss已生成！具備追蹤子彈、震波攻擊和躲避能力！")
 
             # 狙擊Boss出現時同時生成3個額外小怪
             self.spawn_additional_monsters_for_sniper_boss(platforms, player)
 
         # 共同Boss設定
-        self.boss.is_boss = True
+        self.boss.add_capabilities(BOSS)
+        self.boss.projectile_manager = self.projectiles
         self.boss.home_platform = platform
         self.boss_spawned = True
+        self.track_entity(self.boss)
 
         return self.boss
 
@@ -442,12 +604,12 @@ class MonsterManager:
         alive_monsters = [monster for monster in self.monsters if monster.is_alive]
         current_monster_count = len(alive_monsters)
 
-        print(f"🎯 狙擊Boss出現前，場上有 {current_monster_count} 個小怪")
+        log.info(f"🎯 狙擊Boss出現前，場上有 {current_monster_count} 個小怪")
 
         # 如果小怪數量超過3個，只保留3個，其餘移除
         if current_monster_count > 3:
             # 隨機選擇3個小怪保留，其他的標記為死亡
-            monsters_to_keep = random.sample(alive_monsters, 3)
+            monsters_to_keep = rng.sample(alive_monsters, 3)
 
             # 將不在保留清單中的小怪標記為死亡
             removed_count = 0
@@ -456,7 +618,7 @@ class MonsterManager:
                     monster.is_alive = False
                     removed_count += 1
 
-            print(f"🧹 移除了 {removed_count} 個小怪，保留 3 個小怪")
+            log.info(f"🧹 移除了 {removed_count} 個小怪，保留 3 個小怪")
 
         # 如果小怪數量不足3個，補充到3個
         elif current_monster_count < 3:
@@ -472,7 +634,7 @@ class MonsterManager:
                 spawn_x, spawn_y, platform = spawn_result
 
                 # 隨機選擇怪物類型
-                monster_class = random.choice(self.monster_types)
+                monster_class = rng.choice(self.monster_types)
                 new_monster = monster_class(spawn_x, spawn_y)
 
                 # 設定怪物所在平台
@@ -481,30 +643,34 @@ class MonsterManager:
                 # 根據波次調整怪物屬性
                 self.adjust_monster_stats(new_monster)
 
-                self.monsters.append(new_monster)
+                self.add_monster(new_monster)
                 spawned_count += 1
 
-            print(f"➕ 補充了 {spawned_count} 個小怪")
+            log.info(f"➕ 補充了 {spawned_count} 個小怪")
 
         else:
-            print(f"✅ 場上剛好有 3 個小怪，無需調整")
+            log.info(f"✅ 場上剛好有 3 個小怪，無需調整")
 
         # 最終確認
         final_alive_count = len(
             [monster for monster in self.monsters if monster.is_alive]
         )
-        print(f"🎯 狙擊Boss出現後，場上確保有 {final_alive_count} 個小怪！")
+        log.info(f"🎯 狙擊Boss出現後，場上確保有 {final_alive_count} 個小怪！")
 
-    def update(self, player, platforms, dt, bullets=None, level_width=None):
+    def update(
+        self, player, platforms, dt, bullets=None, level_width=None, view_rect=None
+    ):
         """
         更新所有怪物和管理器狀態\n
         \n
         參數:\n
         player (Player): 玩家物件\n
-        platforms (list): 平台列表\n
+        platforms (SpatialGrid): 關卡平台空間網格（批次更新用網格版本判斷平台有沒有變）\n
         dt (float): 距離上次更新的時間（秒）\n
         bullets (list): 玩家子彈列表（可選，用於Boss躲避）\n
         level_width (int): 關卡實際寬度\n
+        view_rect (pygame.Rect): 攝影機看到的範圍（世界座標），用於 AI 細節層級和\n
+        移除飛出畫面的敵方投射物，None 表示以玩家為中心\n
         \n
         回傳:\n
         dict: 更新結果資訊\n
@@ -512,26 +678,43 @@ class MonsterManager:
         # 初始化玩家傷害結果追蹤
         player_damage_result = None
 
-        # 更新所有活躍怪物，傳遞關卡寬度
-        for monster in self.monsters:
-            monster.update(player, platforms, level_width)
+        if view_rect is None:
+            view_rect = self.get_player_view_rect(player)
+
+        # 選出這一步要更新的怪物（遠離畫面的怪物隔幾步才更新一次）
+        self.lod_tick += 1
+        active_monsters = self.monsters
+        if self.lod_enabled:
+            active_monsters = self.schedule_lod_updates(player, view_rect)
+
+        # 更新活躍怪物，傳遞關卡寬度（一般怪物可以批次更新時一起算）
+        if self.crowd is not None:
+            self.crowd.update(active_monsters, player, platforms, level_width)
+        else:
+            for monster in active_monsters:
+                monster.update(player, platforms, level_width)
+
+        # 移動過的怪物換到新的格子，還在原本格子裡的不必搬動
+        for monster in active_monsters:
+            self.grid.move(monster)
 
         # 更新Boss（如果存在）
         if self.boss:
             # 如果是狙擊Boss，需要傳入子彈資訊
-            if hasattr(self.boss, "tracking_bullets"):  # 狙擊Boss的標識
+            if isinstance(self.boss, SniperBoss):
                 self.boss.update(player, platforms, bullets, level_width)
             else:
                 self.boss.update(player, platforms, level_width)
+            self.grid.move(self.boss)
 
-            # 處理岩漿Boss的火焰子彈邏輯（只針對岩漿Boss）
-            if hasattr(self.boss, "fire_bullets"):
-                damage_result = self.update_boss_fire_bullets(player)
-                if damage_result:
-                    player_damage_result = damage_result
+            # 處理岩漿Boss的火焰子彈發射（只針對岩漿Boss）
+            if FIRE_BULLET_EMITTER in self.boss.capabilities:
+                self.fire_boss_bullets(player)
 
-            # 處理狙擊Boss的子彈邏輯（追蹤子彈由狙擊Boss自己處理，這裡不需要額外處理）
-            # 但是如果有需要額外的子彈管理器邏輯，可以在這裡添加
+        # 一次更新所有敵方投射物並檢查是否擊中玩家
+        damage_result = self.projectiles.update(player, view_rect)
+        if damage_result:
+            player_damage_result = damage_result
 
         # 移除死亡怪物（包含Boss）
         killed_this_frame = self.remove_dead_monsters()
@@ -550,15 +733,13 @@ class MonsterManager:
         sniper_boss_defeated = False  # 狙擊Boss是否被擊敗（觸發勝利）
 
         if self.boss and not self.boss.is_alive:
-            boss_type = (
-                "狙擊Boss" if hasattr(self.boss, "tracking_bullets") else "岩漿Boss"
-            )
+            boss_type = "狙擊Boss" if isinstance(self.boss, SniperBoss) else "岩漿Boss"
             boss_death_x = self.boss.x
             boss_death_y = self.boss.y
 
             if self.boss_stage == 1:
                 # 岩漿Boss被擊敗，啟動轉換延遲機制
-                print(f"🔥 第一階段Boss已被擊敗！將在3秒後出現最終Boss...")
+                log.info(f"🔥 第一階段Boss已被擊敗！將在3秒後出現最終Boss...")
                 self.boss_stage = 2
                 self.boss_spawned = False  # 重置以生成下一階段Boss
                 self.waiting_for_boss_transition = True  # 開始等待轉換
@@ -567,10 +748,11 @@ class MonsterManager:
 
             elif self.boss_stage == 2:
                 # 狙擊Boss被擊敗，真正的勝利
-                print(f"🎉 最終Boss - 狙擊Boss已被擊敗！真正的勝利！")
+                log.info(f"🎉 最終Boss - 狙擊Boss已被擊敗！真正的勝利！")
                 boss_defeated = True
                 sniper_boss_defeated = True
 
+            self.untrack_entity(self.boss)
             self.boss = None
 
         # 處理Boss轉換延遲
@@ -579,7 +761,7 @@ class MonsterManager:
             if self.boss_transition_timer >= self.boss_transition_delay:
                 # 轉換延遲結束，可以生成狙擊Boss
                 self.waiting_for_boss_transition = False
-                print(f"⏰ Boss轉換延遲結束，狙擊Boss可以生成了！")
+                log.info(f"⏰ Boss轉換延遲結束，狙擊Boss可以生成了！")
 
         # 更新生成計時器並嘗試生成新怪物（Boss存在時也繼續生成普通怪物）
         new_monster = None
@@ -598,9 +780,27 @@ class MonsterManager:
             "player_damage_result": player_damage_result,  # 新增：玩家傷害結果
         }
 
+    def get_monsters_in_rect(self, rect):
+        """
+        獲取碰撞矩形和指定矩形重疊的怪物（不含Boss）- 近戰攻擊用\n
+        \n
+        和怪物列表一樣包含這一步剛死亡、還沒移除的怪物\n
+        \n
+        參數:\n
+        rect (pygame.Rect): 查詢範圍\n
+        \n
+        回傳:\n
+        list: 重疊的怪物，順序和怪物列表一致\n
+        """
+        return [
+            monster
+            for monster in self.grid.query_rect(rect)
+            if BOSS not in monster.capabilities
+        ]
+
     def get_monsters_in_range(self, x, y, range_distance):
         """
-        獲取指定範圍內的怪物\n
+        獲取指定範圍內的怪物（不含Boss），以怪物中心計算距離\n
         \n
         參數:\n
         x (float): 中心點 X 座標\n
@@ -608,27 +808,17 @@ class MonsterManager:
         range_distance (float): 搜尋半徑\n
         \n
         回傳:\n
-        list: 範圍內的怪物列表\n
+        list: 範圍內的怪物列表，順序和怪物列表一致\n
         """
-        monsters_in_range = []
-
-        for monster in self.monsters:
-            if not monster.is_alive:
-                continue
-
-            # 計算距離
-            dx = monster.x - x
-            dy = monster.y - y
-            distance = (dx**2 + dy**2) ** 0.5
-
-            if distance <= range_distance:
-                monsters_in_range.append(monster)
-
-        return monsters_in_range
+        return [
+            monster
+            for monster in self.grid.query_radius(x, y, range_distance)
+            if monster.is_alive and BOSS not in monster.capabilities
+        ]
 
     def get_closest_monster(self, x, y):
         """
-        獲取最近的怪物\n
+        獲取最近的怪物（不含Boss），以怪物中心計算距離\n
         \n
         參數:\n
         x (float): 參考點 X 座標\n
@@ -637,33 +827,7 @@ class MonsterManager:
         回傳:\n
         Monster or None: 最近的怪物\n
         """
-        closest_monster = None
-        closest_distance = float("inf")
-
-        for monster in self.monsters:
-            if not monster.is_alive:
-                continue
-
-            dx = monster.x - x
-            dy = monster.y - y
-            distance = (dx**2 + dy**2) ** 0.5
-
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_monster = monster
-
-        return closest_monster
-
-    def clear_all_monsters(self):
-        """
-        清除所有怪物 - 用於關卡重置\n
-        """
-        self.monsters.clear()
-        self.spawn_timer = 0
-        self.wave_number = 1
-        self.monsters_killed = 0
-        self.max_monsters = 6
-        self.spawn_weights = [1, 1]
+        return self.grid.nearest(x, y, is_living_monster)
 
     def create_boss_fire_bullet(self, target_x, target_y):
         """
@@ -674,12 +838,12 @@ class MonsterManager:
         target_y (float): 目標 Y 座標\n
         \n
         回傳:\n
-        dict or None: 火焰子彈資訊\n
+        EnemyProjectile or None: 火焰子彈\n
         """
-        if not self.boss or not hasattr(self.boss, "fire_bullet_cooldown"):
+        if not self.boss or FIRE_BULLET_EMITTER not in self.boss.capabilities:
             return None
 
-        current_time = time.time()
+        current_time = get_game_time()
         if (
             current_time - self.boss.last_fire_bullet_time
             < self.boss.fire_bullet_cooldown
@@ -698,18 +862,17 @@ class MonsterManager:
             direction_x = dx / distance
             direction_y = dy / distance
 
-            fire_bullet = {
-                "x": start_x,
-                "y": start_y,
-                "velocity_x": direction_x * BOSS_BULLET_SPEED,  # 使用新的Boss子彈速度
-                "velocity_y": direction_y * BOSS_BULLET_SPEED,
-                "damage": BOSS_BULLET_DAMAGE,  # 使用新的Boss子彈傷害
-                "lifetime": BOSS_BULLET_LIFETIME,  # 10秒生存時間
-                "created_time": current_time,
-                "bullet_type": "lava_boss",  # 標記為岩漿Boss子彈
-            }
-
-            self.boss.fire_bullets.append(fire_bullet)
+            fire_bullet = self.projectiles.spawn(
+                "fire_bullet",
+                self.boss,
+                start_x,
+                start_y,
+                direction_x * BOSS_BULLET_SPEED,  # 使用新的Boss子彈速度
+                direction_y * BOSS_BULLET_SPEED,
+                BOSS_BULLET_DAMAGE,  # 使用新的Boss子彈傷害
+                BOSS_BULLET_LIFETIME,  # 10秒生存時間
+            )
+
             self.boss.last_fire_bullet_time = current_time
             return fire_bullet
 
@@ -724,12 +887,12 @@ class MonsterManager:
         target_y (float): 目標 Y 座標\n
         \n
         回傳:\n
-        dict or None: 追蹤子彈資訊\n
+        EnemyProjectile or None: 追蹤子彈\n
         """
-        if not self.boss or not hasattr(self.boss, "new_bullet_cooldown"):
+        if not self.boss or HOMING_BULLET_EMITTER not in self.boss.capabilities:
             return None
 
-        current_time = time.time()
+        current_time = get_game_time()
         if (
             current_time - self.boss.last_new_bullet_time
             < self.boss.new_bullet_cooldown
@@ -748,189 +911,67 @@ class MonsterManager:
             direction_x = dx / distance
             direction_y = dy / distance
 
-            tracking_bullet = {
-                "x": start_x,
-                "y": start_y,
-                "velocity_x": direction_x * BOSS_BULLET_SPEED,  # 使用Boss子彈速度
-                "velocity_y": direction_y * BOSS_BULLET_SPEED,
-                "target_x": target_x,  # 追蹤目標
-                "target_y": target_y,
-                "damage": BOSS_BULLET_DAMAGE,  # 使用Boss子彈傷害
-                "lifetime": BOSS_BULLET_LIFETIME,  # 10秒生存時間
-                "created_time": current_time,
-                "bullet_type": "sniper_boss_tracking",  # 標記為狙擊Boss追蹤子彈
-                "tracking_strength": SNIPER_BOSS_TRACKING_SPEED,  # 追蹤強度
-            }
-
-            self.boss.boss_bullets.append(tracking_bullet)
+            tracking_bullet = self.projectiles.spawn(
+                "homing_bullet",
+                self.boss,
+                start_x,
+                start_y,
+                direction_x * BOSS_BULLET_SPEED,  # 使用Boss子彈速度
+                direction_y * BOSS_BULLET_SPEED,
+                BOSS_BULLET_DAMAGE,  # 使用Boss子彈傷害
+                BOSS_BULLET_LIFETIME,  # 10秒生存時間
+            )
+            tracking_bullet.tracking_strength = SNIPER_BOSS_TRACKING_SPEED  # 追蹤強度
+
             self.boss.last_new_bullet_time = current_time
-            print(f"🎯 狙擊Boss發射追蹤子彈！")
+            log.debug(f"🎯 狙擊Boss發射追蹤子彈！")
             return tracking_bullet
 
         return None
 
-    def update_boss_fire_bullets(self, player):
+    def fire_boss_bullets(self, player):
         """
-        更新Boss火焰子彈和狙擊Boss追蹤子彈狀態並檢查碰撞\n
+        讓Boss嘗試發射火焰子彈或追蹤子彈\n
         \n
-        參數:\n
-        player (Player): 玩家物件\n
-        \n
-        回傳:\n
-        dict: 玩家傷害結果（如果有的話）\n
-        """
-        if not self.boss:
-            return None
-
-        # 處理岩漿Boss的火焰子彈（舊系統）
-        if hasattr(self.boss, "fire_bullets"):
-            damage_result = self.update_lava_boss_fire_bullets(player)
-            if damage_result:
-                return damage_result
-
-        # 處理狙擊Boss的追蹤子彈（新系統）
-        if hasattr(self.boss, "boss_bullets"):
-            damage_result = self.update_sniper_boss_bullets(player)
-            if damage_result:
-                return damage_result
-
-        return None
-
-    def update_lava_boss_fire_bullets(self, player):
-        """
-        更新岩漿Boss火焰子彈狀態\n
+        子彈的移動和碰撞由投射物管理器統一處理，這裡只決定要不要發射\n
         \n
         參數:\n
         player (Player): 玩家物件\n
-        \n
-        回傳:\n
-        dict: 玩家傷害結果（如果有的話）\n
         """
-        current_time = time.time()
-        active_bullets = []
-        player_damage_result = None
+        if not self.boss or not self.boss.is_alive or not player.is_alive:
+            return
 
-        for bullet in self.boss.fire_bullets:
-            # 檢查生存時間
-            if current_time - bullet["created_time"] > bullet["lifetime"]:
-                continue
-
-            # 更新位置
-            bullet["x"] += bullet["velocity_x"]
-            bullet["y"] += bullet["velocity_y"]
-
-            # 檢查與玩家的碰撞
-            bullet_rect = pygame.Rect(bullet["x"] - 8, bullet["y"] - 8, 16, 16)
-            if bullet_rect.colliderect(player.rect):
-                # 火焰子彈擊中玩家
-                damage_result = player.take_damage(bullet["damage"])
-                if damage_result:
-                    player_damage_result = damage_result
-                print(f"🔥 Boss火焰子彈擊中玩家！造成 {bullet['damage']} 點傷害")
-                continue  # 擊中後子彈消失
-
-            # 檢查是否超出螢幕
-            if 0 <= bullet["x"] <= SCREEN_WIDTH and 0 <= bullet["y"] <= SCREEN_HEIGHT:
-                active_bullets.append(bullet)
-
-        self.boss.fire_bullets = active_bullets
-
-        # 嘗試發射新的火焰子彈
-        if self.boss.is_alive and player.is_alive:
-            # 計算與玩家的距離
-            dx = player.x - self.boss.x
-            dy = player.y - self.boss.y
-            distance = (dx**2 + dy**2) ** 0.5
+        # 計算與玩家的距離
+        dx = player.x - self.boss.x
+        dy = player.y - self.boss.y
+        distance = (dx**2 + dy**2) ** 0.5
 
+        # 岩漿Boss的火焰子彈
+        if FIRE_BULLET_EMITTER in self.boss.capabilities:
             # 如果玩家在合適的距離內，發射火焰子彈
             if 80 <= distance <= 250:  # 火焰子彈的有效攻擊範圍
                 self.create_boss_fire_bullet(player.x, player.y)
 
-        return player_damage_result
-
-    def update_sniper_boss_bullets(self, player):
-        """
-        更新狙擊Boss追蹤子彈狀態\n
-        \n
-        參數:\n
-        player (Player): 玩家物件\n
-        \n
-        回傳:\n
-        dict: 玩家傷害結果（如果有的話）\n
-        """
-        current_time = time.time()
-        active_bullets = []
-        player_damage_result = None
-
-        for bullet in self.boss.boss_bullets:
-            # 檢查生存時間
-            if current_time - bullet["created_time"] > bullet["lifetime"]:
-                continue
-
-            # 更新追蹤目標位置
-            bullet["target_x"] = player.x + player.width // 2
-            bullet["target_y"] = player.y + player.height // 2
-
-            # 計算朝向目標的方向
-            dx = bullet["target_x"] - bullet["x"]
-            dy = bullet["target_y"] - bullet["y"]
-            distance = (dx**2 + dy**2) ** 0.5
-
-            if distance > 0:
-                # 計算新的追蹤方向
-                direction_x = dx / distance
-                direction_y = dy / distance
-
-                # 混合當前速度和追蹤方向，實現平滑追蹤
-                tracking_strength = bullet["tracking_strength"]
-                bullet["velocity_x"] = (1 - tracking_strength) * bullet[
-                    "velocity_x"
-                ] + tracking_strength * direction_x * BOSS_BULLET_SPEED
-                bullet["velocity_y"] = (1 - tracking_strength) * bullet[
-                    "velocity_y"
-                ] + tracking_strength * direction_y * BOSS_BULLET_SPEED
-
-            # 更新位置
-            bullet["x"] += bullet["velocity_x"]
-            bullet["y"] += bullet["velocity_y"]
-
-            # 檢查與玩家的碰撞
-            bullet_rect = pygame.Rect(bullet["x"] - 8, bullet["y"] - 8, 16, 16)
-            if bullet_rect.colliderect(player.rect):
-                # 追蹤子彈擊中玩家
-                damage_result = player.take_damage(bullet["damage"])
-                if damage_result:
-                    player_damage_result = damage_result
-                print(f"🎯 狙擊Boss追蹤子彈擊中玩家！造成 {bullet['damage']} 點傷害")
-                continue  # 擊中後子彈消失
-
-            # 檢查是否超出螢幕邊界太遠（避免無限追蹤）
-            if (
-                -200 <= bullet["x"] <= SCREEN_WIDTH + 200
-                and -200 <= bullet["y"] <= SCREEN_HEIGHT + 200
-            ):
-                active_bullets.append(bullet)
-
-        self.boss.boss_bullets = active_bullets
-
-        # 嘗試發射新的追蹤子彈
-        if self.boss.is_alive and player.is_alive:
-            # 計算與玩家的距離
-            dx = player.x - self.boss.x
-            dy = player.y - self.boss.y
-            distance = (dx**2 + dy**2) ** 0.5
-
+        # 狙擊Boss的追蹤子彈
+        elif HOMING_BULLET_EMITTER in self.boss.capabilities:
             # 如果玩家在攻擊範圍內，發射追蹤子彈
             if distance <= 300:  # 狙擊Boss的攻擊範圍
                 self.create_sniper_boss_tracking_bullet(
                     player.x + player.width // 2, player.y + player.height // 2
                 )
 
-        return player_damage_result
+    def has_sniper_boss(self):
+        """
+        檢查目前是否有狙擊Boss\n
+        \n
+        回傳:\n
+        bool: True 表示狙擊Boss存在\n
+        """
+        return isinstance(self.boss, SniperBoss)
 
     def draw(self, screen, camera_x=0, camera_y=0):
         """
-        繪製所有怪物\n
+        繪製所有怪物和敵方投射物\n
         \n
         參數:\n
         screen (pygame.Surface): 要繪製到的螢幕表面\n
@@ -944,82 +985,18 @@ class MonsterManager:
         if self.boss:
             self.boss.draw(screen, camera_x, camera_y)
 
+        # 繪製所有怪物和Boss的投射物
+        self.projectiles.draw(screen, camera_x, camera_y)
+
+        if self.boss:
             # 特別標示Boss（根據Boss類型顯示不同標籤）
             boss_screen_x = self.boss.x - camera_x
             boss_screen_y = self.boss.y - camera_y
 
-            font = get_chinese_font(FONT_SIZE_MEDIUM)
-
-            if hasattr(self.boss, "tracking_bullets"):  # 狙擊Boss
-                boss_text = font.render("🎯 SNIPER BOSS", True, PURPLE)
-
-                # 繪製狙擊Boss的追蹤子彈
-                if hasattr(self.boss, "boss_bullets"):
-                    for bullet in self.boss.boss_bullets:
-                        bullet_screen_x = bullet["x"] - camera_x
-                        bullet_screen_y = bullet["y"] - camera_y
-                        # 只繪製在螢幕範圍內的追蹤子彈
-                        if (
-                            -20 <= bullet_screen_x <= SCREEN_WIDTH + 20
-                            and -20 <= bullet_screen_y <= SCREEN_HEIGHT + 20
-                        ):
-                            # 繪製追蹤子彈：紫色外圈和亮紫色內圈
-                            pygame.draw.circle(
-                                screen,
-                                SNIPER_BOSS_BULLET_COLOR,
-                                (int(bullet_screen_x), int(bullet_screen_y)),
-                                8,
-                            )
-                            pygame.draw.circle(
-                                screen,
-                                (255, 100, 255),  # 亮紫色內圈
-                                (int(bullet_screen_x), int(bullet_screen_y)),
-                                4,
-                            )
-
-                # 繪製狙擊Boss的散彈子彈
-                if hasattr(self.boss, "shotgun_bullets"):
-                    for bullet in self.boss.shotgun_bullets:
-                        bullet_screen_x = bullet["x"] - camera_x
-                        bullet_screen_y = bullet["y"] - camera_y
-                        # 只繪製在螢幕範圍內的散彈
-                        if (
-                            -20 <= bullet_screen_x <= SCREEN_WIDTH + 20
-                            and -20 <= bullet_screen_y <= SCREEN_HEIGHT + 20
-                        ):
-                            # 繪製散彈：紅色實心圓
-                            pygame.draw.circle(
-                                screen,
-                                SNIPER_BOSS_SHOTGUN_COLOR,
-                                (int(bullet_screen_x), int(bullet_screen_y)),
-                                6,
-                            )
+            if isinstance(self.boss, SniperBoss):  # 狙擊Boss
+                boss_text = get_text_surface("🎯 SNIPER BOSS", FONT_SIZE_MEDIUM, PURPLE)
             else:  # 岩漿Boss
-                boss_text = font.render("🔥 LAVA BOSS", True, RED)
-
-                # 繪製岩漿Boss的火焰子彈
-                if hasattr(self.boss, "fire_bullets"):
-                    for bullet in self.boss.fire_bullets:
-                        bullet_screen_x = bullet["x"] - camera_x
-                        bullet_screen_y = bullet["y"] - camera_y
-                        # 只繪製在螢幕範圍內的火焰子彈
-                        if (
-                            -20 <= bullet_screen_x <= SCREEN_WIDTH + 20
-                            and -20 <= bullet_screen_y <= SCREEN_HEIGHT + 20
-                        ):
-                            # 繪製火焰子彈：橘紅色外圈和黃色內圈
-                            pygame.draw.circle(
-                                screen,
-                                FIRE_BULLET_COLOR,
-                                (int(bullet_screen_x), int(bullet_screen_y)),
-                                8,
-                            )
-                            pygame.draw.circle(
-                                screen,
-                                YELLOW,
-                                (int(bullet_screen_x), int(bullet_screen_y)),
-                                4,
-                            )
+                boss_text = get_text_surface("🔥 LAVA BOSS", FONT_SIZE_MEDIUM, RED)
 
             # 繪製Boss標籤
             text_rect = boss_text.get_rect()
@@ -1063,14 +1040,43 @@ class MonsterManager:
             "max_monsters": self.max_monsters,
         }
 
+    def reset(self):
+        """
+        把怪物管理器恢復成剛建立時的狀態 - 重新開始遊戲時使用\n
+        \n
+        和 reset_for_new_level() 不同，波次、Boss 和生成設定全部回到初始值；\n
+        投射物管理器和批次更新的陣列快取繼續使用，不重新建立\n
+        """
+        self.monsters.clear()
+        self.untrack_all()
+        self.projectiles.clear()
+        self.spawn_timer = 0
+        self.spawn_interval = 3.0
+        self.max_monsters = 6
+        self.wave_number = 1
+        self.monsters_killed = 0
+        self.boss_spawned = False
+        self.boss = None
+        self.boss_stage = 1
+        self.boss_transition_timer = 0
+        self.boss_transition_delay = 3.0
+        self.waiting_for_boss_transition = False
+        self.lod_enabled = USE_MONSTER_AI_LOD
+        self.lod_tick = 0
+        self.lod_next_bucket = 0
+        self.monster_types = [LavaMonster, WaterMonster]
+        self.spawn_weights = [1, 1]
+
     def reset_for_new_level(self):
         """
         為新關卡重置怪物管理器\n
         \n
         清除所有現有怪物，重置計時器和統計\n
         """
-        # 清除所有怪物
+        # 清除所有怪物和投射物
         self.monsters.clear()
+        self.untrack_all()
+        self.projectiles.clear()
 
         # 重置計時器和計數器
         self.spawn_timer = 0
@@ -1086,11 +1092,16 @@ class MonsterManager:
         # 保持當前波次但可選擇重置
         # self.wave_number = 1  # 如果要重置波次的話
 
-        print(f"🔄 怪物系統已為新關卡重置")
+        log.info(f"🔄 怪物系統已為新關卡重置")
 
     def clear_all_monsters(self):
         """
         清除所有怪物\n
         """
+        for monster in self.monsters:
+            self.untrack_entity(monster)
         self.monsters.clear()
-        print("🧹 已清除所有怪物")
+        self.projectiles.clear()
+        self.lod_tick = 0
+        self.lod_next_bucket = 0
+        log.info("🧹 已清除所有怪物")
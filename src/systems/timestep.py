@@ -0,0 +1,134 @@
+######################載入套件######################
+import time
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+except ImportError:
+    from src.config import *
+
+######################固定步長時鐘類別######################
+
+
+class FixedTimestep:
+    """
+    固定步長時鐘 - 用累加器把真實時間切成固定長度的模擬步\n
+    \n
+    玩家、怪物、子彈、手榴彈的物理都是「每次更新移動固定距離」，\n
+    所以模擬必須用固定頻率推進，遊戲速度才不會受到電腦快慢影響：\n
+    1. 每幀把經過的真實時間加進累加器\n
+    2. 累加器每滿一個步長就執行一次模擬更新\n
+    3. 剩下不滿一步的時間換算成插值比例給繪製使用\n
+    \n
+    參數:\n
+    step (float): 每個模擬步的長度（秒），預設 FIXED_TIMESTEP\n
+    max_steps (int): 每幀最多執行的步數，避免卡頓後追趕不完\n
+    """
+
+    def __init__(self, step=FIXED_TIMESTEP, max_steps=MAX_STEPS_PER_FRAME):
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.last_time = time.perf_counter()
+
+    def reset(self):
+        """
+        重置累加器和計時起點 - 重新開始遊戲或暫停恢復時使用\n
+        """
+        self.accumulator = 0.0
+        self.last_time = time.perf_counter()
+
+    def advance(self):
+        """
+        加入這一幀經過的真實時間，並算出這一幀要執行幾個模擬步\n
+        \n
+        回傳:\n
+        int: 這一幀要執行的模擬步數\n
+        """
+        current_time = time.perf_counter()
+        frame_time = current_time - self.last_time
+        self.last_time = current_time
+
+        self.accumulator += frame_time
+
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            # 落後太多時直接丟掉多出來的時間，不然會越追越慢
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step
+
+        return steps
+
+    def get_alpha(self):
+        """
+        取得繪製插值比例\n
+        \n
+        回傳:\n
+        float: 0.0 ~ 1.0，表示目前時間落在上一步和下一步之間的位置\n
+        """
+        return min(1.0, self.accumulator / self.step)
+
+
+######################繪製插值類別######################
+
+
+class RenderInterpolator:
+    """
+    繪製插值器 - 在上一個和目前的模擬狀態之間內插物件位置\n
+    \n
+    模擬頻率和螢幕更新頻率不同步時，直接畫最新狀態會有抖動。\n
+    做法是每個模擬步之前記下物件位置，繪製時暫時把位置換成內插值，\n
+    畫完再還原，所以不會影響任何遊戲邏輯。\n
+    """
+
+    def __init__(self):
+        self.previous_positions = {}  # id(物件) -> (物件, x, y)
+        self.saved_positions = []  # 繪製期間被暫時替換的 (物件, x, y)
+
+    def capture(self, objects):
+        """
+        記錄模擬步之前的物件位置\n
+        \n
+        參數:\n
+        objects (list): 要插值的物件列表（需要有 x、y 屬性）\n
+        """
+        self.previous_positions = {id(obj): (obj, obj.x, obj.y) for obj in objects}
+
+    def clear(self):
+        """
+        清除記錄的位置 - 重置遊戲時使用，避免從舊位置內插\n
+        """
+        self.previous_positions = {}
+        self.saved_positions = []
+
+    def apply(self, objects, alpha):
+        """
+        把物件位置暫時換成內插位置\n
+        \n
+        參數:\n
+        objects (list): 要繪製的物件列表\n
+        alpha (float): 插值比例，0.0 = 上一步，1.0 = 目前狀態\n
+        """
+        self.saved_positions = []
+
+        for obj in objects:
+            previous = self.previous_positions.get(id(obj))
+            # 新出現的物件沒有上一步位置，直接畫目前位置
+            if previous is None or previous[0] is not obj:
+                continue
+
+            _, previous_x, previous_y = previous
+            self.saved_positions.append((obj, obj.x, obj.y))
+            obj.x = previous_x + (obj.x - previous_x) * alpha
+            obj.y = previous_y + (obj.y - previous_y) * alpha
+
+    def restore(self):
+        """
+        繪製完成後還原物件的真實位置\n
+        """
+        for obj, x, y in self.saved_positions:
+            obj.x = x
+            obj.y = y
+        self.saved_positions = []
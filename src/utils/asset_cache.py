@@ -0,0 +1,217 @@
+######################載入套件######################
+import pygame
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+    from .game_logger import get_logger
+except ImportError:
+    from src.config import *
+    from src.utils.game_logger import get_logger
+
+log = get_logger("assets")
+
+######################圖片變化設定######################
+
+# 圖片變化類型 -> (水平翻轉, 垂直翻轉)
+IMAGE_VARIANTS = {
+    "normal": (False, False),
+    "flip_x": (True, False),  # 左右鏡像，用於朝左的角色
+    "flip_y": (False, True),
+    "flip_xy": (True, True),  # 上下左右都翻轉，相當於旋轉 180 度
+}
+
+# 遊戲中會大量生成的角色圖片，開始遊戲前先準備好
+GAME_SPRITE_ASSETS = [
+    (LAVA_MONSTER_IMAGE_PATH, LAVA_MONSTER_IMAGE_SIZE, ["normal", "flip_x"]),
+    (WATER_MONSTER_IMAGE_PATH, WATER_MONSTER_IMAGE_SIZE, ["normal", "flip_x"]),
+    (LAVA_BOSS_IMAGE_PATH, LAVA_BOSS_IMAGE_SIZE, ["normal", "flip_x"]),
+    (SNIPER_BOSS_LEFT_IMAGE_PATH, SNIPER_BOSS_IMAGE_SIZE, ["normal"]),
+    (SNIPER_BOSS_RIGHT_IMAGE_PATH, SNIPER_BOSS_IMAGE_SIZE, ["normal"]),
+]
+
+######################圖片資源快取類別######################
+
+
+class AssetCache:
+    """
+    圖片資源快取 - 整個程式共用，同一張圖片只從硬碟讀取一次\n
+    \n
+    以 (路徑, 尺寸, 變化) 當作鍵值保存處理好的圖片：\n
+    1. 原始圖片只解碼一次（convert_alpha 後保存）\n
+    2. 縮放後的圖片依尺寸保存，同尺寸的怪物直接共用\n
+    3. 鏡像翻轉的圖片也事先做好，繪製時不必每幀翻轉\n
+    4. 載入失敗的路徑會記住錯誤，之後不會再去讀硬碟\n
+    5. 武器旋轉圖片依取整後的角度保存，滑鼠怎麼甩都只旋轉一次\n
+    \n
+    注意：回傳的圖片是共用的，需要修改時請先 copy()\n
+    """
+
+    def __init__(self):
+        self.images = {}  # (路徑, 尺寸, 變化) -> pygame.Surface
+        self.failures = {}  # 路徑 -> 載入失敗時的例外
+        self.rotations = {}  # (圖片, 角度格數) -> (旋轉後圖片, 錨點偏移)
+        self.rotation_count = round(360 / WEAPON_ROTATION_STEP)  # 一圈的角度格數
+
+    def get_image(self, path, size=None, variant="normal"):
+        """
+        取得處理好的圖片，第一次使用時才載入和轉換\n
+        \n
+        參數:\n
+        path (str): 圖片檔案路徑\n
+        size (tuple): 目標尺寸 (寬, 高)，None 表示原始大小\n
+        variant (str): 圖片變化，對應 IMAGE_VARIANTS 的鍵\n
+        \n
+        回傳:\n
+        pygame.Surface: 處理好的圖片\n
+        \n
+        例外:\n
+        pygame.error / FileNotFoundError: 圖片載入失敗（和直接載入時相同）\n
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+
+        key = (path, size, variant)
+        image = self.images.get(key)
+        if image is not None:
+            return image
+
+        if variant != "normal":
+            # 從同尺寸的原圖翻轉
+            flip_x, flip_y = IMAGE_VARIANTS[variant]
+            image = pygame.transform.flip(
+                self.get_image(path, size), flip_x, flip_y
+            )
+        elif size is not None:
+            # 從原始大小的圖片縮放
+            image = pygame.transform.scale(self.get_image(path), size)
+        else:
+            image = self.load_from_disk(path)
+
+        self.images[key] = image
+        return image
+
+    def load_from_disk(self, path):
+        """
+        從硬碟讀取圖片 - 每個路徑只會真正讀取一次\n
+        \n
+        參數:\n
+        path (str): 圖片檔案路徑\n
+        \n
+        回傳:\n
+        pygame.Surface: 轉換成含透明度格式的圖片\n
+        """
+        if path in self.failures:
+            raise self.failures[path]
+
+        try:
+            image = pygame.image.load(path).convert_alpha()
+        except (pygame.error, FileNotFoundError) as e:
+            self.failures[path] = e
+            raise
+
+        log.info(f"✅ 成功載入圖片: {path}")
+        return image
+
+    def get_rotated_image(self, image, angle):
+        """
+        取得旋轉後的圖片 - 角度以 WEAPON_ROTATION_STEP 取整後快取\n
+        \n
+        參數:\n
+        image (pygame.Surface): 要旋轉的圖片（需要是快取裡不會變動的圖片）\n
+        angle (float): 旋轉角度（度，逆時針為正，和 pygame.transform.rotate 相同）\n
+        \n
+        回傳:\n
+        tuple: (旋轉後的圖片, (x 偏移, y 偏移))\n
+        偏移是從旋轉中心到圖片左上角的距離，繪製位置 = 中心 + 偏移\n
+        """
+        step_index = round(angle / WEAPON_ROTATION_STEP) % self.rotation_count
+        key = (image, step_index)
+        rotated = self.rotations.get(key)
+        if rotated is not None:
+            return rotated
+
+        rotated_image = pygame.transform.rotate(
+            image, step_index * WEAPON_ROTATION_STEP
+        )
+        # 旋轉後圖片會變大，中心仍然是原圖中心
+        anchor_offset = (
+            -(rotated_image.get_width() // 2),
+            -(rotated_image.get_height() // 2),
+        )
+        rotated = (rotated_image, anchor_offset)
+        self.rotations[key] = rotated
+        return rotated
+
+    def preload(self, entries):
+        """
+        預先載入並處理圖片 - 遊戲開始前呼叫，遊戲中生成物件時就不用讀檔\n
+        \n
+        參數:\n
+        entries (list): (路徑, 尺寸, 變化列表) 的列表\n
+        \n
+        回傳:\n
+        int: 成功準備好的圖片數量\n
+        """
+        ready_count = 0
+        for path, size, variants in entries:
+            for variant in variants:
+                try:
+                    self.get_image(path, size, variant)
+                    ready_count += 1
+                except (pygame.error, FileNotFoundError) as e:
+                    log.warning(f"⚠️ 預先載入圖片失敗: {e}")
+                    break  # 同一個檔案的其他變化也會失敗，不用再試
+
+        return ready_count
+
+    def clear(self):
+        """
+        清除所有快取的圖片、旋轉圖片和失敗紀錄\n
+        """
+        self.images.clear()
+        self.failures.clear()
+        self.rotations.clear()
+
+
+# 整個程式共用的圖片快取
+_asset_cache = AssetCache()
+
+
+def get_image(path, size=None, variant="normal"):
+    """
+    從共用快取取得圖片\n
+    \n
+    參數:\n
+    path (str): 圖片檔案路徑\n
+    size (tuple): 目標尺寸 (寬, 高)，None 表示原始大小\n
+    variant (str): 圖片變化（normal、flip_x、flip_y、flip_xy）\n
+    \n
+    回傳:\n
+    pygame.Surface: 處理好的圖片（共用，不可直接修改）\n
+    """
+    return _asset_cache.get_image(path, size, variant)
+
+
+def get_rotated_image(image, angle):
+    """
+    從共用快取取得旋轉後的圖片和錨點偏移\n
+    \n
+    參數:\n
+    image (pygame.Surface): 要旋轉的圖片\n
+    angle (float): 旋轉角度（度，逆時針為正）\n
+    \n
+    回傳:\n
+    tuple: (旋轉後的圖片, (x 偏移, y 偏移))\n
+    """
+    return _asset_cache.get_rotated_image(image, angle)
+
+
+def get_asset_cache():
+    """
+    取得整個程式共用的圖片快取\n
+    \n
+    回傳:\n
+    AssetCache: 共用的圖片快取\n
+    """
+    return _asset_cache
@@ -0,0 +1,203 @@
+######################載入套件######################
+import threading
+
+import pygame
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+    from .game_logger import get_logger
+except ImportError:
+    from src.config import *
+    from src.utils.game_logger import get_logger
+
+log = get_logger("audio")
+
+######################音效清單######################
+
+# 短音效：名稱 -> (說明, 路徑, 音量)，在背景執行緒整個解碼進記憶體
+SOUND_EFFECTS = {
+    "shooting": ("射擊音效", SHOOTING_SOUND_PATH, SHOOTING_SOUND_VOLUME),
+    "ultimate": ("必殺技音效", ULTIMATE_SOUND_PATH, ULTIMATE_SOUND_VOLUME),
+    "game_over": ("死亡音效", GAME_OVER_SOUND_PATH, GAME_OVER_SOUND_VOLUME),
+    "victory": ("勝利星星音效", VICTORY_SOUND_PATH, VICTORY_SOUND_VOLUME),
+    "health_pickup": (
+        "愛心道具音效",
+        HEALTH_PICKUP_SOUND_PATH,
+        HEALTH_PICKUP_SOUND_VOLUME,
+    ),
+}
+
+# 長音樂：名稱 -> (說明, 路徑, 音量)，用 pygame.mixer.music 邊播邊讀，不整首解碼
+MUSIC_TRACKS = {
+    "sniper_incoming": (
+        "狙擊怪來襲音樂",
+        SNIPER_INCOMING_MUSIC_PATH,
+        SNIPER_INCOMING_MUSIC_VOLUME,
+    ),
+    "boss": ("Boss背景音樂", BOSS_MUSIC_PATH, BOSS_MUSIC_VOLUME),
+}
+
+######################音效管理類別######################
+
+
+class AudioManager:
+    """
+    音效管理器 - 開啟音效裝置、在背景載入短音效、串流播放長音樂\n
+    \n
+    特點：\n
+    1. 視窗出現後才開始載入，短音效在背景執行緒解碼，不會擋住第一幀\n
+    2. 還沒載入好或載入失敗的音效直接略過，遊戲照常進行\n
+    3. Boss 音樂這類長音樂用 pygame.mixer.music 串流播放，不必整首解碼進記憶體\n
+    4. 音樂串流只有一條，播放新的音樂會取代正在播放的音樂\n
+    5. 載入失敗的音樂會記住錯誤，之後不會每一步重新讀硬碟\n
+    \n
+    沒有呼叫 start()（例如無頭模式）時不會開啟音效裝置，所有播放都會略過\n
+    """
+
+    def __init__(self):
+        self.enabled = False  # 音效裝置是否已經開啟
+        self.sounds = {}  # 名稱 -> 解碼好的 pygame.mixer.Sound
+        self.failures = {}  # 名稱 -> 載入失敗時的例外
+        self.thread = None  # 背景載入執行緒
+        self.stop_requested = threading.Event()
+        self.current_music = None  # 正在串流播放的音樂名稱
+
+    def start(self):
+        """
+        開啟音效裝置並啟動背景載入執行緒\n
+        \n
+        回傳:\n
+        bool: True 表示音效裝置開啟成功\n
+        """
+        if self.enabled:
+            return True
+
+        try:
+            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            pygame.mixer.set_num_channels(SOUND_CHANNELS)  # 設定音效頻道數量
+        except pygame.error as e:
+            log.warning(f"開啟音效裝置失敗: {e}")
+            log.warning("遊戲將在沒有音效的情況下運行")
+            return False
+
+        self.enabled = True
+        self.stop_requested.clear()
+        self.thread = threading.Thread(
+            target=self.load_sound_effects, name="game-audio-loader", daemon=True
+        )
+        self.thread.start()
+        return True
+
+    def load_sound_effects(self):
+        """
+        背景執行緒主程式 - 依序解碼所有短音效，每個載入好就可以播放\n
+        """
+        for name, (label, path, volume) in SOUND_EFFECTS.items():
+            if self.stop_requested.is_set():
+                break
+
+            try:
+                sound = pygame.mixer.Sound(path)
+                sound.set_volume(volume)
+            except (pygame.error, FileNotFoundError) as e:
+                self.failures[name] = e
+                log.warning(f"載入{label}失敗: {e}")
+                continue
+
+            self.sounds[name] = sound
+            log.info(f"成功載入{label}: {path}")
+
+    def get_sound(self, name):
+        """
+        取得解碼好的短音效\n
+        \n
+        參數:\n
+        name (str): SOUND_EFFECTS 裡的音效名稱\n
+        \n
+        回傳:\n
+        pygame.mixer.Sound: 音效，還沒載入好或載入失敗時回傳 None\n
+        """
+        return self.sounds.get(name)
+
+    def is_loading(self):
+        """
+        檢查背景執行緒是否還在載入音效\n
+        \n
+        回傳:\n
+        bool: True 表示還有音效沒載入完\n
+        """
+        return self.thread is not None and self.thread.is_alive()
+
+    def play_music(self, name):
+        """
+        串流播放長音樂並無限循環，會取代正在播放的音樂\n
+        \n
+        參數:\n
+        name (str): MUSIC_TRACKS 裡的音樂名稱\n
+        \n
+        回傳:\n
+        bool: True 表示開始播放，音效裝置沒開或音樂載入失敗時回傳 False\n
+        """
+        if not self.enabled or name in self.failures:
+            return False
+
+        label, path, volume = MUSIC_TRACKS[name]
+        try:
+            pygame.mixer.music.load(path)
+            # 串流只有一條，音量最大就是 1.0
+            pygame.mixer.music.set_volume(min(1.0, volume))
+            pygame.mixer.music.play(loops=-1)
+        except (pygame.error, FileNotFoundError) as e:
+            self.failures[name] = e
+            log.warning(f"載入{label}失敗: {e}")
+            return False
+
+        self.current_music = name
+        return True
+
+    def stop_music(self, fade_ms=0):
+        """
+        停止正在串流播放的音樂\n
+        \n
+        參數:\n
+        fade_ms (int): 漸弱時間（毫秒），0 表示立刻停止\n
+        """
+        if self.current_music is None:
+            return
+
+        try:
+            if fade_ms > 0:
+                pygame.mixer.music.fadeout(fade_ms)
+            else:
+                pygame.mixer.music.stop()
+        except pygame.error as e:
+            log.warning(f"停止音樂失敗: {e}")
+        self.current_music = None
+
+    def is_music_playing(self, name):
+        """
+        檢查指定的音樂是否正在播放\n
+        \n
+        參數:\n
+        name (str): MUSIC_TRACKS 裡的音樂名稱\n
+        \n
+        回傳:\n
+        bool: True 表示這首音樂正在串流播放\n
+        """
+        return self.current_music == name and pygame.mixer.music.get_busy()
+
+    def close(self, timeout=1.0):
+        """
+        停止背景載入並關閉音樂，關閉 pygame 之前呼叫\n
+        \n
+        參數:\n
+        timeout (float): 最多等待背景執行緒幾秒\n
+        """
+        self.stop_requested.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+            self.thread = None
+
+        if self.enabled:
+            self.stop_music()
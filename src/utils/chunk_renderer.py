@@ -0,0 +1,157 @@
+######################載入套件######################
+import pygame
+import math
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+except ImportError:
+    from src.config import *
+
+# 區塊透明部分使用的色鍵（關卡物件不會用到這個洋紅色）
+CHUNK_COLORKEY = (255, 0, 255)
+
+######################靜態關卡分塊繪製類別######################
+
+
+class ChunkRenderer:
+    """
+    靜態關卡分塊繪製 - 把不會動的關卡物件預先畫到固定大小的區塊圖片上\n
+    \n
+    關卡以 chunk_size x chunk_size 的區塊切開，每個區塊第一次出現在畫面時，\n
+    才從空間網格查出和它重疊的物件畫進區塊圖片。之後每幀只需要把\n
+    攝影機範圍內的幾個區塊貼到螢幕，繪製成本和關卡大小無關。\n
+    \n
+    特點：\n
+    1. 圖層依照傳入順序繪製（例如先平台、後尖刺），和原本逐一繪製的先後相同\n
+    2. 沒有任何物件的區塊只記錄為空區塊，不會建立圖片\n
+    3. 最多保留 cache_limit 個區塊圖片，超過時丟掉最久沒用到的區塊\n
+    \n
+    參數:\n
+    layers (list): 要預先繪製的空間網格列表，物件需要有 draw(screen, camera_x, camera_y)\n
+    chunk_size (int): 每個區塊的邊長（像素）\n
+    cache_limit (int): 最多保留的區塊圖片數量\n
+    """
+
+    def __init__(
+        self,
+        layers,
+        chunk_size=LEVEL_CHUNK_SIZE,
+        cache_limit=LEVEL_CHUNK_CACHE_LIMIT,
+    ):
+        self.layers = layers
+        self.chunk_size = chunk_size
+        self.cache_limit = cache_limit
+        self.chunks = {}  # (區塊x, 區塊y) -> pygame.Surface，順序就是最近使用順序
+        self.empty_chunks = set()  # 沒有任何物件的區塊
+
+    def clear(self):
+        """
+        丟掉所有畫好的區塊 - 關卡重新生成後呼叫，下次繪製時重新烘焙\n
+        """
+        self.chunks.clear()
+        self.empty_chunks.clear()
+
+    def invalidate_rect(self, rect):
+        """
+        丟掉和矩形重疊的區塊 - 關卡段載入或丟棄後呼叫，只重新烘焙受影響的區塊\n
+        \n
+        參數:\n
+        rect (pygame.Rect): 物件有變動的範圍（世界座標）\n
+        """
+        size = self.chunk_size
+        for chunk_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for chunk_x in range(rect.left // size, (rect.right - 1) // size + 1):
+                key = (chunk_x, chunk_y)
+                self.chunks.pop(key, None)
+                self.empty_chunks.discard(key)
+
+    def get_chunk(self, chunk_x, chunk_y):
+        """
+        取得區塊圖片，還沒畫過的區塊會先烘焙\n
+        \n
+        參數:\n
+        chunk_x (int): 區塊 x 索引\n
+        chunk_y (int): 區塊 y 索引\n
+        \n
+        回傳:\n
+        pygame.Surface or None: 區塊圖片，空區塊回傳 None\n
+        """
+        key = (chunk_x, chunk_y)
+        if key in self.empty_chunks:
+            return None
+
+        chunk = self.chunks.pop(key, None)
+        if chunk is None:
+            chunk = self.bake_chunk(chunk_x, chunk_y)
+            if chunk is None:
+                self.empty_chunks.add(key)
+                return None
+
+            # 超過上限時丟掉最久沒用到的區塊
+            while len(self.chunks) >= self.cache_limit:
+                del self.chunks[next(iter(self.chunks))]
+
+        # 重新放到最後，表示最近用過
+        self.chunks[key] = chunk
+        return chunk
+
+    def bake_chunk(self, chunk_x, chunk_y):
+        """
+        把和區塊重疊的靜態物件畫成一張區塊圖片\n
+        \n
+        參數:\n
+        chunk_x (int): 區塊 x 索引\n
+        chunk_y (int): 區塊 y 索引\n
+        \n
+        回傳:\n
+        pygame.Surface or None: 區塊圖片，區塊內沒有物件時回傳 None\n
+        """
+        size = self.chunk_size
+        left = chunk_x * size
+        top = chunk_y * size
+        chunk_rect = pygame.Rect(left, top, size, size)
+
+        layer_items = [grid.query_rect(chunk_rect) for grid in self.layers]
+        if not any(layer_items):
+            return None
+
+        # 用色鍵當透明色，貼圖比逐像素透明度快
+        chunk = pygame.Surface((size, size))
+        chunk.fill(CHUNK_COLORKEY)
+        chunk.set_colorkey(CHUNK_COLORKEY, pygame.RLEACCEL)
+
+        # 把區塊左上角當成攝影機位置，物件就會畫在區塊內的相對位置
+        for items in layer_items:
+            for item in items:
+                item.draw(chunk, left, top)
+
+        return chunk
+
+    def draw(self, screen, camera_x=0, camera_y=0):
+        """
+        把攝影機範圍內的區塊貼到螢幕上\n
+        \n
+        參數:\n
+        screen (pygame.Surface): 遊戲畫面\n
+        camera_x (int): 攝影機 x 偏移\n
+        camera_y (int): 攝影機 y 偏移\n
+        """
+        # 物件各自繪製時，螢幕座標 (x - camera_x) 會被捨去小數，
+        # 對畫面內的物件相當於攝影機位置無條件進位，區塊用同樣的位置才不會差一像素
+        view_left = math.ceil(camera_x)
+        view_top = math.ceil(camera_y)
+
+        size = self.chunk_size
+        start_x = view_left // size
+        end_x = (view_left + screen.get_width() - 1) // size
+        start_y = view_top // size
+        end_y = (view_top + screen.get_height() - 1) // size
+
+        for chunk_y in range(start_y, end_y + 1):
+            for chunk_x in range(start_x, end_x + 1):
+                chunk = self.get_chunk(chunk_x, chunk_y)
+                if chunk is not None:
+                    screen.blit(
+                        chunk, (chunk_x * size - view_left, chunk_y * size - view_top)
+                    )
@@ -6,9 +6,15 @@ import math
 # 嘗試相對導入，如果失敗則使用絕對導入
 try:
     from ..config import *
+    from .asset_cache import get_image
+    from .game_logger import get_logger
 except ImportError:
     # 直接執行時使用絕對導入
     from src.config import *
+    from src.utils.asset_cache import get_image
+    from src.utils.game_logger import get_logger
+
+log = get_logger("clouds")
 
 ######################雲朵系統######################
 
@@ -57,14 +63,10 @@ class Cloud:
         pygame.Surface: 雲朵圖片表面，如果載入失敗則返回程式繪製的雲朵\n
         """
         try:
-            # 嘗試載入雲朵圖片
-            cloud_image = pygame.image.load(CLOUD_IMAGE_PATH).convert_alpha()
-            cloud_image = pygame.transform.scale(
-                cloud_image, (int(self.width), int(self.height))
-            )
-            return cloud_image
+            # 嘗試從共用快取取得雲朵圖片（同尺寸的雲朵共用同一張）
+            return get_image(CLOUD_IMAGE_PATH, (int(self.width), int(self.height)))
         except (pygame.error, FileNotFoundError) as e:
-            print(f"🌤️ 載入雲朵圖片失敗: {e}")
+            log.warning(f"🌤️ 載入雲朵圖片失敗: {e}")
             # 創建一個白色雲朵，完全不透明
             cloud_surface = pygame.Surface(
                 (int(self.width), int(self.height)), pygame.SRCALPHA
@@ -108,8 +110,11 @@ class Cloud:
                 int(self.height * 0.2),
             )
 
-            print(
-                f"🌤️ 使用統一白色雲朵圖案，大小: {int(self.width)}x{int(self.height)}, 顏色: {cloud_color}"
+            log.debug(
+                "🌤️ 使用統一白色雲朵圖案，大小: %dx%d, 顏色: %s",
+                self.width,
+                self.height,
+                cloud_color,
             )
             return cloud_surface
 
@@ -0,0 +1,319 @@
+######################載入套件######################
+import atexit
+import queue
+import sys
+import threading
+import time
+
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+except ImportError:
+    from src.config import *
+
+######################日誌等級######################
+
+DEBUG = 10  # 每發子彈、每次命中這類頻繁的遊戲過程訊息
+INFO = 20  # 載入資源、Boss 出現、遊戲結束這類一般訊息
+WARNING = 30  # 載入失敗但遊戲可以繼續
+ERROR = 40  # 功能無法使用
+
+LOG_LEVELS = {"DEBUG": DEBUG, "INFO": INFO, "WARNING": WARNING, "ERROR": ERROR}
+
+# 每個分類最多記住幾則訊息的輸出時間，超過就全部忘掉重新計算
+RATE_LIMIT_KEY_LIMIT = 1024
+
+
+def parse_level(level):
+    """
+    把等級名稱轉成數字\n
+    \n
+    參數:\n
+    level (str or int): 等級名稱（不分大小寫）或等級數字\n
+    \n
+    回傳:\n
+    int: 等級數字\n
+    \n
+    例外:\n
+    ValueError: 未知的等級名稱\n
+    """
+    if isinstance(level, int):
+        return level
+
+    level_name = str(level).upper()
+    if level_name not in LOG_LEVELS:
+        raise ValueError(f"未知的日誌等級: {level}")
+    return LOG_LEVELS[level_name]
+
+
+######################背景輸出類別######################
+
+
+class LogSink:
+    """
+    背景輸出 - 訊息先放進佇列，由背景執行緒寫到終端機\n
+    \n
+    終端機很慢或輸出被導到管線時，寫入會卡住，\n
+    放在背景執行緒裡卡住的只有輸出本身，遊戲迴圈照常進行\n
+    \n
+    特點：\n
+    1. 第一則訊息進來時才啟動執行緒\n
+    2. 佇列滿了就丟掉新訊息並計數，遊戲迴圈永遠不會等待輸出\n
+    3. 程式結束時把佇列裡剩下的訊息寫完\n
+    \n
+    參數:\n
+    stream (file): 輸出目標，None 表示每次寫入時使用目前的 sys.stdout\n
+    queue_limit (int): 等待輸出的訊息上限\n
+    """
+
+    def __init__(self, stream=None, queue_limit=LOG_QUEUE_LIMIT):
+        self.stream = stream
+        self.queue = queue.Queue(maxsize=queue_limit)
+        self.thread = None
+        self.lock = threading.Lock()
+        self.dropped_count = 0  # 佇列滿了被丟掉的訊息數量
+        self.exit_hook_registered = False
+
+    def start(self):
+        """
+        啟動背景輸出執行緒，並在程式結束時自動關閉\n
+        """
+        with self.lock:
+            if self.thread is not None:
+                return
+
+            self.thread = threading.Thread(
+                target=self.run, name="game-log-sink", daemon=True
+            )
+            self.thread.start()
+
+            if not self.exit_hook_registered:
+                atexit.register(self.close)
+                self.exit_hook_registered = True
+
+    def write(self, line):
+        """
+        把一行訊息放進輸出佇列，不等待實際寫入\n
+        \n
+        參數:\n
+        line (str): 要輸出的訊息\n
+        """
+        if self.thread is None:
+            self.start()
+
+        try:
+            self.queue.put_nowait(line)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def run(self):
+        """
+        背景執行緒主迴圈 - 逐行寫出，佇列清空時才 flush\n
+        """
+        while True:
+            line = self.queue.get()
+            if line is None:
+                break
+
+            stream = self.stream or sys.stdout
+            try:
+                stream.write(line + "\n")
+                if self.queue.empty():
+                    stream.flush()
+            except (OSError, ValueError):
+                # 終端機已經關閉，訊息寫不出去也不影響遊戲
+                pass
+
+    def close(self, timeout=1.0):
+        """
+        寫完佇列裡剩下的訊息並停止背景執行緒\n
+        \n
+        參數:\n
+        timeout (float): 最多等待幾秒\n
+        """
+        with self.lock:
+            thread = self.thread
+            self.thread = None
+
+        if thread is None:
+            return
+
+        try:
+            if self.dropped_count > 0:
+                self.queue.put(
+                    f"⚠️ 輸出太慢，丟掉了 {self.dropped_count} 則日誌訊息",
+                    timeout=timeout,
+                )
+                self.dropped_count = 0
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+
+        thread.join(timeout)
+
+
+######################分類日誌類別######################
+
+
+class GameLogger:
+    """
+    分類日誌 - 每個子系統使用自己的分類，可以個別調整顯示等級\n
+    \n
+    用法：\n
+    log = get_logger("audio")\n
+    log.debug("🔊 射擊音效：傷害 %s → 音量 %.2f", damage, volume)\n
+    \n
+    特點：\n
+    1. 等級不夠的訊息只做一次數字比較就返回，關閉的分類幾乎沒有成本\n
+    2. 參數寫成 % 格式時，訊息真的要輸出才會組字串\n
+    3. 同一則訊息（預設以格式字串當鍵）在 rate_limit 秒內只輸出一次，\n
+       期間重複的次數會附在下一次輸出的訊息後面\n
+    \n
+    參數:\n
+    category (str): 分類名稱\n
+    level (int): 顯示的最低等級\n
+    sink (LogSink): 背景輸出\n
+    rate_limit (float): 同一則訊息最短的輸出間隔（秒）\n
+    """
+
+    def __init__(self, category, level, sink, rate_limit=LOG_RATE_LIMIT_SECONDS):
+        self.category = category
+        self.level = level
+        self.sink = sink
+        self.rate_limit = rate_limit
+        self.last_emit = {}  # 訊息鍵 -> (上次輸出時間, 之後略過的次數)
+
+    def is_enabled(self, level):
+        """
+        檢查某個等級的訊息會不會輸出 - 組訊息很花時間時可以先檢查\n
+        \n
+        參數:\n
+        level (int): 日誌等級\n
+        \n
+        回傳:\n
+        bool: True 表示會輸出\n
+        """
+        return level >= self.level
+
+    def log(self, level, message, *args, key=None):
+        """
+        輸出一則訊息\n
+        \n
+        參數:\n
+        level (int): 日誌等級\n
+        message (str): 訊息，有 args 時當作 % 格式字串\n
+        *args: 格式參數\n
+        key (str): 頻率限制用的鍵，None 表示使用 message\n
+        """
+        if level < self.level:
+            return
+
+        if key is None:
+            key = message
+
+        current_time = time.monotonic()
+        skipped_count = 0
+        record = self.last_emit.get(key)
+        if record is not None:
+            last_time, skipped_count = record
+            if current_time - last_time < self.rate_limit:
+                self.last_emit[key] = (last_time, skipped_count + 1)
+                return
+        elif len(self.last_emit) >= RATE_LIMIT_KEY_LIMIT:
+            self.last_emit.clear()
+
+        self.last_emit[key] = (current_time, 0)
+
+        if args:
+            message = message % args
+        if skipped_count > 0:
+            message = f"{message}（另有 {skipped_count} 則相同訊息已略過）"
+
+        self.sink.write(message)
+
+    def debug(self, message, *args, key=None):
+        """
+        輸出 DEBUG 等級的訊息，參數和 log() 相同\n
+        """
+        if self.level <= DEBUG:
+            self.log(DEBUG, message, *args, key=key)
+
+    def info(self, message, *args, key=None):
+        """
+        輸出 INFO 等級的訊息，參數和 log() 相同\n
+        """
+        if self.level <= INFO:
+            self.log(INFO, message, *args, key=key)
+
+    def warning(self, message, *args, key=None):
+        """
+        輸出 WARNING 等級的訊息，參數和 log() 相同\n
+        """
+        if self.level <= WARNING:
+            self.log(WARNING, message, *args, key=key)
+
+    def error(self, message, *args, key=None):
+        """
+        輸出 ERROR 等級的訊息，參數和 log() 相同\n
+        """
+        if self.level <= ERROR:
+            self.log(ERROR, message, *args, key=key)
+
+
+######################日誌設定######################
+
+# 整個程式共用的背景輸出和分類日誌
+_log_sink = LogSink()
+_loggers = {}  # 分類名稱 -> GameLogger
+_default_level = parse_level(LOG_LEVEL)
+_category_levels = {
+    category: parse_level(level) for category, level in LOG_CATEGORY_LEVELS.items()
+}
+
+
+def get_logger(category):
+    """
+    取得分類日誌，同一個分類共用同一個物件\n
+    \n
+    參數:\n
+    category (str): 分類名稱，例如 "audio"、"monsters"\n
+    \n
+    回傳:\n
+    GameLogger: 分類日誌\n
+    """
+    logger = _loggers.get(category)
+    if logger is None:
+        level = _category_levels.get(category, _default_level)
+        logger = GameLogger(category, level, _log_sink)
+        _loggers[category] = logger
+    return logger
+
+
+def set_log_level(level, category=None):
+    """
+    調整顯示等級 - 已經建立的分類日誌也會一起更新\n
+    \n
+    參數:\n
+    level (str or int): 等級名稱或等級數字\n
+    category (str): 只調整這個分類，None 表示調整所有沒有個別設定的分類\n
+    """
+    global _default_level
+    level = parse_level(level)
+
+    if category is not None:
+        _category_levels[category] = level
+        if category in _loggers:
+            _loggers[category].level = level
+        return
+
+    _default_level = level
+    for name, logger in _loggers.items():
+        if name not in _category_levels:
+            logger.level = level
+
+
+def shutdown_logging():
+    """
+    寫完所有還沒輸出的訊息 - 程式結束時會自動呼叫，也可以提早呼叫\n
+    """
+    _log_sink.close()
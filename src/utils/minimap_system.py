@@ -433,9 +433,6 @@ class MinimapSystem:
         legend_x = 5
         legend_y = self.minimap_height - 80
 
-        # 字體（使用較小字體）
-        legend_font = get_chinese_font(10)
-
         # 繪製圖例背景
         legend_bg = pygame.Rect(legend_x - 2, legend_y - 2, 80, 75)
         pygame.draw.rect(self.minimap_surface, (0, 0, 0, 180), legend_bg)
@@ -495,7 +492,7 @@ class MinimapSystem:
                 )
 
             # 繪製文字
-            text_surface = legend_font.render(text, True, (255, 255, 255))
+            text_surface = get_text_surface(text, 10, (255, 255, 255))  # 使用較小字體
             self.minimap_surface.blit(text_surface, (legend_x + 15, item_y + 2))
 
     def update(self, dt=1 / 60):
@@ -555,8 +552,7 @@ class MinimapSystem:
         screen (pygame.Surface): 主遊戲螢幕\n
         """
         # 繪製小地圖標題
-        title_font = get_chinese_font(16)
-        title_text = title_font.render("小地圖", True, WHITE)
+        title_text = get_text_surface("小地圖", 16, WHITE)
         title_rect = title_text.get_rect()
         title_rect.centerx = self.minimap_x + self.minimap_width // 2
         title_rect.bottom = self.minimap_y - 5
@@ -569,8 +565,7 @@ class MinimapSystem:
             and self.minimap_y <= mouse_y <= self.minimap_y + self.minimap_height
         ):
 
-            hint_font = get_chinese_font(12)
-            hint_text = hint_font.render("拖拽移動", True, (255, 255, 255, 200))
+            hint_text = get_text_surface("拖拽移動", 12, (255, 255, 255, 200))
             hint_rect = hint_text.get_rect()
             hint_rect.centerx = self.minimap_x + self.minimap_width // 2
             hint_rect.top = self.minimap_y + self.minimap_height + 5
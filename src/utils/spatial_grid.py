@@ -0,0 +1,462 @@
+######################載入套件######################
+# 支援直接執行和模組執行兩種方式
+try:
+    from ..config import *
+except ImportError:
+    from src.config import *
+
+######################靜態空間網格類別######################
+
+
+class SpatialGrid:
+    """
+    靜態空間網格 - 把不會移動的關卡物件依位置分桶，加速碰撞查詢\n
+    \n
+    平台、尖刺和愛心都不會移動，只有載入或丟棄關卡段時才需要重建網格，\n
+    之後每個玩家、怪物、手榴彈只需要檢查附近幾格裡的物件，\n
+    不用每幀掃過整個關卡的所有平台。\n
+    \n
+    特點：\n
+    1. 覆蓋很多格的大物件（地板、牆壁）不逐格登記，每次查詢直接檢查，\n
+       關卡再寬，重建網格的成本也只和一般物件數量有關\n
+    2. 查詢結果依照加入順序排列，碰撞處理的先後順序和原本的列表一致\n
+    3. 可以直接當成列表迭代，舊的逐一掃描寫法仍然可以使用\n
+    \n
+    參數:\n
+    items (list): 要加入網格的物件（需要有 rect 屬性）\n
+    cell_size (int): 每個網格的邊長（像素）\n
+    """
+
+    def __init__(self, items=None, cell_size=SPATIAL_GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (格子x, 格子y) -> 物件索引列表
+        self.large_indices = []  # 覆蓋超過 SPATIAL_GRID_LARGE_ITEM_CELLS 格的物件索引
+        self.items = []
+        self.version = 0  # 內容每次改變就加一，讓使用者知道快取要重建
+
+        if items:
+            for item in items:
+                self.insert(item)
+
+    def get_cell_range(self, rect):
+        """
+        計算矩形覆蓋的網格範圍\n
+        \n
+        參數:\n
+        rect (pygame.Rect): 要計算的矩形\n
+        \n
+        回傳:\n
+        tuple: (起始格x, 結束格x, 起始格y, 結束格y)，結束格包含在內\n
+        """
+        return (
+            rect.left // self.cell_size,
+            (rect.right - 1) // self.cell_size,
+            rect.top // self.cell_size,
+            (rect.bottom - 1) // self.cell_size,
+        )
+
+    def insert(self, item):
+        """
+        把物件加入網格\n
+        \n
+        參數:\n
+        item: 要加入的物件（需要有 rect 屬性）\n
+        """
+        index = len(self.items)
+        self.items.append(item)
+        self.version += 1
+
+        start_x, end_x, start_y, end_y = self.get_cell_range(item.rect)
+        cell_count = (end_x - start_x + 1) * (end_y - start_y + 1)
+        if cell_count > SPATIAL_GRID_LARGE_ITEM_CELLS:
+            self.large_indices.append(index)
+            return
+
+        for cell_y in range(start_y, end_y + 1):
+            for cell_x in range(start_x, end_x + 1):
+                self.cells.setdefault((cell_x, cell_y), []).append(index)
+
+    def rebuild(self, items):
+        """
+        清空網格並重新加入所有物件 - 關卡重新生成或載入、丟棄關卡段時使用\n
+        \n
+        參數:\n
+        items (list): 新的物件列表\n
+        """
+        self.cells = {}
+        self.large_indices = []
+        self.items = []
+        self.version += 1
+        for item in items:
+            self.insert(item)
+
+    def query_rect(self, rect):
+        """
+        找出和矩形重疊的所有物件\n
+        \n
+        參數:\n
+        rect (pygame.Rect): 查詢範圍\n
+        \n
+        回傳:\n
+        list: 重疊的物件，依照加入網格的順序排列\n
+        """
+        start_x, end_x, start_y, end_y = self.get_cell_range(rect)
+
+        candidate_indices = set(self.large_indices)
+        for cell_y in range(start_y, end_y + 1):
+            for cell_x in range(start_x, end_x + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if bucket:
+                    candidate_indices.update(bucket)
+
+        # 依照加入順序排列，碰撞處理結果才會和逐一掃描完全相同
+        results = []
+        for index in sorted(candidate_indices):
+            item = self.items[index]
+            if rect.colliderect(item.rect):
+                results.append(item)
+        return results
+
+    def query_point(self, x, y):
+        """
+        找出包含指定座標點的所有物件\n
+        \n
+        參數:\n
+        x (float): 查詢點 X 座標\n
+        y (float): 查詢點 Y 座標\n
+        \n
+        回傳:\n
+        list: 包含該點的物件，依照加入網格的順序排列\n
+        """
+        bucket = self.cells.get((int(x) // self.cell_size, int(y) // self.cell_size))
+        if self.large_indices:
+            bucket = sorted(self.large_indices + (bucket or []))
+        if not bucket:
+            return []
+
+        return [
+            self.items[index]
+            for index in bucket
+            if self.items[index].rect.collidepoint(x, y)
+        ]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+######################動態空間網格類別######################
+
+
+class DynamicSpatialGrid:
+    """
+    動態空間網格 - 把會移動的怪物和Boss依位置分桶，加速範圍和最近目標查詢\n
+    \n
+    和 SpatialGrid 不同，物件移動後不重建網格：呼叫 move() 時，\n
+    物件還在原本那幾格就什麼都不做，換格子時才把這個物件搬過去。\n
+    \n
+    特點：\n
+    1. 物件的位置是碰撞矩形和 (x, y, width, height) 合起來的範圍，\n
+       碰撞矩形還沒同步的物件（例如剛躲避子彈的狙擊Boss）也查得到\n
+    2. 距離以物件中心 (x + width // 2, y + height // 2) 計算，一律比較平方距離\n
+    3. 查詢結果依照加入網格的順序排列，距離相同時先加入的物件優先\n
+    4. 物件在 update 以外的地方被移動時，要自己呼叫 move()\n
+    \n
+    參數:\n
+    cell_size (int): 每個網格的邊長（像素）\n
+    """
+
+    def __init__(self, cell_size=MONSTER_GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (格子x, 格子y) -> {加入順序: 物件}
+        self.entries = {}  # id(物件) -> (加入順序, 格子範圍)
+        self.items = {}  # 加入順序 -> 物件，依照加入順序排列
+        self.next_order = 0
+
+    def get_cell_range(self, item):
+        """
+        計算物件覆蓋的網格範圍\n
+        \n
+        參數:\n
+        item: 網格裡的物件（需要有 rect、x、y、width、height 屬性）\n
+        \n
+        回傳:\n
+        tuple: (起始格x, 結束格x, 起始格y, 結束格y)，結束格包含在內\n
+        """
+        rect = item.rect
+        cell_size = self.cell_size
+        left = min(rect.left, item.x)
+        top = min(rect.top, item.y)
+        right = max(rect.right, item.x + item.width)
+        bottom = max(rect.bottom, item.y + item.height)
+        return (
+            int(left // cell_size),
+            int(right // cell_size),
+            int(top // cell_size),
+            int(bottom // cell_size),
+        )
+
+    def add_to_cells(self, order, item, cell_range):
+        """
+        把物件登記到範圍內的每一格\n
+        \n
+        參數:\n
+        order (int): 物件的加入順序\n
+        item: 要登記的物件\n
+        cell_range (tuple): get_cell_range() 算出的網格範圍\n
+        """
+        start_x, end_x, start_y, end_y = cell_range
+        for cell_y in range(start_y, end_y + 1):
+            for cell_x in range(start_x, end_x + 1):
+                self.cells.setdefault((cell_x, cell_y), {})[order] = item
+
+    def remove_from_cells(self, order, cell_range):
+        """
+        把物件從範圍內的每一格移除，空的格子一併刪掉\n
+        \n
+        參數:\n
+        order (int): 物件的加入順序\n
+        cell_range (tuple): 物件登記時的網格範圍\n
+        """
+        start_x, end_x, start_y, end_y = cell_range
+        for cell_y in range(start_y, end_y + 1):
+            for cell_x in range(start_x, end_x + 1):
+                bucket = self.cells[(cell_x, cell_y)]
+                del bucket[order]
+                if not bucket:
+                    del self.cells[(cell_x, cell_y)]
+
+    def insert(self, item):
+        """
+        把物件加入網格\n
+        \n
+        參數:\n
+        item: 要加入的物件\n
+        """
+        order = self.next_order
+        self.next_order += 1
+        cell_range = self.get_cell_range(item)
+        self.entries[id(item)] = (order, cell_range)
+        self.items[order] = item
+        self.add_to_cells(order, item, cell_range)
+
+    def remove(self, item):
+        """
+        把物件移出網格，不在網格裡的物件直接略過\n
+        \n
+        參數:\n
+        item: 要移除的物件\n
+        """
+        entry = self.entries.pop(id(item), None)
+        if entry is None:
+            return
+
+        order, cell_range = entry
+        del self.items[order]
+        self.remove_from_cells(order, cell_range)
+
+    def move(self, item):
+        """
+        物件移動後更新它所在的格子 - 還在原本那幾格時不做任何事\n
+        \n
+        參數:\n
+        item: 移動過的物件\n
+        """
+        entry = self.entries.get(id(item))
+        if entry is None:
+            return
+
+        order, old_range = entry
+        cell_range = self.get_cell_range(item)
+        if cell_range == old_range:
+            return
+
+        self.remove_from_cells(order, old_range)
+        self.add_to_cells(order, item, cell_range)
+        self.entries[id(item)] = (order, cell_range)
+
+    def clear(self):
+        """
+        移除所有物件 - 重新開始或換關卡時使用\n
+        """
+        self.cells.clear()
+        self.entries.clear()
+        self.items.clear()
+
+    def collect(self, start_x, end_x, start_y, end_y):
+        """
+        收集範圍內所有格子裡的物件\n
+        \n
+        參數:\n
+        start_x (int): 起始格x\n
+        end_x (int): 結束格x（包含）\n
+        start_y (int): 起始格y\n
+        end_y (int): 結束格y（包含）\n
+        \n
+        回傳:\n
+        dict: 加入順序 -> 物件，跨好幾格的物件只出現一次\n
+        """
+        candidates = {}
+        for cell_y in range(start_y, end_y + 1):
+            for cell_x in range(start_x, end_x + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if bucket:
+                    candidates.update(bucket)
+        return candidates
+
+    def query_rect(self, rect):
+        """
+        找出碰撞矩形和查詢矩形重疊的所有物件\n
+        \n
+        參數:\n
+        rect (pygame.Rect): 查詢範圍\n
+        \n
+        回傳:\n
+        list: 重疊的物件，依照加入網格的順序排列\n
+        """
+        cell_size = self.cell_size
+        candidates = self.collect(
+            rect.left // cell_size,
+            rect.right // cell_size,
+            rect.top // cell_size,
+            rect.bottom // cell_size,
+        )
+        return [
+            candidates[order]
+            for order in sorted(candidates)
+            if rect.colliderect(candidates[order].rect)
+        ]
+
+    def query_radius(self, x, y, radius):
+        """
+        找出中心點在圓形範圍內的所有物件\n
+        \n
+        參數:\n
+        x (float): 圓心 X 座標\n
+        y (float): 圓心 Y 座標\n
+        radius (float): 半徑，距離剛好等於半徑也算在範圍內\n
+        \n
+        回傳:\n
+        list: 範圍內的物件，依照加入網格的順序排列\n
+        """
+        cell_size = self.cell_size
+        candidates = self.collect(
+            int((x - radius) // cell_size),
+            int((x + radius) // cell_size),
+            int((y - radius) // cell_size),
+            int((y + radius) // cell_size),
+        )
+
+        radius_squared = radius * radius
+        results = []
+        for order in sorted(candidates):
+            item = candidates[order]
+            dx = item.x + item.width // 2 - x
+            dy = item.y + item.height // 2 - y
+            if dx * dx + dy * dy <= radius_squared:
+                results.append(item)
+        return results
+
+    def nearest(self, x, y, accept=None):
+        """
+        找出中心點離指定位置最近的物件\n
+        \n
+        從查詢點所在的格子一圈一圈往外找，找到的物件比下一圈可能的距離還近就停止；\n
+        要找的格子比物件還多時，直接掃過所有物件比較快。\n
+        \n
+        參數:\n
+        x (float): 查詢點 X 座標\n
+        y (float): 查詢點 Y 座標\n
+        accept (callable): 篩選條件，回傳 False 的物件不列入，None 表示全部列入\n
+        \n
+        回傳:\n
+        object or None: 最近的物件，距離相同時回傳先加入的，沒有物件時回傳 None\n
+        """
+        cell_size = self.cell_size
+        center_x = int(x // cell_size)
+        center_y = int(y // cell_size)
+
+        best_item = None
+        best_key = None  # (平方距離, 加入順序)
+        ring = 0
+        while True:
+            if (2 * ring + 1) ** 2 > len(self.items):
+                candidates = self.items
+            elif ring == 0:
+                candidates = self.cells.get((center_x, center_y), {})
+            else:
+                candidates = self.collect_ring(center_x, center_y, ring)
+
+            for order, item in candidates.items():
+                if accept is not None and not accept(item):
+                    continue
+                dx = item.x + item.width // 2 - x
+                dy = item.y + item.height // 2 - y
+                key = (dx * dx + dy * dy, order)
+                if best_key is None or key < best_key:
+                    best_item = item
+                    best_key = key
+
+            if candidates is self.items:
+                return best_item
+
+            # 還沒找過的格子離查詢點至少 ring 格，找到的物件比這更近就不可能再有更近的
+            reach = ring * cell_size
+            if best_key is not None and best_key[0] < reach * reach:
+                return best_item
+            ring += 1
+
+    def collect_ring(self, center_x, center_y, ring):
+        """
+        收集和中心格子距離剛好 ring 格的那一圈格子裡的物件\n
+        \n
+        參數:\n
+        center_x (int): 中心格x\n
+        center_y (int): 中心格y\n
+        ring (int): 第幾圈，至少為 1\n
+        \n
+        回傳:\n
+        dict: 加入順序 -> 物件\n
+        """
+        candidates = {}
+        cells = self.cells
+        top = center_y - ring
+        bottom = center_y + ring
+        for cell_x in range(center_x - ring, center_x + ring + 1):
+            for cell in ((cell_x, top), (cell_x, bottom)):
+                bucket = cells.get(cell)
+                if bucket:
+                    candidates.update(bucket)
+        left = center_x - ring
+        right = center_x + ring
+        for cell_y in range(top + 1, bottom):
+            for cell in ((left, cell_y), (right, cell_y)):
+                bucket = cells.get(cell)
+                if bucket:
+                    candidates.update(bucket)
+        return candidates
+
+    def __iter__(self):
+        return iter(self.items.values())
+
+    def __len__(self):
+        return len(self.items)
+
+
+def query_nearby(objects, rect):
+    """
+    找出和矩形重疊的物件 - 同時支援靜態、動態空間網格和一般列表\n
+    \n
+    參數:\n
+    objects (SpatialGrid, DynamicSpatialGrid or list): 空間網格或物件列表\n
+    rect (pygame.Rect): 查詢範圍\n
+    \n
+    回傳:\n
+    list: 重疊的物件，順序和原本列表一致\n
+    """
+    if isinstance(objects, (SpatialGrid, DynamicSpatialGrid)):
+        return objects.query_rect(rect)
+
+    return [obj for obj in objects if rect.colliderect(obj.rect)]